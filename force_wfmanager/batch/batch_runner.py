@@ -0,0 +1,233 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import logging
+import os
+import queue
+import subprocess
+import tempfile
+import time
+
+from traits.api import (
+    Enum,
+    Float,
+    HasStrictTraits,
+    Instance,
+    Int,
+    List,
+    Str,
+    Tuple,
+)
+
+from force_bdss.api import BaseUIHooksManager, IFactoryRegistry
+
+from force_wfmanager.batch.results_writers import BaseResultsWriter
+from force_wfmanager.io.workflow_io import write_workflow_file
+from force_wfmanager.model.bdss_run import (
+    BDSSRun,
+    RUN_FAILED,
+    RUN_FINISHED,
+    RUN_RUNNING,
+    RUN_STOPPED,
+)
+from force_wfmanager.server.zmq_server import READY_TIMEOUT, ZMQServer
+
+log = logging.getLogger(__name__)
+
+
+class BatchRunner(HasStrictTraits):
+    """ Executes a workflow with the BDSS without a GUI. The results are
+    received through the same :class:`ZMQServer` and UI hooks managers as
+    in the Workflow Manager, collected in the :class:`AnalysisModel` of a
+    :class:`BDSSRun`, and streamed to the :attr:`results_writers`.
+
+    Events are received by the server thread and processed by the thread
+    calling :meth:`run`. This module must not import any GUI toolkit.
+    """
+
+    #: Registry of the available factories
+    factory_registry = Instance(IFactoryRegistry)
+
+    #: Path to spawn for the BDSS CLI executable
+    bdss_executable_path = Str("force_bdss")
+
+    #: Transport used by the ZeroMQ Server receiving the BDSS events
+    zmq_transport = Enum(ZMQServer.TRANSPORT_IPC, ZMQServer.TRANSPORT_TCP)
+
+    #: The UI hooks managers contributed by the plugins. These set up
+    #: the communication of the BDSS with the server.
+    ui_hooks_managers = List(BaseUIHooksManager)
+
+    #: Writers receiving the rows of the results as they are completed
+    results_writers = List(Instance(BaseResultsWriter))
+
+    #: Seconds to wait for the last events once the BDSS has exited
+    drain_timeout = Float(5.0)
+
+    #: Seconds between two checks of the BDSS process
+    poll_interval = Float(0.1)
+
+    #: Events received by the server thread, waiting to be processed
+    _events = Instance(queue.Queue, ())
+
+    #: Header written to the results writers
+    _written_header = Tuple()
+
+    #: Number of rows written to the results writers
+    _written_rows = Int(0)
+
+    def _ui_hooks_managers_default(self):
+        managers = []
+        for factory in self.factory_registry.ui_hooks_factories:
+            try:
+                managers.append(factory.create_ui_hooks_manager())
+            except Exception:
+                log.exception(
+                    "Failed to create UI "
+                    "hook manager by factory {}".format(
+                        factory.__class__.__name__
+                    )
+                )
+        return managers
+
+    def run(self, workflow_model):
+        """ Executes `workflow_model` with the BDSS, and waits for its
+        completion. A KeyboardInterrupt asks the BDSS to stop.
+
+        Parameters
+        ----------
+        workflow_model: Workflow
+            The workflow to execute
+
+        Returns
+        -------
+        run: BDSSRun
+            The run, holding the results of the execution
+        returncode: int
+            The exit status of the BDSS
+        """
+        run = BDSSRun(
+            name="Batch run",
+            workflow_model=workflow_model,
+            factory_registry=self.factory_registry,
+        )
+        run.zmq_server = ZMQServer(
+            on_event_callback=self._events.put,
+            on_error_callback=self._server_error_callback,
+            transport=self.zmq_transport,
+        )
+        run.zmq_server.start()
+        if not run.zmq_server.wait_until_ready(READY_TIMEOUT):
+            raise RuntimeError("Unable to start the ZMQ server.")
+
+        try:
+            for hook_manager in self.ui_hooks_managers:
+                try:
+                    hook_manager.before_execution(run)
+                except Exception:
+                    log.exception(
+                        "Failed before_execution hook "
+                        "for hook manager {}".format(
+                            hook_manager.__class__.__name__
+                        )
+                    )
+
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                workflow_path = os.path.join(tmp_dir, "workflow.json")
+                write_workflow_file(run.workflow_model, workflow_path)
+                process = subprocess.Popen(
+                    [self.bdss_executable_path, workflow_path]
+                )
+                run.status = RUN_RUNNING
+                returncode = self._wait_for_process(process, run)
+                self._drain_events(run)
+        finally:
+            for hook_manager in self.ui_hooks_managers:
+                try:
+                    hook_manager.after_execution(run)
+                except Exception:
+                    log.exception(
+                        "Failed after_execution hook "
+                        "for hook manager {}".format(
+                            hook_manager.__class__.__name__
+                        )
+                    )
+            run.zmq_server.stop()
+            self._process_events(run)
+            for writer in self.results_writers:
+                writer.close()
+
+        if returncode == 0:
+            run.status = RUN_FINISHED
+        elif run.stop_requested:
+            run.status = RUN_STOPPED
+        else:
+            run.status = RUN_FAILED
+
+        return run, returncode
+
+    def _wait_for_process(self, process, run):
+        """ Processes the events until the BDSS process exits, and returns
+        its exit status."""
+        while True:
+            try:
+                returncode = process.poll()
+                if returncode is not None:
+                    return returncode
+                self._process_events(run, timeout=self.poll_interval)
+            except KeyboardInterrupt:
+                log.info("Interrupted, stopping the BDSS")
+                run.stop()
+
+    def _drain_events(self, run):
+        """ Processes the events sent before the BDSS exited, until the
+        BDSS has said goodbye to the server or the timeout expires."""
+        deadline = time.monotonic() + self.drain_timeout
+        while (run.zmq_server.state == ZMQServer.STATE_RECEIVING
+               and time.monotonic() < deadline):
+            self._process_events(run, timeout=self.poll_interval)
+
+    def _process_events(self, run, timeout=None):
+        """ Adds the queued events to the results of `run`. Waits up to
+        `timeout` seconds for the first one, if given."""
+        try:
+            if timeout is not None:
+                self._process_event(run, self._events.get(timeout=timeout))
+            while True:
+                self._process_event(run, self._events.get_nowait())
+        except queue.Empty:
+            pass
+
+    def _process_event(self, run, event):
+        run.notify_event(event)
+        self._write_new_rows(run)
+
+    def _write_new_rows(self, run):
+        """ Sends the header and the rows completed since the last call
+        to the results writers."""
+        analysis_model = run.analysis_model
+        if not analysis_model.header:
+            return
+
+        if not self._written_header:
+            self._written_header = tuple(analysis_model.header)
+            for writer in self.results_writers:
+                writer.write_header(self._written_header)
+
+        steps = analysis_model.evaluation_steps
+        metadata = analysis_model.step_metadata
+        # The MCO restarted and the results were cleared
+        if len(steps) < self._written_rows:
+            self._written_rows = 0
+        for index in range(self._written_rows, len(steps)):
+            for writer in self.results_writers:
+                writer.write_row(steps[index], metadata[index])
+        self._written_rows = len(steps)
+
+    def _server_error_callback(self, error_type, error_message):
+        """ Callback in case of server error. Invoked by the server
+        thread."""
+        if error_type == ZMQServer.ERROR_TYPE_CRITICAL:
+            log.error(error_message)
+        else:
+            log.warning(error_message)
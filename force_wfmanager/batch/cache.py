@@ -0,0 +1,88 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+""" Command line interface to inspect and prune the result cache of the
+Workflow Manager. As for the batch runner, this module must not import
+any GUI toolkit.
+"""
+
+import datetime
+
+import click
+
+from force_wfmanager.model.result_cache import (
+    ResultCache,
+    default_cache_directory,
+)
+from force_wfmanager.version import __version__
+
+#: Bytes in a megabyte, the unit of the sizes on the command line
+MEGABYTE = 1024 ** 2
+
+
+@click.group()
+@click.version_option(version=__version__)
+@click.option(
+    '--cache-dir', default=default_cache_directory,
+    type=click.Path(file_okay=False),
+    help="Directory of the result cache"
+)
+@click.pass_context
+def force_wfmanager_cache(ctx, cache_dir):
+    """Inspects and prunes the cache of the results of the runs."""
+    ctx.obj = ResultCache(directory=cache_dir)
+
+
+@force_wfmanager_cache.command("list")
+@click.pass_obj
+def list_entries(cache):
+    """Lists the cached results, from the least to the most recently
+    used."""
+    entries = cache.entries()
+    for entry in entries:
+        last_used = datetime.datetime.fromtimestamp(entry.last_used)
+        click.echo(
+            f"{entry.key}  {_format_size(entry.size):>10}  "
+            f"{last_used:%Y-%m-%d %H:%M:%S}"
+        )
+    click.echo(
+        f"{len(entries)} entries, "
+        f"{_format_size(sum(entry.size for entry in entries))} in "
+        f"{cache.directory}"
+    )
+
+
+@force_wfmanager_cache.command()
+@click.option(
+    '--max-size', type=click.FloatRange(min=0), required=True,
+    help="Maximum total size of the remaining entries, in MB"
+)
+@click.pass_obj
+def prune(cache, max_size):
+    """Removes the least recently used results until the cache fits in
+    the given size."""
+    removed = cache.prune(max_size=int(max_size * MEGABYTE))
+    click.echo(f"Removed {len(removed)} entries.")
+
+
+@force_wfmanager_cache.command()
+@click.pass_obj
+def clear(cache):
+    """Removes all the cached results."""
+    removed = cache.clear()
+    click.echo(f"Removed {len(removed)} entries.")
+
+
+@force_wfmanager_cache.command()
+@click.argument('keys', nargs=-1, required=True)
+@click.pass_obj
+def remove(cache, keys):
+    """Removes the cached results of the given KEYS."""
+    for key in keys:
+        if not cache.remove(key):
+            raise click.ClickException(f"No cached results for {key}.")
+        click.echo(f"Removed {key}.")
+
+
+def _format_size(size):
+    return f"{size / MEGABYTE:.2f} MB"
@@ -0,0 +1,181 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import csv
+import json
+import math
+import struct
+
+from traits.api import Any, HasStrictTraits, List, Str, Tuple
+
+#: Leading bytes of the binary results files
+BINARY_RESULTS_MAGIC = b"FWMR\x01"
+
+
+class BaseResultsWriter(HasStrictTraits):
+    """ Base class of the writers streaming the rows of an
+    :class:`AnalysisModel <.analysis_model.AnalysisModel>` to a file,
+    as they are received from the BDSS.
+    """
+
+    #: Path of the output file
+    path = Str()
+
+    #: The open output file
+    _file = Any()
+
+    def write_header(self, header):
+        """ Writes the column names. Called once, before any row."""
+        raise NotImplementedError
+
+    def write_row(self, row, metadata):
+        """ Writes a completed row, with its metadata."""
+        raise NotImplementedError
+
+    def close(self):
+        """ Flushes and closes the output file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class CSVResultsWriter(BaseResultsWriter):
+    """ Streams the rows to a CSV file. The metadata are not written,
+    as in :meth:`AnalysisModel.dump_csv`."""
+
+    #: CSV writer of the output file
+    _writer = Any()
+
+    def write_header(self, header):
+        self._file = open(self.path, "w", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(header)
+        self._file.flush()
+
+    def write_row(self, row, metadata):
+        self._writer.writerow(row)
+        self._file.flush()
+
+
+class JSONLinesResultsWriter(BaseResultsWriter):
+    """ Streams the rows to a JSON Lines file: a first line with the
+    header, then one ``{"data": ..., "metadata": ...}`` object per row.
+    """
+
+    def write_header(self, header):
+        self._file = open(self.path, "w")
+        self._write_line({"header": list(header)})
+
+    def write_row(self, row, metadata):
+        self._write_line({"data": list(row), "metadata": metadata})
+
+    def _write_line(self, data):
+        self._file.write(json.dumps(data) + "\n")
+        self._file.flush()
+
+
+class JSONResultsWriter(BaseResultsWriter):
+    """ Writes the rows to a JSON file in the format of
+    :meth:`AnalysisModel.dump_json`, which can be loaded back in the
+    Workflow Manager. The file is written when the writer is closed."""
+
+    #: The column names
+    _header = Tuple()
+
+    #: The (row, metadata) received so far
+    _rows = List(Tuple)
+
+    def write_header(self, header):
+        self._header = tuple(header)
+
+    def write_row(self, row, metadata):
+        self._rows.append((tuple(row), metadata))
+
+    def close(self):
+        data = {"header": self._header}
+        for index, (row, metadata) in enumerate(self._rows, start=1):
+            data[index] = {"data": row, "metadata": metadata}
+        with open(self.path, "w") as output:
+            json.dump(data, output, indent=4)
+
+
+class BinaryResultsWriter(BaseResultsWriter):
+    """ Streams the rows to a compact binary file. The file starts with
+    :data:`BINARY_RESULTS_MAGIC`, the number of columns (uint32) and the
+    column names (uint16 length and UTF-8 bytes each), followed by each
+    row as little-endian float64 values. Values that cannot be converted
+    to floats are stored as NaN. The metadata are not written."""
+
+    #: Packs a full row
+    _row_struct = Any()
+
+    def write_header(self, header):
+        self._file = open(self.path, "wb")
+        self._file.write(BINARY_RESULTS_MAGIC)
+        self._file.write(struct.pack("<I", len(header)))
+        for name in header:
+            encoded = str(name).encode("utf-8")
+            self._file.write(struct.pack("<H", len(encoded)))
+            self._file.write(encoded)
+        self._row_struct = struct.Struct(f"<{len(header)}d")
+        self._file.flush()
+
+    def write_row(self, row, metadata):
+        self._file.write(self._row_struct.pack(*map(_to_float, row)))
+        self._file.flush()
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def read_binary_results(path):
+    """ Reads a file written by :class:`BinaryResultsWriter`.
+
+    Returns
+    -------
+    header: tuple of str
+        The column names
+    rows: list of tuple of float
+        The rows of the results
+    """
+    with open(path, "rb") as fp:
+        if fp.read(len(BINARY_RESULTS_MAGIC)) != BINARY_RESULTS_MAGIC:
+            raise IOError(f"{path} is not a binary results file.")
+        n_columns, = struct.unpack("<I", fp.read(4))
+        header = []
+        for _ in range(n_columns):
+            length, = struct.unpack("<H", fp.read(2))
+            header.append(fp.read(length).decode("utf-8"))
+        row_struct = struct.Struct(f"<{n_columns}d")
+        data = fp.read()
+
+    rows = [
+        row_struct.unpack_from(data, offset)
+        for offset in range(0, len(data), row_struct.size)
+    ] if n_columns else []
+    return tuple(header), rows
+
+
+#: Writer class for each supported file extension
+RESULTS_WRITERS = {
+    ".csv": CSVResultsWriter,
+    ".json": JSONResultsWriter,
+    ".jsonl": JSONLinesResultsWriter,
+    ".bin": BinaryResultsWriter,
+}
+
+
+def create_results_writer(path):
+    """ Returns the results writer for the extension of `path`."""
+    for extension, writer_class in RESULTS_WRITERS.items():
+        if path.endswith(extension):
+            return writer_class(path=path)
+
+    raise IOError(
+        f"Unrecognised results file type {path}, should be one of "
+        f"{', '.join(RESULTS_WRITERS)}."
+    )
@@ -0,0 +1,121 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+""" Headless entry point, executing a workflow and collecting its results
+without starting the GUI. Neither this module nor the modules it imports
+may import Qt, Chaco or TraitsUI.
+"""
+
+import logging
+import sys
+
+import click
+
+from envisage.application import Application
+from envisage.core_plugin import CorePlugin
+from stevedore import extension
+from stevedore.exception import NoMatches
+
+from force_bdss.api import IFactoryRegistry
+from force_bdss.core_plugins.factory_registry_plugin import (
+    FactoryRegistryPlugin
+)
+
+from force_wfmanager.batch.batch_runner import BatchRunner
+from force_wfmanager.batch.results_writers import create_results_writer
+from force_wfmanager.io.workflow_io import load_workflow_file
+from force_wfmanager.server.zmq_server import ZMQServer
+from force_wfmanager.version import __version__
+
+log = logging.getLogger(__name__)
+
+
+@click.command()
+@click.version_option(version=__version__)
+@click.option(
+    '--output', '-o', 'output_files', multiple=True,
+    type=click.Path(dir_okay=False, writable=True),
+    help="Streams the results to a .csv, .jsonl or .bin file, or writes "
+         "them to a .json file at the end of the run. Can be repeated."
+)
+@click.option(
+    '--bdss-executable', default="force_bdss",
+    help="Path of the force_bdss executable"
+)
+@click.option(
+    '--transport', default=ZMQServer.TRANSPORT_IPC,
+    type=click.Choice([ZMQServer.TRANSPORT_IPC, ZMQServer.TRANSPORT_TCP]),
+    help="Transport used to receive the results from the BDSS"
+)
+@click.option(
+    '--debug', is_flag=True, default=False,
+    help="Prints extra debug information"
+)
+@click.argument('workflow_file', type=click.Path(exists=True))
+def force_wfmanager_batch(workflow_file, output_files, bdss_executable,
+                          transport, debug):
+    """Executes a workflow with the BDSS and collects its results,
+    without starting the GUI. Exits with the status of the BDSS."""
+    sys.exit(main(
+        workflow_file=workflow_file,
+        output_files=output_files,
+        bdss_executable=bdss_executable,
+        transport=transport,
+        debug=debug,
+    ))
+
+
+def main(workflow_file, output_files=(), bdss_executable="force_bdss",
+         transport=ZMQServer.TRANSPORT_IPC, debug=False):
+    """Executes the workflow in `workflow_file` and writes the results
+    to the `output_files`. Returns the exit status of the BDSS, or 1 if
+    the BDSS could not be executed."""
+    logging.basicConfig(level=logging.DEBUG if debug else logging.WARNING)
+
+    application = Application(plugins=load_plugins())
+    application.start()
+    try:
+        factory_registry = application.get_service(IFactoryRegistry)
+        try:
+            workflow_model = load_workflow_file(
+                factory_registry, workflow_file
+            )
+            runner = BatchRunner(
+                factory_registry=factory_registry,
+                bdss_executable_path=bdss_executable,
+                zmq_transport=transport,
+                results_writers=[
+                    create_results_writer(path) for path in output_files
+                ],
+            )
+            _, returncode = runner.run(workflow_model)
+        except Exception as e:
+            log.exception("Unable to run BDSS.")
+            click.echo(f"Unable to run BDSS: {e}", err=True)
+            return 1
+    finally:
+        application.stop()
+
+    return returncode
+
+
+def load_plugins():
+    """Returns the plugins required to execute a workflow: the core
+    plugins and the BDSS extension plugins."""
+    plugins = [CorePlugin(), FactoryRegistryPlugin()]
+
+    mgr = extension.ExtensionManager(
+        namespace='force.bdss.extensions',
+        invoke_on_load=True
+    )
+
+    def import_extensions(ext):
+        log.info("Found extension {}".format(ext.name))
+        plugins.append(ext.obj)
+
+    try:
+        mgr.map(import_extensions)
+    except NoMatches:
+        log.info("No extensions found")
+
+    return plugins
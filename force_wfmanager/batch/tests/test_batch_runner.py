@@ -0,0 +1,160 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import unittest
+from unittest import mock
+
+from testfixtures import LogCapture
+
+from force_bdss.api import (
+    DataValue,
+    MCOProgressEvent,
+    MCOStartEvent,
+    Workflow,
+)
+from force_bdss.tests.probe_classes.factory_registry import (
+    ProbeFactoryRegistry,
+)
+
+from force_wfmanager.batch.batch_runner import BatchRunner
+from force_wfmanager.batch.results_writers import BaseResultsWriter
+from force_wfmanager.model.bdss_run import (
+    RUN_FAILED,
+    RUN_FINISHED,
+    RUN_STOPPED,
+)
+from force_wfmanager.server.zmq_server import ZMQServer
+from force_wfmanager.tests.dummy_classes.dummy_events import (
+    ProbeUIRuntimeEvent
+)
+
+POPEN_PATH = "force_wfmanager.batch.batch_runner.subprocess.Popen"
+WRITE_WORKFLOW_PATH = "force_wfmanager.batch.batch_runner.write_workflow_file"
+
+
+class ProbeResultsWriter(BaseResultsWriter):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lines = []
+
+    def write_header(self, header):
+        self.lines.append(header)
+
+    def write_row(self, row, metadata):
+        self.lines.append((row, metadata))
+
+    def close(self):
+        self.lines.append("closed")
+
+
+def progress_event(x, y):
+    return MCOProgressEvent(
+        optimal_point=[DataValue(value=x)],
+        optimal_kpis=[DataValue(value=y)],
+    )
+
+
+class TestBatchRunner(unittest.TestCase):
+    def setUp(self):
+        self.registry = ProbeFactoryRegistry()
+        self.writer = ProbeResultsWriter()
+        self.runner = BatchRunner(
+            factory_registry=self.registry,
+            results_writers=[self.writer],
+            poll_interval=0.01,
+            drain_timeout=0.1,
+        )
+
+    def run_workflow(self, returncodes, events=()):
+        process = mock.Mock()
+        process.poll.side_effect = returncodes
+        for event in events:
+            self.runner._events.put(event)
+
+        with mock.patch(POPEN_PATH) as mock_popen, \
+                mock.patch(WRITE_WORKFLOW_PATH) as mock_write:
+            mock_popen.return_value = process
+            run, returncode = self.runner.run(Workflow())
+
+        self.assertEqual(
+            "force_bdss", mock_popen.call_args[0][0][0]
+        )
+        self.assertEqual(
+            mock_write.call_args[0][1], mock_popen.call_args[0][0][1]
+        )
+        self.assertEqual(ZMQServer.STATE_STOPPED, run.zmq_server.state)
+        return run, returncode
+
+    def test_ui_hooks_managers(self):
+        self.assertEqual(1, len(self.runner.ui_hooks_managers))
+
+    def test_run(self):
+        hook_manager = self.runner.ui_hooks_managers[0]
+        run, returncode = self.run_workflow(
+            [None, None, 0],
+            [
+                MCOStartEvent(parameter_names=["x"], kpi_names=["y"]),
+                ProbeUIRuntimeEvent(),
+                progress_event(1.0, 2.0),
+                progress_event(3.0, 4.0),
+            ],
+        )
+
+        self.assertEqual(0, returncode)
+        self.assertEqual(RUN_FINISHED, run.status)
+        self.assertTrue(hook_manager.before_execution_called)
+        self.assertTrue(hook_manager.after_execution_called)
+        self.assertEqual(
+            [(1.0, 2.0), (3.0, 4.0)], run.analysis_model.evaluation_steps
+        )
+        self.assertEqual(
+            [
+                ("x", "y"),
+                ((1.0, 2.0), {"some_metadata": 0}),
+                ((3.0, 4.0), {}),
+                "closed",
+            ],
+            self.writer.lines,
+        )
+
+    def test_run_failure(self):
+        run, returncode = self.run_workflow([2])
+        self.assertEqual(2, returncode)
+        self.assertEqual(RUN_FAILED, run.status)
+        self.assertEqual(["closed"], self.writer.lines)
+
+    def test_interrupt(self):
+        with mock.patch.object(
+            ZMQServer, "publish_message"
+        ) as mock_publish:
+            run, returncode = self.run_workflow(
+                [KeyboardInterrupt(), None, 1]
+            )
+        mock_publish.assert_called_with("STOP_BDSS")
+        self.assertEqual(RUN_STOPPED, run.status)
+
+    def test_hook_manager_raises(self):
+        hook_manager = self.runner.ui_hooks_managers[0]
+        hook_manager.before_execution_raises = True
+        hook_manager.after_execution_raises = True
+        with LogCapture() as capture:
+            self.run_workflow([0])
+
+        for hook in ["before_execution", "after_execution"]:
+            self.assertIn(
+                (
+                    "force_wfmanager.batch.batch_runner",
+                    "ERROR",
+                    f"Failed {hook} hook for hook manager "
+                    "ProbeUIHooksManager",
+                ),
+                capture.actual(),
+            )
+
+    def test_launch_failure(self):
+        with mock.patch(POPEN_PATH) as mock_popen, \
+                mock.patch(WRITE_WORKFLOW_PATH):
+            mock_popen.side_effect = OSError("no force_bdss")
+            with self.assertRaises(OSError):
+                self.runner.run(Workflow())
+        self.assertEqual(["closed"], self.writer.lines)
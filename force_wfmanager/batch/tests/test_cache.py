@@ -0,0 +1,64 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from click.testing import CliRunner
+
+from force_wfmanager.batch.cache import force_wfmanager_cache
+from force_wfmanager.model.analysis_model import AnalysisModel
+from force_wfmanager.model.result_cache import ResultCache
+
+
+class TestCacheCommand(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        self.cache = ResultCache(directory=self.tmp_dir)
+
+        analysis_model = AnalysisModel()
+        analysis_model.notify(("x",))
+        analysis_model.notify((1,))
+        for key in ["key1", "key2"]:
+            self.cache.put(key, analysis_model)
+
+    def invoke(self, *args):
+        return CliRunner().invoke(
+            force_wfmanager_cache, ["--cache-dir", self.tmp_dir] + list(args)
+        )
+
+    def test_list(self):
+        result = self.invoke("list")
+        self.assertEqual(0, result.exit_code, result.output)
+        lines = result.output.splitlines()
+        self.assertEqual(3, len(lines))
+        self.assertTrue(lines[0].startswith("key"))
+        self.assertIn("2 entries", lines[2])
+        self.assertIn(self.tmp_dir, lines[2])
+
+    def test_prune(self):
+        result = self.invoke("prune", "--max-size", "0")
+        self.assertEqual(0, result.exit_code, result.output)
+        self.assertIn("Removed 2 entries.", result.output)
+        self.assertEqual([], self.cache.entries())
+
+        result = self.invoke("prune")
+        self.assertNotEqual(0, result.exit_code)
+
+    def test_clear(self):
+        result = self.invoke("clear")
+        self.assertEqual(0, result.exit_code, result.output)
+        self.assertIn("Removed 2 entries.", result.output)
+        self.assertEqual([], os.listdir(self.tmp_dir))
+
+    def test_remove(self):
+        result = self.invoke("remove", "key1")
+        self.assertEqual(0, result.exit_code, result.output)
+        self.assertEqual(["key2"], [e.key for e in self.cache.entries()])
+
+        result = self.invoke("remove", "key1")
+        self.assertEqual(1, result.exit_code)
+        self.assertIn("No cached results for key1", result.output)
@@ -0,0 +1,90 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import json
+import math
+import os
+import shutil
+import tempfile
+import unittest
+
+from force_wfmanager.batch.results_writers import (
+    BinaryResultsWriter,
+    create_results_writer,
+    CSVResultsWriter,
+    JSONLinesResultsWriter,
+    JSONResultsWriter,
+    read_binary_results,
+)
+from force_wfmanager.model.analysis_model import AnalysisModel
+
+
+class TestResultsWriters(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+
+    def write(self, file_name):
+        path = os.path.join(self.tmp_dir, file_name)
+        writer = create_results_writer(path)
+        writer.write_header(("x", "y"))
+        writer.write_row((1.0, 2), {"a": 1})
+        writer.write_row((3.5, "C0"), {})
+        writer.close()
+        return writer, path
+
+    def test_csv(self):
+        writer, path = self.write("results.csv")
+        self.assertIsInstance(writer, CSVResultsWriter)
+        with open(path) as fp:
+            self.assertEqual(
+                ["x,y", "1.0,2", "3.5,C0"], fp.read().splitlines()
+            )
+
+    def test_json_lines(self):
+        writer, path = self.write("results.jsonl")
+        self.assertIsInstance(writer, JSONLinesResultsWriter)
+        with open(path) as fp:
+            lines = [json.loads(line) for line in fp]
+        self.assertEqual(
+            [
+                {"header": ["x", "y"]},
+                {"data": [1.0, 2], "metadata": {"a": 1}},
+                {"data": [3.5, "C0"], "metadata": {}},
+            ],
+            lines,
+        )
+
+    def test_json(self):
+        writer, path = self.write("results.json")
+        self.assertIsInstance(writer, JSONResultsWriter)
+        with open(path) as fp:
+            data = json.load(fp)
+
+        # Can be loaded in an AnalysisModel
+        model = AnalysisModel()
+        model.from_json(data)
+        self.assertEqual(("x", "y"), model.header)
+        self.assertEqual([(1.0, 2), (3.5, "C0")], model.evaluation_steps)
+        self.assertEqual([{"a": 1}, {}], model.step_metadata)
+
+    def test_binary(self):
+        writer, path = self.write("results.bin")
+        self.assertIsInstance(writer, BinaryResultsWriter)
+        header, rows = read_binary_results(path)
+        self.assertEqual(("x", "y"), header)
+        self.assertEqual(2, len(rows))
+        self.assertEqual((1.0, 2.0), rows[0])
+        self.assertEqual(3.5, rows[1][0])
+        self.assertTrue(math.isnan(rows[1][1]))
+
+    def test_binary_invalid_file(self):
+        path = os.path.join(self.tmp_dir, "results.bin")
+        with open(path, "wb") as fp:
+            fp.write(b"not results")
+        with self.assertRaises(IOError):
+            read_binary_results(path)
+
+    def test_unknown_extension(self):
+        with self.assertRaisesRegex(IOError, "results.txt"):
+            create_results_writer("results.txt")
@@ -0,0 +1,85 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import subprocess
+import sys
+import unittest
+from unittest import mock
+
+from click.testing import CliRunner
+
+from force_wfmanager.batch.batch_runner import BatchRunner
+from force_wfmanager.batch.run import force_wfmanager_batch, main
+from force_wfmanager.batch.results_writers import CSVResultsWriter
+from force_wfmanager.server.zmq_server import ZMQServer
+
+BATCH_RUNNER_PATH = "force_wfmanager.batch.run.BatchRunner"
+LOAD_WORKFLOW_PATH = "force_wfmanager.batch.run.load_workflow_file"
+
+#: Modules which must not be imported by the headless entry point
+GUI_MODULES = ["PyQt5", "PySide2", "pyface.qt", "chaco", "enable", "traitsui"]
+
+
+class TestRun(unittest.TestCase):
+    def test_main(self):
+        with mock.patch(BATCH_RUNNER_PATH) as mock_runner, \
+                mock.patch(LOAD_WORKFLOW_PATH) as mock_load:
+            mock_runner.return_value.run.return_value = (None, 3)
+            returncode = main(
+                workflow_file="workflow.json",
+                output_files=["results.csv"],
+                transport=ZMQServer.TRANSPORT_TCP,
+            )
+
+        self.assertEqual(3, returncode)
+        self.assertEqual("workflow.json", mock_load.call_args[0][1])
+        kwargs = mock_runner.call_args[1]
+        self.assertEqual(ZMQServer.TRANSPORT_TCP, kwargs["zmq_transport"])
+        self.assertEqual("force_bdss", kwargs["bdss_executable_path"])
+        self.assertIsInstance(
+            kwargs["results_writers"][0], CSVResultsWriter
+        )
+        mock_runner.return_value.run.assert_called_with(
+            mock_load.return_value
+        )
+
+    def test_main_failure(self):
+        with mock.patch(LOAD_WORKFLOW_PATH) as mock_load:
+            mock_load.side_effect = Exception("boom")
+            self.assertEqual(1, main(workflow_file="workflow.json"))
+
+    def test_command(self):
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            with open("workflow.json", "w") as fp:
+                fp.write("{}")
+            with mock.patch(
+                "force_wfmanager.batch.run.main", return_value=2
+            ) as mock_main:
+                result = runner.invoke(
+                    force_wfmanager_batch,
+                    ["workflow.json", "-o", "a.csv", "-o", "b.bin"],
+                )
+
+        self.assertEqual(2, result.exit_code)
+        mock_main.assert_called_with(
+            workflow_file="workflow.json",
+            output_files=("a.csv", "b.bin"),
+            bdss_executable="force_bdss",
+            transport=ZMQServer.TRANSPORT_IPC,
+            debug=False,
+        )
+
+    def test_no_gui_imports(self):
+        code = (
+            "import sys\n"
+            "import force_wfmanager.batch.run\n"
+            "print('\\n'.join(sys.modules))\n"
+        )
+        output = subprocess.check_output(
+            [sys.executable, "-c", code], universal_newlines=True
+        )
+        imported = output.splitlines()
+        for module in GUI_MODULES:
+            self.assertNotIn(module, imported)
+        self.assertIn(BatchRunner.__module__, imported)
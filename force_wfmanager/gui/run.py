@@ -6,8 +6,7 @@ import click
 
 from envisage.core_plugin import CorePlugin
 from envisage.ui.tasks.tasks_plugin import TasksPlugin
-from stevedore import extension
-from stevedore.exception import NoMatches
+from pyface.api import GUI
 from traits.api import push_exception_handler
 
 from force_bdss.core_plugins.factory_registry_plugin import (
@@ -15,7 +14,10 @@ from force_bdss.core_plugins.factory_registry_plugin import (
 )
 from force_wfmanager.version import __version__
 from force_wfmanager.wfmanager import WfManager
+from force_wfmanager.plugins.lazy_extension_plugin import discover_plugins
+from force_wfmanager.plugins.plugin_metadata import PluginMetadataCache
 from force_wfmanager.plugins.wfmanager_plugin import WfManagerPlugin
+from force_wfmanager.utils.startup_timer import startup_timer
 
 push_exception_handler(lambda *args: None, reraise_exceptions=True)
 
@@ -35,11 +37,55 @@ push_exception_handler(lambda *args: None, reraise_exceptions=True)
     '--window-size', nargs=2, type=int,
     help="Sets the initial window size"
 )
+@click.option(
+    '--warm-workers', is_flag=True, default=False,
+    help="Spreads the runs over BDSS worker processes which keep "
+         "the plugins loaded between runs"
+)
+@click.option(
+    '--result-cache/--no-result-cache', default=True,
+    help="Caches the results of the runs, and offers to load them when "
+         "an unchanged workflow is run again"
+)
+@click.option(
+    '--evaluation-store/--no-evaluation-store', default=True,
+    help="Stores the evaluations of the runs, so that the BDSS can skip "
+         "the parameter values already evaluated by previous runs"
+)
+@click.option(
+    '--telemetry-interval', type=float, default=1.0,
+    help="Seconds between two samples of the resource usage of the BDSS "
+         "processes, displayed in the Review task. 0 disables the sampling"
+)
+@click.option(
+    '--checkpoints/--no-checkpoints', default=True,
+    help="Writes checkpoints of the runs, from which an interrupted run "
+         "can be resumed"
+)
+@click.option(
+    '--verification-delay', type=float, default=0.2,
+    help="Seconds during which the changes of the workflow are gathered "
+         "before verifying it in the background. 0 verifies the workflow "
+         "on each change"
+)
+@click.option(
+    '--plugin-cache/--no-plugin-cache', default=True,
+    help="Caches the metadata of the installed plugins, so that they are "
+         "only imported when needed"
+)
+@click.option(
+    '--startup-report', type=click.Path(dir_okay=False), default=None,
+    help="Writes the duration of the phases of the startup, up to the "
+         "first paint of the window, in the given JSON file"
+)
 @click.argument(
     'workflow_file', type=click.Path(exists=True), required=False,
     default=None
 )
-def force_wfmanager(workflow_file, debug, window_size, profile):
+def force_wfmanager(workflow_file, debug, window_size, profile,
+                    warm_workers, result_cache, evaluation_store,
+                    telemetry_interval, checkpoints, verification_delay,
+                    plugin_cache, startup_report):
     """Launches the FORCE workflow manager application"""
     if not window_size:
         window_size = None
@@ -47,11 +93,24 @@ def force_wfmanager(workflow_file, debug, window_size, profile):
     main(workflow_file=workflow_file,
          debug=debug,
          window_size=window_size,
-         profile=profile)
-
-
-def main(workflow_file, debug, window_size, profile):
+         profile=profile,
+         warm_workers=warm_workers,
+         result_cache=result_cache,
+         evaluation_store=evaluation_store,
+         telemetry_interval=telemetry_interval,
+         checkpoints=checkpoints,
+         verification_delay=verification_delay,
+         plugin_cache=plugin_cache,
+         startup_report=startup_report)
+
+
+def main(workflow_file, debug, window_size, profile, warm_workers=False,
+         result_cache=True, evaluation_store=True, telemetry_interval=1.0,
+         checkpoints=True, verification_delay=0.2, plugin_cache=True,
+         startup_report=None):
     """Launches the FORCE workflow manager application"""
+    startup_timer.start()
+
     if debug is False:
         logging.basicConfig(filename="force_wfmanager.log", filemode="w")
     else:
@@ -64,26 +123,29 @@ def main(workflow_file, debug, window_size, profile):
         profiler = cProfile.Profile()
         profiler.enable()
 
-    log = logging.getLogger(__name__)
-
+    # The factory registry is timed on its first use by the
+    # WfManagerPlugin, when the Setup task is created
     plugins = [CorePlugin(), TasksPlugin(), FactoryRegistryPlugin(),
-               WfManagerPlugin(workflow_file=workflow_file)]
-
-    mgr = extension.ExtensionManager(
-        namespace='force.bdss.extensions',
-        invoke_on_load=True
-    )
-
-    def import_extensions(ext):
-        log.info("Found extension {}".format(ext.name))
-        plugins.append(ext.obj)
-
-    try:
-        mgr.map(import_extensions)
-    except NoMatches:
-        log.info("No extensions found")
+               WfManagerPlugin(workflow_file=workflow_file,
+                               warm_workers=warm_workers,
+                               result_cache=result_cache,
+                               evaluation_store=evaluation_store,
+                               telemetry_interval=telemetry_interval,
+                               checkpoints=checkpoints,
+                               verification_delay=verification_delay)]
+
+    with startup_timer.span("plugin discovery"):
+        plugins.extend(discover_plugins(
+            cache=PluginMetadataCache() if plugin_cache else None
+        ))
 
     wfmanager = WfManager(plugins=plugins, window_size=window_size)
+    wfmanager.on_trait_change(
+        lambda: GUI.invoke_later(
+            _startup_painted, startup_timer.now(), startup_report
+        ),
+        "application_initialized",
+    )
     wfmanager.run()
 
     if profile:
@@ -98,3 +160,12 @@ def main(workflow_file, debug, window_size, profile):
         with open(fname + '.pstats', 'w') as fp:
             stats = pstats.Stats(profiler, stream=fp).sort_stats('cumulative')
             stats.print_stats()
+
+
+def _startup_painted(start, startup_report):
+    """Called by the event loop once the main window is painted, i.e. at
+    the end of the startup. Writes the startup report, if requested."""
+    startup_timer.add("first paint", start)
+    startup_timer.finish()
+    if startup_report:
+        startup_timer.write_report(startup_report, version=__version__)
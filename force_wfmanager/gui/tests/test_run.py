@@ -1,10 +1,16 @@
 #  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
 #  All rights reserved.
 
+import json
+import os
+import shutil
+import tempfile
 import unittest
 from unittest import mock
 
-from force_wfmanager.gui.run import main
+from force_wfmanager.gui.run import _startup_painted, main
+from force_wfmanager.plugins.plugin_metadata import PluginMetadataCache
+from force_wfmanager.utils.startup_timer import startup_timer
 from force_wfmanager.wfmanager import WfManager
 
 
@@ -25,3 +31,44 @@ class TestRun(unittest.TestCase):
                  window_size=(1680, 1050))
 
             self.assertTrue(mock_wfmanager.called)
+
+    def test_main_plugin_cache(self):
+        with mock.patch('force_wfmanager.gui.run.WfManager') as \
+                mock_wfmanager, mock.patch(
+                    'force_wfmanager.gui.run.discover_plugins',
+                    return_value=[]) as mock_discover:
+            mock_wfmanager.side_effect = mock_wfmanager_constructor
+
+            main(workflow_file=None,
+                 debug=False,
+                 profile=False,
+                 window_size=(1680, 1050))
+            self.assertIsInstance(
+                mock_discover.call_args[1]["cache"], PluginMetadataCache
+            )
+
+            main(workflow_file=None,
+                 debug=False,
+                 profile=False,
+                 window_size=(1680, 1050),
+                 plugin_cache=False)
+            mock_discover.assert_called_with(cache=None)
+
+    def test_startup_report(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        report_path = os.path.join(tmp_dir, "startup.json")
+
+        startup_timer.start()
+        with startup_timer.span("plugin discovery"):
+            pass
+        _startup_painted(startup_timer.now(), report_path)
+
+        self.assertTrue(startup_timer.finished)
+        with open(report_path) as fp:
+            report = json.load(fp)
+        self.assertIn("version", report)
+        self.assertEqual(
+            ["plugin discovery", "first paint"],
+            [span["name"] for span in report["spans"]],
+        )
@@ -0,0 +1,58 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import subprocess
+import sys
+import unittest
+
+#: Modules which are slow to import, and only needed to review the results
+PLOTTING_MODULES = ["chaco", "enable", "scipy"]
+
+
+def imported_modules(statements):
+    """Returns the names of the modules imported by `statements`, executed
+    in a new interpreter."""
+    script = "\n".join(
+        statements + ["import sys", "print('\\n'.join(sys.modules))"]
+    )
+    output = subprocess.check_output(
+        [sys.executable, "-c", script], universal_newlines=True
+    )
+    return set(output.split())
+
+
+class TestStartupImports(unittest.TestCase):
+    def test_startup(self):
+        modules = imported_modules(["import force_wfmanager.gui.run"])
+        self.assertIn("force_wfmanager.wfmanager_review_task", modules)
+        for module_name in PLOTTING_MODULES:
+            self.assertNotIn(module_name, modules)
+
+    def test_review_task_creation(self):
+        modules = imported_modules([
+            "from force_wfmanager.model.analysis_model import AnalysisModel",
+            "from force_wfmanager.wfmanager_review_task import "
+            "WfManagerReviewTask",
+            "task = WfManagerReviewTask()",
+            "pane = task.create_central_pane()",
+            "task.analysis_model = AnalysisModel()",
+        ])
+        for module_name in PLOTTING_MODULES:
+            self.assertNotIn(module_name, modules)
+
+    def test_data_view_shown(self):
+        modules = imported_modules([
+            "from force_wfmanager.model.analysis_model import AnalysisModel",
+            "from force_wfmanager.ui.review.data_view_pane import "
+            "DataViewPane",
+            "pane = DataViewPane(analysis_model=AnalysisModel())",
+            "pane.show_data_view()",
+        ])
+        self.assertIn("chaco", modules)
+
+    def test_lazy_exports(self):
+        modules = imported_modules(["import force_wfmanager.ui"])
+        self.assertNotIn("chaco", modules)
+
+        modules = imported_modules(["from force_wfmanager.ui import BasePlot"])
+        self.assertIn("chaco", modules)
@@ -0,0 +1,55 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+""" Checkpoints of the runs, from which an interrupted run can be resumed.
+A checkpoint is a project file, holding the workflow executed by the run
+and its results so far, so that it can also be opened in the Review task.
+"""
+
+import os
+import tempfile
+import time
+
+from force_wfmanager.io.project_io import write_project_file
+from force_wfmanager.model.result_cache import default_cache_directory
+
+
+def default_checkpoint_directory():
+    """ Returns the default directory of the checkpoints, next to the
+    result cache."""
+    return os.path.join(
+        os.path.dirname(default_cache_directory()), "checkpoints"
+    )
+
+
+def checkpoint_file_name(run):
+    """ Returns the name of a new checkpoint file of `run`, starting with
+    the date and time, so that the checkpoints are sorted by age."""
+    timestamp = time.strftime("%Y%m%d-%H%M%S")
+    return f"{timestamp}-run-{run.identifier}.json"
+
+
+def write_checkpoint_file(workflow_model, analysis_model, file_path):
+    """ Writes a checkpoint as a project file. The previous checkpoint in
+    `file_path` is replaced atomically, so that it is never lost if the
+    machine stops while writing.
+
+    Parameters
+    ----------
+    workflow_model: Workflow
+        The workflow executed by the run
+    analysis_model: AnalysisModel
+        The results of the run
+    file_path: str
+        Path of the checkpoint file
+    """
+    directory = os.path.dirname(os.path.abspath(file_path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=directory)
+    os.close(fd)
+    try:
+        write_project_file(workflow_model, analysis_model, tmp_path)
+        os.replace(tmp_path, file_path)
+    except Exception:
+        os.remove(tmp_path)
+        raise
@@ -0,0 +1,47 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import json
+
+from force_wfmanager.model.parameter_sweep import ParameterSweep, SweepAxis
+
+
+def load_sweep_file(workflow_model, factory_registry, file_path):
+    """ Loads a sweep specification from a JSON file, of the form::
+
+        {
+            "variant_column": "variant",
+            "axes": [
+                {"path": "mco_model.parameters[0].lower_bound",
+                 "values": [0.0, 0.5]},
+                {"path": "mco_model.kpis[1].target_value",
+                 "grid": {"start": 0.0, "stop": 1.0, "num": 3},
+                 "name": "target"}
+            ]
+        }
+
+    Parameters
+    ----------
+    workflow_model: Workflow
+        The workflow to create the variants from
+    factory_registry:
+        Workflow factory registry
+    file_path: str
+        The file_path pointing to the sweep specification
+
+    Returns
+    -------
+    sweep: ParameterSweep
+    """
+    with open(file_path, "r") as fp:
+        sweep_json = json.load(fp)
+
+    sweep = ParameterSweep(
+        workflow_model=workflow_model,
+        factory_registry=factory_registry,
+        axes=[SweepAxis.from_json(data) for data in sweep_json["axes"]],
+    )
+    if "variant_column" in sweep_json:
+        sweep.variant_column = sweep_json["variant_column"]
+
+    return sweep
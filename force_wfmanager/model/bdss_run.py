@@ -0,0 +1,378 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import logging
+import os
+import time
+
+from traits.api import (
+    Bool,
+    Dict,
+    Enum,
+    Float,
+    HasStrictTraits,
+    Instance,
+    Int,
+    List,
+    Property,
+    Str,
+    Tuple,
+)
+
+from force_bdss.api import (
+    IFactoryRegistry,
+    MCOProgressEvent,
+    MCORuntimeEvent,
+    MCOStartEvent,
+    Workflow,
+)
+
+from force_wfmanager.io.checkpoint_io import write_checkpoint_file
+from force_wfmanager.model.analysis_model import AnalysisModel
+from force_wfmanager.model.evaluation_store import (
+    CACHED_EVALUATION,
+    EVALUATION_ORIGIN_KEY,
+    EvaluationStore,
+    FRESH_EVALUATION,
+    parameter_key,
+)
+from force_wfmanager.model.resource_telemetry import ResourceTelemetry
+from force_wfmanager.server.zmq_server import ZMQServer
+
+log = logging.getLogger(__name__)
+
+#: Run status values.
+#: Queued: waiting for enough cores to be available.
+RUN_QUEUED = "Queued"
+
+#: Running: the BDSS executable has been launched.
+RUN_RUNNING = "Running"
+
+#: Finished: the BDSS executable completed successfully.
+RUN_FINISHED = "Finished"
+
+#: Failed: the run could not be started, or the BDSS executable failed.
+RUN_FAILED = "Failed"
+
+#: Stopped: the run was stopped (or cancelled) by the user.
+RUN_STOPPED = "Stopped"
+
+
+class BDSSRun(HasStrictTraits):
+    """A single execution of a workflow by the BDSS. Each run holds
+    a snapshot of the workflow it executes, its own results and the ZMQ
+    server that receives the events of the BDSS process.
+    """
+
+    #: Sequential identifier of the run, assigned by the scheduler
+    identifier = Int()
+
+    #: Human readable name of the run
+    name = Str()
+
+    #: Snapshot of the workflow executed by this run. Changes to the
+    #: workflow in the Setup task do not affect this copy.
+    workflow_model = Instance(Workflow)
+
+    #: Registry of the available factories
+    factory_registry = Instance(IFactoryRegistry)
+
+    #: The results of this run
+    analysis_model = Instance(AnalysisModel, ())
+
+    #: The resource usage of the BDSS processes of this run over time,
+    #: if sampled
+    telemetry = Instance(ResourceTelemetry, ())
+
+    #: ZeroMQ Server receiving the events of the BDSS process of this run.
+    #: None until the run is launched.
+    zmq_server = Instance(ZMQServer)
+
+    #: Number of cores reserved by this run in the scheduler core budget
+    cores = Int(1)
+
+    #: Current status of the run
+    status = Enum(
+        RUN_QUEUED, RUN_RUNNING, RUN_FINISHED, RUN_FAILED, RUN_STOPPED
+    )
+
+    #: Whether the run has been paused by the user
+    paused = Bool(False)
+
+    #: Whether the user requested the run to stop
+    stop_requested = Bool(False)
+
+    #: Key of the results of this run in the result cache, if enabled
+    cache_key = Str()
+
+    #: Store of the evaluations of the workflows with the same structure.
+    #: The rows of this run are added to it, and the BDSS can look up the
+    #: known evaluations before evaluating. None if disabled.
+    evaluation_store = Instance(EvaluationStore)
+
+    #: Key of the structure of the workflow in the evaluation store
+    workflow_key = Str()
+
+    #: Names of the MCO parameter columns, sent by the BDSS at start
+    parameter_names = List(Str)
+
+    #: The parameter vectors whose evaluations were served from the
+    #: evaluation store, by :func:`parameter_key`
+    _served_lookups = Instance(set, ())
+
+    #: Path of the checkpoint file of this run, rewritten periodically
+    #: while it executes. Empty if checkpoints are disabled.
+    checkpoint_path = Str()
+
+    #: Minimum number of seconds between two checkpoints
+    checkpoint_interval = Float(30.0)
+
+    #: Time of the last checkpoint, or of the start of the MCO
+    _last_checkpoint = Float()
+
+    #: Header and rows of the interrupted run continued by this run
+    _resumed_header = Tuple()
+    _resumed_steps = List(Tuple)
+
+    #: The values of the evaluations of the interrupted run, by
+    #: :func:`parameter_key`. Served to the lookups of the BDSS, and not
+    #: added to the results again.
+    _resumed_evaluations = Dict(Str, Dict)
+
+    #: Number of evaluations received so far
+    progress = Property(
+        Int, depends_on="analysis_model.evaluation_steps[]"
+    )
+
+    #: Whether the BDSS is executing this run
+    is_running = Property(Bool, depends_on="status")
+
+    #: Short description of the run for the UI
+    label = Property(Str, depends_on="name,status,progress")
+
+    def _get_progress(self):
+        return len(self.analysis_model.evaluation_steps)
+
+    def _get_is_running(self):
+        return self.status == RUN_RUNNING
+
+    def _get_label(self):
+        return f"{self.name} ({self.status}, {self.progress} evaluations)"
+
+    def notify_event(self, event):
+        """Adds the data of an MCO event received from the BDSS to the
+        :attr:`analysis_model`. Must be invoked by the main thread."""
+        if isinstance(event, MCOStartEvent):
+            self.parameter_names = list(event.parameter_names)
+            self._last_checkpoint = time.monotonic()
+            if self._continue_resumed_run(event.serialize()):
+                return
+            self.analysis_model.clear()
+
+        if isinstance(
+            event, (MCOStartEvent, MCOProgressEvent, MCORuntimeEvent)
+        ):
+            event_data = event.serialize()
+            parameter_values = None
+            if isinstance(event, MCOProgressEvent):
+                if self._is_resumed_evaluation(event_data):
+                    return
+                parameter_values = self._tag_evaluation(event_data)
+
+            self.analysis_model.notify(
+                event_data,
+                metadata=isinstance(event, MCORuntimeEvent)
+            )
+
+            if parameter_values is not None:
+                self._store_evaluation(parameter_values)
+
+            if isinstance(event, MCOProgressEvent):
+                self._checkpoint_if_due()
+
+    def resume(self, analysis_model_data):
+        """Prepares this run to continue an interrupted run, from the
+        results saved in its checkpoint. The results are kept in the
+        :attr:`analysis_model`, and fed back to the BDSS, as long as its
+        MCO reports the same columns.
+
+        Parameters
+        ----------
+        analysis_model_data: dict
+            The results of the interrupted run, as saved by
+            :meth:`AnalysisModel.to_json`
+        """
+        self.analysis_model.from_json(analysis_model_data)
+        self._resumed_header = self.analysis_model.header
+        self._resumed_steps = list(self.analysis_model.evaluation_steps)
+
+    def evaluation_history(self):
+        """Returns the evaluations of the interrupted run continued by
+        this run, as a JSON serializable dict with the "header", the
+        "parameter_names" and the "rows", or None if the run was not
+        resumed. Invoked by the ZMQ server thread, when the MCO of the
+        BDSS asks for them to warm-start."""
+        if not self._resumed_steps:
+            return None
+        return {
+            "header": list(self._resumed_header),
+            "parameter_names": list(self.parameter_names),
+            "rows": [list(step) for step in self._resumed_steps],
+        }
+
+    def write_checkpoint(self):
+        """Writes the workflow and the results of this run to its
+        checkpoint file, if enabled."""
+        if not self.checkpoint_path:
+            return
+        self._last_checkpoint = time.monotonic()
+        try:
+            write_checkpoint_file(
+                self.workflow_model, self.analysis_model, self.checkpoint_path
+            )
+        except Exception:
+            log.exception(
+                f"Unable to write the checkpoint {self.checkpoint_path}"
+            )
+
+    def remove_checkpoint(self):
+        """Removes the checkpoint file of this run, once it is not needed
+        to resume it."""
+        if not self.checkpoint_path:
+            return
+        try:
+            os.remove(self.checkpoint_path)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            log.exception(
+                f"Unable to remove the checkpoint {self.checkpoint_path}"
+            )
+
+    def _checkpoint_if_due(self):
+        if (self.checkpoint_path and time.monotonic() - self._last_checkpoint
+                >= self.checkpoint_interval):
+            self.write_checkpoint()
+
+    def _continue_resumed_run(self, header):
+        """Indexes the evaluations of the resumed run by parameter values
+        when its BDSS starts. Returns whether its results are continued,
+        i.e. the MCO reports the same columns."""
+        if not self._resumed_steps:
+            return False
+
+        if tuple(header) != self._resumed_header:
+            log.warning(
+                "The columns of the results changed since the run was "
+                "interrupted. Its results are discarded."
+            )
+            self._resumed_steps = []
+            return False
+
+        self._resumed_evaluations = {}
+        for step in self._resumed_steps:
+            parameter_values = self._parameter_values(step)
+            if parameter_values is not None:
+                self._resumed_evaluations[parameter_key(parameter_values)] = {
+                    name: value
+                    for name, value in zip(self._resumed_header, step)
+                    if name not in self.parameter_names
+                }
+        return True
+
+    def _is_resumed_evaluation(self, event_data):
+        """Whether `event_data` reports an evaluation of the resumed run,
+        already in the results."""
+        if not self._resumed_evaluations:
+            return False
+        parameter_values = self._parameter_values(event_data)
+        return (
+            parameter_values is not None
+            and parameter_key(parameter_values) in self._resumed_evaluations
+        )
+
+    def _parameter_values(self, event_data):
+        """Returns the values of the MCO parameters in a row of the
+        results, or None if they can't be found."""
+        header = self.analysis_model.header
+        try:
+            parameter_values = [
+                event_data[header.index(name)]
+                for name in self.parameter_names
+            ]
+            parameter_key(parameter_values)
+        except (IndexError, KeyError, TypeError, ValueError):
+            return None
+        return parameter_values
+
+    def lookup_evaluation(self, parameter_values):
+        """Returns the values of a known evaluation of the MCO
+        `parameter_values` by column name, or None. Invoked by the ZMQ
+        server thread, when the BDSS asks before evaluating."""
+        key = parameter_key(parameter_values)
+        values = self._resumed_evaluations.get(key)
+        if values is not None:
+            return values
+
+        if self.evaluation_store is None or not self.workflow_key:
+            return None
+
+        values = self.evaluation_store.lookup(
+            self.workflow_key, parameter_values
+        )
+        if values is not None:
+            self._served_lookups.add(key)
+        return values
+
+    def _tag_evaluation(self, event_data):
+        """Tags the row completed by `event_data` as a fresh or cached
+        evaluation in its metadata. Returns the parameter values of a
+        fresh evaluation, to be stored, or None."""
+        if self.evaluation_store is None or not self.workflow_key:
+            return None
+
+        parameter_values = self._parameter_values(event_data)
+        if parameter_values is None:
+            return None
+        key = parameter_key(parameter_values)
+
+        if key in self._served_lookups:
+            origin = CACHED_EVALUATION
+        else:
+            origin = FRESH_EVALUATION
+        self.analysis_model.notify(
+            {EVALUATION_ORIGIN_KEY: origin}, metadata=True
+        )
+        return parameter_values if origin == FRESH_EVALUATION else None
+
+    def _store_evaluation(self, parameter_values):
+        """Adds the last completed row to the evaluation store."""
+        row = self.analysis_model.evaluation_steps[-1]
+        values = {
+            name: value
+            for name, value in zip(self.analysis_model.header, row)
+            if name not in self.parameter_names
+        }
+        try:
+            self.evaluation_store.add(
+                self.workflow_key, parameter_values, values
+            )
+        except Exception:
+            log.exception("Unable to add the evaluation to the store.")
+
+    def stop(self):
+        """Asks the BDSS process of this run to stop."""
+        self.stop_requested = True
+        self.paused = False
+        if self.zmq_server is not None:
+            self.zmq_server.publish_message("STOP_BDSS")
+
+    def pause(self):
+        """Pauses the MCO of this run, or resumes it if already paused."""
+        if self.paused:
+            message = "RESUME_BDSS"
+        else:
+            message = "PAUSE_BDSS"
+        if self.zmq_server is not None:
+            self.zmq_server.publish_message(message)
+        self.paused = not self.paused
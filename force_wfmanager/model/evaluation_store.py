@@ -0,0 +1,167 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+
+from traits.api import Any, HasStrictTraits, Instance, Str
+
+from force_bdss.api import WorkflowWriter
+
+from force_wfmanager.model.result_cache import default_cache_directory
+
+log = logging.getLogger(__name__)
+
+#: Metadata key tagging the origin of each row of a run
+EVALUATION_ORIGIN_KEY = "evaluation"
+
+#: Origin of the rows evaluated by the BDSS
+FRESH_EVALUATION = "fresh"
+
+#: Origin of the rows whose evaluation was found in the store
+CACHED_EVALUATION = "cached"
+
+
+def default_store_path():
+    """ Returns the default path of the evaluation store database, next
+    to the result cache."""
+    return os.path.join(
+        os.path.dirname(default_cache_directory()), "evaluations.sqlite"
+    )
+
+
+def workflow_structure_key(workflow_model, plugin_versions):
+    """ Returns the key of the evaluations of `workflow_model` in the
+    store: a SHA-256 hash of its execution layers, of the names of its
+    MCO parameters and KPIs and of the plugin versions. The settings of
+    the MCO and the ranges of the parameters are left out, as they do not
+    change the result of evaluating a given parameter vector.
+
+    Parameters
+    ----------
+    workflow_model: Workflow
+        The workflow executed by the BDSS
+    plugin_versions: dict
+        The version of each plugin, by plugin id
+    """
+    workflow_data = WorkflowWriter().get_workflow_data(workflow_model)
+    mco_model = workflow_model.mco_model
+    data = {
+        "execution_layers": workflow_data["workflow"]["execution_layers"],
+        "parameters": [parameter.name for parameter in mco_model.parameters],
+        "kpis": [kpi.name for kpi in mco_model.kpis],
+        "plugins": plugin_versions,
+    }
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def parameter_key(parameter_values):
+    """ Returns the canonical representation of a parameter vector, used
+    to identify its evaluation in the store."""
+    return json.dumps(list(parameter_values), separators=(",", ":"))
+
+
+class EvaluationStore(HasStrictTraits):
+    """ Persistent store of the evaluations of the MCO parameter vectors,
+    shared by all the runs of workflows with the same structure. Each
+    evaluation is stored as the values of the non-parameter columns of
+    its row, by column name.
+
+    The methods are thread safe: the store is fed by the main thread and
+    queried by the ZMQ server threads.
+    """
+
+    #: Path of the SQLite database of the store
+    path = Str()
+
+    #: Connection to the database, opened on first use
+    _connection = Any()
+
+    #: Serialises the accesses to the connection
+    _lock = Instance(threading.Lock, ())
+
+    def _path_default(self):
+        return default_store_path()
+
+    def add(self, workflow_key, parameter_values, values):
+        """ Stores the evaluation of `parameter_values`, replacing any
+        previous one.
+
+        Parameters
+        ----------
+        workflow_key: str
+            The :func:`workflow_structure_key` of the evaluated workflow
+        parameter_values: list
+            The values of the MCO parameters
+        values: dict
+            The values of the other columns, by column name
+        """
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO evaluations VALUES (?, ?, ?)",
+                    (workflow_key, parameter_key(parameter_values),
+                     json.dumps(values)),
+                )
+
+    def lookup(self, workflow_key, parameter_values):
+        """ Returns the stored values of the evaluation of
+        `parameter_values`, by column name, or None if unknown."""
+        with self._lock:
+            row = self._get_connection().execute(
+                "SELECT data FROM evaluations "
+                "WHERE workflow_key = ? AND parameters = ?",
+                (workflow_key, parameter_key(parameter_values)),
+            ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def count(self, workflow_key=None):
+        """ Returns the number of evaluations stored, for `workflow_key`
+        or in total."""
+        query = "SELECT COUNT(*) FROM evaluations"
+        args = ()
+        if workflow_key is not None:
+            query += " WHERE workflow_key = ?"
+            args = (workflow_key,)
+        with self._lock:
+            return self._get_connection().execute(query, args).fetchone()[0]
+
+    def clear(self, workflow_key=None):
+        """ Removes the evaluations of `workflow_key`, or all of them."""
+        query = "DELETE FROM evaluations"
+        args = ()
+        if workflow_key is not None:
+            query += " WHERE workflow_key = ?"
+            args = (workflow_key,)
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                connection.execute(query, args)
+
+    def close(self):
+        """ Closes the connection to the database."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _get_connection(self):
+        if self._connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS evaluations ("
+                    "workflow_key TEXT, parameters TEXT, data TEXT, "
+                    "PRIMARY KEY (workflow_key, parameters))"
+                )
+            self._connection = connection
+        return self._connection
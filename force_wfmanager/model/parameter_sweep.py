@@ -0,0 +1,177 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import itertools
+import re
+
+from traits.api import (
+    Any,
+    HasStrictTraits,
+    Instance,
+    List,
+    Str,
+)
+
+from force_bdss.api import IFactoryRegistry, Workflow
+
+from force_wfmanager.model.analysis_model import AnalysisModel
+
+#: A single element of an attribute path, e.g. ``parameters[0]``
+_PATH_ELEMENT = re.compile(r"^(?P<name>[A-Za-z_]\w*)(\[(?P<index>\d+)\])?$")
+
+
+class SweepAxis(HasStrictTraits):
+    """ The values taken by a single attribute of the workflow during
+    a parameter sweep.
+    """
+
+    #: Dotted path of the attribute, relative to the workflow, e.g.
+    #: ``mco_model.parameters[0].lower_bound`` or
+    #: ``execution_layers[0].data_sources[1].cutoff``
+    path = Str()
+
+    #: The values taken by the attribute
+    values = List(Any)
+
+    #: Name of the attribute in the variant labels. Defaults to the last
+    #: element of the :attr:`path`.
+    name = Str()
+
+    def _name_default(self):
+        return self.path.split(".")[-1]
+
+    @classmethod
+    def from_json(cls, data):
+        """ Creates an axis from a dictionary containing the ``path`` and
+        either a list of ``values``, or a ``grid`` with the ``start``,
+        ``stop`` and ``num`` of evenly spaced values.
+        """
+        if "values" in data:
+            values = list(data["values"])
+        elif "grid" in data:
+            values = linear_grid(**data["grid"])
+        else:
+            raise KeyError(
+                f"The sweep of {data.get('path')} must define either "
+                "'values' or a 'grid'."
+            )
+
+        axis = cls(path=data["path"], values=values)
+        if "name" in data:
+            axis.name = data["name"]
+        return axis
+
+
+class ParameterSweep(HasStrictTraits):
+    """ Generates variants of a workflow, one for each combination
+    of the values of the sweep axes, and merges their results.
+    """
+
+    #: The workflow to create the variants from. It is never modified.
+    workflow_model = Instance(Workflow)
+
+    #: Registry of the available factories, used to copy the workflow
+    factory_registry = Instance(IFactoryRegistry)
+
+    #: The swept attributes of the workflow
+    axes = List(Instance(SweepAxis))
+
+    #: Name of the column identifying the variant in the merged results
+    variant_column = Str("variant")
+
+    def create_variants(self):
+        """ Returns a list of (label, workflow) tuples, one for each
+        combination of the axes values. Each workflow is a copy of
+        :attr:`workflow_model`.
+        """
+        variants = []
+        value_grid = itertools.product(*(axis.values for axis in self.axes))
+        for values in value_grid:
+            workflow = Workflow.from_json(
+                self.factory_registry, self.workflow_model.__getstate__()
+            )
+            for axis, value in zip(self.axes, values):
+                set_attribute_path(workflow, axis.path, value)
+            label = ", ".join(
+                f"{axis.name}={value}"
+                for axis, value in zip(self.axes, values)
+            )
+            variants.append((label, workflow))
+        return variants
+
+    def merge_results(self, labelled_models):
+        """ Merges the results of the variants into a single
+        :class:`AnalysisModel`, with an extra column containing the label
+        of the variant of each evaluation step.
+
+        Parameters
+        ----------
+        labelled_models: list of (str, AnalysisModel)
+            The label of each variant and its results. Variants without
+            results are skipped.
+
+        Returns
+        -------
+        merged: AnalysisModel
+        """
+        merged = AnalysisModel()
+        header = None
+        for label, model in labelled_models:
+            if not model.header:
+                continue
+            if header is None:
+                header = tuple(model.header)
+                merged.notify((self.variant_column,) + header)
+            elif tuple(model.header) != header:
+                raise ValueError(
+                    f"The results of variant {label} have columns "
+                    f"{model.header}, which differ from {header}."
+                )
+            for step, metadata in zip(
+                model.evaluation_steps, model.step_metadata
+            ):
+                merged.notify(dict(metadata), metadata=True)
+                merged.notify((label,) + tuple(step))
+        return merged
+
+
+def linear_grid(start, stop, num):
+    """ Returns `num` evenly spaced values from `start` to `stop`
+    (both included)."""
+    if num < 1:
+        raise ValueError("A grid must contain at least one value.")
+    if num == 1:
+        return [start]
+    step = (stop - start) / (num - 1)
+    return [start + index * step for index in range(num)]
+
+
+def _split_path(path):
+    """ Returns the (name, index) elements of an attribute path. The
+    index is None for plain attributes."""
+    elements = []
+    for element in path.split("."):
+        match = _PATH_ELEMENT.match(element)
+        if match is None:
+            raise ValueError(f"Invalid attribute path {path}.")
+        index = match.group("index")
+        elements.append(
+            (match.group("name"), None if index is None else int(index))
+        )
+    return elements
+
+
+def set_attribute_path(obj, path, value):
+    """ Sets the attribute of `obj` with the dotted `path` (e.g.
+    ``mco_model.parameters[0].lower_bound``) to `value`."""
+    elements = _split_path(path)
+    for name, index in elements[:-1]:
+        obj = getattr(obj, name)
+        if index is not None:
+            obj = obj[index]
+
+    name, index = elements[-1]
+    if index is None:
+        setattr(obj, name, value)
+    else:
+        getattr(obj, name)[index] = value
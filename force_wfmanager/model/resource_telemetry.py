@@ -0,0 +1,47 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+from traits.api import HasStrictTraits, List, Tuple
+
+#: Name of each value of a resource usage sample, with its unit
+TELEMETRY_HEADER = (
+    "time (s)",
+    "CPU (%)",
+    "RSS (MB)",
+    "threads",
+    "read (MB/s)",
+    "write (MB/s)",
+)
+
+
+class ResourceTelemetry(HasStrictTraits):
+    """ Time series of the resource usage of the BDSS process tree of a
+    run. Each sample holds the values named in :attr:`header`: the time
+    since the start of the run, the CPU usage summed over all the cores
+    (so that 100% is one busy core), the resident memory, the number of
+    threads and the disk I/O rates.
+    """
+
+    #: Names of the values of each sample
+    header = Tuple(TELEMETRY_HEADER)
+
+    #: The samples, in chronological order
+    samples = List(Tuple())
+
+    def append(self, sample):
+        """ Adds a sample, with one value per :attr:`header` entry."""
+        if len(sample) != len(self.header):
+            raise ValueError(
+                f"A resource sample must have {len(self.header)} values, "
+                f"got {len(sample)}."
+            )
+        self.samples.append(tuple(sample))
+
+    def column(self, label):
+        """ Returns the values of the column `label`, as a list."""
+        index = self.header.index(label)
+        return [sample[index] for sample in self.samples]
+
+    def clear(self):
+        """ Removes all the samples."""
+        self.samples = []
@@ -0,0 +1,211 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+
+from traits.api import HasStrictTraits, Int, Property, Str
+
+from force_bdss.api import WorkflowWriter
+
+from force_wfmanager.model.analysis_model import AnalysisModel
+
+log = logging.getLogger(__name__)
+
+#: Extension of the cache entry files
+CACHE_ENTRY_EXTENSION = ".json.gz"
+
+#: Default maximum size of the cache, in bytes
+DEFAULT_MAX_SIZE = 256 * 1024 ** 2
+
+
+def default_cache_directory():
+    """ Returns the default directory of the result cache, in the user
+    cache directory."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "force_wfmanager", "results")
+
+
+def workflow_cache_key(workflow_model, plugin_versions):
+    """ Returns the key of the results of `workflow_model` in the cache:
+    a SHA-256 hash of the canonical serialisation of the workflow and of
+    the versions of the plugins executing it.
+
+    Parameters
+    ----------
+    workflow_model: Workflow
+        The workflow executed by the BDSS
+    plugin_versions: dict
+        The version of each plugin, by plugin id
+    """
+    data = {
+        "workflow": WorkflowWriter().get_workflow_data(workflow_model),
+        "plugins": plugin_versions,
+    }
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class CacheEntry(HasStrictTraits):
+    """ A stored set of results in the :class:`ResultCache`"""
+
+    #: Key of the results
+    key = Str()
+
+    #: Size of the entry file, in bytes
+    size = Int()
+
+    #: Time of the last access to the entry, in seconds since the epoch
+    last_used = Int()
+
+
+class ResultCache(HasStrictTraits):
+    """ Local cache of the results of finished runs, keyed by
+    :func:`workflow_cache_key`. Each entry is a gzipped JSON file of the
+    :class:`AnalysisModel` state. The least recently used entries are
+    evicted when the total size exceeds :attr:`max_size`.
+    """
+
+    #: Directory of the entry files
+    directory = Str()
+
+    #: Maximum total size of the entries, in bytes
+    max_size = Int(DEFAULT_MAX_SIZE)
+
+    #: Total size of the entries, in bytes
+    total_size = Property(Int)
+
+    def _directory_default(self):
+        return default_cache_directory()
+
+    def _get_total_size(self):
+        return sum(entry.size for entry in self.entries())
+
+    def entries(self):
+        """ Returns the entries of the cache, from the least to the most
+        recently used."""
+        try:
+            file_names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+
+        entries = []
+        for file_name in file_names:
+            if not file_name.endswith(CACHE_ENTRY_EXTENSION):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, file_name))
+            except FileNotFoundError:
+                continue
+            entries.append(CacheEntry(
+                key=file_name[:-len(CACHE_ENTRY_EXTENSION)],
+                size=stat.st_size,
+                last_used=int(stat.st_mtime),
+            ))
+        entries.sort(key=lambda entry: entry.last_used)
+        return entries
+
+    def contains(self, key):
+        """ Whether results are stored for `key`"""
+        return os.path.exists(self._path(key))
+
+    def get(self, key):
+        """ Returns a new AnalysisModel with the results stored for `key`,
+        or None if there are none. Marks the entry as recently used."""
+        path = self._path(key)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as fp:
+                data = json.load(fp)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            log.exception(f"Corrupted result cache entry {path}, removing it")
+            self.remove(key)
+            return None
+
+        analysis_model = AnalysisModel()
+        analysis_model.from_json(data["results"])
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return analysis_model
+
+    def put(self, key, analysis_model):
+        """ Stores the results of `analysis_model` under `key`, then evicts
+        the least recently used entries if the cache is too large."""
+        os.makedirs(self.directory, exist_ok=True)
+        data = {
+            "key": key,
+            "created": time.time(),
+            "results": analysis_model.__getstate__(),
+        }
+        # Write to a temporary file first, so that a concurrent reader
+        # never sees a partial entry
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.directory, suffix=".tmp"
+        )
+        os.close(fd)
+        try:
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as fp:
+                json.dump(data, fp, separators=(",", ":"))
+            os.replace(tmp_path, self._path(key))
+        except Exception:
+            os.remove(tmp_path)
+            raise
+
+        self.prune(protect=key)
+
+    def remove(self, key):
+        """ Removes the entry of `key`. Returns whether it existed."""
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            return False
+        return True
+
+    def clear(self):
+        """ Removes all the entries. Returns the removed keys."""
+        return self.prune(max_size=0)
+
+    def prune(self, max_size=None, protect=None):
+        """ Removes the least recently used entries until their total size
+        is at most `max_size`, :attr:`max_size` by default.
+
+        Parameters
+        ----------
+        max_size: int, optional
+            Maximum total size of the remaining entries, in bytes
+        protect: str, optional
+            Key of an entry which is never removed
+
+        Returns
+        -------
+        removed: list of str
+            The keys of the removed entries
+        """
+        if max_size is None:
+            max_size = self.max_size
+
+        entries = self.entries()
+        total_size = sum(entry.size for entry in entries)
+        removed = []
+        for entry in entries:
+            if total_size <= max_size:
+                break
+            if entry.key == protect:
+                continue
+            if self.remove(entry.key):
+                removed.append(entry.key)
+            total_size -= entry.size
+        return removed
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + CACHE_ENTRY_EXTENSION)
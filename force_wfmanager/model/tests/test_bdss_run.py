@@ -0,0 +1,260 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import json
+import os
+import shutil
+import tempfile
+from unittest import mock, TestCase
+
+from testfixtures import LogCapture
+from traits.testing.api import UnittestTools
+
+from force_bdss.api import DataValue, MCOProgressEvent, MCOStartEvent
+
+from force_wfmanager.model.evaluation_store import EvaluationStore
+from force_wfmanager.model.bdss_run import (
+    BDSSRun,
+    RUN_FINISHED,
+    RUN_QUEUED,
+    RUN_RUNNING,
+)
+from force_wfmanager.server.zmq_server import ZMQServer
+from force_wfmanager.tests.dummy_classes.dummy_events import (
+    ProbeUIRuntimeEvent
+)
+
+CHECKPOINT_WRITER_PATH = "force_wfmanager.model.bdss_run.write_checkpoint_file"
+WORKFLOW_DATA_PATH = (
+    "force_wfmanager.io.project_io.WorkflowWriter.get_workflow_data"
+)
+
+
+class TestBDSSRun(TestCase, UnittestTools):
+    def setUp(self):
+        self.run = BDSSRun(name="Run 1")
+
+    def test_init(self):
+        self.assertEqual(RUN_QUEUED, self.run.status)
+        self.assertEqual(0, self.run.progress)
+        self.assertFalse(self.run.is_running)
+        self.assertFalse(self.run.paused)
+        self.assertEqual("Run 1 (Queued, 0 evaluations)", self.run.label)
+
+    def test_notify_event(self):
+        self.run.analysis_model.header = ("a",)
+        self.run.analysis_model.notify((1.0,))
+
+        self.run.notify_event(
+            MCOStartEvent(parameter_names=["x"], kpi_names=["y"])
+        )
+        self.assertEqual(("x", "y"), self.run.analysis_model.header)
+        self.assertEqual(0, self.run.progress)
+
+        self.run.notify_event(ProbeUIRuntimeEvent())
+        with self.assertTraitChanges(self.run, "label"):
+            self.run.notify_event(
+                MCOProgressEvent(
+                    optimal_point=[DataValue(value=1.0)],
+                    optimal_kpis=[DataValue(value=2.0)],
+                )
+            )
+        self.assertEqual(1, self.run.progress)
+        self.assertEqual(
+            [(1.0, 2.0)], self.run.analysis_model.evaluation_steps
+        )
+        self.assertEqual(
+            [{'some_metadata': 0}], self.run.analysis_model.step_metadata
+        )
+
+        self.run.status = RUN_FINISHED
+        self.assertEqual("Run 1 (Finished, 1 evaluations)", self.run.label)
+
+    def test_controls(self):
+        self.run.status = RUN_RUNNING
+        self.assertTrue(self.run.is_running)
+
+        # Not launched yet
+        self.run.pause()
+        self.assertTrue(self.run.paused)
+        self.run.pause()
+
+        self.run.zmq_server = mock.Mock(spec=ZMQServer)
+        mock_publish = self.run.zmq_server.publish_message
+
+        self.run.pause()
+        self.assertTrue(self.run.paused)
+        mock_publish.assert_called_with("PAUSE_BDSS")
+
+        self.run.pause()
+        self.assertFalse(self.run.paused)
+        mock_publish.assert_called_with("RESUME_BDSS")
+
+        self.run.pause()
+        self.run.stop()
+        self.assertFalse(self.run.paused)
+        self.assertTrue(self.run.stop_requested)
+        mock_publish.assert_called_with("STOP_BDSS")
+
+    def test_evaluation_store(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        store = EvaluationStore(path=os.path.join(tmp_dir, "store.sqlite"))
+        self.addCleanup(store.close)
+        store.add("key", [1.0], {"y": 2.0})
+
+        # Disabled
+        self.assertIsNone(self.run.lookup_evaluation([1.0]))
+
+        self.run.evaluation_store = store
+        self.run.workflow_key = "key"
+        self.run.notify_event(
+            MCOStartEvent(parameter_names=["x"], kpi_names=["y"])
+        )
+        self.assertEqual(["x"], self.run.parameter_names)
+
+        self.assertEqual({"y": 2.0}, self.run.lookup_evaluation([1.0]))
+        self.assertIsNone(self.run.lookup_evaluation([3.0]))
+
+        for x, y in [(1.0, 2.0), (3.0, 4.0)]:
+            self.run.notify_event(
+                MCOProgressEvent(
+                    optimal_point=[DataValue(value=x)],
+                    optimal_kpis=[DataValue(value=y)],
+                )
+            )
+
+        self.assertEqual(
+            [{"evaluation": "cached"}, {"evaluation": "fresh"}],
+            self.run.analysis_model.step_metadata
+        )
+        # The fresh evaluation was added to the store
+        self.assertEqual({"y": 4.0}, store.lookup("key", [3.0]))
+        self.assertEqual(2, store.count("key"))
+
+    def notify_evaluations(self, *evaluations):
+        for x, y in evaluations:
+            self.run.notify_event(
+                MCOProgressEvent(
+                    optimal_point=[DataValue(value=x)],
+                    optimal_kpis=[DataValue(value=y)],
+                )
+            )
+
+    def test_checkpoint(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        checkpoint_path = os.path.join(tmp_dir, "checkpoints", "run.json")
+
+        # Disabled
+        with mock.patch(CHECKPOINT_WRITER_PATH) as mock_write:
+            self.run.write_checkpoint()
+            self.run.remove_checkpoint()
+        mock_write.assert_not_called()
+
+        self.run.checkpoint_path = checkpoint_path
+        self.run.checkpoint_interval = 3600.0
+        self.run.notify_event(
+            MCOStartEvent(parameter_names=["x"], kpi_names=["y"])
+        )
+        with mock.patch(CHECKPOINT_WRITER_PATH) as mock_write:
+            # Not saved until the interval elapses
+            self.notify_evaluations((1.0, 2.0))
+            mock_write.assert_not_called()
+            self.run.checkpoint_interval = 0.0
+            self.notify_evaluations((3.0, 4.0))
+            mock_write.assert_called_once_with(
+                self.run.workflow_model,
+                self.run.analysis_model,
+                checkpoint_path,
+            )
+
+            mock_write.side_effect = OSError("disk full")
+            with LogCapture() as capture:
+                self.run.write_checkpoint()
+            capture.check(
+                (
+                    "force_wfmanager.model.bdss_run",
+                    "ERROR",
+                    f"Unable to write the checkpoint {checkpoint_path}",
+                )
+            )
+
+        with mock.patch(WORKFLOW_DATA_PATH, return_value={}):
+            self.run.write_checkpoint()
+        with open(checkpoint_path) as fp:
+            data = json.load(fp)
+        self.assertEqual(["x", "y"], data["analysis_model"]["header"])
+        self.assertEqual(["run.json"], os.listdir(os.path.dirname(
+            checkpoint_path
+        )))
+
+        self.run.remove_checkpoint()
+        self.assertFalse(os.path.exists(checkpoint_path))
+        self.run.remove_checkpoint()
+
+    def test_resume(self):
+        interrupted = BDSSRun()
+        interrupted.notify_event(
+            MCOStartEvent(parameter_names=["x"], kpi_names=["y"])
+        )
+        interrupted.analysis_model.notify({"origin": "first"}, metadata=True)
+        interrupted.analysis_model.notify((1.0, 2.0))
+        interrupted.analysis_model.notify((3.0, 4.0))
+        self.assertIsNone(interrupted.evaluation_history())
+
+        self.run.resume(
+            json.loads(json.dumps(interrupted.analysis_model.to_json()))
+        )
+        self.assertEqual(
+            [(1.0, 2.0), (3.0, 4.0)], self.run.analysis_model.evaluation_steps
+        )
+        self.run.notify_event(
+            MCOStartEvent(parameter_names=["x"], kpi_names=["y"])
+        )
+
+        # The history is kept, and fed back to the BDSS
+        self.assertEqual(2, self.run.progress)
+        self.assertEqual(
+            {"header": ["x", "y"], "parameter_names": ["x"],
+             "rows": [[1.0, 2.0], [3.0, 4.0]]},
+            self.run.evaluation_history(),
+        )
+        self.assertEqual({"y": 4.0}, self.run.lookup_evaluation([3.0]))
+        self.assertIsNone(self.run.lookup_evaluation([5.0]))
+
+        # Without duplicated evaluations
+        self.notify_evaluations((3.0, 4.0), (5.0, 6.0))
+        self.assertEqual(
+            [(1.0, 2.0), (3.0, 4.0), (5.0, 6.0)],
+            self.run.analysis_model.evaluation_steps,
+        )
+        self.assertEqual(
+            {"origin": "first"}, self.run.analysis_model.step_metadata[0]
+        )
+
+    def test_resume_changed_columns(self):
+        self.run.notify_event(
+            MCOStartEvent(parameter_names=["x"], kpi_names=["y"])
+        )
+        self.notify_evaluations((1.0, 2.0))
+        self.run.resume(
+            json.loads(json.dumps(self.run.analysis_model.to_json()))
+        )
+        self.assertEqual(1, self.run.progress)
+
+        with LogCapture() as capture:
+            self.run.notify_event(
+                MCOStartEvent(parameter_names=["x"], kpi_names=["z"])
+            )
+        capture.check(
+            (
+                "force_wfmanager.model.bdss_run",
+                "WARNING",
+                "The columns of the results changed since the run was "
+                "interrupted. Its results are discarded.",
+            )
+        )
+        self.assertEqual(("x", "z"), self.run.analysis_model.header)
+        self.assertEqual(0, self.run.progress)
+        self.assertIsNone(self.run.evaluation_history())
@@ -0,0 +1,133 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import os
+import shutil
+import tempfile
+import threading
+from unittest import mock, TestCase
+
+from force_wfmanager.model.evaluation_store import (
+    EvaluationStore,
+    parameter_key,
+    workflow_structure_key,
+)
+
+WORKFLOW_WRITER_PATH = (
+    "force_wfmanager.model.evaluation_store.WorkflowWriter"
+)
+
+
+def mock_workflow(parameter_names, kpi_names):
+    workflow = mock.Mock()
+    workflow.mco_model.parameters = [
+        mock.Mock(spec=["name"]) for _ in parameter_names
+    ]
+    for parameter, name in zip(
+            workflow.mco_model.parameters, parameter_names):
+        parameter.name = name
+    workflow.mco_model.kpis = [mock.Mock(spec=["name"]) for _ in kpi_names]
+    for kpi, name in zip(workflow.mco_model.kpis, kpi_names):
+        kpi.name = name
+    return workflow
+
+
+class TestWorkflowStructureKey(TestCase):
+    def test_key(self):
+        with mock.patch(WORKFLOW_WRITER_PATH) as mock_writer:
+            get_workflow_data = mock_writer.return_value.get_workflow_data
+            get_workflow_data.return_value = {
+                "version": "1",
+                "workflow": {
+                    "mco_model": {"model_data": {"num_points": 5}},
+                    "execution_layers": [[{"id": "ds"}]],
+                },
+            }
+            workflow = mock_workflow(["x"], ["y"])
+            key = workflow_structure_key(workflow, {"plugin": "0.1"})
+
+            # The MCO settings do not change the structure
+            get_workflow_data.return_value["workflow"]["mco_model"] = {
+                "model_data": {"num_points": 10}
+            }
+            self.assertEqual(
+                key, workflow_structure_key(workflow, {"plugin": "0.1"})
+            )
+
+            self.assertNotEqual(
+                key, workflow_structure_key(workflow, {"plugin": "0.2"})
+            )
+            self.assertNotEqual(
+                key,
+                workflow_structure_key(
+                    mock_workflow(["x"], ["z"]), {"plugin": "0.1"}
+                )
+            )
+            get_workflow_data.return_value["workflow"][
+                "execution_layers"] = [[{"id": "other"}]]
+            self.assertNotEqual(
+                key, workflow_structure_key(workflow, {"plugin": "0.1"})
+            )
+
+    def test_parameter_key(self):
+        self.assertEqual("[1.0,2]", parameter_key((1.0, 2)))
+
+
+class TestEvaluationStore(TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        self.path = os.path.join(self.tmp_dir, "store", "store.sqlite")
+        self.store = EvaluationStore(path=self.path)
+        self.addCleanup(self.store.close)
+
+    def test_add_lookup(self):
+        self.assertIsNone(self.store.lookup("key", [1.0]))
+        self.assertEqual(0, self.store.count())
+
+        self.store.add("key", [1.0, 2.0], {"y": 3.0})
+        self.store.add("key", [1.0, 3.0], {"y": 4.0})
+        self.store.add("other", [1.0, 2.0], {"y": 5.0})
+
+        self.assertEqual({"y": 3.0}, self.store.lookup("key", [1.0, 2.0]))
+        self.assertEqual({"y": 5.0}, self.store.lookup("other", [1.0, 2.0]))
+        self.assertIsNone(self.store.lookup("key", [2.0, 2.0]))
+        self.assertEqual({"y": 4.0}, self.store.lookup("key", [1.0, 3.0]))
+        self.assertEqual(2, self.store.count("key"))
+        self.assertEqual(3, self.store.count())
+
+        # Replaces the previous evaluation
+        self.store.add("key", [1.0, 2.0], {"y": 6.0})
+        self.assertEqual({"y": 6.0}, self.store.lookup("key", [1.0, 2.0]))
+        self.assertEqual(3, self.store.count())
+
+    def test_persistence(self):
+        self.store.add("key", [1.0], {"y": 3.0})
+        self.store.close()
+
+        store = EvaluationStore(path=self.path)
+        self.addCleanup(store.close)
+        self.assertEqual({"y": 3.0}, store.lookup("key", [1.0]))
+
+    def test_clear(self):
+        self.store.add("key", [1.0], {"y": 3.0})
+        self.store.add("other", [1.0], {"y": 3.0})
+
+        self.store.clear("key")
+        self.assertEqual(0, self.store.count("key"))
+        self.assertEqual(1, self.store.count())
+
+        self.store.clear()
+        self.assertEqual(0, self.store.count())
+
+    def test_threads(self):
+        self.store.add("key", [1.0], {"y": 3.0})
+        results = []
+
+        thread = threading.Thread(
+            target=lambda: results.append(self.store.lookup("key", [1.0]))
+        )
+        thread.start()
+        thread.join()
+
+        self.assertEqual([{"y": 3.0}], results)
@@ -0,0 +1,148 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import unittest
+
+from traits.api import HasStrictTraits, Int, List
+
+from force_bdss.api import KPISpecification, Workflow
+from force_bdss.tests.probe_classes.factory_registry import (
+    ProbeFactoryRegistry,
+)
+
+from force_wfmanager.model.analysis_model import AnalysisModel
+from force_wfmanager.model.parameter_sweep import (
+    linear_grid,
+    ParameterSweep,
+    set_attribute_path,
+    SweepAxis,
+)
+
+
+class Leaf(HasStrictTraits):
+    value = Int()
+
+
+class Node(HasStrictTraits):
+    leaves = List(Leaf)
+    numbers = List(Int)
+
+
+def get_sweep():
+    registry = ProbeFactoryRegistry()
+    workflow = Workflow()
+    workflow.mco_model = registry.mco_factories[0].create_model()
+    workflow.mco_model.kpis.append(KPISpecification(name="kpi"))
+    return ParameterSweep(
+        workflow_model=workflow,
+        factory_registry=registry,
+        axes=[
+            SweepAxis(path="mco_model.kpis[0].name", values=["a", "b"]),
+            SweepAxis(
+                path="mco_model.kpis[0].objective",
+                values=["MINIMISE", "MAXIMISE"],
+                name="obj",
+            ),
+        ],
+    )
+
+
+class TestParameterSweep(unittest.TestCase):
+    def setUp(self):
+        self.sweep = get_sweep()
+
+    def test_create_variants(self):
+        variants = self.sweep.create_variants()
+
+        self.assertEqual(
+            [
+                "name=a, obj=MINIMISE",
+                "name=a, obj=MAXIMISE",
+                "name=b, obj=MINIMISE",
+                "name=b, obj=MAXIMISE",
+            ],
+            [label for label, _ in variants],
+        )
+        kpis = [workflow.mco_model.kpis[0] for _, workflow in variants]
+        self.assertEqual(
+            ["a", "a", "b", "b"], [kpi.name for kpi in kpis]
+        )
+        self.assertEqual(
+            ["MINIMISE", "MAXIMISE", "MINIMISE", "MAXIMISE"],
+            [kpi.objective for kpi in kpis],
+        )
+        # The original workflow is not modified
+        self.assertEqual(
+            "kpi", self.sweep.workflow_model.mco_model.kpis[0].name
+        )
+        for _, workflow in variants:
+            self.assertIsNot(self.sweep.workflow_model, workflow)
+
+    def test_merge_results(self):
+        first = AnalysisModel()
+        first.notify(("x", "y"))
+        first.notify({"a": 1}, metadata=True)
+        first.notify((1, 2))
+        second = AnalysisModel()
+        second.notify(("x", "y"))
+        second.notify((3, 4))
+        second.notify((5, 6))
+
+        merged = self.sweep.merge_results(
+            [("first", first), ("empty", AnalysisModel()), ("second", second)]
+        )
+        self.assertEqual(("variant", "x", "y"), merged.header)
+        self.assertEqual(
+            [("first", 1, 2), ("second", 3, 4), ("second", 5, 6)],
+            merged.evaluation_steps,
+        )
+        self.assertEqual([{"a": 1}, {}, {}], merged.step_metadata)
+
+        self.sweep.variant_column = "case"
+        merged = self.sweep.merge_results([("first", first)])
+        self.assertEqual(("case", "x", "y"), merged.header)
+
+    def test_merge_incompatible_results(self):
+        first = AnalysisModel()
+        first.notify(("x", "y"))
+        second = AnalysisModel()
+        second.notify(("x", "z"))
+
+        with self.assertRaisesRegex(ValueError, "variant second"):
+            self.sweep.merge_results([("first", first), ("second", second)])
+
+    def test_axis_from_json(self):
+        axis = SweepAxis.from_json({"path": "a.b", "values": [1, 2]})
+        self.assertEqual("b", axis.name)
+        self.assertEqual([1, 2], axis.values)
+
+        axis = SweepAxis.from_json(
+            {
+                "path": "a.b",
+                "grid": {"start": 0.0, "stop": 1.0, "num": 3},
+                "name": "c"
+            }
+        )
+        self.assertEqual("c", axis.name)
+        self.assertEqual([0.0, 0.5, 1.0], axis.values)
+
+        with self.assertRaises(KeyError):
+            SweepAxis.from_json({"path": "a.b"})
+
+    def test_linear_grid(self):
+        self.assertEqual([2], linear_grid(2, 3, 1))
+        self.assertEqual([0, 2.5, 5], linear_grid(0, 5, 3))
+        with self.assertRaises(ValueError):
+            linear_grid(0, 1, 0)
+
+    def test_set_attribute_path(self):
+        node = Node(leaves=[Leaf(), Leaf()], numbers=[1, 2])
+
+        set_attribute_path(node, "leaves[1].value", 3)
+        self.assertEqual([0, 3], [leaf.value for leaf in node.leaves])
+
+        set_attribute_path(node, "numbers[0]", 5)
+        self.assertEqual([5, 2], node.numbers)
+
+        with self.assertRaisesRegex(ValueError, "Invalid attribute path"):
+            set_attribute_path(node, "leaves[a].value", 3)
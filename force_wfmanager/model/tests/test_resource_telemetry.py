@@ -0,0 +1,42 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import unittest
+
+from force_wfmanager.model.resource_telemetry import (
+    ResourceTelemetry,
+    TELEMETRY_HEADER,
+)
+
+
+class TestResourceTelemetry(unittest.TestCase):
+    def setUp(self):
+        self.telemetry = ResourceTelemetry()
+
+    def test_init(self):
+        self.assertEqual(TELEMETRY_HEADER, self.telemetry.header)
+        self.assertEqual([], self.telemetry.samples)
+        self.assertEqual([], self.telemetry.column("CPU (%)"))
+
+    def test_append(self):
+        self.telemetry.append([1.0, 95.0, 120.5, 4, 0.0, 1.5])
+        self.telemetry.append((2.0, 180.0, 240.0, 6, 0.5, 0.0))
+        self.assertEqual(
+            [(1.0, 95.0, 120.5, 4, 0.0, 1.5),
+             (2.0, 180.0, 240.0, 6, 0.5, 0.0)],
+            self.telemetry.samples,
+        )
+        self.assertEqual([1.0, 2.0], self.telemetry.column("time (s)"))
+        self.assertEqual([4, 6], self.telemetry.column("threads"))
+
+        with self.assertRaisesRegex(ValueError, "must have 6 values"):
+            self.telemetry.append((3.0, 100.0))
+        self.assertEqual(2, len(self.telemetry.samples))
+
+        with self.assertRaises(ValueError):
+            self.telemetry.column("GPU (%)")
+
+    def test_clear(self):
+        self.telemetry.append([1.0, 95.0, 120.5, 4, 0.0, 1.5])
+        self.telemetry.clear()
+        self.assertEqual([], self.telemetry.samples)
@@ -0,0 +1,140 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import os
+import shutil
+import tempfile
+from unittest import mock, TestCase
+
+from force_wfmanager.model.analysis_model import AnalysisModel
+from force_wfmanager.model.result_cache import (
+    CACHE_ENTRY_EXTENSION,
+    ResultCache,
+    default_cache_directory,
+    workflow_cache_key,
+)
+
+WORKFLOW_WRITER_PATH = "force_wfmanager.model.result_cache.WorkflowWriter"
+
+
+def create_analysis_model(n_rows):
+    analysis_model = AnalysisModel()
+    analysis_model.notify(("x", "y"))
+    for index in range(n_rows):
+        analysis_model.notify({"index": index}, metadata=True)
+        analysis_model.notify((index, index * 0.5))
+    return analysis_model
+
+
+class TestWorkflowCacheKey(TestCase):
+    def test_key(self):
+        with mock.patch(WORKFLOW_WRITER_PATH) as mock_writer:
+            get_workflow_data = mock_writer.return_value.get_workflow_data
+            get_workflow_data.return_value = {
+                "version": "1", "workflow": {"a": 1, "b": [1, 2]}
+            }
+            key = workflow_cache_key(None, {"plugin": "0.1"})
+            self.assertEqual(64, len(key))
+
+            # Independent of the order of the keys
+            get_workflow_data.return_value = {
+                "workflow": {"b": [1, 2], "a": 1}, "version": "1"
+            }
+            self.assertEqual(key, workflow_cache_key(None, {"plugin": "0.1"}))
+
+            self.assertNotEqual(
+                key, workflow_cache_key(None, {"plugin": "0.2"})
+            )
+            get_workflow_data.return_value = {
+                "workflow": {"b": [2, 1], "a": 1}, "version": "1"
+            }
+            self.assertNotEqual(
+                key, workflow_cache_key(None, {"plugin": "0.1"})
+            )
+
+    def test_default_cache_directory(self):
+        with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": "cache"}):
+            self.assertEqual(
+                os.path.join("cache", "force_wfmanager", "results"),
+                default_cache_directory()
+            )
+
+
+class TestResultCache(TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        self.cache = ResultCache(
+            directory=os.path.join(self.tmp_dir, "results")
+        )
+
+    def set_last_used(self, key, last_used):
+        path = os.path.join(self.cache.directory, key + CACHE_ENTRY_EXTENSION)
+        os.utime(path, (last_used, last_used))
+
+    def test_empty(self):
+        self.assertEqual([], self.cache.entries())
+        self.assertEqual(0, self.cache.total_size)
+        self.assertFalse(self.cache.contains("key"))
+        self.assertIsNone(self.cache.get("key"))
+        self.assertFalse(self.cache.remove("key"))
+        self.assertEqual([], self.cache.clear())
+
+    def test_put_get(self):
+        analysis_model = create_analysis_model(3)
+        self.cache.put("key", analysis_model)
+
+        self.assertTrue(self.cache.contains("key"))
+        self.assertEqual(["key"], [e.key for e in self.cache.entries()])
+        self.assertGreater(self.cache.total_size, 0)
+        self.assertEqual(
+            ["key.json.gz"], os.listdir(self.cache.directory)
+        )
+
+        cached = self.cache.get("key")
+        self.assertIsNot(analysis_model, cached)
+        self.assertEqual(analysis_model.header, cached.header)
+        self.assertEqual(
+            analysis_model.evaluation_steps, cached.evaluation_steps
+        )
+        self.assertEqual(analysis_model.step_metadata, cached.step_metadata)
+
+        self.assertTrue(self.cache.remove("key"))
+        self.assertIsNone(self.cache.get("key"))
+
+    def test_corrupted_entry(self):
+        os.makedirs(self.cache.directory)
+        path = os.path.join(
+            self.cache.directory, "key" + CACHE_ENTRY_EXTENSION
+        )
+        with open(path, "w") as fp:
+            fp.write("not gzip")
+
+        self.assertIsNone(self.cache.get("key"))
+        self.assertFalse(os.path.exists(path))
+
+    def test_lru_eviction(self):
+        for index, key in enumerate(["a", "b", "c"]):
+            self.cache.put(key, create_analysis_model(10))
+            self.set_last_used(key, 1000 + index)
+        entry_size = max(entry.size for entry in self.cache.entries())
+
+        # Reading an entry makes it the most recently used
+        self.cache.get("a")
+        self.assertEqual(
+            ["b", "c", "a"], [entry.key for entry in self.cache.entries()]
+        )
+
+        self.assertEqual(["b"], self.cache.prune(max_size=2 * entry_size))
+        self.assertEqual(
+            ["c", "a"], [entry.key for entry in self.cache.entries()]
+        )
+
+        # Storing a new entry evicts the least recently used ones, but
+        # never the new one
+        self.cache.max_size = 1
+        self.cache.put("d", create_analysis_model(10))
+        self.assertEqual(["d"], [entry.key for entry in self.cache.entries()])
+
+        self.assertEqual(["d"], self.cache.clear())
+        self.assertEqual([], self.cache.entries())
@@ -221,6 +221,86 @@ class TestUINotification(unittest.TestCase):
 
         self.assertIsNone(listener._context)
 
+    def test_lookup_evaluation(self):
+        listener = self.listener
+        self.assertIsNone(listener.lookup_evaluation([1.0]))
+
+        self.sync_socket.recv_multipart.side_effect = [
+            [x.encode("utf-8") for x in ["HELLO", "an_id", "1"]],
+            [x.encode("utf-8") for x in ["LOOKUP", "an_id", '{"kpi": 2.0}']],
+            [x.encode("utf-8") for x in ["LOOKUP", "an_id", "null"]],
+            [x.encode("utf-8") for x in ["GOODBYE", "an_id"]],
+        ]
+        listener.initialize(self.model)
+
+        self.assertEqual({"kpi": 2.0}, listener.lookup_evaluation([1.0, 2]))
+        self.assertEqual(
+            self.sync_socket.send_multipart.call_args[0][0],
+            [x.encode("utf-8") for x in ["LOOKUP", "an_id", "[1.0, 2]"]],
+        )
+        self.assertIsNone(listener.lookup_evaluation([3.0, 4]))
+
+        with LogCapture() as capture:
+            self.assertIsNone(listener.lookup_evaluation([3.0, 4]))
+            capture.check(
+                (
+                    "force_wfmanager.notifications.ui_notification",
+                    "ERROR",
+                    "Unexpected reply to the evaluation lookup from UI "
+                    "server. '['GOODBYE', 'an_id']'",
+                )
+            )
+
+    def test_lookup_evaluation_no_response(self):
+        self.sync_socket.poll.side_effect = [1, 0]
+        listener = self.listener
+        listener.initialize(self.model)
+        with LogCapture() as capture:
+            self.assertIsNone(listener.lookup_evaluation([1.0]))
+            capture.check(
+                (
+                    "force_wfmanager.notifications.ui_notification",
+                    "ERROR",
+                    "No reply to the evaluation lookup from UI server "
+                    "after 1000 ms. Continuing without UI notification.",
+                )
+            )
+
+        self.assertIsNone(listener._context)
+
+    def test_fetch_history(self):
+        listener = self.listener
+        self.assertIsNone(listener.fetch_history())
+
+        history = '{"header": ["x", "y"], "rows": [[1.0, 2.0]]}'
+        self.sync_socket.recv_multipart.side_effect = [
+            [x.encode("utf-8") for x in ["HELLO", "an_id", "1"]],
+            [x.encode("utf-8") for x in ["HISTORY", "an_id", history]],
+            [x.encode("utf-8") for x in ["LOOKUP", "an_id", "null"]],
+            [x.encode("utf-8") for x in ["GOODBYE", "an_id"]],
+        ]
+        listener.initialize(self.model)
+
+        self.assertEqual(
+            {"header": ["x", "y"], "rows": [[1.0, 2.0]]},
+            listener.fetch_history(),
+        )
+        self.assertEqual(
+            self.sync_socket.send_multipart.call_args[0][0],
+            [x.encode("utf-8") for x in ["HISTORY", "an_id"]],
+        )
+
+        with LogCapture() as capture:
+            self.assertIsNone(listener.fetch_history())
+            capture.check(
+                (
+                    "force_wfmanager.notifications.ui_notification",
+                    "ERROR",
+                    "Unexpected reply to the history request from UI "
+                    "server. '['LOOKUP', 'an_id', 'null']'",
+                )
+            )
+
     def test_double_clear_sockets(self):
         listener = self.listener
 
@@ -33,7 +33,11 @@ class TestUINotificationHooksManager(unittest.TestCase):
         mock_registry = mock.Mock(spec=FactoryRegistry)
         mock_task.factory_registry = mock_registry
         mock_server = mock.Mock(spec=ZMQServer)
-        mock_server.ports = (54537, 54531, 54538)
+        mock_server.urls = (
+            "tcp://127.0.0.1:54537",
+            "tcp://127.0.0.1:54531",
+            "tcp://127.0.0.1:54538",
+        )
         mock_task.zmq_server = mock_server
         mock_registry.notification_listener_factory_by_id.return_value \
             = self.nl_factory
@@ -60,3 +64,29 @@ class TestUINotificationHooksManager(unittest.TestCase):
 
         manager.after_execution(mock_task)
         self.assertNotIn(model, workflow.notification_listeners)
+
+    def test_before_execution_ipc(self):
+        manager = self.factory.create_ui_hooks_manager()
+        workflow = Workflow()
+
+        mock_task = mock.Mock(spec=Task)
+        mock_task.workflow_model = workflow
+        mock_registry = mock.Mock(spec=FactoryRegistry)
+        mock_task.factory_registry = mock_registry
+        mock_server = mock.Mock(spec=ZMQServer)
+        mock_server.urls = (
+            "ipc:///tmp/force_wfmanager_xyz/sub",
+            "ipc:///tmp/force_wfmanager_xyz/pub",
+            "ipc:///tmp/force_wfmanager_xyz/sync",
+        )
+        mock_task.zmq_server = mock_server
+        mock_registry.notification_listener_factory_by_id.return_value \
+            = self.nl_factory
+
+        manager.before_execution(mock_task)
+
+        model = workflow.notification_listeners[0]
+        self.assertEqual(model.pub_url, "ipc:///tmp/force_wfmanager_xyz/sub")
+        self.assertEqual(
+            model.sync_url, "ipc:///tmp/force_wfmanager_xyz/sync")
+        self.assertEqual(model.sub_url, "ipc:///tmp/force_wfmanager_xyz/pub")
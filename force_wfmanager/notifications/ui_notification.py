@@ -2,6 +2,7 @@
 #  All rights reserved.
 
 from concurrent.futures import ThreadPoolExecutor
+import json
 import logging
 import zmq
 
@@ -197,6 +198,73 @@ class UINotification(BaseNotificationListener, UIEventNotificationMixin):
                 ]
             )
 
+    def lookup_evaluation(self, parameter_values):
+        """ Asks the Workflow Manager for a known evaluation of the MCO
+        `parameter_values`, so that the MCO can skip evaluating them again.
+
+        Parameters
+        ----------
+        parameter_values: list
+            The values of the MCO parameters
+
+        Returns
+        -------
+        values: dict or None
+            The values of the other columns of the evaluation, by name,
+            or None if the evaluation is unknown or the Workflow Manager
+            can't be reached.
+        """
+        return self._request(
+            "LOOKUP", "the evaluation lookup",
+            json.dumps(list(parameter_values))
+        )
+
+    def fetch_history(self):
+        """ Asks the Workflow Manager for the evaluations of the
+        interrupted run resumed by this execution, so that the MCO can
+        warm-start from them.
+
+        Returns
+        -------
+        history: dict or None
+            The "header" of the results, the "parameter_names" and the
+            "rows" of the evaluations, or None if the run was not resumed
+            or the Workflow Manager can't be reached.
+        """
+        return self._request("HISTORY", "the history request")
+
+    def _request(self, msg, description, *data):
+        """ Sends a `msg` request on the synchronization socket, and
+        returns the JSON data of the reply, or None."""
+        if not self._context:
+            return None
+
+        self._sync_socket.send_multipart([
+            x.encode("utf-8") for x in [msg, self._identifier, *data]
+        ])
+        events = self._sync_socket.poll(1000, zmq.POLLIN)
+        if events == 0:
+            # The request socket can't be used without a reply
+            log.error(
+                f"No reply to {description} from UI server after "
+                "1000 ms. Continuing without UI notification."
+            )
+            self._close_and_clear_sockets()
+            return None
+
+        recv = [x.decode("utf-8") for x in self._sync_socket.recv_multipart()]
+        try:
+            reply, identifier, reply_data = recv
+            if reply != msg:
+                raise ValueError(reply)
+            return json.loads(reply_data)
+        except ValueError:
+            log.error(
+                f"Unexpected reply to {description} from UI "
+                f"server. '{recv}'"
+            )
+            return None
+
     def finalize(self):
         """ Disconnects from the ZMQServer."""
         if not self._context:
@@ -21,8 +21,9 @@ class UINotificationHooksManager(BaseUIHooksManager):
 
         Parameters
         ----------
-        task: pyface.tasks.task.Task
-            The task containing the workflow model and the zmq server.
+        task: BDSSRun
+            The run containing the workflow model, the factory registry
+            and the zmq server.
 
         Note
         ----
@@ -44,10 +45,12 @@ class UINotificationHooksManager(BaseUIHooksManager):
             notification_model = nl_factory.create_model()
             model.notification_listeners.append(notification_model)
 
-        sub_port, pub_port, sync_port = task.zmq_server.ports
-        notification_model.sync_url = "tcp://127.0.0.1:" + str(sync_port)
-        notification_model.pub_url = "tcp://127.0.0.1:" + str(sub_port)
-        notification_model.sub_url = "tcp://127.0.0.1:" + str(pub_port)
+        # The listener publishes to the server subscriber socket and
+        # vice versa.
+        sub_url, pub_url, sync_url = task.zmq_server.urls
+        notification_model.sync_url = sync_url
+        notification_model.pub_url = sub_url
+        notification_model.sub_url = pub_url
         notification_model.identifier = ""
 
     def after_execution(self, task):
@@ -58,8 +61,9 @@ class UINotificationHooksManager(BaseUIHooksManager):
 
         Parameters
         ----------
-        task: pyface.tasks.task.Task
-            The task containing the workflow model and the zmq server.
+        task: BDSSRun
+            The run containing the workflow model, the factory registry
+            and the zmq server.
         """
         model = task.workflow_model
         notification_model = None
@@ -0,0 +1,224 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import functools
+import logging
+
+from envisage.api import Plugin, ServiceOffer
+import pkg_resources
+from traits.api import Any, Bool, Instance, Int, List
+
+from force_wfmanager.plugins.plugin_metadata import (
+    entry_points_key,
+    PluginMetadata,
+    protocol_name,
+    SERVICE_OFFERS,
+)
+from force_wfmanager.utils.startup_timer import startup_timer
+
+log = logging.getLogger(__name__)
+
+#: The entry point namespace of the BDSS plugins
+PLUGIN_NAMESPACE = "force.bdss.extensions"
+
+
+class LazyExtensionPlugin(Plugin):
+    """ Stands in the application for a BDSS plugin which has not been
+    imported yet, from its cached :class:`PluginMetadata`. The plugin is
+    imported when its contributions to an extension point are first
+    needed, e.g. when the factory registry looks up a factory of a
+    workflow, or when :meth:`load` is called.
+
+    The service offers of the plugin are contributed as proxy offers for
+    the cached protocols, which import the plugin when the service is
+    first requested. The properties of the offers are only known once the
+    plugin is imported, so the lazy offers can't be filtered by a query.
+    """
+
+    #: The entry point of the plugin
+    entry_point = Any()
+
+    #: The cached metadata of the plugin
+    metadata = Instance(PluginMetadata)
+
+    #: The version of the plugin
+    version = Int()
+
+    #: The plugin, once imported
+    plugin = Instance(Plugin)
+
+    #: Whether the plugin was started by the application
+    _started = Bool(False)
+
+    #: The proxy service offers of the plugin, created when first needed
+    _service_offers = List(ServiceOffer)
+
+    def _id_default(self):
+        return self.metadata.id
+
+    def _name_default(self):
+        return self.metadata.name
+
+    def _version_default(self):
+        return self.metadata.version
+
+    def load(self):
+        """ Imports and instantiates the plugin, if not done yet, and
+        returns it."""
+        if self.plugin is None:
+            log.info(f"Loading the extension {self.entry_point.name}")
+            with startup_timer.span(
+                "plugin load", plugin=self.entry_point.name, lazy=True
+            ):
+                plugin = self.entry_point.resolve()()
+            plugin.application = self.application
+            if self._started:
+                plugin.start()
+            self.plugin = plugin
+        return self.plugin
+
+    def get_extensions(self, extension_point_id):
+        """ Returns the contributions of the plugin to an extension point,
+        importing the plugin only if it contributes to it."""
+        if extension_point_id == SERVICE_OFFERS:
+            return self._proxy_service_offers()
+        if not self.metadata.contributes_to(extension_point_id):
+            return []
+        return self.load().get_extensions(extension_point_id)
+
+    def get_contributed_uis(self):
+        """ Returns the contributed UIs of the plugin, if any"""
+        if not self.metadata.contributed_uis:
+            return []
+        return self.load().get_contributed_uis()
+
+    def get_data_views(self):
+        """ Returns the data views of the plugin, if any"""
+        if not self.metadata.data_views:
+            return []
+        return self.load().get_data_views()
+
+    def create_service(self, index, **properties):
+        """ Imports the plugin, and returns the service of its service
+        offer at `index`, as the envisage service registry creates it.
+
+        Parameters
+        ----------
+        index: int
+            The position of the offer among the service offers of the
+            plugin
+        properties: dict
+            The properties of the proxy offer, ignored in favour of those
+            of the plugin's offer
+        """
+        service_offers = self.load().get_extensions(SERVICE_OFFERS)
+        expected = self.metadata.service_offers[index]
+        if (
+            index >= len(service_offers)
+            or protocol_name(service_offers[index].protocol) != expected
+        ):
+            raise ValueError(
+                f"The service offers of the extension "
+                f"{self.entry_point.name} do not match its cached "
+                f"metadata: expected {expected} at position {index}"
+            )
+        service_offer = service_offers[index]
+        factory = service_offer.factory
+        if isinstance(factory, str):
+            factory = self.application.import_symbol(factory)
+        if callable(factory):
+            return factory(**service_offer.properties)
+        return factory
+
+    def start(self):
+        """ Starts the plugin with the application, if imported already"""
+        self._started = True
+        if self.plugin is not None:
+            self.plugin.start()
+
+    def stop(self):
+        """ Stops the plugin with the application, if imported"""
+        self._started = False
+        if self.plugin is not None:
+            self.plugin.stop()
+
+    def _proxy_service_offers(self):
+        if not self._service_offers and self.metadata.service_offers:
+            self._service_offers = [
+                ServiceOffer(
+                    protocol=protocol,
+                    factory=functools.partial(self.create_service, index),
+                )
+                for index, protocol in enumerate(self.metadata.service_offers)
+            ]
+        return self._service_offers
+
+
+def load_plugins(plugins):
+    """ Returns `plugins`, with the lazy plugins replaced by the plugins
+    they load."""
+    return [
+        plugin.load() if isinstance(plugin, LazyExtensionPlugin) else plugin
+        for plugin in plugins
+    ]
+
+
+def discover_plugins(cache=None, namespace=PLUGIN_NAMESPACE):
+    """ Returns the plugins of the entry points in `namespace`. If the
+    metadata of the installed plugins is found in `cache`, lazy plugins
+    are returned, which do not import the plugin modules at startup.
+    Otherwise the plugins are imported, and their metadata is cached for
+    the next startup.
+
+    Parameters
+    ----------
+    cache: PluginMetadataCache or None
+        The cache of the metadata of the plugins. None imports the plugins.
+    namespace: str
+        The entry point namespace of the plugins
+    """
+    entry_points = list(pkg_resources.iter_entry_points(namespace))
+    if not entry_points:
+        log.info("No extensions found")
+        return []
+
+    key = entry_points_key(entry_points)
+    if cache is not None:
+        cached_metadata = cache.load(key)
+        if cached_metadata is not None and all(
+            str(entry_point) in cached_metadata
+            for entry_point in entry_points
+        ):
+            return [
+                LazyExtensionPlugin(
+                    entry_point=entry_point,
+                    metadata=cached_metadata[str(entry_point)],
+                )
+                for entry_point in entry_points
+            ]
+
+    plugins = []
+    plugins_metadata = []
+    # Plugins failing to load are not cached, so that the errors are
+    # reported again at the next startup
+    cacheable = True
+    for entry_point in entry_points:
+        log.info(f"Found extension {entry_point.name}")
+        try:
+            with startup_timer.span("plugin load", plugin=entry_point.name):
+                plugin = entry_point.resolve()()
+        except Exception:
+            log.exception(f"Unable to load the extension {entry_point.name}")
+            cacheable = False
+            continue
+        plugins.append(plugin)
+        if getattr(plugin, "broken", False):
+            cacheable = False
+        else:
+            plugins_metadata.append(
+                PluginMetadata.from_plugin(str(entry_point), plugin)
+            )
+
+    if cache is not None and cacheable:
+        cache.save(key, plugins_metadata)
+    return plugins
@@ -0,0 +1,221 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+from traits.api import Dict, HasStrictTraits, Int, List, Str
+
+from force_wfmanager.model.result_cache import default_cache_directory
+
+log = logging.getLogger(__name__)
+
+#: The id of the extension point of the service offers, collected by the
+#: envisage CorePlugin
+SERVICE_OFFERS = "envisage.service_offers"
+
+
+def default_plugin_cache_path():
+    """ Returns the default path of the plugin metadata cache, next to the
+    result cache."""
+    return os.path.join(
+        os.path.dirname(default_cache_directory()), "plugins.json"
+    )
+
+
+def entry_points_key(entry_points):
+    """ Returns the key of the metadata of the plugins of `entry_points`
+    in the cache: a SHA-256 hash of the entry points and of the versions
+    of the distributions providing them. Installing, removing or upgrading
+    a plugin changes the key.
+
+    Parameters
+    ----------
+    entry_points: list of pkg_resources.EntryPoint
+        The entry points of the plugins
+    """
+    data = sorted(
+        [str(entry_point), entry_point.dist.project_name,
+         entry_point.dist.version]
+        for entry_point in entry_points
+    )
+    canonical = json.dumps(data, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _contribution_name(item):
+    """ Returns the id of a contribution to an extension point if it has
+    one, e.g. for the factories, or the name of its class otherwise."""
+    item_id = getattr(item, "id", None)
+    if isinstance(item_id, str) and item_id:
+        return item_id
+    return type(item).__name__
+
+
+def protocol_name(protocol):
+    """ Returns the name under which the envisage service registry
+    registers the services offered for `protocol`, a class or the name
+    of one."""
+    if isinstance(protocol, str):
+        return protocol
+    return f"{protocol.__module__}.{protocol.__name__}"
+
+
+class PluginMetadata(HasStrictTraits):
+    """ What the Workflow Manager needs to know about a plugin before
+    importing it: its identity and what it contributes.
+    """
+
+    #: The entry point of the plugin, as "name = module:attribute"
+    entry_point = Str()
+
+    #: The id of the plugin
+    id = Str()
+
+    #: The name of the plugin
+    name = Str()
+
+    #: The version of the plugin
+    version = Int()
+
+    #: The ids of the extension points the plugin contributes to, with the
+    #: ids of its contributions, e.g. of its factories. The service offers
+    #: are listed in :attr:`service_offers` instead.
+    extensions = Dict(Str, List(Str))
+
+    #: The protocol names of the service offers of the plugin, in order
+    service_offers = List(Str)
+
+    #: The class names of the contributed UIs of the plugin
+    contributed_uis = List(Str)
+
+    #: The class names of the data views of the plugin
+    data_views = List(Str)
+
+    @classmethod
+    def from_plugin(cls, entry_point, plugin):
+        """ Returns the metadata of a loaded plugin.
+
+        Parameters
+        ----------
+        entry_point: str
+            The entry point of the plugin
+        plugin: Plugin
+            The plugin instantiated from the entry point
+        """
+        extensions = {}
+        service_offers = []
+        contributing_traits = plugin.traits(
+            contributes_to=lambda value: value is not None
+        )
+        for trait_name, trait in contributing_traits.items():
+            items = getattr(plugin, trait_name)
+            if not items:
+                continue
+            if trait.contributes_to == SERVICE_OFFERS:
+                service_offers.extend(
+                    protocol_name(offer.protocol) for offer in items
+                )
+            else:
+                extensions.setdefault(trait.contributes_to, []).extend(
+                    _contribution_name(item) for item in items
+                )
+
+        def class_names(method_name):
+            method = getattr(plugin, method_name, None)
+            if method is None:
+                return []
+            return [klass.__name__ for klass in method()]
+
+        return cls(
+            entry_point=entry_point,
+            id=plugin.id,
+            name=plugin.name,
+            version=getattr(plugin, "version", 0),
+            extensions=extensions,
+            service_offers=service_offers,
+            contributed_uis=class_names("get_contributed_uis"),
+            data_views=class_names("get_data_views"),
+        )
+
+    def contributes_to(self, extension_point_id):
+        """ Returns whether the plugin contributes to the extension point
+        with id `extension_point_id`."""
+        return extension_point_id in self.extensions
+
+    def to_json(self):
+        """ Returns a dictionary representation of the metadata"""
+        return self.trait_get(
+            "entry_point", "id", "name", "version", "extensions",
+            "service_offers", "contributed_uis", "data_views",
+        )
+
+
+class PluginMetadataCache(HasStrictTraits):
+    """ On-disk cache of the metadata of the installed plugins, so that
+    the plugins do not have to be imported at startup. The cache is a JSON
+    file holding the metadata, with the :func:`entry_points_key` of the
+    plugins it was built from.
+    """
+
+    #: Path of the cache file
+    path = Str()
+
+    def _path_default(self):
+        return default_plugin_cache_path()
+
+    def load(self, key):
+        """ Returns the metadata of the plugins, by entry point, if cached
+        with `key`, or None otherwise."""
+        try:
+            with open(self.path, "r") as fp:
+                data = json.load(fp)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            log.exception(f"Unable to read the plugin cache {self.path}")
+            return None
+
+        if data.get("key") != key:
+            return None
+        try:
+            plugins = [PluginMetadata(**item) for item in data["plugins"]]
+        except Exception:
+            log.exception(f"Invalid plugin cache {self.path}")
+            return None
+        return {metadata.entry_point: metadata for metadata in plugins}
+
+    def save(self, key, plugins):
+        """ Replaces the content of the cache with the metadata of
+        `plugins`, built from the entry points with the given `key`. The
+        cache file is replaced atomically, as several applications may
+        start at the same time.
+
+        Parameters
+        ----------
+        key: str
+            The :func:`entry_points_key` of the plugins
+        plugins: list of PluginMetadata
+            The metadata of the plugins
+        """
+        data = {
+            "key": key,
+            "plugins": [metadata.to_json() for metadata in plugins],
+        }
+        directory = os.path.dirname(os.path.abspath(self.path))
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=directory)
+        except OSError:
+            log.exception(f"Unable to write the plugin cache {self.path}")
+            return
+        try:
+            with os.fdopen(fd, "w") as fp:
+                json.dump(data, fp, indent=4)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            log.exception(f"Unable to write the plugin cache {self.path}")
+            os.remove(tmp_path)
@@ -0,0 +1,161 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from envisage.api import ServiceRegistry
+from testfixtures import LogCapture
+
+from force_wfmanager.plugins.lazy_extension_plugin import (
+    discover_plugins,
+    LazyExtensionPlugin,
+    load_plugins,
+)
+from force_wfmanager.plugins.plugin_metadata import (
+    entry_points_key,
+    PluginMetadata,
+    PluginMetadataCache,
+    SERVICE_OFFERS,
+)
+from force_wfmanager.plugins.tests.test_plugin_metadata import (
+    ENTRY_POINT,
+    make_entry_point,
+)
+from force_wfmanager.tests.dummy_classes.dummy_contributed_ui import (
+    DummyContributedUI,
+    DummyContributedUI2,
+    DummyUIPlugin,
+)
+from force_wfmanager.ui import IContributedUI
+
+ITER_ENTRY_POINTS_PATH = (
+    "force_wfmanager.plugins.lazy_extension_plugin.pkg_resources."
+    "iter_entry_points"
+)
+MISSING_ENTRY_POINT = "missing = force_wfmanager.missing:MissingPlugin"
+
+
+class TestLazyExtensionPlugin(unittest.TestCase):
+    def setUp(self):
+        self.entry_point = make_entry_point()
+        self.plugin = LazyExtensionPlugin(
+            entry_point=self.entry_point,
+            metadata=PluginMetadata.from_plugin(ENTRY_POINT, DummyUIPlugin()),
+        )
+
+    def test_metadata(self):
+        self.assertEqual(DummyUIPlugin().id, self.plugin.id)
+        self.assertEqual("Example", self.plugin.name)
+        self.assertEqual(2, self.plugin.version)
+        self.assertIsNone(self.plugin.plugin)
+
+    def test_get_extensions(self):
+        # Not imported for the extension points it does not contribute to
+        self.assertEqual([], self.plugin.get_extensions("envisage.plugins"))
+        self.assertEqual([], self.plugin.get_data_views())
+        self.assertIsNone(self.plugin.plugin)
+
+        extension_point_id = DummyUIPlugin.class_traits()[
+            "data_source_factories"
+        ].contributes_to
+        factories = self.plugin.get_extensions(extension_point_id)
+        self.assertIsInstance(self.plugin.plugin, DummyUIPlugin)
+        self.assertEqual(
+            self.plugin.plugin.data_source_factories, factories
+        )
+        self.assertEqual(2, len(self.plugin.get_contributed_uis()))
+
+    def test_service_offers(self):
+        service_offers = self.plugin.get_extensions(SERVICE_OFFERS)
+        self.assertEqual(2, len(service_offers))
+        self.assertIs(
+            service_offers, self.plugin.get_extensions(SERVICE_OFFERS)
+        )
+        self.assertIsNone(self.plugin.plugin)
+
+        # The plugin is imported when the services are first requested
+        registry = ServiceRegistry()
+        for service_offer in service_offers:
+            registry.register_service(
+                service_offer.protocol,
+                service_offer.factory,
+                service_offer.properties,
+            )
+        services = registry.get_services(IContributedUI)
+        self.assertIsInstance(self.plugin.plugin, DummyUIPlugin)
+        self.assertEqual(
+            [DummyContributedUI, DummyContributedUI2],
+            [type(service) for service in services],
+        )
+
+        self.plugin.metadata.service_offers = ["other.IOther"] * 2
+        with self.assertRaisesRegex(ValueError, "do not match"):
+            self.plugin.create_service(0)
+
+    def test_load(self):
+        self.plugin.start()
+        with mock.patch.object(DummyUIPlugin, "start") as mock_start:
+            plugin = self.plugin.load()
+            mock_start.assert_called_once_with()
+        self.assertIs(plugin, self.plugin.load())
+        self.assertEqual(
+            [plugin, "other"], load_plugins([self.plugin, "other"])
+        )
+
+        with mock.patch.object(DummyUIPlugin, "stop") as mock_stop:
+            self.plugin.stop()
+            mock_stop.assert_called_once_with()
+
+
+class TestDiscoverPlugins(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        self.cache = PluginMetadataCache(
+            path=os.path.join(tmp_dir, "plugins.json")
+        )
+
+    def test_no_plugins(self):
+        with mock.patch(ITER_ENTRY_POINTS_PATH, return_value=[]):
+            self.assertEqual([], discover_plugins(cache=self.cache))
+        self.assertFalse(os.path.exists(self.cache.path))
+
+    def test_discover_plugins(self):
+        entry_points = [make_entry_point()]
+        with mock.patch(ITER_ENTRY_POINTS_PATH, return_value=entry_points):
+            # Imported the first time, and cached
+            plugins = discover_plugins(cache=self.cache)
+            self.assertEqual(1, len(plugins))
+            self.assertIsInstance(plugins[0], DummyUIPlugin)
+            self.assertTrue(os.path.exists(self.cache.path))
+
+            # Lazily imported afterwards
+            plugins = discover_plugins(cache=self.cache)
+            self.assertEqual(1, len(plugins))
+            self.assertIsInstance(plugins[0], LazyExtensionPlugin)
+            self.assertEqual(DummyUIPlugin().id, plugins[0].id)
+
+            # Always imported without a cache
+            plugins = discover_plugins()
+            self.assertIsInstance(plugins[0], DummyUIPlugin)
+
+        # Installing another plugin invalidates the cache
+        entry_points.append(make_entry_point(MISSING_ENTRY_POINT))
+        with mock.patch(ITER_ENTRY_POINTS_PATH, return_value=entry_points):
+            with LogCapture() as capture:
+                plugins = discover_plugins(cache=self.cache)
+        self.assertEqual(1, len(plugins))
+        self.assertIsInstance(plugins[0], DummyUIPlugin)
+        capture.check_present(
+            (
+                "force_wfmanager.plugins.lazy_extension_plugin",
+                "ERROR",
+                "Unable to load the extension missing",
+            )
+        )
+        # The failing plugin is not cached, so that it is reported again
+        self.assertIsNone(self.cache.load(entry_points_key(entry_points)))
@@ -0,0 +1,115 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import pkg_resources
+from testfixtures import LogCapture
+
+from force_wfmanager.plugins.plugin_metadata import (
+    entry_points_key,
+    PluginMetadata,
+    PluginMetadataCache,
+    protocol_name,
+    SERVICE_OFFERS,
+)
+from force_wfmanager.tests.dummy_classes.dummy_contributed_ui import (
+    DummyUIPlugin,
+)
+from force_wfmanager.ui import IContributedUI
+
+ENTRY_POINT = (
+    "uitest = force_wfmanager.tests.dummy_classes.dummy_contributed_ui:"
+    "DummyUIPlugin"
+)
+
+
+def make_entry_point(source=ENTRY_POINT, version="1.0"):
+    dist = mock.Mock(project_name="force-dummy", version=version)
+    return pkg_resources.EntryPoint.parse(source, dist=dist)
+
+
+class TestPluginMetadata(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        self.cache = PluginMetadataCache(
+            path=os.path.join(self.tmp_dir, "plugins.json")
+        )
+
+    def test_entry_points_key(self):
+        key = entry_points_key([make_entry_point()])
+        self.assertEqual(64, len(key))
+        self.assertEqual(key, entry_points_key([make_entry_point()]))
+        self.assertNotEqual(
+            key, entry_points_key([make_entry_point(version="1.1")])
+        )
+        self.assertNotEqual(
+            key,
+            entry_points_key([make_entry_point(), make_entry_point(
+                "other = force_wfmanager.plugins:OtherPlugin"
+            )]),
+        )
+
+    def test_from_plugin(self):
+        plugin = DummyUIPlugin()
+        metadata = PluginMetadata.from_plugin(ENTRY_POINT, plugin)
+
+        self.assertEqual(ENTRY_POINT, metadata.entry_point)
+        self.assertEqual(plugin.id, metadata.id)
+        self.assertEqual("Example", metadata.name)
+        self.assertEqual(2, metadata.version)
+        data_sources = plugin.trait("data_source_factories").contributes_to
+        self.assertTrue(metadata.contributes_to(data_sources))
+        self.assertEqual(
+            [factory.id for factory in plugin.data_source_factories],
+            metadata.extensions[data_sources],
+        )
+        mco_factories = plugin.trait("mco_factories").contributes_to
+        self.assertFalse(metadata.contributes_to(mco_factories))
+        # The service offers are recorded by protocol
+        self.assertFalse(metadata.contributes_to(SERVICE_OFFERS))
+        self.assertEqual(
+            [protocol_name(IContributedUI)] * 2, metadata.service_offers
+        )
+        self.assertEqual(
+            "force_wfmanager.ui.contributed_ui.i_contributed_ui."
+            "IContributedUI",
+            protocol_name(IContributedUI),
+        )
+        self.assertEqual(
+            ["DummyContributedUI", "DummyContributedUI2"],
+            metadata.contributed_uis,
+        )
+        self.assertEqual([], metadata.data_views)
+
+    def test_save_load(self):
+        self.assertIsNone(self.cache.load("key"))
+
+        metadata = PluginMetadata.from_plugin(ENTRY_POINT, DummyUIPlugin())
+        self.cache.save("key", [metadata])
+        self.assertEqual(["plugins.json"], os.listdir(self.tmp_dir))
+
+        loaded = self.cache.load("key")
+        self.assertEqual([ENTRY_POINT], list(loaded))
+        self.assertEqual(metadata.to_json(), loaded[ENTRY_POINT].to_json())
+
+        # The plugins changed since the cache was saved
+        self.assertIsNone(self.cache.load("other_key"))
+
+    def test_load_invalid(self):
+        with open(self.cache.path, "w") as fp:
+            json.dump({"key": "key", "plugins": [{"unknown": 1}]}, fp)
+        with LogCapture() as capture:
+            self.assertIsNone(self.cache.load("key"))
+        self.assertEqual("ERROR", capture.records[0].levelname)
+
+        with open(self.cache.path, "w") as fp:
+            fp.write("{")
+        with LogCapture():
+            self.assertIsNone(self.cache.load("key"))
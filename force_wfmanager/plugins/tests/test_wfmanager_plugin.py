@@ -6,8 +6,17 @@ from unittest import mock
 
 from envisage.api import Application
 
+from force_bdss.api import IFactoryRegistry
+from force_bdss.core_plugins.factory_registry_plugin import (
+    FactoryRegistryPlugin
+)
+
 from force_wfmanager.plugins.wfmanager_plugin import WfManagerPlugin
+from force_wfmanager.server.execution_backend import LocalExecutionBackend
+from force_wfmanager.server.i_execution_backend import IExecutionBackend
+from force_wfmanager.server.local_cluster_backend import LocalClusterBackend
 from force_wfmanager.tests.mock_methods import mock_return_none
+from force_wfmanager.utils.startup_timer import startup_timer
 
 SETUP_TASK = "force_wfmanager.plugins.wfmanager_plugin.WfManagerSetupTask"
 REVIEW_TASK = "force_wfmanager.plugins.wfmanager_plugin.WfManagerReviewTask"
@@ -17,7 +26,7 @@ PLUGIN_SERVICE = 'envisage.api.Plugin.application.get_service'
 class TestWfManagerPlugin(unittest.TestCase):
     def setUp(self):
         self.wfmanager_plugin = WfManagerPlugin(workflow_file=None)
-        self.wfmanager_plugin.application = mock.Mock(spec=Application)
+        self.wfmanager_plugin.application = mock.MagicMock(spec=Application)
 
     def test_init(self):
         self.assertEqual(len(self.wfmanager_plugin.tasks), 2)
@@ -38,8 +47,50 @@ class TestWfManagerPlugin(unittest.TestCase):
             self.wfmanager_plugin._create_review_task()
             self.assertTrue(mock_review_task.called)
 
+    def test_factory_registry(self):
+        application = self.wfmanager_plugin.application
+        registry_plugin = FactoryRegistryPlugin()
+        application.__iter__.return_value = iter([registry_plugin])
+        # Any access to the factories, which loads the plugins contributing
+        # them, fails: they are only loaded when needed
+        factory_registry = mock.NonCallableMock(spec=[])
+        application.get_service.return_value = factory_registry
+
+        startup_timer.start()
+        self.assertIs(factory_registry, self.wfmanager_plugin.factory_registry)
+        self.assertIs(factory_registry, self.wfmanager_plugin.factory_registry)
+        application.get_service.assert_called_once_with(IFactoryRegistry)
+
+        spans = [
+            span for span in startup_timer.spans
+            if span.name == "factory registry construction"
+        ]
+        self.assertEqual(1, len(spans))
+        self.assertEqual({"plugin": registry_plugin.id}, spans[0].details)
+
     def test_init_with_file(self):
         self.wfmanager_plugin.workflow_file = 'some_workflow_file.json'
 
         with self.assertRaises(Exception):
             self.wfmanager_plugin.workflow_file = 0
+
+    def test_create_execution_backend(self):
+        application = self.wfmanager_plugin.application
+        application.get_service.return_value = None
+
+        backend = self.wfmanager_plugin._create_execution_backend()
+        self.assertIsInstance(backend, LocalExecutionBackend)
+        self.assertEqual(1.0, backend.telemetry_interval)
+
+        self.wfmanager_plugin.warm_workers = True
+        backend = self.wfmanager_plugin._create_execution_backend()
+        self.assertIsInstance(backend, LocalClusterBackend)
+
+        # A backend offered by another plugin is used instead
+        contributed_backend = mock.Mock(spec=IExecutionBackend)
+        application.get_service.return_value = contributed_backend
+        self.assertIs(
+            contributed_backend,
+            self.wfmanager_plugin._create_execution_backend(),
+        )
+        application.get_service.assert_called_with(IExecutionBackend)
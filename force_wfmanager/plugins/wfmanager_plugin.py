@@ -3,11 +3,23 @@
 
 from envisage.api import Plugin
 from envisage.ui.tasks.api import TaskFactory
-from traits.api import Either, List, Str
+from traits.api import (
+    Any, Bool, Either, Float, Instance, List, Property, Str
+)
 
 
 from force_bdss.api import IFactoryRegistry
+from force_bdss.core_plugins.factory_registry_plugin import (
+    FactoryRegistryPlugin
+)
+from force_wfmanager.io.checkpoint_io import default_checkpoint_directory
+from force_wfmanager.model.evaluation_store import EvaluationStore
+from force_wfmanager.model.result_cache import ResultCache
+from force_wfmanager.server.execution_backend import LocalExecutionBackend
+from force_wfmanager.server.i_execution_backend import IExecutionBackend
+from force_wfmanager.server.local_cluster_backend import LocalClusterBackend
 from force_wfmanager.ui import IContributedUI
+from force_wfmanager.utils.startup_timer import startup_timer
 from force_wfmanager.wfmanager_review_task import WfManagerReviewTask
 from force_wfmanager.wfmanager_setup_task import WfManagerSetupTask
 from force_wfmanager.wfmanager_global_task import WfManagerGlobalTask
@@ -27,6 +39,35 @@ class WfManagerPlugin(Plugin):
 
     workflow_file = Either(None, Str())
 
+    #: Execute the workflows in warm BDSS worker processes, spreading the
+    #: runs over them as over the nodes of a cluster. Ignored if another
+    #: plugin offers an :class:`IExecutionBackend` service.
+    warm_workers = Bool(False)
+
+    #: Cache the results of the finished runs
+    result_cache = Bool(True)
+
+    #: Store the evaluations of the runs, for the BDSS to look them up
+    evaluation_store = Bool(True)
+
+    #: Seconds between two samples of the resource usage of the BDSS
+    #: processes. Zero disables the sampling.
+    telemetry_interval = Float(1.0)
+
+    #: Write checkpoints of the runs, from which they can be resumed
+    checkpoints = Bool(True)
+
+    #: Seconds during which the verification requests of the workflow are
+    #: coalesced, before verifying it in a secondary thread. Zero verifies
+    #: the workflow synchronously on each request.
+    verification_delay = Float(0.2)
+
+    #: The factory registry of the application, fetched on first use
+    factory_registry = Property(Instance(IFactoryRegistry))
+
+    #: Private trait of the `factory_registry` property
+    _factory_registry = Any()
+
     # -----------------
     #      Defaults
     # -----------------
@@ -43,35 +84,83 @@ class WfManagerPlugin(Plugin):
     def _contributed_task_extensions_default(self):
         return [WfManagerGlobalTask()]
 
+    # -----------------
+    #    Properties
+    # -----------------
+
+    def _get_factory_registry(self):
+        """ Returns the factory registry. Its first request is timed as the
+        construction of the registry service. The plugins contributing the
+        factories are timed as they are loaded, when their factories are
+        first needed."""
+        if self._factory_registry is None:
+            with startup_timer.span(
+                "factory registry construction",
+                plugin=self._factory_registry_plugin_id(),
+            ):
+                factory_registry = self.application.get_service(
+                    IFactoryRegistry
+                )
+            self._factory_registry = factory_registry
+        return self._factory_registry
+
     # -----------------
     #  Private Methods
     # -----------------
 
     def _create_setup_task(self):
+        with startup_timer.span("setup task creation"):
+            wf_manager_setup_task = self._setup_task()
 
-        factory_registry = self.application.get_service(
-            IFactoryRegistry
-        )
+        if self.workflow_file is not None:
+            with startup_timer.span("workflow file loading"):
+                wf_manager_setup_task.load_workflow(self.workflow_file)
+
+        return wf_manager_setup_task
+
+    def _setup_task(self):
         # Plugin contributed UIs targeted at a specific, predefined workflow
         contributed_uis = self.application.get_services(
             IContributedUI
         )
         wf_manager_setup_task = WfManagerSetupTask(
-            factory_registry=factory_registry,
-            contributed_uis=contributed_uis
+            factory_registry=self.factory_registry,
+            contributed_uis=contributed_uis,
+            execution_backend=self._create_execution_backend(),
+            result_cache=ResultCache() if self.result_cache else None,
+            evaluation_store=(
+                EvaluationStore() if self.evaluation_store else None
+            ),
+            checkpoint_directory=(
+                default_checkpoint_directory() if self.checkpoints else ""
+            ),
+            verification_delay=self.verification_delay,
         )
+        return wf_manager_setup_task
 
-        if self.workflow_file is not None:
-            wf_manager_setup_task.load_workflow(self.workflow_file)
+    def _create_execution_backend(self):
+        # Backends offered by other plugins, e.g. for a batch system,
+        # take precedence over the local ones
+        backend = self.application.get_service(IExecutionBackend)
+        if backend is not None:
+            return backend
+        if self.warm_workers:
+            return LocalClusterBackend()
+        return LocalExecutionBackend(
+            telemetry_interval=self.telemetry_interval
+        )
 
-        return wf_manager_setup_task
+    def _factory_registry_plugin_id(self):
+        """ Returns the id of the plugin offering the factory registry"""
+        for plugin in self.application:
+            if isinstance(plugin, FactoryRegistryPlugin):
+                return plugin.id
+        return ""
 
     def _create_review_task(self):
-        factory_registry = self.application.get_service(
-            IFactoryRegistry
-        )
-        wf_manager_review_task = WfManagerReviewTask(
-            factory_registry=factory_registry
-        )
+        with startup_timer.span("review task creation"):
+            wf_manager_review_task = WfManagerReviewTask(
+                factory_registry=self.factory_registry
+            )
 
         return wf_manager_review_task
@@ -0,0 +1,326 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+""" Warm BDSS workers: long-lived processes which keep the BDSS and its
+plugins imported, and execute workflows on request. Workflows are sent
+as JSON over a ZMQ REQ/REP channel. Events, stop and pause messages use
+the usual notification listener and ZMQServer of each run.
+
+The worker process is started with::
+
+    python -m force_wfmanager.server.bdss_worker <url>
+"""
+
+import json
+import logging
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+
+import zmq
+from traits.api import (
+    Any,
+    Enum,
+    Float,
+    HasStrictTraits,
+    Instance,
+    Int,
+    List,
+    Property,
+    Str,
+)
+
+log = logging.getLogger(__name__)
+
+#: Actions of the requests sent to the workers
+ACTION_RUN = "run"
+ACTION_EXIT = "exit"
+
+
+class BDSSWorker(HasStrictTraits):
+    """ Client side of a single warm worker process. The methods are
+    thread safe, but a worker executes one workflow at a time."""
+
+    #: Python interpreter running the worker process
+    python_executable = Str(sys.executable)
+
+    #: Transport of the channel to the worker process
+    transport = Enum("ipc", "tcp")
+
+    #: Seconds between two checks that the worker process is alive,
+    #: while waiting for a reply
+    poll_interval = Float(0.5)
+
+    #: Seconds to wait for the worker to exit when stopped
+    exit_timeout = Float(5.0)
+
+    #: Whether the worker process is running
+    is_alive = Property()
+
+    #: The worker process
+    _process = Any()
+
+    #: ZMQ context and REQ socket of the channel to the worker
+    _context = Any()
+    _socket = Any()
+
+    #: Temporary directory of the ipc socket
+    _ipc_dir = Any()
+
+    #: Serialises the requests to the worker
+    _lock = Instance(threading.Lock, ())
+
+    def _get_is_alive(self):
+        return self._process is not None and self._process.poll() is None
+
+    def start(self):
+        """ Starts the worker process. Plugins are loaded by the worker
+        in the background, while the first request is queued."""
+        self._context = zmq.Context.instance()
+        self._socket = self._context.socket(zmq.REQ)
+        self._socket.setsockopt(zmq.LINGER, 0)
+        if self.transport == "ipc" and zmq.has("ipc"):
+            self._ipc_dir = tempfile.mkdtemp(prefix="force_wfmanager_")
+            url = "ipc://" + os.path.join(self._ipc_dir, "worker")
+            self._socket.bind(url)
+        else:
+            port = self._socket.bind_to_random_port("tcp://127.0.0.1")
+            url = f"tcp://127.0.0.1:{port}"
+
+        try:
+            self._process = subprocess.Popen(
+                [self.python_executable, "-m", __name__, url]
+            )
+        except Exception:
+            self._close_socket()
+            raise
+
+    def execute(self, workflow_path):
+        """ Executes the workflow in `workflow_path` in the worker process,
+        and waits for its completion. Raises CalledProcessError if the
+        BDSS returned a non-zero status, as :func:`subprocess.check_call`
+        would."""
+        with open(workflow_path, "r") as fp:
+            workflow_data = json.load(fp)
+
+        with self._lock:
+            reply = self._request(
+                {"action": ACTION_RUN, "workflow": workflow_data}
+            )
+
+        if reply["status"] != 0:
+            raise subprocess.CalledProcessError(
+                reply["status"],
+                [self.python_executable, "-m", __name__, workflow_path],
+                output=reply.get("error"),
+            )
+
+    def stop(self):
+        """ Asks the worker process to exit, and kills it if it does not
+        exit in time. A worker still executing a workflow is killed."""
+        if not self._lock.acquire(timeout=self.exit_timeout):
+            # The executing thread closes the socket when the worker dies
+            log.warning("BDSS worker is still executing, killing it")
+            self._process.kill()
+            return
+
+        try:
+            if self.is_alive:
+                try:
+                    self._socket.send_json(
+                        {"action": ACTION_EXIT}, flags=zmq.NOBLOCK
+                    )
+                    self._process.wait(self.exit_timeout)
+                except Exception:
+                    log.exception("BDSS worker did not exit, killing it")
+                    self._process.kill()
+                    self._process.wait()
+            self._close_socket()
+        finally:
+            self._lock.release()
+
+    def _request(self, message):
+        """ Sends a request and returns the reply, checking regularly
+        that the worker process did not die."""
+        # A REQ socket blocks on send until the worker has connected
+        self._wait_for(zmq.POLLOUT)
+        self._socket.send_json(message)
+        self._wait_for(zmq.POLLIN)
+        return self._socket.recv_json()
+
+    def _wait_for(self, event):
+        """ Waits until the socket is ready for `event`, raising
+        RuntimeError if the worker process dies meanwhile."""
+        while not self._socket.poll(int(self.poll_interval * 1000), event):
+            if not self.is_alive:
+                returncode = self._process.returncode
+                self._close_socket()
+                raise RuntimeError(
+                    "The BDSS worker exited unexpectedly with status "
+                    f"{returncode}"
+                )
+
+    def _close_socket(self):
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+        if self._ipc_dir is not None:
+            shutil.rmtree(self._ipc_dir, ignore_errors=True)
+            self._ipc_dir = None
+
+
+class BDSSWorkerPool(HasStrictTraits):
+    """ A pool of warm workers. Workers are started when needed, up to
+    :attr:`max_workers`, and reused by the following executions."""
+
+    #: Maximum number of worker processes
+    max_workers = Int(1)
+
+    #: Transport of the channels to the worker processes
+    transport = Enum("ipc", "tcp")
+
+    #: All the workers of the pool
+    workers = List(Instance(BDSSWorker))
+
+    #: Workers not executing a workflow
+    _idle = Instance(queue.Queue, ())
+
+    #: Protects :attr:`workers`
+    _lock = Instance(threading.Lock, ())
+
+    def prestart(self, count=1):
+        """ Starts workers until `count` of them are running, so that the
+        plugins are already loaded when the first workflows are executed.
+        """
+        count = min(count, self.max_workers)
+        started = []
+        with self._lock:
+            while len(self.workers) < count:
+                started.append(self._start_worker())
+        for worker in started:
+            self._idle.put(worker)
+
+    def execute(self, workflow_path):
+        """ Executes the workflow in `workflow_path` in an idle worker,
+        starting a new one if needed. See :meth:`BDSSWorker.execute`."""
+        worker = self._acquire()
+        try:
+            worker.execute(workflow_path)
+        finally:
+            self._release(worker)
+
+    def shutdown(self):
+        """ Stops all the workers."""
+        with self._lock:
+            workers, self.workers = self.workers, []
+        for worker in workers:
+            worker.stop()
+
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if len(self.workers) < self.max_workers:
+                return self._start_worker()
+
+        return self._idle.get()
+
+    def _release(self, worker):
+        if worker.is_alive:
+            self._idle.put(worker)
+        else:
+            # Replaced by a new worker at the next execution
+            with self._lock:
+                if worker in self.workers:
+                    self.workers.remove(worker)
+            worker.stop()
+
+    def _start_worker(self):
+        worker = BDSSWorker(transport=self.transport)
+        worker.start()
+        self.workers.append(worker)
+        return worker
+
+
+# Worker process
+
+def load_extensions():
+    """ Imports the BDSS and its extension plugins, so that they are
+    already loaded when the first workflow is executed."""
+    from stevedore import extension
+    from stevedore.exception import NoMatches
+
+    import force_bdss.api  # noqa: F401
+    from force_bdss.app.bdss_application import BDSSApplication  # noqa: F401
+
+    mgr = extension.ExtensionManager(
+        namespace='force.bdss.extensions', invoke_on_load=False
+    )
+    try:
+        mgr.map(lambda ext: log.info(f"Loaded extension {ext.name}"))
+    except NoMatches:
+        log.info("No extensions found")
+
+
+def execute_workflow(workflow_data):
+    """ Executes a workflow in this process, as the force_bdss command
+    would. Returns the exit status and an error message."""
+    from force_bdss.app.bdss_application import BDSSApplication
+
+    tmp_dir = tempfile.mkdtemp(prefix="force_wfmanager_")
+    try:
+        workflow_path = os.path.join(tmp_dir, "workflow.json")
+        with open(workflow_path, "w") as fp:
+            json.dump(workflow_data, fp)
+
+        application = BDSSApplication(False, workflow_path)
+        application.run()
+    except SystemExit as e:
+        if e.code is None or e.code == 0:
+            return 0, ""
+        if isinstance(e.code, int):
+            return e.code, ""
+        return 1, str(e.code)
+    except Exception as e:
+        log.exception("Error while executing the workflow")
+        return 1, str(e)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return 0, ""
+
+
+def serve(url):
+    """ Executes the workflows received on `url` until asked to exit."""
+    load_extensions()
+
+    context = zmq.Context.instance()
+    socket = context.socket(zmq.REP)
+    socket.setsockopt(zmq.LINGER, 0)
+    socket.connect(url)
+    try:
+        while True:
+            message = socket.recv_json()
+            if message.get("action") == ACTION_RUN:
+                status, error = execute_workflow(message["workflow"])
+                socket.send_json({"status": status, "error": error})
+            elif message.get("action") == ACTION_EXIT:
+                break
+            else:
+                socket.send_json(
+                    {"status": 1, "error": f"Unknown request {message}"}
+                )
+    finally:
+        socket.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    serve(sys.argv[1])
@@ -0,0 +1,184 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+""" Backends executing the BDSS runs on the local machine. See
+:class:`IExecutionBackend <.i_execution_backend.IExecutionBackend>`.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import logging
+import os
+import subprocess
+import threading
+
+from pyface.api import GUI
+from traits.api import (
+    Dict,
+    Float,
+    HasStrictTraits,
+    Instance,
+    Int,
+    provides,
+    Str,
+)
+
+from force_wfmanager.model.bdss_run import (
+    RUN_FAILED,
+    RUN_FINISHED,
+    RUN_QUEUED,
+    RUN_RUNNING,
+)
+from force_wfmanager.server.i_execution_backend import IExecutionBackend
+from force_wfmanager.server.process_monitor import (
+    ProcessMonitor,
+    is_supported as process_monitor_supported,
+)
+
+log = logging.getLogger(__name__)
+
+
+@provides(IExecutionBackend)
+class BaseExecutionBackend(HasStrictTraits):
+    """ Base class of the backends which wait for the completion of each
+    run in a thread. Subclasses implement :meth:`execute`. Stop and pause
+    messages are published by the ZMQ server of the run.
+    """
+
+    #: Maximum number of runs executed at the same time
+    max_runs = Int()
+
+    #: Executes the runs in secondary threads
+    executor = Instance(ThreadPoolExecutor)
+
+    #: The future of each run submitted and not completed yet
+    _futures = Dict()
+
+    #: Serialises the accesses to :attr:`_futures`, whose entries are
+    #: removed by the executor threads
+    _futures_lock = Instance(threading.Lock, ())
+
+    def _max_runs_default(self):
+        return os.cpu_count() or 1
+
+    def _executor_default(self):
+        return ThreadPoolExecutor(max_workers=self.max_runs)
+
+    def start(self):
+        """ Nothing to prepare by default."""
+
+    def submit(self, run, workflow_path):
+        """ Executes the workflow in a thread of :attr:`executor`. The
+        future of the run is forgotten once done."""
+        future = self.executor.submit(self._execute, run, workflow_path)
+        with self._futures_lock:
+            self._futures[run] = future
+        future.add_done_callback(partial(self._forget_future, run))
+        return future
+
+    def poll(self, run):
+        """ Returns the status of the future of `run`, or None if unknown
+        or done already."""
+        with self._futures_lock:
+            future = self._futures.get(run)
+        if future is None:
+            return None
+        if future.running():
+            return RUN_RUNNING
+        if not future.done():
+            return RUN_QUEUED
+        if future.cancelled() or future.exception() is not None:
+            return RUN_FAILED
+        return RUN_FINISHED
+
+    def stop(self, run):
+        """ Publishes the stop message to the BDSS of `run`."""
+        run.stop()
+
+    def pause(self, run):
+        """ Publishes the pause or resume message to the BDSS of `run`."""
+        run.pause()
+
+    def shutdown(self):
+        """ Stops accepting new runs."""
+        self.executor.shutdown(wait=False)
+
+    def execute(self, run, workflow_path):
+        """ Executes the workflow in `workflow_path` for `run`, and waits
+        for its completion. Invoked in a secondary thread.
+
+        Raises
+        ------
+        subprocess.CalledProcessError
+            If the BDSS returned a non-zero status
+        """
+        raise NotImplementedError
+
+    def _forget_future(self, run, future):
+        """ Removes the future of `run` once done, unless the run was
+        submitted again since."""
+        with self._futures_lock:
+            if self._futures.get(run) is future:
+                del self._futures[run]
+
+    def _execute(self, run, workflow_path):
+        """Secondary thread executor routine."""
+        try:
+            self.execute(run, workflow_path)
+        except OSError:
+            log.exception(
+                "Error while executing force_bdss executable. "
+                " Is force_bdss in your path?"
+            )
+            raise
+        except subprocess.CalledProcessError:
+            log.exception(
+                "force_bdss returned a non-zero value after execution"
+            )
+            raise
+        except Exception:
+            log.exception(
+                "Unknown exception occurred "
+                "while invoking force bdss executable."
+            )
+            raise
+
+
+class LocalExecutionBackend(BaseExecutionBackend):
+    """ Executes each run in a new process of the BDSS executable on the
+    local machine. The resource usage of the process tree can be sampled
+    into the telemetry of the run, on Linux.
+    """
+
+    #: Path to spawn for the BDSS CLI executable.
+    bdss_executable_path = Str("force_bdss")
+
+    #: Seconds between two samples of the resource usage of the BDSS
+    #: processes of a run. Zero disables the sampling.
+    telemetry_interval = Float(0.0)
+
+    def execute(self, run, workflow_path):
+        """ Executes the BDSS executable, as :func:`subprocess.check_call`
+        does."""
+        command = [self.bdss_executable_path, workflow_path]
+        if self.telemetry_interval > 0 and process_monitor_supported():
+            self._execute_monitored(command, run)
+        else:
+            subprocess.check_call(command)
+
+    def _execute_monitored(self, command, run):
+        """ Executes `command`, and samples the resource usage of its
+        process tree into the telemetry of `run` until it exits."""
+        process = subprocess.Popen(command)
+        monitor = ProcessMonitor(
+            pid=process.pid,
+            interval=self.telemetry_interval,
+            callback=partial(GUI.invoke_later, run.telemetry.append),
+        )
+        monitor.start()
+        try:
+            returncode = process.wait()
+        finally:
+            monitor.stop()
+        if returncode:
+            raise subprocess.CalledProcessError(returncode, command)
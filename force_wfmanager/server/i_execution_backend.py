@@ -0,0 +1,60 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+from traits.api import Int, Interface
+
+
+class IExecutionBackend(Interface):
+    """Interface definition for the backends executing the BDSS runs of
+    the Setup task, e.g. on the local machine or on the nodes of a batch
+    system.
+
+    Before submitting a run, the Setup task starts the ZMQ server of the
+    run (:attr:`BDSSRun.zmq_server`) and writes the address of the server
+    in the workflow file. A backend must execute the BDSS where it can
+    reach that server: the events of the MCO are streamed to the UI
+    through it, and the stop and pause messages are published by it.
+    """
+
+    #: Maximum number of runs executed at the same time
+    max_runs = Int()
+
+    def start(self):
+        """Prepares the backend for the first submission, e.g. by starting
+        worker processes or connecting to a scheduler."""
+
+    def submit(self, run, workflow_path):
+        """Starts the execution of the workflow file of a run, and
+        returns at once.
+
+        Parameters
+        ----------
+        run: BDSSRun
+            The run to execute
+        workflow_path: str
+            Path of the workflow file to execute. It is removed when the
+            execution completes, so remote backends must copy it.
+
+        Returns
+        -------
+        future: concurrent.futures.Future
+            Completes with the execution, with the exception of a failed
+            execution
+        """
+
+    def poll(self, run):
+        """Returns the status of the execution of `run`: one of the
+        ``RUN_QUEUED``, ``RUN_RUNNING``, ``RUN_FINISHED`` or ``RUN_FAILED``
+        values of :mod:`force_wfmanager.model.bdss_run`, or None if the
+        run was not submitted to this backend. The backend may forget the
+        runs whose execution has completed, returning None for them."""
+
+    def stop(self, run):
+        """Asks the BDSS executing `run` to stop."""
+
+    def pause(self, run):
+        """Pauses the MCO of `run`, or resumes it if already paused."""
+
+    def shutdown(self):
+        """Releases the resources of the backend. Runs still executing may
+        be killed."""
@@ -0,0 +1,41 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+from traits.api import Enum, Instance
+
+from force_wfmanager.server.bdss_worker import BDSSWorkerPool
+from force_wfmanager.server.execution_backend import BaseExecutionBackend
+
+
+class LocalClusterBackend(BaseExecutionBackend):
+    """ Spreads the runs over :attr:`max_runs` long-lived local worker
+    processes, which stand in for the nodes of a cluster. As on a cluster,
+    the workflow is shipped to the node executing it, and the events of
+    the BDSS are streamed back through the ZMQ server of the run. The
+    workers keep the BDSS plugins loaded between runs.
+    """
+
+    #: Transport of the channels to the worker processes
+    transport = Enum("ipc", "tcp")
+
+    #: The worker processes
+    pool = Instance(BDSSWorkerPool)
+
+    def _pool_default(self):
+        return BDSSWorkerPool(
+            max_workers=self.max_runs, transport=self.transport
+        )
+
+    def start(self):
+        """ Starts the worker processes, so that the plugins are loaded
+        when the first runs are submitted."""
+        self.pool.prestart(self.max_runs)
+
+    def execute(self, run, workflow_path):
+        """ Executes the workflow in an idle worker process."""
+        self.pool.execute(workflow_path)
+
+    def shutdown(self):
+        """ Stops the worker processes."""
+        super(LocalClusterBackend, self).shutdown()
+        self.pool.shutdown()
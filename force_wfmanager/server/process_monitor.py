@@ -0,0 +1,215 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+""" Sampling of the resource usage of a process and its descendants
+through the /proc file system. Only available on Linux.
+"""
+
+import logging
+import os
+import threading
+import time
+
+from traits.api import (
+    Any,
+    Callable,
+    Dict,
+    Float,
+    HasStrictTraits,
+    Instance,
+    Int,
+    Str,
+)
+
+log = logging.getLogger(__name__)
+
+#: Bytes in a megabyte, the unit of the memory and I/O values
+MEGABYTE = 1024 ** 2
+
+
+def is_supported(proc_dir="/proc"):
+    """ Whether the resource usage can be sampled on this system."""
+    return os.path.isdir(os.path.join(proc_dir, "self"))
+
+
+def read_stat(pid, proc_dir="/proc"):
+    """ Reads the /proc/<pid>/stat file of a process.
+
+    Returns
+    -------
+    stat: dict or None
+        The parent pid, the CPU time in clock ticks, the number of threads
+        and the resident memory in pages, or None if the process vanished.
+    """
+    try:
+        with open(os.path.join(proc_dir, str(pid), "stat")) as fp:
+            data = fp.read()
+    except OSError:
+        return None
+
+    # The command name may contain spaces and parentheses, and is
+    # followed by the other fields, starting with the state (field 3)
+    fields = data[data.rfind(")") + 2:].split()
+    try:
+        return {
+            "ppid": int(fields[1]),
+            "cpu_ticks": int(fields[11]) + int(fields[12]),
+            "num_threads": int(fields[17]),
+            "rss_pages": int(fields[21]),
+        }
+    except (IndexError, ValueError):
+        return None
+
+
+def read_io(pid, proc_dir="/proc"):
+    """ Returns the bytes read from and written to the storage by a
+    process, as (read_bytes, write_bytes). Zeros if not readable."""
+    counters = {}
+    try:
+        with open(os.path.join(proc_dir, str(pid), "io")) as fp:
+            for line in fp:
+                name, _, value = line.partition(":")
+                counters[name] = value.strip()
+    except OSError:
+        return 0, 0
+
+    try:
+        return int(counters["read_bytes"]), int(counters["write_bytes"])
+    except (KeyError, ValueError):
+        return 0, 0
+
+
+def read_process_tree(pid, proc_dir="/proc"):
+    """ Returns the stat of `pid` and of all its descendants, by pid."""
+    stats = {}
+    for name in os.listdir(proc_dir):
+        if name.isdigit():
+            stat = read_stat(name, proc_dir)
+            if stat is not None:
+                stats[int(name)] = stat
+
+    if pid not in stats:
+        return {}
+
+    children = {}
+    for child, stat in stats.items():
+        children.setdefault(stat["ppid"], []).append(child)
+
+    tree = {}
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        tree[current] = stats[current]
+        pending.extend(children.get(current, []))
+    return tree
+
+
+class ProcessMonitor(HasStrictTraits):
+    """ Samples the resource usage of a process tree in a thread, and
+    passes each sample to :attr:`callback`, in the format of
+    :class:`ResourceTelemetry <.resource_telemetry.ResourceTelemetry>`.
+    """
+
+    #: The pid of the root process
+    pid = Int()
+
+    #: Seconds between two samples
+    interval = Float(1.0)
+
+    #: Called by the monitor thread with each sample
+    callback = Callable()
+
+    #: Location of the proc file system
+    proc_dir = Str("/proc")
+
+    #: Clock ticks per second of the CPU times
+    clock_ticks = Int()
+
+    #: Page size of the resident memory, in bytes
+    page_size = Int()
+
+    #: Wall clock time of the start of the sampling, and of the previous
+    #: sample
+    _start_time = Float()
+    _last_time = Float()
+
+    #: CPU ticks and I/O bytes of each process at the previous sample
+    _last_counters = Dict()
+
+    #: The sampling thread
+    _thread = Any()
+
+    #: Set when the sampling must stop
+    _stop_event = Instance(threading.Event, ())
+
+    def _clock_ticks_default(self):
+        return os.sysconf("SC_CLK_TCK")
+
+    def _page_size_default(self):
+        return os.sysconf("SC_PAGE_SIZE")
+
+    def start(self):
+        """ Starts sampling in a new thread."""
+        self._start_time = self._last_time = time.monotonic()
+        self._last_counters = {}
+        self._thread = threading.Thread(
+            target=self._run, name="ProcessMonitor", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """ Stops sampling, and waits for the thread to exit."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def sample(self):
+        """ Returns a new sample of the process tree, or None if the root
+        process does not exist anymore."""
+        tree = read_process_tree(self.pid, self.proc_dir)
+        if not tree:
+            return None
+
+        now = time.monotonic()
+        elapsed = max(now - self._last_time, 1e-6)
+
+        counters = {}
+        cpu_ticks = read_bytes = write_bytes = 0
+        rss_pages = num_threads = 0
+        for pid, stat in tree.items():
+            io = read_io(pid, self.proc_dir)
+            counters[pid] = (stat["cpu_ticks"],) + io
+            # Processes started since the previous sample count from zero
+            last = self._last_counters.get(pid, (0, 0, 0))
+            cpu_ticks += max(stat["cpu_ticks"] - last[0], 0)
+            read_bytes += max(io[0] - last[1], 0)
+            write_bytes += max(io[1] - last[2], 0)
+            rss_pages += stat["rss_pages"]
+            num_threads += stat["num_threads"]
+
+        self._last_counters = counters
+        self._last_time = now
+
+        return (
+            now - self._start_time,
+            100.0 * cpu_ticks / self.clock_ticks / elapsed,
+            rss_pages * self.page_size / MEGABYTE,
+            num_threads,
+            read_bytes / MEGABYTE / elapsed,
+            write_bytes / MEGABYTE / elapsed,
+        )
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                sample = self.sample()
+            except Exception:
+                log.exception("Unable to sample the resource usage")
+                return
+            if sample is None:
+                return
+            try:
+                self.callback(sample)
+            except Exception:
+                log.exception("Resource sample callback raised exception")
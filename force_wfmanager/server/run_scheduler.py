@@ -0,0 +1,125 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import logging
+import os
+
+from traits.api import (
+    Callable,
+    HasStrictTraits,
+    Int,
+    List,
+    Property,
+)
+
+from force_wfmanager.model.bdss_run import (
+    BDSSRun,
+    RUN_FAILED,
+    RUN_QUEUED,
+    RUN_RUNNING,
+    RUN_STOPPED,
+)
+
+log = logging.getLogger(__name__)
+
+
+class RunScheduler(HasStrictTraits):
+    """Queue of BDSS runs. Runs are launched in submission order, as
+    long as the cores they require fit in the :attr:`core_budget`.
+    A run requiring more cores than the budget is launched when no
+    other run is executing.
+
+    The scheduler does not execute the runs itself: it calls the
+    :attr:`launcher` with each run that can start, and must be informed
+    through :meth:`run_finished` when the execution of a run completes.
+    All the methods must be called by the same (main) thread.
+    """
+
+    #: Maximum number of cores used by the runs executing concurrently
+    core_budget = Int()
+
+    #: Callable invoked with a run when it can be started. The run is
+    #: already marked as running when the launcher is invoked. If the
+    #: launcher raises, the run is marked as failed.
+    launcher = Callable()
+
+    #: All the submitted runs, in submission order
+    runs = List(BDSSRun)
+
+    #: Runs waiting to be launched
+    queued_runs = Property(List(BDSSRun), depends_on="runs.status")
+
+    #: Runs currently executing
+    running_runs = Property(List(BDSSRun), depends_on="runs.status")
+
+    #: Number of cores used by the running runs
+    cores_in_use = Property(Int, depends_on="runs.[status,cores]")
+
+    #: Identifier assigned to the next submitted run
+    _next_identifier = Int(1)
+
+    def _core_budget_default(self):
+        return os.cpu_count() or 1
+
+    def _get_queued_runs(self):
+        return [run for run in self.runs if run.status == RUN_QUEUED]
+
+    def _get_running_runs(self):
+        return [run for run in self.runs if run.status == RUN_RUNNING]
+
+    def _get_cores_in_use(self):
+        return sum(run.cores for run in self.running_runs)
+
+    def submit(self, run):
+        """Adds a run to the queue and launches it if there are enough
+        cores available."""
+        run.identifier = self._next_identifier
+        self._next_identifier += 1
+        if not run.name:
+            run.name = f"Run {run.identifier}"
+        run.status = RUN_QUEUED
+        self.runs.append(run)
+        self.schedule()
+
+    def record(self, run):
+        """Adds a run that does not need to be launched, e.g. holding
+        results merged from other runs, to the list of runs."""
+        run.identifier = self._next_identifier
+        self._next_identifier += 1
+        if not run.name:
+            run.name = f"Run {run.identifier}"
+        self.runs.append(run)
+
+    def cancel(self, run):
+        """Removes a queued run from the queue. Returns True if the
+        run was cancelled, False if it was not waiting to be launched."""
+        if run.status != RUN_QUEUED:
+            return False
+        run.status = RUN_STOPPED
+        return True
+
+    def run_finished(self, run, status):
+        """Marks a running run as completed with the given `status`,
+        releasing its cores, and launches the runs that can now start."""
+        run.status = status
+        self.schedule()
+
+    def schedule(self):
+        """Launches the queued runs, in submission order, until the
+        first one that does not fit in the core budget."""
+        for run in self.queued_runs:
+            # The launcher might have already completed and rescheduled
+            if run.status != RUN_QUEUED:
+                continue
+
+            cores_in_use = self.cores_in_use
+            if (cores_in_use != 0
+                    and cores_in_use + run.cores > self.core_budget):
+                break
+
+            run.status = RUN_RUNNING
+            try:
+                self.launcher(run)
+            except Exception:
+                log.exception(f"Unable to launch {run.name}")
+                run.status = RUN_FAILED
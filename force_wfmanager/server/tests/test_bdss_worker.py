@@ -0,0 +1,209 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from force_wfmanager.server.bdss_worker import (
+    BDSSWorker,
+    BDSSWorkerPool,
+    execute_workflow,
+    serve,
+)
+
+POPEN_PATH = "force_wfmanager.server.bdss_worker.subprocess.Popen"
+LOAD_EXTENSIONS_PATH = "force_wfmanager.server.bdss_worker.load_extensions"
+EXECUTE_WORKFLOW_PATH = (
+    "force_wfmanager.server.bdss_worker.execute_workflow"
+)
+BDSS_APPLICATION_PATH = (
+    "force_bdss.app.bdss_application.BDSSApplication"
+)
+BDSS_WORKER_PATH = "force_wfmanager.server.bdss_worker.BDSSWorker"
+
+
+class FakeProcess:
+    """Stands for the worker process, running :func:`serve` in a thread
+    of the test process instead."""
+
+    def __init__(self, args, results):
+        self.returncode = None
+        self.workflows = []
+
+        def execute(workflow_data):
+            self.workflows.append(workflow_data)
+            return results.pop(0)
+
+        def target():
+            with mock.patch(LOAD_EXTENSIONS_PATH), \
+                    mock.patch(EXECUTE_WORKFLOW_PATH, side_effect=execute):
+                serve(args[-1])
+            self.returncode = 0
+
+        self.thread = threading.Thread(target=target)
+        self.thread.start()
+
+    def poll(self):
+        return self.returncode
+
+    def wait(self, timeout=None):
+        self.thread.join(timeout)
+        return self.returncode
+
+    def kill(self):
+        pass
+
+
+class TestBDSSWorker(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        self.workflow_path = os.path.join(self.tmp_dir, "workflow.json")
+        with open(self.workflow_path, "w") as fp:
+            json.dump({"version": "1"}, fp)
+
+    def start_worker(self, results, **kwargs):
+        processes = []
+
+        def popen(args):
+            processes.append(FakeProcess(args, results))
+            return processes[-1]
+
+        worker = BDSSWorker(**kwargs)
+        with mock.patch(POPEN_PATH, side_effect=popen) as mock_popen:
+            worker.start()
+        args = mock_popen.call_args[0][0]
+        self.assertEqual(
+            [worker.python_executable, "-m",
+             "force_wfmanager.server.bdss_worker"],
+            args[:3]
+        )
+        return worker, processes[0]
+
+    def test_execute(self):
+        for transport in ["ipc", "tcp"]:
+            worker, process = self.start_worker(
+                [(0, ""), (2, "boom")], transport=transport
+            )
+            self.assertTrue(worker.is_alive)
+
+            worker.execute(self.workflow_path)
+            with self.assertRaises(subprocess.CalledProcessError) as cm:
+                worker.execute(self.workflow_path)
+            self.assertEqual(2, cm.exception.returncode)
+            self.assertEqual("boom", cm.exception.output)
+            self.assertEqual([{"version": "1"}] * 2, process.workflows)
+
+            worker.stop()
+            self.assertFalse(worker.is_alive)
+            self.assertFalse(process.thread.is_alive())
+
+    def test_worker_died(self):
+        worker = BDSSWorker(poll_interval=0.01)
+        process = mock.Mock()
+        process.poll.return_value = -9
+        process.returncode = -9
+        with mock.patch(POPEN_PATH, return_value=process):
+            worker.start()
+
+        with self.assertRaisesRegex(RuntimeError, "status -9"):
+            worker.execute(self.workflow_path)
+        self.assertFalse(worker.is_alive)
+        worker.stop()
+
+    def test_start_failure(self):
+        worker = BDSSWorker()
+        with mock.patch(POPEN_PATH, side_effect=OSError("no python")):
+            with self.assertRaises(OSError):
+                worker.start()
+        self.assertFalse(worker.is_alive)
+
+    def test_execute_workflow(self):
+        with mock.patch(BDSS_APPLICATION_PATH) as mock_application:
+            self.assertEqual((0, ""), execute_workflow({"version": "1"}))
+            path = mock_application.call_args[0][1]
+            self.assertFalse(os.path.exists(path))
+
+            mock_application.return_value.run.side_effect = SystemExit(3)
+            self.assertEqual((3, ""), execute_workflow({}))
+
+            mock_application.return_value.run.side_effect = SystemExit(
+                "failed"
+            )
+            self.assertEqual((1, "failed"), execute_workflow({}))
+
+            mock_application.return_value.run.side_effect = SystemExit()
+            self.assertEqual((0, ""), execute_workflow({}))
+
+            mock_application.return_value.run.side_effect = Exception("boom")
+            self.assertEqual((1, "boom"), execute_workflow({}))
+
+
+def mock_bdss_worker(is_alive=True):
+    worker = mock.Mock(spec=BDSSWorker)
+    worker.is_alive = is_alive
+    return worker
+
+
+class TestBDSSWorkerPool(unittest.TestCase):
+    def setUp(self):
+        self.pool = BDSSWorkerPool(max_workers=2)
+
+    def test_execute(self):
+        with mock.patch(BDSS_WORKER_PATH) as mock_worker:
+            workers = [mock_bdss_worker(), mock_bdss_worker()]
+            mock_worker.side_effect = workers
+
+            self.pool.prestart()
+            self.pool.prestart()
+            self.assertEqual(workers[:1], self.pool.workers)
+            workers[0].start.assert_called_once_with()
+
+            # The started worker is reused
+            self.pool.execute("workflow.json")
+            self.pool.execute("workflow.json")
+            self.assertEqual(2, workers[0].execute.call_count)
+            self.assertEqual(1, mock_worker.call_count)
+
+            # A new worker is started if they are all busy
+            self.assertIs(workers[0], self.pool._acquire())
+            self.pool.execute("workflow.json")
+            workers[1].execute.assert_called_once_with("workflow.json")
+            self.assertEqual(workers, self.pool.workers)
+
+            self.pool.shutdown()
+            for worker in workers:
+                worker.stop.assert_called_once_with()
+            self.assertEqual([], self.pool.workers)
+
+    def test_prestart_count(self):
+        with mock.patch(BDSS_WORKER_PATH) as mock_worker:
+            workers = [mock_bdss_worker() for _ in range(3)]
+            mock_worker.side_effect = workers
+
+            # No more than the maximum number of workers are started
+            self.pool.prestart(3)
+            self.assertEqual(workers[:2], self.pool.workers)
+            self.assertEqual(2, self.pool._idle.qsize())
+
+            self.pool.prestart(2)
+            self.assertEqual(2, mock_worker.call_count)
+
+    def test_dead_worker(self):
+        with mock.patch(BDSS_WORKER_PATH) as mock_worker:
+            worker = mock_bdss_worker(is_alive=False)
+            worker.execute.side_effect = RuntimeError("died")
+            mock_worker.return_value = worker
+
+            with self.assertRaises(RuntimeError):
+                self.pool.execute("workflow.json")
+
+        worker.stop.assert_called_once_with()
+        self.assertEqual([], self.pool.workers)
+        self.assertTrue(self.pool._idle.empty())
@@ -0,0 +1,182 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+from concurrent.futures import Future
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+from testfixtures import LogCapture
+from traits.api import Instance
+
+from force_wfmanager.model.bdss_run import (
+    BDSSRun,
+    RUN_FAILED,
+    RUN_FINISHED,
+    RUN_RUNNING,
+)
+from force_wfmanager.server.execution_backend import (
+    BaseExecutionBackend,
+    LocalExecutionBackend,
+)
+from force_wfmanager.server.i_execution_backend import IExecutionBackend
+
+try:
+    import mock
+except ImportError:
+    from unittest import mock
+
+GUI_INVOKE_LATER_PATH = (
+    "force_wfmanager.server.execution_backend.GUI.invoke_later"
+)
+
+
+def wait_until_forgotten(backend, run, timeout=10):
+    """ Waits for `backend` to forget the completed execution of `run`,
+    which is done by the executor thread after the future completes."""
+    deadline = time.monotonic() + timeout
+    while backend.poll(run) is not None:
+        if time.monotonic() > deadline:
+            raise AssertionError("The execution of the run is not forgotten")
+        time.sleep(0.01)
+
+
+class WaitingBackend(BaseExecutionBackend):
+    """ Backend whose executions wait for the test to release them."""
+
+    started = Instance(threading.Event, ())
+
+    released = Instance(threading.Event, ())
+
+    def execute(self, run, workflow_path):
+        self.started.set()
+        self.released.wait(10)
+
+
+class TestLocalExecutionBackend(unittest.TestCase):
+    def setUp(self):
+        self.backend = LocalExecutionBackend(
+            max_runs=2, bdss_executable_path=sys.executable
+        )
+        self.addCleanup(self.backend.shutdown)
+        self.run = BDSSRun()
+
+    def write_script(self, code):
+        fd, path = tempfile.mkstemp(suffix=".py")
+        with os.fdopen(fd, "w") as fp:
+            fp.write(code)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_interface(self):
+        self.assertIsInstance(self.backend, IExecutionBackend)
+        self.assertEqual(os.cpu_count() or 1, LocalExecutionBackend().max_runs)
+
+    def test_submit(self):
+        script = self.write_script("import time\ntime.sleep(0.2)\n")
+        self.assertIsNone(self.backend.poll(self.run))
+        with mock.patch(
+            "subprocess.check_call", wraps=subprocess.check_call
+        ) as mock_call:
+            future = self.backend.submit(self.run, script)
+            self.assertIsNone(future.result(10))
+        mock_call.assert_called_once_with([sys.executable, script])
+        wait_until_forgotten(self.backend, self.run)
+        self.assertEqual([], self.run.telemetry.samples)
+
+    def test_failure(self):
+        script = self.write_script("raise SystemExit(3)\n")
+        with LogCapture() as capture:
+            future = self.backend.submit(self.run, script)
+            self.assertIsInstance(
+                future.exception(10), subprocess.CalledProcessError
+            )
+        capture.check(
+            (
+                "force_wfmanager.server.execution_backend",
+                "ERROR",
+                "force_bdss returned a non-zero value after execution",
+            )
+        )
+        wait_until_forgotten(self.backend, self.run)
+
+        self.backend.bdss_executable_path = "/not/a/force_bdss"
+        with LogCapture() as capture:
+            future = self.backend.submit(self.run, script)
+            self.assertIsInstance(future.exception(10), OSError)
+        capture.check(
+            (
+                "force_wfmanager.server.execution_backend",
+                "ERROR",
+                "Error while executing force_bdss executable. "
+                " Is force_bdss in your path?",
+            )
+        )
+
+    def test_telemetry(self):
+        self.backend.telemetry_interval = 0.01
+        script = self.write_script("import time\ntime.sleep(0.5)\n")
+        with mock.patch(
+            GUI_INVOKE_LATER_PATH,
+            side_effect=lambda func, *args: func(*args),
+        ):
+            self.backend.submit(self.run, script).result(10)
+            self.assertGreater(len(self.run.telemetry.samples), 0)
+
+            script = self.write_script("raise SystemExit(3)\n")
+            with LogCapture():
+                future = self.backend.submit(self.run, script)
+                self.assertIsInstance(
+                    future.exception(10), subprocess.CalledProcessError
+                )
+
+    def test_stop_pause(self):
+        run = mock.Mock(spec=BDSSRun)
+        self.backend.pause(run)
+        run.pause.assert_called_once_with()
+        self.backend.stop(run)
+        run.stop.assert_called_once_with()
+
+
+class TestBaseExecutionBackend(unittest.TestCase):
+    def test_poll(self):
+        backend = WaitingBackend(max_runs=1)
+        self.addCleanup(backend.shutdown)
+        run = BDSSRun()
+
+        future = backend.submit(run, "workflow.json")
+        self.assertTrue(backend.started.wait(10))
+        self.assertEqual(RUN_RUNNING, backend.poll(run))
+
+        backend.released.set()
+        future.result(10)
+        wait_until_forgotten(backend, run)
+
+        # The statuses of the done futures are reported until forgotten
+        future = Future()
+        future.set_result(None)
+        backend._futures[run] = future
+        self.assertEqual(RUN_FINISHED, backend.poll(run))
+        future = Future()
+        future.set_exception(Exception("failed"))
+        backend._futures[run] = future
+        self.assertEqual(RUN_FAILED, backend.poll(run))
+
+    def test_not_implemented(self):
+        backend = BaseExecutionBackend()
+        self.addCleanup(backend.shutdown)
+        with LogCapture() as capture:
+            future = backend.submit(BDSSRun(), "workflow.json")
+            self.assertIsInstance(future.exception(10), NotImplementedError)
+        capture.check(
+            (
+                "force_wfmanager.server.execution_backend",
+                "ERROR",
+                "Unknown exception occurred "
+                "while invoking force bdss executable.",
+            )
+        )
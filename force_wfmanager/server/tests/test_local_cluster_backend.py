@@ -0,0 +1,42 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import unittest
+
+from force_wfmanager.model.bdss_run import BDSSRun
+from force_wfmanager.server.bdss_worker import BDSSWorkerPool
+from force_wfmanager.server.i_execution_backend import IExecutionBackend
+from force_wfmanager.server.local_cluster_backend import LocalClusterBackend
+from force_wfmanager.server.tests.test_execution_backend import (
+    wait_until_forgotten
+)
+
+try:
+    import mock
+except ImportError:
+    from unittest import mock
+
+
+class TestLocalClusterBackend(unittest.TestCase):
+    def setUp(self):
+        self.backend = LocalClusterBackend(max_runs=3, transport="tcp")
+
+    def test_pool(self):
+        self.assertIsInstance(self.backend, IExecutionBackend)
+        self.assertEqual(3, self.backend.pool.max_workers)
+        self.assertEqual("tcp", self.backend.pool.transport)
+
+    def test_execute(self):
+        pool = mock.Mock(spec=BDSSWorkerPool)
+        self.backend.pool = pool
+        run = BDSSRun()
+
+        self.backend.start()
+        pool.prestart.assert_called_once_with(3)
+
+        self.backend.submit(run, "workflow.json").result(10)
+        pool.execute.assert_called_once_with("workflow.json")
+        wait_until_forgotten(self.backend, run)
+
+        self.backend.shutdown()
+        pool.shutdown.assert_called_once_with()
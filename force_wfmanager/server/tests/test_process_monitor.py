@@ -0,0 +1,144 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from force_wfmanager.server.process_monitor import (
+    is_supported,
+    MEGABYTE,
+    ProcessMonitor,
+    read_io,
+    read_process_tree,
+    read_stat,
+)
+
+try:
+    import mock
+except ImportError:
+    from unittest import mock
+
+TIME_PATH = "force_wfmanager.server.process_monitor.time.monotonic"
+
+
+def stat_line(pid, name, ppid, utime, stime, threads, rss):
+    """ Returns the content of a /proc/<pid>/stat file."""
+    fields = ["S", ppid, 0, 0, 0, 0, 0, 0, 0, 0, 0, utime, stime,
+              0, 0, 20, 0, threads, 0, 0, 0, rss, 0]
+    return f"{pid} ({name}) " + " ".join(str(f) for f in fields) + "\n"
+
+
+class TestProcessMonitor(unittest.TestCase):
+    def setUp(self):
+        self.proc_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.proc_dir)
+        os.mkdir(os.path.join(self.proc_dir, "self"))
+
+        # A BDSS process, with a worker process, and an unrelated process
+        self.write_process(100, "force_bdss", 1, 10, 5, 2, 1000,
+                           read_bytes=0, write_bytes=0)
+        self.write_process(101, "my (worker)", 100, 20, 0, 3, 512)
+        self.write_process(200, "bash", 1, 1000, 0, 1, 100)
+
+    def write_process(self, pid, name, ppid, utime, stime, threads, rss,
+                      read_bytes=None, write_bytes=None):
+        directory = os.path.join(self.proc_dir, str(pid))
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, "stat"), "w") as fp:
+            fp.write(stat_line(pid, name, ppid, utime, stime, threads, rss))
+        if read_bytes is not None:
+            with open(os.path.join(directory, "io"), "w") as fp:
+                fp.write(
+                    f"rchar: 12\nread_bytes: {read_bytes}\n"
+                    f"write_bytes: {write_bytes}\n"
+                )
+
+    def test_is_supported(self):
+        self.assertTrue(is_supported(self.proc_dir))
+        self.assertFalse(
+            is_supported(os.path.join(self.proc_dir, "missing"))
+        )
+
+    def test_read_stat(self):
+        self.assertEqual(
+            {"ppid": 100, "cpu_ticks": 20, "num_threads": 3,
+             "rss_pages": 512},
+            read_stat(101, self.proc_dir),
+        )
+        self.assertIsNone(read_stat(999, self.proc_dir))
+
+        with open(os.path.join(self.proc_dir, "200", "stat"), "w") as fp:
+            fp.write("200 (bash) S 1")
+        self.assertIsNone(read_stat(200, self.proc_dir))
+
+    def test_read_io(self):
+        self.write_process(100, "force_bdss", 1, 10, 5, 2, 1000,
+                           read_bytes=2048, write_bytes=4096)
+        self.assertEqual((2048, 4096), read_io(100, self.proc_dir))
+        self.assertEqual((0, 0), read_io(101, self.proc_dir))
+
+    def test_read_process_tree(self):
+        tree = read_process_tree(100, self.proc_dir)
+        self.assertEqual({100, 101}, set(tree))
+        self.assertEqual({101}, set(read_process_tree(101, self.proc_dir)))
+        self.assertEqual({}, read_process_tree(999, self.proc_dir))
+
+    def test_sample(self):
+        monitor = ProcessMonitor(
+            pid=100, proc_dir=self.proc_dir, clock_ticks=100,
+            page_size=1024,
+        )
+        with mock.patch(TIME_PATH, return_value=10.0):
+            monitor.start()
+            monitor.stop()
+
+        with mock.patch(TIME_PATH, return_value=12.0):
+            sample = monitor.sample()
+        # 35 ticks of CPU over 2 seconds, 1512 pages of 1kB
+        self.assertEqual(
+            (2.0, 17.5, 1512 * 1024 / MEGABYTE, 5, 0.0, 0.0), sample
+        )
+
+        self.write_process(100, "force_bdss", 1, 110, 5, 2, 1000,
+                           read_bytes=MEGABYTE, write_bytes=4 * MEGABYTE)
+        self.write_process(102, "new", 101, 50, 0, 1, 0)
+        with mock.patch(TIME_PATH, return_value=13.0):
+            sample = monitor.sample()
+        self.assertEqual(
+            (3.0, 150.0, 1512 * 1024 / MEGABYTE, 6, 1.0, 4.0), sample
+        )
+
+        shutil.rmtree(os.path.join(self.proc_dir, "100"))
+        self.assertIsNone(monitor.sample())
+
+    def test_run(self):
+        sampled = threading.Event()
+        samples = []
+
+        def callback(sample):
+            samples.append(sample)
+            sampled.set()
+
+        monitor = ProcessMonitor(
+            pid=100, interval=0.01, callback=callback,
+            proc_dir=self.proc_dir,
+        )
+        monitor.start()
+        self.assertTrue(sampled.wait(5.0))
+        monitor.stop()
+        self.assertIsNone(monitor._thread)
+        self.assertEqual(6, len(samples[0]))
+
+        # The sampling ends with the process
+        shutil.rmtree(os.path.join(self.proc_dir, "100"))
+        monitor = ProcessMonitor(
+            pid=100, interval=0.01, callback=callback,
+            proc_dir=self.proc_dir,
+        )
+        monitor.start()
+        monitor._thread.join(5.0)
+        self.assertFalse(monitor._thread.is_alive())
+        monitor.stop()
@@ -0,0 +1,126 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+from unittest import mock, TestCase
+
+from testfixtures import LogCapture
+
+from force_wfmanager.model.bdss_run import (
+    BDSSRun,
+    RUN_FAILED,
+    RUN_FINISHED,
+    RUN_QUEUED,
+    RUN_RUNNING,
+    RUN_STOPPED,
+)
+from force_wfmanager.server.run_scheduler import RunScheduler
+
+
+class TestRunScheduler(TestCase):
+    def setUp(self):
+        self.launcher = mock.Mock()
+        self.scheduler = RunScheduler(core_budget=2, launcher=self.launcher)
+
+    def test_default_core_budget(self):
+        self.assertGreaterEqual(RunScheduler().core_budget, 1)
+
+    def test_submit(self):
+        runs = [BDSSRun() for _ in range(3)]
+        for run in runs:
+            self.scheduler.submit(run)
+
+        self.assertEqual(runs, self.scheduler.runs)
+        self.assertEqual(
+            ["Run 1", "Run 2", "Run 3"], [run.name for run in runs]
+        )
+        self.assertEqual(
+            [RUN_RUNNING, RUN_RUNNING, RUN_QUEUED],
+            [run.status for run in runs],
+        )
+        self.assertEqual(runs[:2], self.scheduler.running_runs)
+        self.assertEqual(runs[2:], self.scheduler.queued_runs)
+        self.assertEqual(2, self.scheduler.cores_in_use)
+        self.assertEqual(
+            [mock.call(runs[0]), mock.call(runs[1])],
+            self.launcher.call_args_list,
+        )
+
+        self.scheduler.run_finished(runs[0], RUN_FINISHED)
+        self.assertEqual(RUN_FINISHED, runs[0].status)
+        self.assertEqual(RUN_RUNNING, runs[2].status)
+        self.launcher.assert_called_with(runs[2])
+
+    def test_large_run(self):
+        large_run = BDSSRun(cores=4)
+        small_run = BDSSRun()
+        self.scheduler.submit(small_run)
+        self.scheduler.submit(large_run)
+        self.assertEqual(RUN_QUEUED, large_run.status)
+
+        # Launched alone, even if it exceeds the budget
+        self.scheduler.run_finished(small_run, RUN_FINISHED)
+        self.assertEqual(RUN_RUNNING, large_run.status)
+        self.assertEqual(4, self.scheduler.cores_in_use)
+
+        # Runs are launched in submission order
+        other_run = BDSSRun()
+        self.scheduler.submit(other_run)
+        self.assertEqual(RUN_QUEUED, other_run.status)
+
+    def test_cancel(self):
+        runs = [BDSSRun() for _ in range(3)]
+        for run in runs:
+            self.scheduler.submit(run)
+
+        self.assertFalse(self.scheduler.cancel(runs[0]))
+        self.assertEqual(RUN_RUNNING, runs[0].status)
+
+        self.assertTrue(self.scheduler.cancel(runs[2]))
+        self.assertEqual(RUN_STOPPED, runs[2].status)
+
+        self.scheduler.run_finished(runs[0], RUN_STOPPED)
+        self.assertEqual(2, self.launcher.call_count)
+
+    def test_launcher_raises(self):
+        self.launcher.side_effect = Exception("boom")
+        run = BDSSRun()
+        with LogCapture() as capture:
+            self.scheduler.submit(run)
+
+        capture.check(
+            (
+                "force_wfmanager.server.run_scheduler",
+                "ERROR",
+                "Unable to launch Run 1",
+            )
+        )
+        self.assertEqual(RUN_FAILED, run.status)
+        self.assertEqual(0, self.scheduler.cores_in_use)
+
+    def test_launcher_completes_run(self):
+        # A launcher that fails synchronously releases the cores
+        # and reschedules from within the scheduling loop
+        def launcher(run):
+            if run.name == "Run 1":
+                self.scheduler.run_finished(run, RUN_FAILED)
+
+        self.scheduler.core_budget = 1
+        self.scheduler.launcher = launcher
+        runs = [BDSSRun(), BDSSRun()]
+        self.scheduler.runs.extend(runs)
+        for run in runs:
+            run.name = f"Run {runs.index(run) + 1}"
+        self.scheduler.schedule()
+
+        self.assertEqual(RUN_FAILED, runs[0].status)
+        self.assertEqual(RUN_RUNNING, runs[1].status)
+
+    def test_record(self):
+        self.scheduler.submit(BDSSRun())
+        run = BDSSRun(status=RUN_FINISHED)
+        self.scheduler.record(run)
+
+        self.assertEqual("Run 2", run.name)
+        self.assertEqual(RUN_FINISHED, run.status)
+        self.assertEqual(run, self.scheduler.runs[-1])
+        self.assertEqual(1, self.launcher.call_count)
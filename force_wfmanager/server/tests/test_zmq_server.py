@@ -3,6 +3,7 @@
 
 import json
 import logging
+import os
 import unittest
 import contextlib
 import random
@@ -15,8 +16,8 @@ from unittest import mock
 
 import time
 
-from force_bdss.api import MCOStartEvent
-from force_wfmanager.server.zmq_server import ZMQServer
+from force_bdss.api import BaseDriverEvent, MCOStartEvent
+from force_wfmanager.server.zmq_server import ZMQServer, _EventSequencer
 
 
 class MockPoller(object):
@@ -113,9 +114,33 @@ class TestZMQServer(unittest.TestCase):
         server.stop()
         self.assertEqual(server.state, ZMQServer.STATE_STOPPED)
 
+    def test_start_and_stop_ipc(self):
+        def cb(event):
+            pass
+
+        def err_cb(error_type, error_msg):
+            pass
+
+        server = ZMQServer(cb, err_cb, transport=ZMQServer.TRANSPORT_IPC)
+
+        server.start()
+        wait_condition(lambda: server.state == ZMQServer.STATE_WAITING)
+        for url in server.urls:
+            self.assertTrue(url.startswith("ipc://"))
+        ipc_dir = server._ipc_dir
+        self.assertTrue(os.path.isdir(ipc_dir))
+
+        server.stop()
+        wait_condition(lambda: server.state == ZMQServer.STATE_STOPPED)
+        self.assertIsNone(server.urls)
+        self.assertFalse(os.path.exists(ipc_dir))
+
     @contextlib.contextmanager
-    def mock_started_server(self, events_received, errors_received):
-        with self.mock_server(events_received, errors_received) as server:
+    def mock_started_server(self, events_received, errors_received,
+                            **server_kwargs):
+        with self.mock_server(
+                events_received, errors_received, **server_kwargs
+        ) as server:
             server.start()
             wait_condition(lambda: server.state == ZMQServer.STATE_WAITING)
 
@@ -125,7 +150,7 @@ class TestZMQServer(unittest.TestCase):
             wait_condition(lambda: server.state == ZMQServer.STATE_STOPPED)
 
     @contextlib.contextmanager
-    def mock_server(self, events_received, errors_received):
+    def mock_server(self, events_received, errors_received, **server_kwargs):
         mock_sub_socket = MockSocket()
         mock_sync_socket = MockSocket()
         mock_inproc_socket = MockSocket()
@@ -153,7 +178,7 @@ class TestZMQServer(unittest.TestCase):
             ]
             mock_get_context.return_value = mock_context
 
-            server = ZMQServer(cb, err_cb)
+            server = ZMQServer(cb, err_cb, **server_kwargs)
 
             yield server
 
@@ -194,6 +219,191 @@ class TestZMQServer(unittest.TestCase):
             ]
             wait_condition(lambda: server.state == ZMQServer.STATE_WAITING)
 
+    def test_receive_info_deserialization_workers(self):
+        events = []
+        errors = []
+
+        def slow_loads_json(data):
+            # The first messages take longer to deserialize, so that
+            # they complete out of order in the worker pool.
+            delay = json.loads(data)["model_data"]["delay"]
+            time.sleep(delay)
+            return delay
+
+        with mock.patch.object(
+            BaseDriverEvent, "loads_json", side_effect=slow_loads_json
+        ) as mock_loads_json, self.mock_started_server(
+            events, errors, deserialization_workers=3
+        ) as server:
+            server._sync_socket.data = [
+                x.encode("utf-8") for x in ["HELLO", "xxx", "1"]
+            ]
+            wait_condition(lambda: server.state == ZMQServer.STATE_RECEIVING)
+
+            delays = [0.3, 0.2, 0.0]
+            for delay in delays:
+                event_data = {
+                    "id": "force_bdss.events.mco_events.MCOStartEvent",
+                    "model_data": {"delay": delay},
+                }
+                server._sub_socket.data = [
+                    x.encode("utf-8")
+                    for x in ["MESSAGE", "xxx", json.dumps(event_data)]
+                ]
+                wait_condition(lambda: server._sub_socket.data is None)
+
+            wait_condition(lambda: len(events) == 3)
+
+        self.assertEqual(delays, events)
+        self.assertEqual(3, mock_loads_json.call_count)
+        self.assertIsNone(server._deserialization_executor)
+
+    def test_event_sequencer(self):
+        dispatched = []
+        sequencer = _EventSequencer(dispatched.append)
+
+        sequence_numbers = [sequencer.reserve() for _ in range(4)]
+        self.assertEqual([0, 1, 2, 3], sequence_numbers)
+
+        sequencer.push(2, "third")
+        sequencer.push(1, None)
+        self.assertEqual([], dispatched)
+
+        sequencer.push(0, "first")
+        self.assertEqual(["first", "third"], dispatched)
+
+        sequencer.push(3, "fourth")
+        self.assertEqual(["first", "third", "fourth"], dispatched)
+
+    def test_lookup(self):
+        events = []
+        errors = []
+        lookups = []
+
+        def lookup_cb(parameter_values):
+            lookups.append(parameter_values)
+            if parameter_values == [1.0, 2.0]:
+                return {"kpi": 3.0}
+            if parameter_values == [0.0, 0.0]:
+                raise Exception("boom")
+            return None
+
+        with self.mock_started_server(
+                events, errors, on_lookup_callback=lookup_cb) as server:
+            server._sync_socket.data = [
+                x.encode("utf-8") for x in ["HELLO", "xxx", "1"]
+            ]
+            wait_condition(lambda: server.state == ZMQServer.STATE_RECEIVING)
+
+            for values, expected in [
+                    ([1.0, 2.0], {"kpi": 3.0}),
+                    ([2.0, 2.0], None),
+                    ([0.0, 0.0], None)]:
+                server._sync_socket.received = None
+                server._sync_socket.data = [
+                    x.encode("utf-8")
+                    for x in ["LOOKUP", "xxx", json.dumps(values)]
+                ]
+                wait_condition(
+                    lambda: server._sync_socket.received is not None
+                )
+                msg, identifier, result = [
+                    x.decode("utf-8") for x in server._sync_socket.received
+                ]
+                self.assertEqual(("LOOKUP", "xxx"), (msg, identifier))
+                self.assertEqual(expected, json.loads(result))
+
+            self.assertEqual(ZMQServer.STATE_RECEIVING, server.state)
+            self.assertEqual(
+                [[1.0, 2.0], [2.0, 2.0], [0.0, 0.0]], lookups
+            )
+
+    def test_history(self):
+        events = []
+        errors = []
+        history = {"header": ["x", "y"], "rows": [[1.0, 2.0]]}
+        callbacks = [lambda: history, lambda: None, lambda: 1 / 0]
+
+        with self.mock_started_server(
+                events, errors,
+                on_history_callback=lambda: callbacks.pop(0)()) as server:
+            server._sync_socket.data = [
+                x.encode("utf-8") for x in ["HELLO", "xxx", "1"]
+            ]
+            wait_condition(lambda: server.state == ZMQServer.STATE_RECEIVING)
+
+            for expected in [history, None, None]:
+                server._sync_socket.received = None
+                server._sync_socket.data = [
+                    x.encode("utf-8") for x in ["HISTORY", "xxx"]
+                ]
+                wait_condition(
+                    lambda: server._sync_socket.received is not None
+                )
+                msg, identifier, result = [
+                    x.decode("utf-8") for x in server._sync_socket.received
+                ]
+                self.assertEqual(("HISTORY", "xxx"), (msg, identifier))
+                self.assertEqual(expected, json.loads(result))
+
+            self.assertEqual(ZMQServer.STATE_RECEIVING, server.state)
+
+    def test_tcp_urls(self):
+        events = []
+        errors = []
+        with self.mock_started_server(events, errors) as server:
+            for url in server.urls:
+                self.assertRegex(url, r"^tcp://127\.0\.0\.1:\d+$")
+
+        with self.mock_started_server(
+            events, errors, tcp_interface="*"
+        ) as server:
+            for url in server.urls:
+                self.assertRegex(url, r"^tcp://127\.0\.0\.1:\d+$")
+
+    def test_ipc_urls(self):
+        events = []
+        errors = []
+        with self.mock_started_server(
+            events, errors, transport=ZMQServer.TRANSPORT_IPC
+        ) as server:
+            ipc_dir = server._ipc_dir
+            self.assertEqual(
+                server.urls,
+                tuple(
+                    "ipc://" + os.path.join(ipc_dir, name)
+                    for name in ["sub", "pub", "sync"]
+                )
+            )
+
+        self.assertIsNone(server.urls)
+        self.assertFalse(os.path.exists(ipc_dir))
+
+    def test_ipc_fallback_to_tcp(self):
+        events = []
+        errors = []
+
+        def bind(where):
+            if where.startswith("ipc://"):
+                raise Exception("Boom")
+
+        with LogCapture(level=logging.ERROR), mock.patch.object(
+            MockSocket, "bind", side_effect=bind
+        ), self.mock_started_server(
+            events, errors, transport=ZMQServer.TRANSPORT_IPC
+        ) as server:
+            for url in server.urls:
+                self.assertTrue(url.startswith("tcp://127.0.0.1:"))
+
+        with mock.patch(
+            "force_wfmanager.server.zmq_server.zmq.has", return_value=False
+        ), self.mock_started_server(
+            events, errors, transport=ZMQServer.TRANSPORT_IPC
+        ) as server:
+            self.assertIsNone(server._ipc_dir)
+            for url in server.urls:
+                self.assertTrue(url.startswith("tcp://127.0.0.1:"))
+
     def test_error_conditions_waiting_sync(self):
         events = []
         errors = []
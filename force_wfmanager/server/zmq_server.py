@@ -1,7 +1,12 @@
 #  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
 #  All rights reserved.
 
+from concurrent.futures import ThreadPoolExecutor
+import json
 import logging
+import os
+import shutil
+import tempfile
 import threading
 
 import zmq
@@ -10,6 +15,9 @@ from force_bdss.api import BaseDriverEvent, DriverEventDeserializationError
 
 log = logging.getLogger(__name__)
 
+#: Seconds to wait for a server to start listening, before giving up on it
+READY_TIMEOUT = 10.0
+
 
 class ZMQServer(threading.Thread):
     """ZeroMQ based server. It is a state machine with different
@@ -27,6 +35,27 @@ class ZMQServer(threading.Thread):
     multipart message received. Note that each individual entry of the list
     has already been decoded from utf-8 (our transfer encoding), and is
     therefore a unicode string.
+
+    Event deserialization normally happens in the server thread itself.
+    If `deserialization_workers` is set, the server thread only receives
+    the frames and hands the payload to a pool of worker threads. The
+    deserialized events are put back in arrival order before being passed
+    to the event callback.
+
+    The network sockets are bound either on TCP ports of the loopback
+    interface, or on ipc (Unix domain) endpoints in a private temporary
+    directory, according to `transport`. If the ipc transport is not
+    available, the server falls back to TCP. The endpoints that a client
+    must connect to are made available in `urls` once the server is
+    started.
+
+    While receiving, the client can also send LOOKUP requests on the
+    synchronization socket, with a JSON list of parameter values. The
+    server replies with the JSON result of `on_lookup_callback`, so that
+    the BDSS can skip the evaluations that are already known. Similarly,
+    HISTORY requests are replied with the JSON result of
+    `on_history_callback`, the evaluations of the interrupted run resumed
+    by the client, so that its MCO can warm-start.
     """
 
     STATE_STOPPED = "STOPPED"
@@ -41,7 +70,17 @@ class ZMQServer(threading.Thread):
     #: Warning: the server will stay alive and keep processing.
     ERROR_TYPE_WARNING = 2
 
-    def __init__(self, on_event_callback, on_error_callback):
+    #: Transport types.
+    #: TCP: bind on random ports of `tcp_interface`.
+    TRANSPORT_TCP = "tcp"
+
+    #: IPC: bind on Unix domain sockets in a private temporary directory.
+    TRANSPORT_IPC = "ipc"
+
+    def __init__(self, on_event_callback, on_error_callback,
+                 deserialization_workers=0, transport=TRANSPORT_TCP,
+                 tcp_interface="127.0.0.1", on_lookup_callback=None,
+                 on_history_callback=None):
         """Sets up the server with the appropriate configuration.
         When the event is detected, on_event_callback will be called
         _in_the_secondary_thread_.
@@ -56,19 +95,57 @@ class ZMQServer(threading.Thread):
             A function or method to call when an error occurs.
             This function will be called by the secondary thread, and will
             accept the error type and the error message arguments.
+        deserialization_workers: int
+            Number of worker threads used to deserialize the received
+            events. If zero (default), events are deserialized by the
+            server thread. Otherwise, on_event_callback is called by
+            one of the worker threads, always in the order in which the
+            events were received.
+        transport: str
+            Either TRANSPORT_TCP or TRANSPORT_IPC. If the ipc transport
+            is requested but can't be used, TCP is used instead.
+        tcp_interface: str
+            The interface the TCP sockets are bound to. Defaults to the
+            loopback interface. Use "*" to listen on all interfaces.
+        on_lookup_callback: function(parameter_values)
+            A function or method returning the known KPI values of an
+            evaluation as a JSON serializable dict, or None if unknown.
+            This function will be called by the secondary thread on
+            LOOKUP requests. If None, all the lookups are unknown.
+        on_history_callback: function()
+            A function or method returning the evaluations of the resumed
+            run as a JSON serializable object, or None. This function will
+            be called by the secondary thread on HISTORY requests. If None,
+            there is no history.
         """
         super(ZMQServer, self).__init__(name="ZMQServer")
         self.daemon = True
         self.state = ZMQServer.STATE_STOPPED
         self._on_event_callback = on_event_callback
         self._on_error_callback = on_error_callback
+        self._on_lookup_callback = on_lookup_callback
+        self._on_history_callback = on_history_callback
+
+        self.deserialization_workers = deserialization_workers
+        self._deserialization_executor = None
+        self._event_sequencer = None
+
+        self.transport = transport
+        self.tcp_interface = tcp_interface
+        self._ipc_dir = None
 
         self._context = self._get_context()
         self._sub_socket = None
         self._pub_socket = None
         self._sync_socket = None
         self._inproc_socket = None
-        self.ports = None
+
+        #: The (sub, pub, sync) socket URLs a client must connect to.
+        #: None if the server is not running.
+        self.urls = None
+
+        #: Set when the server is listening, or has failed to start.
+        self._ready = threading.Event()
 
     def run(self):
         if self.state != ZMQServer.STATE_STOPPED:
@@ -80,17 +157,18 @@ class ZMQServer(threading.Thread):
         try:
             (
                 self._sub_socket,
-                sub_port,
+                sub_url,
                 self._pub_socket,
-                _pub_port,
+                pub_url,
                 self._sync_socket,
-                sync_port,
+                sync_url,
                 self._inproc_socket,
             ) = self._setup_sockets()
         except Exception as e:
             log.exception("Unable to setup sockets")
             self._close_all_sockets_noexc()
             self.state = ZMQServer.STATE_STOPPED
+            self._ready.set()
             self._on_error_callback(
                 self.ERROR_TYPE_CRITICAL,
                 "Unable to setup server sockets: {}.\n"
@@ -99,7 +177,7 @@ class ZMQServer(threading.Thread):
             )
             return
 
-        self.ports = (sub_port, _pub_port, sync_port)
+        self.urls = (sub_url, pub_url, sync_url)
 
         try:
             poller = self._get_poller()
@@ -110,6 +188,7 @@ class ZMQServer(threading.Thread):
             log.exception("Unable to setup sockets")
             self._close_all_sockets_noexc()
             self.state = ZMQServer.STATE_STOPPED
+            self._ready.set()
             self._on_error_callback(
                 self.ERROR_TYPE_CRITICAL,
                 "Unable to register sockets to poller: {}.\n"
@@ -118,7 +197,15 @@ class ZMQServer(threading.Thread):
             )
             return
 
+        if self.deserialization_workers > 0:
+            self._deserialization_executor = ThreadPoolExecutor(
+                max_workers=self.deserialization_workers,
+                thread_name_prefix="ZMQServerDeserializer",
+            )
+            self._event_sequencer = _EventSequencer(self._dispatch_event)
+
         self.state = ZMQServer.STATE_WAITING
+        self._ready.set()
 
         while True:
             try:
@@ -126,6 +213,7 @@ class ZMQServer(threading.Thread):
             except Exception as e:
                 log.exception("Unable to poll")
                 self._close_all_sockets_noexc()
+                self._shutdown_executor_noexc()
                 self.state = ZMQServer.STATE_STOPPED
                 self._on_error_callback(
                     self.ERROR_TYPE_CRITICAL,
@@ -175,6 +263,7 @@ class ZMQServer(threading.Thread):
                         "Handler {} raised exception.".format(handle)
                     )
                     self._close_all_sockets_noexc()
+                    self._shutdown_executor_noexc()
                     self.state = ZMQServer.STATE_STOPPED
                     self._on_error_callback(
                         self.ERROR_TYPE_CRITICAL,
@@ -189,11 +278,24 @@ class ZMQServer(threading.Thread):
             if self._inproc_socket in events:
                 self._inproc_socket.recv()
                 self._close_network_sockets_noexc()
+                self._shutdown_executor_noexc()
                 self.state = ZMQServer.STATE_STOPPED
                 self._inproc_socket.send("".encode("utf-8"))
                 self._inproc_socket.close()
                 return
 
+    def wait_until_ready(self, timeout=None):
+        """Blocks until the server is listening, or has failed to start.
+        Gives up after `timeout` seconds, if given.
+
+        Returns
+        -------
+        bool:
+            True if the server is listening.
+        """
+        self._ready.wait(timeout)
+        return self.state != ZMQServer.STATE_STOPPED
+
     def stop(self):
         """Stops the server. This method is synchronous.
         It stops until the server acknowledges that it
@@ -223,37 +325,79 @@ class ZMQServer(threading.Thread):
     def _setup_sockets(self):
         """Sets up the sockets."""
         context = self._context
+        if self.transport == ZMQServer.TRANSPORT_IPC:
+            self._ipc_dir = self._create_ipc_dir()
+
         sub_socket = context.socket(zmq.SUB)
         sub_socket.setsockopt(zmq.SUBSCRIBE, "".encode("utf-8"))
         sub_socket.setsockopt(zmq.LINGER, 0)
-        sub_port = sub_socket.bind_to_random_port("tcp://*")
+        sub_url = self._bind_socket(sub_socket, "sub")
 
         pub_socket = context.socket(zmq.PUB)
         pub_socket.setsockopt(zmq.LINGER, 0)
-        pub_port = pub_socket.bind_to_random_port("tcp://*")
+        pub_url = self._bind_socket(pub_socket, "pub")
 
         sync_socket = context.socket(zmq.REP)
         sync_socket.setsockopt(zmq.LINGER, 0)
-        sync_port = sync_socket.bind_to_random_port("tcp://*")
+        sync_url = self._bind_socket(sync_socket, "sync")
 
         inproc_socket = context.socket(zmq.PAIR)
         inproc_socket.bind("inproc://stop")
         return (
             sub_socket,
-            sub_port,
+            sub_url,
             pub_socket,
-            pub_port,
+            pub_url,
             sync_socket,
-            sync_port,
+            sync_url,
             inproc_socket,
         )
 
+    def _create_ipc_dir(self):
+        """Creates the private directory that will contain the ipc
+        endpoints. Returns None if the ipc transport is not available."""
+        if not zmq.has("ipc"):
+            log.warning(
+                "The ipc transport is not supported on this platform. "
+                "Falling back to tcp."
+            )
+            return None
+
+        try:
+            return tempfile.mkdtemp(prefix="force_wfmanager_")
+        except OSError:
+            log.exception(
+                "Unable to create the ipc directory. Falling back to tcp."
+            )
+            return None
+
+    def _bind_socket(self, socket, name):
+        """Binds the socket to an ipc endpoint `name` in the private
+        directory if available, or to a random TCP port otherwise.
+        Returns the URL a client must connect to."""
+        if self._ipc_dir is not None:
+            url = "ipc://" + os.path.join(self._ipc_dir, name)
+            try:
+                socket.bind(url)
+                return url
+            except Exception:
+                log.exception(
+                    "Unable to bind {}. Falling back to tcp.".format(url)
+                )
+
+        port = socket.bind_to_random_port("tcp://" + self.tcp_interface)
+        if self.tcp_interface in ("*", "0.0.0.0"):
+            host = "127.0.0.1"
+        else:
+            host = self.tcp_interface
+        return "tcp://{}:{}".format(host, port)
+
     def _close_network_sockets_noexc(self):
         """Closes all the network sockets: pub and sync sockets.
         This method throws away all exceptions that the operation might
         encounter, and performs closing on all sockets without halting.
         """
-        self.ports = None
+        self.urls = None
         try:
             self._sub_socket.close()
         except Exception:
@@ -272,6 +416,10 @@ class ZMQServer(threading.Thread):
             pass
         self._sync_socket = None
 
+        if self._ipc_dir is not None:
+            shutil.rmtree(self._ipc_dir, ignore_errors=True)
+        self._ipc_dir = None
+
     def _close_all_sockets_noexc(self):
         """Close all sockets, both the network ones and the inproc one.
         This method throws away all exceptions that the operation might
@@ -285,6 +433,20 @@ class ZMQServer(threading.Thread):
 
         self._inproc_socket = None
 
+    def _shutdown_executor_noexc(self):
+        """Waits for the pending deserializations to be dispatched and
+        shuts down the worker pool, if any. Any exception is discarded.
+        """
+        if self._deserialization_executor is None:
+            return
+
+        try:
+            self._deserialization_executor.shutdown(wait=True)
+        except Exception:
+            log.exception("Unable to shut down deserialization workers")
+        self._deserialization_executor = None
+        self._event_sequencer = None
+
     def _get_context(self):
         return zmq.Context()
 
@@ -312,6 +474,14 @@ class ZMQServer(threading.Thread):
         self.state = ZMQServer.STATE_RECEIVING
 
     def _handle_RECEIVING_sync(self, data):
+        if len(data) == 3 and data[0] == "LOOKUP":
+            self._handle_lookup(data[1], data[2])
+            return
+
+        if len(data) == 2 and data[0] == "HISTORY":
+            self._handle_history(data[1])
+            return
+
         if len(data) != 2:
             log.error("Unknown request received {}".format(data))
             return
@@ -326,6 +496,42 @@ class ZMQServer(threading.Thread):
 
         self.state = ZMQServer.STATE_WAITING
 
+    def _handle_lookup(self, identifier, serialized_values):
+        """Replies to a LOOKUP request with the known result of the
+        evaluation of the given parameter values, or null."""
+        result = None
+        if self._on_lookup_callback is not None:
+            try:
+                result = self._on_lookup_callback(
+                    json.loads(serialized_values)
+                )
+            except Exception:
+                log.exception("on_lookup_callback raised exception")
+                result = None
+
+        # The client waits for a reply, which must always be sent
+        self._sync_socket.send_multipart([
+            x.encode("utf-8")
+            for x in ["LOOKUP", identifier, json.dumps(result)]
+        ])
+
+    def _handle_history(self, identifier):
+        """Replies to a HISTORY request with the evaluations of the
+        resumed run, or null."""
+        result = None
+        if self._on_history_callback is not None:
+            try:
+                result = self._on_history_callback()
+            except Exception:
+                log.exception("on_history_callback raised exception")
+                result = None
+
+        # The client waits for a reply, which must always be sent
+        self._sync_socket.send_multipart([
+            x.encode("utf-8")
+            for x in ["HISTORY", identifier, json.dumps(result)]
+        ])
+
     def _handle_RECEIVING_pub(self, data):
         if len(data) != 3:
             log.error("Unknown request received {}".format(data))
@@ -337,10 +543,37 @@ class ZMQServer(threading.Thread):
             log.error("Unknown msg request received {}".format(msg))
             return
 
+        if self._deserialization_executor is None:
+            self._dispatch_event(self._deserialize_event(serialized_data))
+            return
+
+        sequence_number = self._event_sequencer.reserve()
+        self._deserialization_executor.submit(
+            self._deserialize_and_sequence, sequence_number, serialized_data
+        )
+
+    def _deserialize_event(self, serialized_data):
+        """Returns the event contained in `serialized_data`, or None
+        if the data can't be deserialized."""
         try:
-            event = BaseDriverEvent.loads_json(serialized_data)
+            return BaseDriverEvent.loads_json(serialized_data)
         except DriverEventDeserializationError:
             log.error("Received invalid data. Discarding")
+            return None
+
+    def _deserialize_and_sequence(self, sequence_number, serialized_data):
+        """Worker thread routine. Deserializes the event and hands it
+        over to the sequencer, which dispatches it in arrival order."""
+        try:
+            event = self._deserialize_event(serialized_data)
+        except Exception:
+            log.exception("Unexpected error while deserializing event")
+            event = None
+        self._event_sequencer.push(sequence_number, event)
+
+    def _dispatch_event(self, event):
+        """Invokes the event callback, unless `event` is None."""
+        if event is None:
             return
 
         try:
@@ -353,3 +586,46 @@ class ZMQServer(threading.Thread):
         self._pub_socket.send_multipart(
             [x.encode("utf-8") for x in ["MESSAGE", message, ""]]
         )
+
+
+class _EventSequencer(object):
+    """Reorder buffer for events deserialized out of order by the
+    worker pool of :class:`ZMQServer`. Each received message reserves
+    a sequence number in the server thread. Deserialized events are
+    pushed back by the workers, and dispatched only when all the events
+    received before them have been dispatched.
+    """
+
+    def __init__(self, dispatch):
+        #: Callable invoked with each event, in arrival order
+        self._dispatch = dispatch
+
+        #: Next sequence number to be assigned to a received message
+        self._next_reserved = 0
+
+        #: Next sequence number to be dispatched
+        self._next_dispatched = 0
+
+        #: Events that are ready, but wait for an earlier event
+        self._pending = {}
+
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Returns the sequence number of a newly received message.
+        Only called by the server thread."""
+        sequence_number = self._next_reserved
+        self._next_reserved += 1
+        return sequence_number
+
+    def push(self, sequence_number, event):
+        """Stores the deserialized `event` and dispatches all the events
+        that are now in sequence. A None event is a placeholder for a
+        message that couldn't be deserialized, and is skipped."""
+        with self._lock:
+            self._pending[sequence_number] = event
+            while self._next_dispatched in self._pending:
+                event = self._pending.pop(self._next_dispatched)
+                self._next_dispatched += 1
+                if event is not None:
+                    self._dispatch(event)
@@ -101,9 +101,9 @@ class TestWFManagerTasks(GuiTestAssistant, TestCase):
     def test_default_data_views(self):
         # Test of the data view selection feature within the task.
 
-        # Two default plot types
+        # Three default data views
         self.assertEqual(
-            2, len(self.review_task.central_pane.available_data_views)
+            3, len(self.review_task.central_pane.available_data_views)
         )
 
         # Initial state
@@ -132,9 +132,9 @@ class TestWFManagerTasksWithPlugins(GuiTestAssistant, TestCase):
         )
 
     def test_discover_data_views(self):
-        # Twp default plot types plus three contributed
+        # Three default data views plus three contributed
         self.assertEqual(
-            5, len(self.review_task.central_pane.available_data_views),
+            6, len(self.review_task.central_pane.available_data_views),
         )
 
         # fire the button to populate descriptions
@@ -1,11 +1,17 @@
 #  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
 #  All rights reserved.
 
+from concurrent.futures import Future
+from functools import partial
+import json
+import os
+import shutil
+import tempfile
 from unittest import mock, TestCase
 import subprocess
 from testfixtures import LogCapture
 
-from pyface.constant import OK, CANCEL, YES
+from pyface.constant import CANCEL, NO, OK, YES
 from pyface.file_dialog import FileDialog
 from pyface.ui.qt4.util.gui_test_assistant import GuiTestAssistant
 
@@ -20,7 +26,18 @@ from force_bdss.tests.probe_classes.factory_registry import (
     ProbeFactoryRegistry,
 )
 
-from force_wfmanager.server.zmq_server import ZMQServer
+from force_wfmanager.model.bdss_run import (
+    BDSSRun,
+    RUN_FAILED,
+    RUN_FINISHED,
+    RUN_QUEUED,
+    RUN_RUNNING,
+    RUN_STOPPED,
+)
+from force_wfmanager.model.evaluation_store import EvaluationStore
+from force_wfmanager.model.result_cache import ResultCache
+from force_wfmanager.server.i_execution_backend import IExecutionBackend
+from force_wfmanager.server.zmq_server import READY_TIMEOUT, ZMQServer
 from force_wfmanager.tests.dummy_classes.dummy_contributed_ui import (
     DummyContributedUI2,
 )
@@ -37,7 +54,6 @@ from .mock_methods import (
     mock_dialog,
     mock_return_args,
     mock_file_reader_failure,
-    mock_confirm_function,
     mock_subprocess,
 )
 from .test_wfmanager_tasks import get_probe_wfmanager_tasks
@@ -52,8 +68,11 @@ FILE_OPEN_PATH = "force_wfmanager.io.workflow_io.WorkflowWriter.write"
 WORKFLOW_WRITER_PATH = "force_wfmanager.io.workflow_io.WorkflowWriter"
 WORKFLOW_READER_PATH = "force_wfmanager.io.workflow_io.WorkflowReader"
 SETUP_ERROR_PATH = "force_wfmanager.wfmanager_setup_task.error"
-SUBPROCESS_PATH = "force_wfmanager.wfmanager_setup_task.subprocess"
+SUBPROCESS_PATH = "force_wfmanager.server.execution_backend.subprocess"
 OS_REMOVE_PATH = "force_wfmanager.wfmanager_setup_task.os.remove"
+GUI_INVOKE_LATER_PATH = (
+    "force_wfmanager.wfmanager_setup_task.GUI.invoke_later"
+)
 ZMQSERVER_SETUP_SOCKETS_PATH = (
     "force_wfmanager.wfmanager_setup_task.ZMQServer._setup_sockets"
 )
@@ -69,9 +88,21 @@ class TestWFManagerTasks(GuiTestAssistant, TestCase):
         self.setup_task, _ = get_probe_wfmanager_tasks()
 
     def test_zmq_start(self):
-        self.setup_task.zmq_server = mock.Mock(spec=ZMQServer)
-        self.setup_task.initialized()
-        self.assertTrue(self.setup_task.zmq_server.start.called)
+        run = BDSSRun(workflow_model=self.setup_task.workflow_model)
+        zmq_server = mock.Mock(spec=ZMQServer)
+        with mock.patch.object(
+            self.setup_task, "_create_zmq_server", return_value=zmq_server
+        ), mock.patch.object(self.setup_task, "execution_backend"):
+            self.setup_task._launch_run(run)
+
+        self.assertIs(zmq_server, run.zmq_server)
+        self.assertTrue(zmq_server.start.called)
+        zmq_server.wait_until_ready.assert_called_once_with(READY_TIMEOUT)
+
+        run.status = RUN_RUNNING
+        self.setup_task.run_scheduler.runs.append(run)
+        self.setup_task.prepare_destroy()
+        self.assertTrue(zmq_server.stop.called)
 
     def test_failed_initialization_of_ui_hooks(self):
         plugin = ProbeFactoryRegistry()
@@ -259,7 +290,10 @@ class TestWFManagerTasks(GuiTestAssistant, TestCase):
             self.assertEqual(old_workflow, self.setup_task.workflow_model)
 
     def test_dispatch_mco_event(self):
-        send_event = self.setup_task._server_event_callback
+        run = BDSSRun()
+        self.setup_task.current_run = run
+        self.assertIs(run.analysis_model, self.setup_task.analysis_model)
+        send_event = partial(self.setup_task._server_event_callback, run)
         self.assertEqual(self.setup_task.analysis_model.header, ())
         with self.event_loop():
             send_event(MCOStartEvent(parameter_names=["x"], kpi_names=["y"]))
@@ -303,20 +337,22 @@ class TestWFManagerTasks(GuiTestAssistant, TestCase):
         )
 
     def test_initialize_finalize(self):
-        self.setup_task.zmq_server.start()
+        zmq_server = self.setup_task._create_zmq_server(BDSSRun())
+        zmq_server.start()
         wait_condition(
             lambda: (
-                self.setup_task.zmq_server.state == ZMQServer.STATE_WAITING
+                zmq_server.state == ZMQServer.STATE_WAITING
             )
         )
 
-        self.setup_task.zmq_server.stop()
+        zmq_server.stop()
 
         self.assertEqual(
-            self.setup_task.zmq_server.state, ZMQServer.STATE_STOPPED
+            zmq_server.state, ZMQServer.STATE_STOPPED
         )
 
     def test_zmq_server_failure(self):
+        zmq_server = self.setup_task._create_zmq_server(BDSSRun())
         with mock.patch(
             ZMQSERVER_SETUP_SOCKETS_PATH
         ) as setup_sockets, mock.patch(
@@ -326,7 +362,7 @@ class TestWFManagerTasks(GuiTestAssistant, TestCase):
         ):
 
             setup_sockets.side_effect = Exception("boom")
-            self.setup_task.zmq_server.start()
+            zmq_server.start()
 
     def test_open_plugin_dialog(self):
 
@@ -337,8 +373,9 @@ class TestWFManagerTasks(GuiTestAssistant, TestCase):
 
         self.setup_task.analysis_model.header = ("x",)
         self.setup_task.analysis_model.notify((2.0,))
+        old_analysis_model = self.setup_task.analysis_model
         mock_open = mock.mock_open()
-        with mock.patch(CONFIRM_PATH) as mock_confirm, mock.patch(
+        with mock.patch(
             FILE_DIALOG_PATH
         ) as mock_file_dialog, mock.patch(
             FILE_OPEN_PATH, mock_open, create=True
@@ -347,15 +384,12 @@ class TestWFManagerTasks(GuiTestAssistant, TestCase):
         ) as mock_writer, mock.patch(
             SUBPROCESS_PATH
         ) as _mock_subprocess:
-            mock_confirm.side_effect = mock_confirm_function(YES)
             mock_file_dialog.side_effect = mock_dialog(FileDialog, OK)
             mock_writer.side_effect = mock_file_writer
             mock_subprocess.side_effect = mock_subprocess
 
             hook_manager = self.setup_task.ui_hooks_managers[0]
 
-            self.assertTrue(self.setup_task.side_pane.ui_enabled)
-            self.assertTrue(self.setup_task.setup_pane.ui_enabled)
             self.assertFalse(hook_manager.before_execution_called)
             self.assertFalse(hook_manager.after_execution_called)
 
@@ -364,19 +398,26 @@ class TestWFManagerTasks(GuiTestAssistant, TestCase):
             ):
                 self.setup_task.run_bdss()
 
+            run = self.setup_task.current_run
             with self.event_loop_until_condition(
-                lambda: self.setup_task.side_pane.ui_enabled
-            ):
-                pass
-
-            with self.event_loop_until_condition(
-                lambda: self.setup_task.setup_pane.ui_enabled
+                lambda: run.status == RUN_FINISHED
             ):
                 pass
 
             self.assertTrue(hook_manager.before_execution_called)
             self.assertTrue(hook_manager.after_execution_called)
 
+        # The run executes a snapshot of the workflow, and the results
+        # of previous runs are preserved
+        self.assertIsNot(self.setup_task.workflow_model, run.workflow_model)
+        self.assertIs(run.analysis_model, self.setup_task.analysis_model)
+        self.assertEqual(1, len(old_analysis_model.evaluation_steps))
+        self.assertEqual([run], self.setup_task.run_scheduler.runs)
+        self.assertFalse(self.setup_task.computation_running)
+        self.assertEqual(
+            ZMQServer.STATE_STOPPED, run.zmq_server.state
+        )
+
     def test_hook_manager_raises(self):
         with mock.patch(FILE_DIALOG_PATH) as mock_file_dialog, mock.patch(
             WORKFLOW_WRITER_PATH
@@ -419,21 +460,98 @@ class TestWFManagerTasks(GuiTestAssistant, TestCase):
                 capture.actual(),
             )
 
-    def test_run_bdss_cancel(self):
-        self.setup_task.analysis_model.header = ("x",)
-        self.setup_task.analysis_model.notify((2.0,))
-        with mock.patch(CONFIRM_PATH) as mock_confirm:
-            mock_confirm.side_effect = mock_confirm_function(CANCEL)
+    def test_run_bdss_queued(self):
+        run_scheduler = self.setup_task.run_scheduler
+        run_scheduler.core_budget = 1
+        with mock.patch.object(self.setup_task, "_launch_run") as mock_launch:
+            run_scheduler.launcher = mock_launch
+            self.setup_task.run_bdss()
+            first_run = self.setup_task.current_run
+            self.setup_task.run_bdss()
+            second_run = self.setup_task.current_run
+
+        mock_launch.assert_called_once_with(first_run)
+        self.assertEqual(RUN_RUNNING, first_run.status)
+        self.assertEqual(RUN_QUEUED, second_run.status)
+        self.assertTrue(self.setup_task.computation_running)
+
+        # Stopping a queued run removes it from the queue
+        self.setup_task.stop_bdss()
+        self.assertEqual(RUN_STOPPED, second_run.status)
+        self.assertFalse(self.setup_task.computation_running)
+        self.assertEqual(RUN_RUNNING, first_run.status)
+
+        # Switching run changes the displayed results
+        self.setup_task.current_run = first_run
+        self.assertIs(
+            first_run.analysis_model, self.setup_task.analysis_model
+        )
+        self.assertTrue(self.setup_task.computation_running)
+
+    def test_run_bdss_cached(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        self.setup_task.result_cache = ResultCache(directory=tmp_dir)
 
-            self.assertTrue(self.setup_task.side_pane.ui_enabled)
+        with mock.patch.object(
+            self.setup_task, "_launch_run"
+        ) as mock_launch, mock.patch.object(
+            self.setup_task, "_result_cache_key", return_value="key"
+        ), mock.patch(CONFIRM_PATH) as mock_confirm:
+            self.setup_task.run_scheduler.launcher = mock_launch
+
+            # Nothing cached yet
+            self.setup_task.run_bdss()
+            run = self.setup_task.current_run
+            mock_confirm.assert_not_called()
+            mock_launch.assert_called_once_with(run)
+            self.assertEqual("key", run.cache_key)
+
+            run.analysis_model.notify(("x",))
+            run.analysis_model.notify((1.0,))
+            self.setup_task._bdss_done(run, None)
+            self.assertTrue(self.setup_task.result_cache.contains("key"))
+
+            # The user declines to load the cached results
+            mock_confirm.return_value = NO
             self.setup_task.run_bdss()
-            self.assertTrue(self.setup_task.side_pane.ui_enabled)
+            self.assertEqual(2, mock_launch.call_count)
+            self.assertEqual(RUN_RUNNING, self.setup_task.current_run.status)
 
-            mock_confirm.assert_called_with(
-                None,
-                "Are you sure you want to run the computation and "
-                "empty the result table?",
-            )
+            mock_confirm.return_value = YES
+            self.setup_task.run_bdss()
+            self.assertEqual(2, mock_launch.call_count)
+
+        cached_run = self.setup_task.current_run
+        self.assertEqual(RUN_FINISHED, cached_run.status)
+        self.assertEqual("Cached results", cached_run.name)
+        self.assertIn(cached_run, self.setup_task.run_scheduler.runs)
+        self.assertIs(
+            cached_run.analysis_model, self.setup_task.analysis_model
+        )
+        self.assertEqual([(1.0,)], cached_run.analysis_model.evaluation_steps)
+
+    def test_evaluation_store(self):
+        run = BDSSRun(workflow_model=self.setup_task.workflow_model)
+        self.setup_task._attach_evaluation_store(run)
+        self.assertIsNone(run.evaluation_store)
+
+        store = mock.Mock(spec=EvaluationStore)
+        self.setup_task.evaluation_store = store
+        with mock.patch(
+            "force_wfmanager.wfmanager_setup_task.workflow_structure_key",
+            return_value="key",
+        ):
+            self.setup_task._attach_evaluation_store(run)
+        self.assertIs(store, run.evaluation_store)
+        self.assertEqual("key", run.workflow_key)
+
+        # The BDSS looks up the evaluations through the server of the run
+        server = self.setup_task._create_zmq_server(run)
+        self.assertEqual(run.lookup_evaluation, server._on_lookup_callback)
+
+        self.setup_task.prepare_destroy()
+        store.close.assert_called_once_with()
 
     def test_run_bdss_failure(self):
         mock_open = mock.mock_open()
@@ -451,20 +569,15 @@ class TestWFManagerTasks(GuiTestAssistant, TestCase):
             def _check_exception_behavior(exception):
                 mock_chk_call.side_effect = exception
 
-                self.assertTrue(self.setup_task.side_pane.ui_enabled)
-                self.assertTrue(self.setup_task.setup_pane.ui_enabled)
-
                 with self.event_loop_until_condition(
                     lambda: mock_chk_call.called
                 ):
                     self.setup_task.run_bdss()
 
-                ui_enabled = self.setup_task.side_pane.ui_enabled
-                with self.event_loop_until_condition(lambda: ui_enabled):
-                    pass
-
-                ui_enabled = self.setup_task.setup_pane.ui_enabled
-                with self.event_loop_until_condition(lambda: ui_enabled):
+                run = self.setup_task.current_run
+                with self.event_loop_until_condition(
+                    lambda: run.status == RUN_FAILED
+                ):
                     pass
 
                 return mock_error.call_args[0][1]
@@ -484,26 +597,89 @@ class TestWFManagerTasks(GuiTestAssistant, TestCase):
                 )
             )
 
-    def test__execute_bdss_failure(self):
-        with mock.patch("subprocess.check_call") as mock_call:
-            mock_call.side_effect = subprocess.CalledProcessError(
-                1, "fake_command"
+    def test_execution_backend(self):
+        backend = mock.Mock(spec=IExecutionBackend)
+        future = Future()
+        backend.submit.return_value = future
+        self.setup_task.execution_backend = backend
+        run = BDSSRun(workflow_model=self.setup_task.workflow_model)
+        run.status = RUN_RUNNING
+        self.setup_task.run_scheduler.runs.append(run)
+        self.setup_task.current_run = run
+
+        self.setup_task.initialized()
+        backend.start.assert_called_once_with()
+
+        with mock.patch.object(
+            self.setup_task, "_create_zmq_server"
+        ), mock.patch(WORKFLOW_WRITER_PATH):
+            self.setup_task._launch_run(run)
+        submitted_run, workflow_path = backend.submit.call_args[0]
+        self.assertIs(run, submitted_run)
+
+        self.setup_task.pause_bdss()
+        backend.pause.assert_called_once_with(run)
+        self.setup_task.stop_bdss()
+        backend.stop.assert_called_once_with(run)
+
+        # The workflow file is removed when the execution completes
+        with mock.patch(OS_REMOVE_PATH) as mock_remove, \
+                mock.patch.object(self.setup_task, "_bdss_done"):
+            with self.event_loop_until_condition(
+                lambda: self.setup_task._bdss_done.called
+            ):
+                future.set_result(None)
+        mock_remove.assert_called_once_with(workflow_path)
+        self.setup_task._bdss_done.assert_called_once_with(run, None)
+
+        self.setup_task.prepare_destroy()
+        backend.shutdown.assert_called_once_with()
+
+    def test_execution_done_remove_failure(self):
+        run = BDSSRun()
+        future = Future()
+        future.set_result(None)
+        with mock.patch(OS_REMOVE_PATH) as mock_remove, \
+                mock.patch(GUI_INVOKE_LATER_PATH) as mock_invoke_later, \
+                LogCapture():
+            mock_remove.side_effect = OSError("OUPS")
+            self.setup_task._execution_done_callback(
+                run, "workflow.json", future
             )
-            with LogCapture() as capture:
-                with self.assertRaises(subprocess.CalledProcessError):
-                    self.setup_task._execute_bdss("")
-            capture.check(
-                (
-                    "force_wfmanager.wfmanager_setup_task",
-                    "ERROR",
-                    "force_bdss returned a non-zero value after execution",
-                ),
-                (
-                    "force_wfmanager.wfmanager_setup_task",
-                    "ERROR",
-                    "Unable to delete temporary workflow file at ",
-                ),
+        exception = mock_invoke_later.call_args[0][2]
+        self.assertIsInstance(exception, OSError)
+
+        # Removal errors are secondary to the execution errors
+        future = Future()
+        error = subprocess.CalledProcessError(1, "force_bdss")
+        future.set_exception(error)
+        with mock.patch(OS_REMOVE_PATH) as mock_remove, \
+                mock.patch(GUI_INVOKE_LATER_PATH) as mock_invoke_later, \
+                LogCapture():
+            mock_remove.side_effect = OSError("OUPS")
+            self.setup_task._execution_done_callback(
+                run, "workflow.json", future
             )
+        self.assertIs(error, mock_invoke_later.call_args[0][2])
+
+    def test_zmq_start_timeout(self):
+        run = BDSSRun(workflow_model=self.setup_task.workflow_model)
+        zmq_server = mock.Mock(spec=ZMQServer)
+        zmq_server.wait_until_ready.return_value = False
+        with mock.patch.object(
+            self.setup_task, "_create_zmq_server", return_value=zmq_server
+        ), mock.patch.object(
+            self.setup_task, "execution_backend"
+        ) as mock_backend, mock.patch(SETUP_ERROR_PATH) as mock_error:
+            mock_error.side_effect = mock_return_args
+            self.setup_task._launch_run(run)
+
+        mock_backend.submit.assert_not_called()
+        self.assertEqual(RUN_FAILED, run.status)
+        self.assertEqual(
+            "Unable to run BDSS: Unable to start the ZMQ server.",
+            mock_error.call_args[0][1],
+        )
 
     def test_run_bdss_write_failure(self):
         with mock.patch(WORKFLOW_WRITER_PATH) as mock_writer, mock.patch(
@@ -514,13 +690,12 @@ class TestWFManagerTasks(GuiTestAssistant, TestCase):
             mock_writer.return_value = workflow_writer
             mock_error.side_effect = mock_return_args
 
-            self.assertTrue(self.setup_task.side_pane.ui_enabled)
-            self.assertTrue(self.setup_task.setup_pane.ui_enabled)
-
             self.setup_task.run_bdss()
 
-            self.assertTrue(self.setup_task.side_pane.ui_enabled)
-            self.assertTrue(self.setup_task.setup_pane.ui_enabled)
+            run = self.setup_task.current_run
+            self.assertEqual(RUN_FAILED, run.status)
+            self.assertFalse(self.setup_task.computation_running)
+            self.assertEqual(ZMQServer.STATE_STOPPED, run.zmq_server.state)
 
             self.assertEqual(
                 mock_error.call_args[0][1], "Unable to run BDSS: write failed"
@@ -567,35 +742,176 @@ class TestWFManagerTasks(GuiTestAssistant, TestCase):
                 setup_task.selected_contributed_ui.run_workflow = True
         _mock_run.assert_called()
 
+    def test_run_sweep(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        sweep_path = os.path.join(tmp_dir, "sweep.json")
+        with open(sweep_path, "w") as fp:
+            json.dump(
+                {"axes": [{"path": "mco_model", "values": [None, None]}]},
+                fp
+            )
+
+        with mock.patch(FILE_DIALOG_PATH) as mock_file_dialog, \
+                mock.patch.object(self.setup_task, "_launch_run"):
+            mock_file_dialog.side_effect = mock_dialog(
+                FileDialog, OK, sweep_path
+            )
+            self.setup_task.run_scheduler.launcher = (
+                self.setup_task._launch_run
+            )
+            self.assertTrue(self.setup_task.run_sweep())
+
+        # No variant file is written
+        self.assertEqual(["sweep.json"], os.listdir(tmp_dir))
+        runs = list(self.setup_task.run_scheduler.runs)
+        self.assertEqual(
+            ["Sweep 1: mco_model=None", "Sweep 1: mco_model=None"],
+            [run.name for run in runs],
+        )
+        self.assertIs(runs[0], self.setup_task.current_run)
+
+        # Results are merged when all the variants have completed
+        for value, run in enumerate(runs):
+            run.analysis_model.notify(("x",))
+            run.analysis_model.notify((value,))
+            self.setup_task.run_scheduler.run_finished(run, RUN_FINISHED)
+
+        merged_run = self.setup_task.current_run
+        self.assertEqual("Sweep 1 (merged)", merged_run.name)
+        self.assertEqual(RUN_FINISHED, merged_run.status)
+        self.assertIs(
+            merged_run.analysis_model, self.setup_task.analysis_model
+        )
+        self.assertEqual(
+            ("variant", "x"), merged_run.analysis_model.header
+        )
+        self.assertEqual(
+            [("mco_model=None", 0), ("mco_model=None", 1)],
+            merged_run.analysis_model.evaluation_steps,
+        )
+        self.assertEqual(
+            runs + [merged_run], self.setup_task.run_scheduler.runs
+        )
+
+    def test_run_sweep_failure(self):
+        with mock.patch(SETUP_ERROR_PATH) as mock_error:
+            mock_error.side_effect = mock_return_args
+            self.assertFalse(
+                self.setup_task._run_sweep_file("missing_sweep.json")
+            )
+        self.assertTrue(
+            mock_error.call_args[0][1].startswith(
+                "Unable to run the parameter sweep"
+            )
+        )
+        self.assertEqual([], self.setup_task.run_scheduler.runs)
+
+    def test_checkpoints(self):
+        run = BDSSRun(workflow_model=self.setup_task.workflow_model)
+        self.setup_task._attach_checkpoint(run)
+        self.assertEqual("", run.checkpoint_path)
+
+        self.setup_task.checkpoint_directory = "checkpoints"
+        self.setup_task.checkpoint_interval = 5.0
+        self.setup_task._attach_checkpoint(run)
+        self.assertEqual("checkpoints", os.path.dirname(run.checkpoint_path))
+        self.assertEqual(5.0, run.checkpoint_interval)
+
+        # The BDSS fetches the evaluations through the server of the run
+        server = self.setup_task._create_zmq_server(run)
+        self.assertEqual(run.evaluation_history, server._on_history_callback)
+
+        # The checkpoint is kept until the run finishes
+        with mock.patch.object(run, "write_checkpoint") as mock_write, \
+                mock.patch.object(run, "remove_checkpoint") as mock_remove:
+            run.status = RUN_RUNNING
+            self.setup_task._bdss_done(run, None)
+            mock_remove.assert_called_once_with()
+            mock_write.assert_not_called()
+
+            run.status = RUN_RUNNING
+            with mock.patch(SETUP_ERROR_PATH):
+                self.setup_task._bdss_done(run, Exception("failed"))
+            mock_write.assert_called_once_with()
+            mock_remove.assert_called_once_with()
+
+    def test_resume_bdss(self):
+        workflow_model = self.setup_task.workflow_model
+        data = {"header": ["x"], "1": {"metadata": {}, "data": [1.0]}}
+        with mock.patch(FILE_DIALOG_PATH) as mock_file_dialog, \
+                mock.patch(
+                    "force_wfmanager.wfmanager_setup_task.load_project_file",
+                    return_value=(data, workflow_model),
+                ), \
+                mock.patch.object(self.setup_task, "_launch_run"):
+            mock_file_dialog.side_effect = mock_dialog(
+                FileDialog, OK, "checkpoint.json"
+            )
+            self.setup_task.run_scheduler.launcher = (
+                self.setup_task._launch_run
+            )
+            self.assertTrue(self.setup_task.resume_bdss())
+
+        run = self.setup_task.current_run
+        self.assertEqual("Resumed checkpoint.json", run.name)
+        self.assertEqual("checkpoint.json", run.checkpoint_path)
+        self.assertIs(workflow_model, run.workflow_model)
+        self.assertEqual([(1.0,)], run.analysis_model.evaluation_steps)
+        self.assertEqual([run], self.setup_task.run_scheduler.runs)
+
+        with mock.patch(FILE_DIALOG_PATH) as mock_file_dialog:
+            mock_file_dialog.side_effect = mock_dialog(FileDialog, CANCEL)
+            self.assertFalse(self.setup_task.resume_bdss())
+
+    def test_resume_bdss_failure(self):
+        with mock.patch(SETUP_ERROR_PATH) as mock_error:
+            mock_error.side_effect = mock_return_args
+            self.assertFalse(
+                self.setup_task._resume_checkpoint_file("missing.json")
+            )
+        self.assertTrue(
+            mock_error.call_args[0][1].startswith("Unable to resume the run")
+        )
+        self.assertEqual([], self.setup_task.run_scheduler.runs)
+
     def test_control_buttons(self):
-        with mock.patch(
-            "force_wfmanager.server.zmq_server.ZMQServer.publish_message"
-        ) as mock_publish:
-            self.setup_task.stop_bdss()
-            self.assertFalse(self.setup_task._paused)
-            self.assertTrue(self.setup_task._not_paused)
-            mock_publish.assert_called_with("STOP_BDSS")
-
-            self.setup_task.pause_bdss()
-            self.assertTrue(self.setup_task._paused)
-            self.assertFalse(self.setup_task._not_paused)
-            mock_publish.assert_called_with("PAUSE_BDSS")
-
-            self.setup_task.pause_bdss()
-            self.assertFalse(self.setup_task._paused)
-            self.assertTrue(self.setup_task._not_paused)
-            mock_publish.assert_called_with("RESUME_BDSS")
+        run = BDSSRun(
+            status=RUN_RUNNING, zmq_server=mock.Mock(spec=ZMQServer)
+        )
+        self.setup_task.current_run = run
+        mock_publish = run.zmq_server.publish_message
+        self.assertTrue(self.setup_task.computation_running)
+
+        self.setup_task.pause_bdss()
+        self.assertTrue(self.setup_task._paused)
+        self.assertFalse(self.setup_task._not_paused)
+        mock_publish.assert_called_with("PAUSE_BDSS")
+
+        self.setup_task.pause_bdss()
+        self.assertFalse(self.setup_task._paused)
+        self.assertTrue(self.setup_task._not_paused)
+        mock_publish.assert_called_with("RESUME_BDSS")
+
+        self.setup_task.pause_bdss()
+        self.setup_task.stop_bdss()
+        self.assertFalse(self.setup_task._paused)
+        self.assertTrue(self.setup_task._not_paused)
+        self.assertTrue(run.stop_requested)
+        mock_publish.assert_called_with("STOP_BDSS")
 
         with mock.patch.object(self.setup_task, "run_bdss") as mock_run:
             self.setup_task.run_button_clicked()
             mock_run.assert_called()
 
     def test__bdss_done(self):
+        run = BDSSRun(status=RUN_RUNNING, stop_requested=True)
         with mock.patch(
             "force_wfmanager.wfmanager_setup_task.information"
         ) as mock_info:
             exception = subprocess.SubprocessError()
-            self.setup_task._bdss_done(exception)
+            self.setup_task._bdss_done(run, exception)
             mock_info.assert_called_with(
                 None, "Execution of BDSS stopped by the user."
             )
+        self.assertEqual(RUN_STOPPED, run.status)
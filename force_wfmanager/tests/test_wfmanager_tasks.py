@@ -275,7 +275,8 @@ class TestWFManagerTasks(GuiTestAssistant, TestCase):
 
             # the workflow gets updated to a new Workflow object
             old_workflow = self.review_task.workflow_model
-            # but the analysis model gets updated in-place
+            # and so does the analysis model, leaving the results of
+            # previous runs untouched
             old_analysis = copy.deepcopy(self.review_task.analysis_model)
             self.assertEqual(old_workflow, self.setup_task.workflow_model)
 
@@ -320,6 +321,50 @@ class TestWFManagerTasks(GuiTestAssistant, TestCase):
                 self.setup_task.analysis_model.evaluation_steps,
                 self.review_task.analysis_model.evaluation_steps,
             )
+            self.assertIs(
+                self.review_task.analysis_model,
+                self.review_task.side_pane.results_table.analysis_model,
+            )
+
+    def test_select_run(self):
+        with mock.patch.object(self.setup_task, "_launch_run"):
+            self.setup_task.run_scheduler.launcher = (
+                self.setup_task._launch_run
+            )
+            self.setup_task.run_bdss()
+            first_run = self.setup_task.current_run
+            self.setup_task.run_bdss()
+            second_run = self.setup_task.current_run
+
+        side_pane = self.review_task.side_pane
+        central_pane = self.review_task.central_pane
+        self.assertEqual([first_run, second_run], side_pane.runs)
+        self.assertIs(second_run, side_pane.selected_run)
+        self.assertIs(
+            second_run.workflow_model, self.review_task.workflow_model
+        )
+        self.assertIs(
+            second_run.analysis_model, self.review_task.analysis_model
+        )
+
+        side_pane.selected_run = first_run
+        self.assertIs(first_run, self.setup_task.current_run)
+        self.assertIs(
+            first_run.workflow_model, self.review_task.workflow_model
+        )
+        self.assertIs(
+            first_run.analysis_model, self.review_task.analysis_model
+        )
+        self.assertIs(
+            first_run.analysis_model,
+            side_pane.results_table.analysis_model,
+        )
+        self.assertIs(
+            first_run.analysis_model,
+            central_pane.data_view.analysis_model,
+        )
+        self.assertIs(first_run.telemetry, self.review_task.telemetry)
+        self.assertIs(first_run.telemetry, central_pane.telemetry)
 
     def test_open_empty_analysis_model(self):
         mock_open = mock.mock_open()
@@ -1,12 +1,44 @@
 #  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
 #  All rights reserved.
 
+import importlib
+import sys
+import types
+
 from .contributed_ui.contributed_ui import ContributedUI  # noqa
 from .contributed_ui.contributed_ui import ContributedUIHandler  # noqa
 from .contributed_ui.i_contributed_ui import IContributedUI  # noqa
 from .contributed_ui.ui_select_modal import UISelectModal  # noqa
 from .contributed_ui.ui_select_modal import UISelectHandler  # noqa
-from force_wfmanager.ui.review.base_plot import BasePlot  # noqa
-from force_wfmanager.ui.review.scatter_plot import ScatterPlot  # noqa
 from .review.i_data_view import IDataView  # noqa
 from .review.base_data_view import BaseDataView  # noqa
+
+#: Classes exported on first access, as they import the plotting libraries,
+#: which are slow to import and not needed until the results are reviewed
+_LAZY_EXPORTS = {
+    "BasePlot": "force_wfmanager.ui.review.base_plot",
+    "ScatterPlot": "force_wfmanager.ui.review.scatter_plot",
+}
+
+
+class _LazyExportsModule(types.ModuleType):
+    """Module type importing the :data:`_LAZY_EXPORTS` on first access.
+    Module level ``__getattr__`` functions are not supported before
+    Python 3.7."""
+
+    def __getattr__(self, name):
+        try:
+            module_name = _LAZY_EXPORTS[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {self.__name__!r} has no attribute {name!r}"
+            )
+        value = getattr(importlib.import_module(module_name), name)
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(_LAZY_EXPORTS))
+
+
+sys.modules[__name__].__class__ = _LazyExportsModule
@@ -1,10 +1,11 @@
 #  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
 #  All rights reserved.
 
+from functools import lru_cache
 import re
 
 from traits.api import (
-    Dict, Event, HasTraits, Instance, Int, Str, provides
+    Dict, Event, HasTraits, Instance, Int, Str, on_trait_change, provides
 )
 from traitsui.api import Action, Group, Handler, View
 
@@ -12,6 +13,13 @@ from force_bdss.api import Workflow, WorkflowReader
 
 from force_wfmanager.ui.contributed_ui.i_contributed_ui import IContributedUI
 
+#: The pattern of the ids of the factories, giving their plugin id and the
+#: version of the plugin
+ID_PATTERN = re.compile(r'(.*)\.v(\d+).*')
+
+#: Marks the items of the lists searched by :func:`search`, which have no key
+_NO_KEY = object()
+
 
 class ContributedUIHandler(Handler):
 
@@ -34,7 +42,8 @@ class ContributedUI(HasTraits):
     #: Description of the UI
     desc = Str()
 
-    #: List of plugin ids and versions required for this UI
+    #: List of plugin ids and versions required for this UI. Found in
+    #: :attr:`workflow_data` by default, and found again when it changes.
     required_plugins = Dict(Str, Int)
 
     #: Data for a premade workflow
@@ -93,10 +102,19 @@ class ContributedUI(HasTraits):
 
         return required_plugins
 
+    @on_trait_change("workflow_data,workflow_data_items", post_init=True)
+    def _invalidate_required_plugins(self):
+        """Finds the :attr:`required_plugins` again in the new
+        :attr:`workflow_data`"""
+        self.reset_traits(["required_plugins"])
+
 
 def search(input, search_term="id", results=None):
     """Search through an input dictionary and return all the matches
-    corresponding to a search term
+    corresponding to a search term, i.e. the values of the keys equal to
+    the search term in the nested dictionaries, lists, sets and tuples of
+    the input, in depth-first order. The input is walked iteratively, so
+    that deeply nested inputs do not exhaust the recursion limit.
 
     Parameters
     ----------
@@ -106,33 +124,38 @@ def search(input, search_term="id", results=None):
     search_term: Any
         Anything that can be used as a dictionary key
     results: List, optional
-        A list storing the current results. Used when search is called
-        recursively e.g. for a dict which has dicts as values.
+        A list the matches are appended to. A new list by default.
     """
-    if not results:
-        # Initial empty results list
+    if results is None:
         results = []
-    if isinstance(input, dict):
-        for key, val in input.items():
-            if key == "id":
-                results.append(val)
-            # Search sub-iterables. Note: Don't search stings (even though
-            # they are iterables!)
-            if isinstance(val, (dict, list, set, tuple)):
-                results = search(val, search_term, results)
-    elif isinstance(input, (list, set, tuple)):
-        for val in input:
-            results = search(val, search_term, results)
+    # A stack of iterators over the (key, value) pairs of the containers
+    # being walked
+    stack = [iter([(_NO_KEY, input)])]
+    while stack:
+        try:
+            key, value = next(stack[-1])
+        except StopIteration:
+            stack.pop()
+            continue
+        if key == search_term:
+            results.append(value)
+        # Search sub-iterables. Note: Don't search stings (even though
+        # they are iterables!)
+        if isinstance(value, dict):
+            stack.append(iter(value.items()))
+        elif isinstance(value, (list, set, tuple)):
+            stack.append((_NO_KEY, item) for item in value)
     return results
 
 
+@lru_cache(maxsize=None)
 def parse_id(id):
     """Parse an id found in json files, which has the form::
 
     ${plugin_id}.v${version_number}.factory.${factory_name}
 
     """
-    result = re.search(r'(.*)\.v(\d+).*', id)
+    result = ID_PATTERN.search(id)
     if result is None:
         raise ValueError(
             f"Unexpected plugin id: {id}\n Plugin ids should have the form:"
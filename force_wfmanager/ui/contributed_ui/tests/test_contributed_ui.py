@@ -72,6 +72,46 @@ class TestContributedUI(GuiTestAssistant, unittest.TestCase):
         ]
         self.assertListEqual(results, expected)
 
+    def test_required_plugins_update(self):
+        self.ui.workflow_data = {
+            "mco_model": {
+                "id": "force.bdss.enthought.plugin.uitest.v3.factory.mco"
+            }
+        }
+        expected = {"force.bdss.enthought.plugin.uitest.v3": 3}
+        self.assertDictEqual(expected, self.ui.required_plugins)
+
+        self.ui.workflow_data["notification_listeners"] = [
+            {"id": "force.bdss.enthought.plugin.other.v1.factory.nl"}
+        ]
+        expected["force.bdss.enthought.plugin.other.v1"] = 1
+        self.assertDictEqual(expected, self.ui.required_plugins)
+
+    def test_search_term(self):
+        input_dict = {
+            'id': 'mco_identifier',
+            'execution_layers': [
+                ({'info': [1, 2, 3]}, {'id': 'datasource_id'}),
+                [{'info': [4, 5, 6]}],
+            ],
+        }
+        self.assertListEqual(
+            [[1, 2, 3], [4, 5, 6]], search(input_dict, search_term="info")
+        )
+        self.assertListEqual([], search(input_dict, search_term="unknown"))
+
+        results = ['previous']
+        search(input_dict, results=results)
+        self.assertListEqual(
+            ['previous', 'mco_identifier', 'datasource_id'], results
+        )
+
+    def test_search_deep_input(self):
+        input_dict = {'id': 'deepest'}
+        for _ in range(5000):
+            input_dict = {'layer': [input_dict]}
+        self.assertListEqual(['deepest'], search(input_dict))
+
     def test_parse_id_error(self):
         with self.assertRaisesRegex(ValueError, "Unexpected plugin id:"):
             parse_id("incorrectid")
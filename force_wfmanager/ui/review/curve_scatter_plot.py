@@ -4,8 +4,6 @@
 import logging
 
 import numpy as np
-from scipy import interpolate
-
 from traits.api import on_trait_change, Str, Bool
 from traitsui.api import (
     HGroup, Item, UItem, VGroup, UReadonly, EnumEditor)
@@ -64,6 +62,10 @@ class CurveScatterPlot(ScatterPlot):
         x = self._plot_data.get_data("x")
         y = self._plot_data.get_data("y")
 
+        # SciPy is only imported when a curve is displayed, as it is slow
+        # to import
+        from scipy import interpolate
+
         # Attempt to fit curve, reset the curves and display an error
         # if this fails
         try:
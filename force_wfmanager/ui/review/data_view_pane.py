@@ -3,6 +3,7 @@
 
 from pyface.tasks.api import TraitsTaskPane
 from traits.api import (
+    Bool,
     Button,
     Dict,
     Enum,
@@ -15,8 +16,7 @@ from traits.api import (
 from traitsui.api import EnumEditor, HGroup, UItem, VGroup, View
 
 from force_wfmanager.model.analysis_model import AnalysisModel
-from force_wfmanager.ui.review.scatter_plot import ScatterPlot
-from force_wfmanager.ui.review.curve_scatter_plot import CurveScatterPlot
+from force_wfmanager.model.resource_telemetry import ResourceTelemetry
 from force_wfmanager.ui.review.base_data_view import BaseDataView
 from force_wfmanager.ui.ui_utils import class_description
 
@@ -27,6 +27,9 @@ class DataViewPane(TraitsTaskPane):
     #: The analysis model containing the results
     analysis_model = Instance(AnalysisModel)
 
+    #: The resource usage of the BDSS processes of the displayed run
+    telemetry = Instance(ResourceTelemetry, ())
+
     # ------------------
     # Regular Attributes
     # ------------------
@@ -37,6 +40,11 @@ class DataViewPane(TraitsTaskPane):
     #: The data view being displayed
     data_view = Instance(BaseDataView)
 
+    #: The data view shown in the UI. None until :meth:`show_data_view` is
+    #: called, so that the plotting libraries are not imported before the
+    #: pane is first shown.
+    displayed_data_view = Instance(BaseDataView)
+
     #: Saved instances of data views from this session (this is used to store
     #: the settings from each data_view while the user tries other options)
     data_view_instances = Dict(Type(BaseDataView), Instance(BaseDataView))
@@ -53,6 +61,9 @@ class DataViewPane(TraitsTaskPane):
     #: Human readable descriptions of each data view, for the UI
     data_view_descriptions = Dict(Type(BaseDataView), Str())
 
+    #: Whether :attr:`data_view` was created
+    _data_view_created = Bool(False)
+
     #: Modal view for changing the selected plot
     selection_changer = View(
         HGroup(
@@ -73,11 +84,15 @@ class DataViewPane(TraitsTaskPane):
     #: View
     traits_view = View(
         VGroup(
-            VGroup(UItem("change_view")), UItem("data_view", style="custom")
+            VGroup(UItem("change_view")),
+            UItem("displayed_data_view", style="custom"),
         )
     )
 
     def _data_view_default(self):
+        from force_wfmanager.ui.review.scatter_plot import ScatterPlot
+
+        self._data_view_created = True
         plot_data_view = ScatterPlot(analysis_model=self.analysis_model)
         plot_data_view.is_active_view = True
         return plot_data_view
@@ -87,9 +102,21 @@ class DataViewPane(TraitsTaskPane):
         to extract their custom data views.
 
         """
+        # The data views are only imported when needed, as the plotting
+        # libraries are slow to import
+        from force_wfmanager.ui.review.curve_scatter_plot import (
+            CurveScatterPlot
+        )
+        from force_wfmanager.ui.review.resource_usage_plot import (
+            ResourceUsagePlot
+        )
+        from force_wfmanager.ui.review.scatter_plot import ScatterPlot
+
         # "Plot" and "CurveScatterPlot" are added first as they serve as
         # the default selection.
-        available_data_views = [ScatterPlot, CurveScatterPlot]
+        available_data_views = [
+            ScatterPlot, CurveScatterPlot, ResourceUsagePlot
+        ]
         if self.task is not None and self.task.window is not None:
             # This is skipped if the current class is instantiated outside
             # of an application (e.g. specific tests)
@@ -123,5 +150,54 @@ class DataViewPane(TraitsTaskPane):
         try:
             self.data_view = self.data_view_instances[data_view_type]
         except KeyError:
-            self.data_view = data_view_type(analysis_model=self.analysis_model)
+            self.data_view = self._create_data_view(data_view_type)
+        self.data_view.is_active_view = True
+
+    def show_data_view(self):
+        """ Shows the data view in the UI. Called when the pane is first
+        shown, i.e. when the Review task is activated."""
+        self.displayed_data_view = self.data_view
+
+    def _data_view_changed(self, data_view):
+        self._data_view_created = True
+        if self.displayed_data_view is not None:
+            self.displayed_data_view = data_view
+
+    @on_trait_change("analysis_model", post_init=True)
+    def update_analysis_model(self):
+        """ Recreates the data view of the current type for a new analysis
+        model, e.g. when the results of a different run are selected. The
+        stored instances refer to the previous model, and are discarded."""
+        if not self._data_view_created:
+            # The default data view uses the new model when created
+            return
+        data_view_type = type(self.data_view)
+        self.data_view.is_active_view = False
+        self.data_view_instances = {}
+        self.data_view = self._create_data_view(data_view_type)
         self.data_view.is_active_view = True
+
+    @on_trait_change("telemetry", post_init=True)
+    def update_telemetry(self):
+        """ Shows the resource usage of a different run in the resource
+        usage plots."""
+        if not self._data_view_created:
+            return
+        from force_wfmanager.ui.review.resource_usage_plot import (
+            ResourceUsagePlot
+        )
+
+        views = [self.data_view] + list(self.data_view_instances.values())
+        for data_view in views:
+            if isinstance(data_view, ResourceUsagePlot):
+                data_view.telemetry = self.telemetry
+
+    def _create_data_view(self, data_view_type):
+        from force_wfmanager.ui.review.resource_usage_plot import (
+            ResourceUsagePlot
+        )
+
+        data_view = data_view_type(analysis_model=self.analysis_model)
+        if isinstance(data_view, ResourceUsagePlot):
+            data_view.telemetry = self.telemetry
+        return data_view
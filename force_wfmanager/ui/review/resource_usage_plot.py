@@ -0,0 +1,94 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+""" This submodule implements the following :class:`BaseDataView` subclass:
+
+* :class:`ResourceUsagePlot` plots the resource usage of the BDSS process
+  tree of a run over time, e.g. to find out when the evaluations are
+  memory-bound or serialised on a single core.
+
+"""
+
+from chaco.api import ArrayPlotData
+from chaco.api import Plot as ChacoPlot
+from enable.api import Component, ComponentEditor
+from traits.api import Enum, Instance, List, on_trait_change
+from traitsui.api import EnumEditor, HGroup, Item, UItem, VGroup, View
+
+from force_wfmanager.model.resource_telemetry import (
+    ResourceTelemetry,
+    TELEMETRY_HEADER,
+)
+
+from .base_data_view import BaseDataView
+
+
+class ResourceUsagePlot(BaseDataView):
+    """Line plot of one resource usage value of a run over time."""
+
+    #: Short description for the UI selection
+    description = "Resource usage of the BDSS processes"
+
+    #: The resource usage samples of the run
+    telemetry = Instance(ResourceTelemetry, ())
+
+    #: The names of the values which can be plotted
+    metric_names = List(list(TELEMETRY_HEADER[1:]))
+
+    #: The plotted value
+    metric = Enum(values="metric_names")
+
+    #: The Chaco plot
+    _plot = Instance(ChacoPlot)
+
+    #: The data of the plot, with "time" and "value" arrays
+    _plot_data = Instance(ArrayPlotData)
+
+    #: Reference to the Chaco component displayed in the TraitsUI view
+    _component = Instance(Component)
+
+    def default_traits_view(self):
+        return View(
+            VGroup(
+                HGroup(
+                    Item(
+                        "metric",
+                        label="Resource",
+                        editor=EnumEditor(name="metric_names"),
+                    )
+                ),
+                UItem("_component", editor=ComponentEditor()),
+            )
+        )
+
+    def __plot_data_default(self):
+        plot_data = ArrayPlotData()
+        plot_data.set_data("time", [])
+        plot_data.set_data("value", [])
+        return plot_data
+
+    def __plot_default(self):
+        plot = ChacoPlot(self._plot_data)
+        plot.plot(("time", "value"), type="line", name="resource")
+        plot.x_axis.title = TELEMETRY_HEADER[0]
+        plot.y_axis.title = self.metric
+        return plot
+
+    def __component_default(self):
+        return self._plot
+
+    @on_trait_change("telemetry:samples[]")
+    def request_telemetry_update(self):
+        """Enables the plot update at the next cycle."""
+        self.update_required = True
+
+    @on_trait_change("metric")
+    def _update_metric(self):
+        self._plot.y_axis.title = self.metric
+        self.update_data_view()
+
+    def update_data_view(self):
+        """Sets the plot data to the samples of :attr:`metric`."""
+        self._plot_data.set_data(
+            "time", self.telemetry.column(TELEMETRY_HEADER[0])
+        )
+        self._plot_data.set_data("value", self.telemetry.column(self.metric))
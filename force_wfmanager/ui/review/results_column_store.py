@@ -0,0 +1,220 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import numbers
+
+import numpy as np
+from traits.api import (
+    Event,
+    HasStrictTraits,
+    Instance,
+    Int,
+    List,
+    Tuple,
+    on_trait_change,
+)
+
+from force_wfmanager.model.analysis_model import AnalysisModel
+
+#: Number of rows allocated for each column of an empty store
+INITIAL_CAPACITY = 64
+
+
+def column_dtype(values):
+    """ Returns the narrowest of the int64, float64 and object dtypes able
+    to store `values`. Booleans and missing values are stored as objects,
+    so that they are displayed as received."""
+    if all(_is_integer(value) for value in values):
+        return np.dtype(np.int64)
+    if all(_is_real(value) for value in values):
+        return np.dtype(np.float64)
+    return np.dtype(object)
+
+
+def _is_integer(value):
+    return (
+        isinstance(value, numbers.Integral)
+        and not isinstance(value, (bool, np.bool_))
+    )
+
+
+def _is_real(value):
+    return (
+        isinstance(value, numbers.Real)
+        and not isinstance(value, (bool, np.bool_))
+    )
+
+
+def _format_integer(value):
+    return str(int(value))
+
+
+def _format_float(value):
+    return str(float(value))
+
+
+#: Formatters of the cells of the columns, by kind of dtype
+FORMATTERS = {
+    "i": _format_integer,
+    "f": _format_float,
+    "O": str,
+}
+
+
+class ResultsColumnStore(HasStrictTraits):
+    """ Columnar copy of the evaluation steps of an AnalysisModel.
+
+    Each column of the AnalysisModel is stored in a NumPy array, of integers
+    or floats when possible, which is allocated with spare capacity so that
+    the evaluation steps are appended in amortised constant time. The store
+    behaves as a read-only sequence of rows, but a table displaying it
+    should read its cells with :meth:`text`, which formats them on demand,
+    and follow :attr:`rows_appended` and :attr:`rows_reset` rather than
+    reloading the whole store on each new evaluation step.
+    """
+
+    # -------------------
+    # Required Attributes
+    # -------------------
+
+    #: The model whose evaluation steps are stored
+    analysis_model = Instance(AnalysisModel)
+
+    # --------------------
+    # Dependent Attributes
+    # --------------------
+
+    #: Number of rows in the store.
+    #: Listens to: :attr:`analysis_model.evaluation_steps
+    #: <force_wfmanager.model.analysis_model.AnalysisModel.evaluation_steps>`
+    length = Int()
+
+    #: Fired with the (first, stop) range of the rows appended to the store
+    rows_appended = Event(Tuple(Int, Int))
+
+    #: Fired when the rows of the store are replaced, e.g. when the
+    #: AnalysisModel is cleared
+    rows_reset = Event()
+
+    # ------------------
+    # Private Attributes
+    # ------------------
+
+    #: The arrays of the columns. Only the first :attr:`length` values
+    #: of each array are used.
+    _columns = List()
+
+    #: The formatter of each column, or None until first needed
+    _formatters = List()
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, row):
+        if row < 0:
+            row += self.length
+        if not 0 <= row < self.length:
+            raise IndexError("Row index out of range")
+        return tuple(
+            self.value(row, column) for column in range(len(self._columns))
+        )
+
+    def value(self, row, column):
+        """ Returns the value of a cell, as a Python object"""
+        value = self._columns[column][row]
+        if isinstance(value, np.generic):
+            return value.item()
+        return value
+
+    def text(self, row, column):
+        """ Returns the text displayed for a cell, formatted with the
+        formatter of the dtype of its column."""
+        formatter = self._formatters[column]
+        if formatter is None:
+            formatter = FORMATTERS[self._columns[column].dtype.kind]
+            self._formatters[column] = formatter
+        return formatter(self._columns[column][row])
+
+    def column_array(self, column):
+        """ Returns a read-only view of the values of a column"""
+        array = self._columns[column][:self.length]
+        array.flags.writeable = False
+        return array
+
+    # Response to model change
+
+    @on_trait_change("analysis_model,analysis_model:header")
+    def reset(self):
+        """ Reloads all the evaluation steps of the AnalysisModel"""
+        self._columns = []
+        self._formatters = []
+        self.length = 0
+        if self.analysis_model is not None:
+            self._append(self.analysis_model.evaluation_steps)
+        self.rows_reset = True
+
+    @on_trait_change("analysis_model:evaluation_steps")
+    def _update_rows(self):
+        """ Appends the new evaluation steps of the AnalysisModel, or
+        reloads them all if some were removed."""
+        evaluation_steps = self.analysis_model.evaluation_steps
+        if len(evaluation_steps) < self.length:
+            self.reset()
+        elif len(evaluation_steps) > self.length:
+            first = self.length
+            self._append(evaluation_steps[first:])
+            self.rows_appended = (first, self.length)
+
+    # Private methods
+
+    def _append(self, rows):
+        """ Appends `rows` to the columns"""
+        if not rows:
+            return
+        first = self.length
+        stop = first + len(rows)
+        for index, values in enumerate(zip(*rows)):
+            if index == len(self._columns):
+                self._columns.append(
+                    np.empty(
+                        max(INITIAL_CAPACITY, len(values)),
+                        dtype=column_dtype(values),
+                    )
+                )
+                self._formatters.append(None)
+            self._store(index, values, first, stop)
+        self.length = stop
+
+    def _store(self, index, values, first, stop):
+        """ Stores `values` in the rows [first, stop) of a column, growing
+        or widening its array as required."""
+        column = self._columns[index]
+        dtype = np.promote_types(column.dtype, column_dtype(values))
+        capacity = len(column)
+        if stop > capacity:
+            capacity = max(stop, 2 * capacity)
+        if dtype != column.dtype or capacity != len(column):
+            column = self._resize(index, capacity, dtype)
+
+        if dtype.kind != "O":
+            try:
+                column[first:stop] = values
+                return
+            except OverflowError:
+                column = self._resize(index, capacity, np.dtype(object))
+        # Assigned one by one, so that sequences are stored as objects
+        for row, value in enumerate(values, first):
+            column[row] = value
+
+    def _resize(self, index, capacity, dtype):
+        """ Replaces the array of a column by one of the given capacity
+        and dtype, holding the same values."""
+        column = np.empty(capacity, dtype=dtype)
+        old_column = self._columns[index]
+        if dtype.kind == "O" and old_column.dtype.kind != "O":
+            column[:self.length] = old_column[:self.length].tolist()
+        else:
+            column[:self.length] = old_column[:self.length]
+        self._columns[index] = column
+        self._formatters[index] = None
+        return column
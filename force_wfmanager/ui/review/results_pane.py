@@ -2,10 +2,11 @@
 #  All rights reserved.
 
 from pyface.tasks.api import TraitsDockPane
-from traits.api import Instance
-from traitsui.api import VGroup, View, UItem
+from traits.api import Dict, Instance, List, on_trait_change, Property
+from traitsui.api import EnumEditor, HGroup, Item, VGroup, View, UItem
 
 from force_wfmanager.model.analysis_model import AnalysisModel
+from force_wfmanager.model.bdss_run import BDSSRun
 from force_wfmanager.ui.review.results_table import ResultsTable
 
 
@@ -19,6 +20,12 @@ class ResultsPane(TraitsDockPane):
     #: The analysis model containing the review
     analysis_model = Instance(AnalysisModel)
 
+    #: The BDSS runs whose results can be displayed
+    runs = List(Instance(BDSSRun))
+
+    #: The run whose results are displayed
+    selected_run = Instance(BDSSRun)
+
     # ------------------
     # Regular Attributes
     # ------------------
@@ -49,13 +56,40 @@ class ResultsPane(TraitsDockPane):
     #: Listens to: :attr:`analysis_model`
     results_table = Instance(ResultsTable)
 
+    #: Labels of the runs, for the run selector.
+    #: Listens to: :attr:`runs`
+    _run_labels = Property(Dict, depends_on="runs.label")
+
     # ----
     # View
     # ----
 
-    traits_view = View(VGroup(UItem("results_table", style="custom")))
+    traits_view = View(
+        VGroup(
+            HGroup(
+                Item(
+                    "selected_run",
+                    editor=EnumEditor(name="_run_labels"),
+                    label="Run",
+                ),
+                visible_when="len(runs) > 1",
+            ),
+            UItem("results_table", style="custom"),
+        )
+    )
 
     # Defaults
 
     def _results_table_default(self):
         return ResultsTable(analysis_model=self.analysis_model)
+
+    # Properties
+
+    def _get__run_labels(self):
+        return {run: run.label for run in self.runs}
+
+    # Response to model change
+
+    @on_trait_change("analysis_model", post_init=True)
+    def update_results_table(self):
+        self.results_table.analysis_model = self.analysis_model
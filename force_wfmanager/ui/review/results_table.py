@@ -2,21 +2,41 @@
 #  All rights reserved.
 
 from traits.api import (
-    Either,
     HasStrictTraits,
     Instance,
     List,
     Property,
-    Tuple,
     on_trait_change,
     Event,
     Int,
 )
-from traitsui.api import TabularEditor, UItem, View
+from traitsui.api import UItem, View
 from traitsui.tabular_adapter import TabularAdapter
 from traitsui.table_column import ListColumn
 
 from force_wfmanager.model.analysis_model import AnalysisModel
+from force_wfmanager.ui.review.results_table_editor import (
+    ResultsTableEditor
+)
+from force_wfmanager.ui.review.sorted_results import SortedResults
+
+#: Markers appended to the titles of the columns sorted in ascending and
+#: descending order
+SORT_MARKERS = {True: " ▲", False: " ▼"}
+
+
+class ResultsTableAdapter(TabularAdapter):
+    """ TabularAdapter reading the cells of SortedResults on demand.
+
+    The rows are identified by their index, so that no tuple is built for
+    the cells drawn by the table.
+    """
+
+    def get_item(self, object, trait, row):
+        return row
+
+    def get_text(self, object, trait, row, column):
+        return getattr(object, trait).text(row, column)
 
 
 class ResultsTable(HasStrictTraits):
@@ -29,32 +49,37 @@ class ResultsTable(HasStrictTraits):
 
     #: Adapter initialised with dummy columns to circumvent
     #: issues raised when setting up the View with no columns
-    tabular_adapter = Instance(TabularAdapter, ())
+    tabular_adapter = Instance(ResultsTableAdapter, ())
 
     # --------------------
     # Dependent Attributes
     # --------------------
 
-    #: Selected evaluation steps in the table
-    _selected_rows = Either(List(Tuple), None)
+    #: Rows of the table_editor, stored by column and sorted by the
+    #: columns clicked by the user.
+    #: Listens to: :attr:`analysis_model`
+    rows = Instance(SortedResults, ())
+
+    #: Positions of the selected evaluation steps in the table
+    _selected_indices = List(Int)
 
     #: When the selected row changes, this event will be triggered
     #: to return the index of that row, so that it can be scrolled to
     _scroll_to_row = Event(Int)
 
+    #: Fired when the title of a column is clicked
+    _column_clicked = Event()
+
+    #: Fired when the title of a column is right clicked
+    _column_right_clicked = Event()
+
     # ----------
     # Properties
     # ----------
 
-    #: Rows of the table_editor
-    rows = Property(List(Tuple), depends_on="analysis_model.evaluation_steps")
-
     #: Columns of the table_editor
     columns = Property(List(ListColumn), depends_on="analysis_model.header")
 
-    def _get_rows(self):
-        return self.analysis_model.evaluation_steps
-
     def _get_columns(self):
         return [
             ListColumn(label=name, index=index)
@@ -65,47 +90,105 @@ class ResultsTable(HasStrictTraits):
     # View
     # ----
     def default_traits_view(self):
-        editor = TabularEditor(
+        editor = ResultsTableEditor(
             adapter=self.tabular_adapter,
             show_titles=True,
-            selected="_selected_rows",
+            selected_row="_selected_indices",
             auto_update=False,
             multi_select=True,
             scroll_to_row="_scroll_to_row",
             scroll_to_row_hint="visible",
+            column_clicked="_column_clicked",
+            column_right_clicked="_column_right_clicked",
             editable=False,
         )
 
         return View(UItem("rows", editor=editor))
 
+    # ------------------
+    #   Public Methods
+    # ------------------
+
+    def sort_by(self, column):
+        """ Sorts the table by a column, keeping the previous sort columns
+        as secondary keys. The order of the column is reversed if it is
+        already the first sort column.
+
+        Parameters
+        ----------
+        column: int
+            The index of the column
+        """
+        sort_keys = self.rows.sort_keys
+        ascending = True
+        if sort_keys and sort_keys[0][0] == column:
+            ascending = not sort_keys[0][1]
+        self.rows.sort_keys = [(column, ascending)] + [
+            key for key in sort_keys if key[0] != column
+        ]
+
+    def clear_sort(self):
+        """ Displays the rows in the order of the evaluation steps"""
+        self.rows.sort_keys = []
+
     # Response to model initialisation
-    @on_trait_change("analysis_model.header")
+    @on_trait_change("analysis_model")
+    def _update_rows(self):
+        self.clear_sort()
+        self.rows.store.analysis_model = self.analysis_model
+
+    @on_trait_change("analysis_model.header,rows.sort_keys[]")
     def _update_adapter(self):
+        if self.analysis_model is None:
+            return
+        sort_orders = dict(self.rows.sort_keys)
         self.tabular_adapter.columns = [
-            name for name in self.analysis_model.header
+            name + SORT_MARKERS.get(sort_orders.get(index), "")
+            for index, name in enumerate(self.analysis_model.header)
         ]
 
+    @on_trait_change("analysis_model.header")
+    def _clear_sort_keys(self):
+        self.clear_sort()
+
+    # Response to the user clicking a column title
+    @on_trait_change("_column_clicked")
+    def _sort_by_clicked_column(self, event):
+        self.sort_by(event.column)
+
+    @on_trait_change("_column_right_clicked")
+    def _clear_sort_on_right_click(self):
+        self.clear_sort()
+
     # Response to model change
-    @on_trait_change("analysis_model.selected_step_indices")
+    @on_trait_change(
+        "analysis_model.selected_step_indices,"
+        "rows:rows_inserted,rows:rows_reset"
+    )
     def update_table(self):
         """ Updates the selected row in the table according to the model """
-        if self.analysis_model.selected_step_indices is None:
-            self._selected_rows = []
+        if (
+            self.analysis_model is None
+            or self.analysis_model.selected_step_indices is None
+        ):
+            self._selected_indices = []
         else:
-            self._selected_rows = [
-                self.rows[ind]
-                for ind in self.analysis_model.selected_step_indices
+            self._selected_indices = [
+                self.rows.view_index(index)
+                for index in self.analysis_model.selected_step_indices
             ]
 
     # Response to new selection by user in UI
-    @on_trait_change("_selected_rows[]")
+    @on_trait_change("_selected_indices[]")
     def update_model(self):
         """ Updates the model according to the selected row in the table """
-        if not self._selected_rows:
+        if self.analysis_model is None:
+            return
+        if not self._selected_indices:
             self.analysis_model._selected_step_indices = None
         else:
             self.analysis_model.selected_step_indices = [
-                self.analysis_model.evaluation_steps.index(row)
-                for row in self._selected_rows
+                self.rows.original_index(row)
+                for row in self._selected_indices
             ]
-            self._scroll_to_row = self.analysis_model.selected_step_indices[0]
+            self._scroll_to_row = self._selected_indices[0]
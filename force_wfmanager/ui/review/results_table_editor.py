@@ -0,0 +1,73 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+from pyface.qt import QtCore
+from traits.api import Property
+from traitsui.api import TabularEditor
+from traitsui.qt4.tabular_editor import TabularEditor as _QtTabularEditor
+
+
+class _ResultsTableEditor(_QtTabularEditor):
+    """ Qt TabularEditor of
+    :class:`SortedResults
+    <force_wfmanager.ui.review.sorted_results.SortedResults>`.
+
+    The Qt model of the TabularEditor already reads the visible cells on
+    demand from the adapter, but resets itself, and so the whole view,
+    each time the edited list changes. This editor instead inserts the
+    rows merged into the sorted results into the Qt model, and only resets
+    it when the results are sorted again.
+    """
+
+    def init(self, parent):
+        super(_ResultsTableEditor, self).init(parent)
+        self.context_object.on_trait_change(
+            self._rows_inserted,
+            self.extended_name + ":rows_inserted",
+            dispatch="ui",
+        )
+        self.context_object.on_trait_change(
+            self.update_editor,
+            self.extended_name + ":rows_reset",
+            dispatch="ui",
+        )
+
+    def dispose(self):
+        self.context_object.on_trait_change(
+            self._rows_inserted,
+            self.extended_name + ":rows_inserted",
+            remove=True,
+        )
+        self.context_object.on_trait_change(
+            self.update_editor,
+            self.extended_name + ":rows_reset",
+            remove=True,
+        )
+        super(_ResultsTableEditor, self).dispose()
+
+    def update_editor(self):
+        """ Resets the Qt model, and restores the selected rows by index,
+        as the sorted rows can't be looked up by value."""
+        if not self._no_update:
+            self.model.beginResetModel()
+            self.model.endResetModel()
+            self._multi_selected_rows_changed(self.multi_selected_rows)
+
+    def _rows_inserted(self, rows_range):
+        first, stop = rows_range
+        self.model.beginInsertRows(QtCore.QModelIndex(), first, stop - 1)
+        self.model.endInsertRows()
+        # The selected rows may have moved, and been updated by the
+        # object before the rows were inserted
+        self._multi_selected_rows_changed(self.multi_selected_rows)
+
+
+class ResultsTableEditor(TabularEditor):
+    """ TabularEditor factory for SortedResults, which must be used
+    with multi_select and selected_row, rather than selected."""
+
+    #: The editor class to be created
+    klass = Property()
+
+    def _get_klass(self):
+        return _ResultsTableEditor
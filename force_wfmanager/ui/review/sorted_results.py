@@ -0,0 +1,286 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import math
+import numbers
+
+import numpy as np
+from traits.api import (
+    Any,
+    Bool,
+    Event,
+    HasStrictTraits,
+    Instance,
+    Int,
+    List,
+    Property,
+    Tuple,
+    on_trait_change,
+)
+
+from force_wfmanager.ui.review.results_column_store import (
+    ResultsColumnStore
+)
+
+#: Number of rows appended at once above which the rows are sorted again,
+#: rather than merged one by one into the sorted rows
+MERGE_LIMIT = 1024
+
+
+class _ObjectKey:
+    """ Sort key of a value of an object column. Numbers come first, then
+    strings, then the other values by their text, in the requested
+    direction. Missing values come last in both directions, as NaNs do in
+    the numerical columns."""
+
+    __slots__ = ("rank", "value", "ascending")
+
+    def __init__(self, value, ascending):
+        if value is None or (isinstance(value, float) and math.isnan(value)):
+            self.rank, self.value = 3, None
+        elif (
+            isinstance(value, numbers.Real)
+            and not isinstance(value, (bool, np.bool_))
+        ):
+            self.rank, self.value = 0, value
+        elif isinstance(value, str):
+            self.rank, self.value = 1, value
+        else:
+            self.rank, self.value = 2, str(value)
+        self.ascending = ascending
+
+    def __lt__(self, other):
+        if self.rank != other.rank:
+            return self.rank < other.rank
+        if self.value is None:
+            return False
+        if self.ascending:
+            return self.value < other.value
+        return other.value < self.value
+
+    def __eq__(self, other):
+        return self.rank == other.rank and self.value == other.value
+
+    __hash__ = None
+
+
+def sort_key_array(values, ascending):
+    """ Returns an array of the sort keys of `values`, whose ascending
+    order is the order of `values` in the requested direction.
+
+    Parameters
+    ----------
+    values: numpy.ndarray
+        The values of a column of a ResultsColumnStore
+    ascending: bool
+        The direction of the sort
+    """
+    if values.dtype.kind == "O":
+        keys = np.empty(len(values), dtype=object)
+        for index, value in enumerate(values):
+            keys[index] = _ObjectKey(value, ascending)
+        return keys
+    if ascending:
+        return values
+    return np.negative(values)
+
+
+class SortedResults(HasStrictTraits):
+    """ The rows of a ResultsColumnStore, in the order of some of its
+    columns.
+
+    The order is held as a permutation of the indices of the rows of the
+    store, computed with :func:`numpy.lexsort` when the sort keys change,
+    so that no row is copied. The rows appended to the store are sorted
+    among themselves, and merged into the permutation at the positions
+    found by binary search in the sorted keys, rather than sorting all the
+    rows again. Rows with equal keys keep the order of the store.
+    """
+
+    # -------------------
+    # Required Attributes
+    # -------------------
+
+    #: The rows to sort
+    store = Instance(ResultsColumnStore, ())
+
+    #: The (column index, ascending) keys of the sort, by decreasing
+    #: priority. The rows are in the order of the store if empty.
+    sort_keys = List(Tuple(Int, Bool))
+
+    # --------------------
+    # Dependent Attributes
+    # --------------------
+
+    #: Fired with the (first, stop) range of the sorted rows inserted
+    #: when rows are appended to the store
+    rows_inserted = Event(Tuple(Int, Int))
+
+    #: Fired when the order of the rows is recomputed
+    rows_reset = Event()
+
+    # ----------
+    # Properties
+    # ----------
+
+    #: The index in the store of each of the sorted rows
+    permutation = Property()
+
+    # ------------------
+    # Private Attributes
+    # ------------------
+
+    #: Private array of the permutation, or None if unsorted
+    _permutation = Any()
+
+    #: The inverse of the permutation, computed when first needed
+    _inverse = Any()
+
+    #: The sort key arrays of the columns of :attr:`sort_keys`, in the
+    #: sorted order
+    _sorted_keys = List()
+
+    #: The dtype kinds of the columns of :attr:`sort_keys` when sorted
+    _key_kinds = List()
+
+    def __len__(self):
+        return len(self.store)
+
+    def __getitem__(self, row):
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("Row index out of range")
+        return self.store[self.original_index(row)]
+
+    def _get_permutation(self):
+        if self._permutation is None:
+            return np.arange(len(self))
+        permutation = self._permutation.view()
+        permutation.flags.writeable = False
+        return permutation
+
+    def original_index(self, row):
+        """ Returns the index in the store of a sorted row"""
+        if self._permutation is None:
+            return row
+        return int(self._permutation[row])
+
+    def view_index(self, index):
+        """ Returns the sorted position of the row of the store at `index`
+        """
+        if self._permutation is None:
+            return index
+        if self._inverse is None:
+            inverse = np.empty_like(self._permutation)
+            inverse[self._permutation] = np.arange(len(self._permutation))
+            self._inverse = inverse
+        return int(self._inverse[index])
+
+    def text(self, row, column):
+        """ Returns the text displayed for a cell of a sorted row"""
+        return self.store.text(self.original_index(row), column)
+
+    # Response to sort change
+
+    @on_trait_change("sort_keys[],store:rows_reset")
+    def sort(self):
+        """ Sorts all the rows of the store"""
+        self._sort_rows()
+        self.rows_reset = True
+
+    @on_trait_change("store:rows_appended")
+    def _merge_rows(self, rows_range):
+        """ Merges the rows appended to the store into the sorted rows"""
+        if self._permutation is None:
+            self.rows_inserted = rows_range
+            return
+
+        first, stop = rows_range
+        if (
+            first == 0
+            or stop - first > MERGE_LIMIT
+            or self._column_kinds() != self._key_kinds
+        ):
+            self.sort()
+            return
+
+        new_keys = [
+            sort_key_array(
+                self.store.column_array(column)[first:stop], ascending
+            )
+            for column, ascending in self.sort_keys
+        ]
+        new_order = np.lexsort(new_keys[::-1])
+        new_keys = [key[new_order] for key in new_keys]
+
+        positions = self._insertion_positions(new_keys)
+        self._permutation = np.insert(
+            self._permutation, positions, new_order + first
+        )
+        self._sorted_keys = [
+            np.insert(sorted_key, positions, new_key)
+            for sorted_key, new_key in zip(self._sorted_keys, new_keys)
+        ]
+        self._inverse = None
+
+        # Positions of the inserted rows in the merged rows
+        inserted = positions + np.arange(len(positions))
+        if inserted[-1] - inserted[0] == len(inserted) - 1:
+            self.rows_inserted = (int(inserted[0]), int(inserted[-1]) + 1)
+        else:
+            self.rows_reset = True
+
+    # Private methods
+
+    def _sort_rows(self):
+        self._inverse = None
+        self._sorted_keys = []
+        self._key_kinds = []
+        if not self.sort_keys:
+            self._permutation = None
+            return
+        if not len(self.store):
+            # Sorted on the first rows appended
+            self._permutation = np.arange(0)
+            return
+
+        keys = [
+            sort_key_array(self.store.column_array(column), ascending)
+            for column, ascending in self.sort_keys
+        ]
+        # The last key of lexsort is the primary one
+        permutation = np.lexsort(keys[::-1])
+        self._permutation = permutation
+        self._sorted_keys = [key[permutation] for key in keys]
+        self._key_kinds = self._column_kinds()
+
+    def _column_kinds(self):
+        return [
+            self.store.column_array(column).dtype.kind
+            for column, _ in self.sort_keys
+        ]
+
+    def _insertion_positions(self, new_keys):
+        """ Returns the positions in the sorted rows before which the new
+        rows, sorted by `new_keys`, must be inserted."""
+        if len(self._sorted_keys) == 1:
+            return np.searchsorted(
+                self._sorted_keys[0], new_keys[0], side="right"
+            )
+
+        positions = np.empty(len(new_keys[0]), dtype=np.intp)
+        for row in range(len(positions)):
+            # Narrow down the range of the rows with equal keys, key by key
+            low, high = 0, len(self._permutation)
+            for sorted_key, new_key in zip(self._sorted_keys, new_keys):
+                segment = sorted_key[low:high]
+                value = new_key[row]
+                low, high = (
+                    low + np.searchsorted(segment, value, side="left"),
+                    low + np.searchsorted(segment, value, side="right"),
+                )
+                if low == high:
+                    break
+            positions[row] = high
+        return positions
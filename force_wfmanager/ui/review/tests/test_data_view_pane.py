@@ -5,7 +5,9 @@ import mock
 import unittest
 
 from force_wfmanager.model.analysis_model import AnalysisModel
+from force_wfmanager.model.resource_telemetry import ResourceTelemetry
 from force_wfmanager.ui.review.data_view_pane import DataViewPane
+from force_wfmanager.ui.review.resource_usage_plot import ResourceUsagePlot
 from force_wfmanager.ui.review.scatter_plot import ScatterPlot
 from force_wfmanager.ui.review.curve_scatter_plot import CurveScatterPlot
 
@@ -46,11 +48,12 @@ class TestDataViewPane(unittest.TestCase):
 
     def test_load_and_set_default_data_views(self):
         # This test class doesn't test the application, so there is no
-        # plugin discovery. Two default plots will be found as they are the
-        # only ones that are automatically populated.
+        # plugin discovery. Three default views will be found as they are
+        # the only ones that are automatically populated.
         self.assertIn(ScatterPlot, self.pane.available_data_views)
         self.assertIn(CurveScatterPlot, self.pane.available_data_views)
-        self.assertEqual(len(self.pane.available_data_views), 2)
+        self.assertIn(ResourceUsagePlot, self.pane.available_data_views)
+        self.assertEqual(len(self.pane.available_data_views), 3)
 
     def test_data_view_descriptions(self):
         # the "change" button needs to be fired to populate the descriptions
@@ -61,3 +64,34 @@ class TestDataViewPane(unittest.TestCase):
             "(force_wfmanager.ui.review.scatter_plot.ScatterPlot)",
             self.pane.data_view_descriptions.values(),
         )
+
+    def test_analysis_model_change(self):
+        self.pane.data_view_selection = CurveScatterPlot
+        old_data_view = self.pane.data_view
+
+        model = AnalysisModel()
+        self.pane.analysis_model = model
+        self.assertIsInstance(self.pane.data_view, CurveScatterPlot)
+        self.assertIsNot(old_data_view, self.pane.data_view)
+        self.assertIs(model, self.pane.data_view.analysis_model)
+        self.assertTrue(self.pane.data_view.is_active_view)
+        self.assertFalse(old_data_view.is_active_view)
+        self.assertEqual({}, self.pane.data_view_instances)
+
+    def test_telemetry(self):
+        self.pane.data_view_selection = ResourceUsagePlot
+        self.assertIs(self.pane.telemetry, self.pane.data_view.telemetry)
+
+        telemetry = ResourceTelemetry()
+        self.pane.telemetry = telemetry
+        self.assertIs(telemetry, self.pane.data_view.telemetry)
+
+        # Stored instances follow the displayed run too
+        self.pane.data_view_selection = ScatterPlot
+        telemetry = ResourceTelemetry()
+        self.pane.telemetry = telemetry
+        self.pane.data_view_selection = ResourceUsagePlot
+        self.assertIs(telemetry, self.pane.data_view.telemetry)
+
+        self.pane.analysis_model = AnalysisModel()
+        self.assertIs(telemetry, self.pane.data_view.telemetry)
@@ -0,0 +1,46 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+from force_wfmanager.model.resource_telemetry import ResourceTelemetry
+from force_wfmanager.ui.review.resource_usage_plot import ResourceUsagePlot
+
+from .test_base_data_view import BasePlotTestCase
+
+
+class TestResourceUsagePlot(BasePlotTestCase):
+
+    plot_cls = ResourceUsagePlot
+
+    def test_init(self):
+        self.assertEqual("CPU (%)", self.plot.metric)
+        self.assertEqual("time (s)", self.plot._plot.x_axis.title)
+        self.assertEqual("CPU (%)", self.plot._plot.y_axis.title)
+        self.assertIs(self.plot._plot, self.plot._component)
+
+    def test_update_data_view(self):
+        self.plot._check_scheduled_updates()
+        self.plot.telemetry.append((1.0, 95.0, 120.0, 4, 0.0, 1.5))
+        self.plot.telemetry.append((2.0, 180.0, 240.0, 6, 0.5, 0.0))
+        self.check_update_is_requested_and_apply()
+        self.assertEqual(
+            [1.0, 2.0], self.plot._plot_data.get_data("time").tolist()
+        )
+        self.assertEqual(
+            [95.0, 180.0], self.plot._plot_data.get_data("value").tolist()
+        )
+
+        self.plot.metric = "RSS (MB)"
+        self.assertEqual("RSS (MB)", self.plot._plot.y_axis.title)
+        self.assertEqual(
+            [120.0, 240.0], self.plot._plot_data.get_data("value").tolist()
+        )
+
+    def test_telemetry_change(self):
+        self.plot._check_scheduled_updates()
+        telemetry = ResourceTelemetry()
+        telemetry.append((1.0, 10.0, 20.0, 1, 0.0, 0.0))
+        self.plot.telemetry = telemetry
+        self.check_update_is_requested_and_apply()
+        self.assertEqual(
+            [10.0], self.plot._plot_data.get_data("value").tolist()
+        )
@@ -0,0 +1,100 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import unittest
+
+import numpy as np
+
+from force_wfmanager.model.analysis_model import AnalysisModel
+from force_wfmanager.ui.review.results_column_store import (
+    INITIAL_CAPACITY,
+    ResultsColumnStore,
+    column_dtype,
+)
+
+
+class TestResultsColumnStore(unittest.TestCase):
+    def setUp(self):
+        self.analysis_model = AnalysisModel()
+        self.analysis_model.header = ("x", "y", "compound")
+        self.analysis_model.notify((2.1, 56, "CO"))
+        self.analysis_model.notify((1.23, 51, "CO2"))
+        self.store = ResultsColumnStore(analysis_model=self.analysis_model)
+
+    def test_column_dtype(self):
+        self.assertEqual(np.int64, column_dtype((1, np.int32(2))))
+        self.assertEqual(np.float64, column_dtype((1, 2.5)))
+        self.assertEqual(object, column_dtype((1, True)))
+        self.assertEqual(object, column_dtype((1.0, None)))
+        self.assertEqual(object, column_dtype((1.0, "a")))
+
+    def test_rows(self):
+        self.assertEqual(2, len(self.store))
+        self.assertEqual((2.1, 56, "CO"), self.store[0])
+        self.assertEqual((1.23, 51, "CO2"), self.store[-1])
+        with self.assertRaises(IndexError):
+            self.store[2]
+
+        self.assertEqual(np.float64, self.store.column_array(0).dtype)
+        self.assertEqual(np.int64, self.store.column_array(1).dtype)
+        np.testing.assert_array_equal(
+            [56, 51], self.store.column_array(1)
+        )
+        with self.assertRaises(ValueError):
+            self.store.column_array(1)[0] = 0
+
+    def test_text(self):
+        self.assertEqual("2.1", self.store.text(0, 0))
+        self.assertEqual("51", self.store.text(1, 1))
+        self.assertEqual("CO2", self.store.text(1, 2))
+
+        # The integers are widened to floats, and formatted as such
+        self.analysis_model.notify((1.5, 50.5, "CO"))
+        self.assertEqual("51.0", self.store.text(1, 1))
+        self.assertEqual("50.5", self.store.text(2, 1))
+
+    def test_append(self):
+        appended = []
+        self.store.on_trait_change(
+            lambda rows_range: appended.append(rows_range), "rows_appended"
+        )
+        for index in range(2 * INITIAL_CAPACITY):
+            self.analysis_model.notify((0.5, index, None))
+
+        self.assertEqual(2 + 2 * INITIAL_CAPACITY, len(self.store))
+        self.assertEqual((2, 3), appended[0])
+        self.assertEqual(
+            (1 + 2 * INITIAL_CAPACITY, 2 + 2 * INITIAL_CAPACITY),
+            appended[-1]
+        )
+        self.assertEqual((0.5, 10, None), self.store[12])
+        self.assertEqual("None", self.store.text(12, 2))
+        self.assertEqual(
+            self.analysis_model.evaluation_steps, list(self.store)
+        )
+
+    def test_widen_column(self):
+        self.analysis_model.notify((1, 2 ** 70, [1, 2]))
+        self.assertEqual(object, self.store.column_array(1).dtype)
+        self.assertEqual((1, 2 ** 70, [1, 2]), self.store[2])
+        self.assertEqual((2.1, 56, "CO"), self.store[0])
+        self.assertEqual(str(2 ** 70), self.store.text(2, 1))
+
+    def test_reset(self):
+        resets = []
+        self.store.on_trait_change(lambda: resets.append(True), "rows_reset")
+
+        self.analysis_model.clear_steps()
+        self.assertEqual(0, len(self.store))
+        self.assertTrue(resets)
+
+        analysis_model = AnalysisModel()
+        analysis_model.header = ("a",)
+        analysis_model.notify(("b",))
+        self.store.analysis_model = analysis_model
+        self.assertEqual([("b",)], list(self.store))
+
+        analysis_model.header = ("c", "d")
+        self.assertEqual(0, len(self.store))
+        analysis_model.notify((1, 2))
+        self.assertEqual([(1, 2)], list(self.store))
@@ -4,6 +4,7 @@
 import unittest
 
 from force_wfmanager.model.analysis_model import AnalysisModel
+from force_wfmanager.model.bdss_run import BDSSRun
 from force_wfmanager.ui.review.results_pane import ResultsPane
 
 
@@ -35,3 +36,22 @@ class TestResultsPane(unittest.TestCase):
         self.assertEqual(
             len(self.pane.results_table.analysis_model.evaluation_steps), 2
         )
+
+    def test_analysis_model_change(self):
+        model = AnalysisModel()
+        self.pane.analysis_model = model
+        self.assertIs(model, self.pane.results_table.analysis_model)
+
+    def test_run_labels(self):
+        runs = [BDSSRun(name="Run 1"), BDSSRun(name="Run 2")]
+        self.pane.runs = runs
+        self.assertEqual(
+            {
+                runs[0]: "Run 1 (Queued, 0 evaluations)",
+                runs[1]: "Run 2 (Queued, 0 evaluations)",
+            },
+            self.pane._run_labels,
+        )
+        with self.assertTraitChanges(self.pane, "_run_labels"):
+            runs[1].analysis_model.header = ("x",)
+            runs[1].analysis_model.notify((1.0,))
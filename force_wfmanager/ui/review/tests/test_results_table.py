@@ -29,30 +29,106 @@ class TestResultsTable(unittest.TestCase):
         self.analysis_model.notify((1.5, 50, "CO"))
         self.assertEqual(self.results_table.rows[2], (1.5, 50, "CO"))
 
+    def test_adapter(self):
+        adapter = self.results_table.tabular_adapter
+        self.assertEqual(["x", "y", "compound"], adapter.columns)
+        self.assertEqual(2, adapter.len(self.results_table, "rows"))
+        self.assertEqual(1, adapter.get_item(self.results_table, "rows", 1))
+        self.assertEqual(
+            "CO2", adapter.get_text(self.results_table, "rows", 1, 2)
+        )
+        self.assertEqual(
+            "2.1", adapter.get_text(self.results_table, "rows", 0, 0)
+        )
+
+    def test_analysis_model_change(self):
+        analysis_model = AnalysisModel()
+        analysis_model.header = ("a",)
+        self.results_table.analysis_model = analysis_model
+        self.assertIs(
+            analysis_model, self.results_table.rows.store.analysis_model
+        )
+        self.assertEqual(0, len(self.results_table.rows))
+
     def test_selection(self):
         # From table to the model
         self.assertIsNone(self.analysis_model.selected_step_indices)
 
-        self.results_table._selected_rows = [(2.1, 56, "CO")]
+        self.results_table._selected_indices = [0]
         self.assertEqual(self.analysis_model.selected_step_indices, [0])
 
-        self.results_table._selected_rows = [(1.23, 51.2, "CO2")]
+        self.results_table._selected_indices = [1]
         self.assertEqual(self.analysis_model.selected_step_indices, [1])
 
-        self.results_table._selected_rows = []
+        self.results_table._selected_indices = []
         self.assertIsNone(self.analysis_model.selected_step_indices)
 
         # From model to the table
         self.analysis_model.selected_step_indices = [1]
+        self.assertEqual(self.results_table._selected_indices, [1])
+
+        self.analysis_model.selected_step_indices = [0, 1]
+        self.assertEqual(self.results_table._selected_indices, [0, 1])
+
+        self.analysis_model.selected_step_indices = None
+        self.assertEqual(self.results_table._selected_indices, [])
+
+    def test_sort_by(self):
+        self.results_table.sort_by(0)
+        self.assertEqual([(0, True)], self.results_table.rows.sort_keys)
+        self.assertEqual(
+            ["x ▲", "y", "compound"],
+            self.results_table.tabular_adapter.columns
+        )
+        self.assertEqual((1.23, 51.2, "CO2"), self.results_table.rows[0])
         self.assertEqual(
-            self.results_table._selected_rows, [(1.23, 51.2, "CO2")]
+            "CO2",
+            self.results_table.tabular_adapter.get_text(
+                self.results_table, "rows", 0, 2
+            )
         )
 
-        self.analysis_model.selected_step_indices = [0, 1]
+        self.results_table.sort_by(0)
+        self.assertEqual([(0, False)], self.results_table.rows.sort_keys)
+        self.results_table.sort_by(2)
+        self.assertEqual(
+            [(2, True), (0, False)], self.results_table.rows.sort_keys
+        )
         self.assertEqual(
-            self.results_table._selected_rows,
-            [(2.1, 56, "CO"), (1.23, 51.2, "CO2")],
+            ["x ▼", "y", "compound ▲"],
+            self.results_table.tabular_adapter.columns
         )
 
-        self.analysis_model.selected_step_indices = None
-        self.assertEqual(self.results_table._selected_rows, [])
+        self.results_table.clear_sort()
+        self.assertEqual(
+            ["x", "y", "compound"], self.results_table.tabular_adapter.columns
+        )
+        self.assertEqual((2.1, 56, "CO"), self.results_table.rows[0])
+
+        # The sort is cleared with the header
+        self.results_table.sort_by(1)
+        self.analysis_model.header = ("a", "b")
+        self.assertEqual([], self.results_table.rows.sort_keys)
+
+    def test_sorted_selection(self):
+        self.results_table.sort_by(0)
+
+        # Selected positions in the table map to the evaluation steps
+        self.results_table._selected_indices = [0]
+        self.assertEqual(self.analysis_model.selected_step_indices, [1])
+
+        # A new first row moves the selection down
+        self.analysis_model.notify((0.5, 50, "CO"))
+        self.assertEqual((0.5, 50, "CO"), self.results_table.rows[0])
+        self.assertEqual(self.results_table._selected_indices, [1])
+        self.assertEqual(self.analysis_model.selected_step_indices, [1])
+
+        # Reversing the sort moves it to its new position
+        self.results_table.sort_by(0)
+        self.assertEqual(self.results_table._selected_indices, [1])
+        self.analysis_model.selected_step_indices = [0, 2]
+        self.assertEqual(self.results_table._selected_indices, [0, 2])
+
+        self.results_table.clear_sort()
+        self.assertEqual(self.results_table._selected_indices, [0, 2])
+        self.assertEqual(self.analysis_model.selected_step_indices, [0, 2])
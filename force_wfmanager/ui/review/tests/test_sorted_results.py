@@ -0,0 +1,137 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from force_wfmanager.model.analysis_model import AnalysisModel
+from force_wfmanager.ui.review.results_column_store import (
+    ResultsColumnStore
+)
+from force_wfmanager.ui.review.sorted_results import (
+    MERGE_LIMIT,
+    SortedResults,
+    sort_key_array,
+)
+
+
+class TestSortedResults(unittest.TestCase):
+    def setUp(self):
+        self.analysis_model = AnalysisModel()
+        self.analysis_model.header = ("x", "y", "compound")
+        for row in [
+            (2, 0.5, "CO"),
+            (1, 0.3, "CO2"),
+            (2, 0.1, "CH4"),
+            (1, 0.3, None),
+        ]:
+            self.analysis_model.notify(row)
+        self.results = SortedResults(
+            store=ResultsColumnStore(analysis_model=self.analysis_model)
+        )
+
+    def assertPermutation(self, permutation):
+        np.testing.assert_array_equal(permutation, self.results.permutation)
+
+    def test_sort_key_array(self):
+        values = np.array([1.0, np.nan, -2.0])
+        np.testing.assert_array_equal(
+            [2, 0, 1], np.argsort(sort_key_array(values, True))
+        )
+        np.testing.assert_array_equal(
+            [0, 2, 1], np.argsort(sort_key_array(values, False))
+        )
+
+        values = np.array(["b", None, 3, "a", True], dtype=object)
+        np.testing.assert_array_equal(
+            [2, 3, 0, 4, 1], np.argsort(sort_key_array(values, True))
+        )
+        np.testing.assert_array_equal(
+            [2, 0, 3, 4, 1], np.argsort(sort_key_array(values, False))
+        )
+
+    def test_unsorted(self):
+        self.assertPermutation([0, 1, 2, 3])
+        self.assertEqual((1, 0.3, "CO2"), self.results[1])
+        self.assertEqual(2, self.results.view_index(2))
+        self.assertEqual("CH4", self.results.text(2, 2))
+
+    def test_sort(self):
+        self.results.sort_keys = [(0, True)]
+        self.assertPermutation([1, 3, 0, 2])
+
+        self.results.sort_keys = [(0, True), (1, False)]
+        self.assertPermutation([1, 3, 0, 2])
+
+        self.results.sort_keys = [(0, False), (1, True)]
+        self.assertPermutation([2, 0, 1, 3])
+        self.assertEqual((2, 0.1, "CH4"), self.results[0])
+        self.assertEqual("CO", self.results.text(1, 2))
+        self.assertEqual(1, self.results.original_index(2))
+        self.assertEqual(0, self.results.view_index(2))
+        self.assertEqual(3, self.results.view_index(3))
+
+        self.results.sort_keys = [(2, True)]
+        self.assertPermutation([2, 0, 1, 3])
+
+        self.results.sort_keys = []
+        self.assertPermutation([0, 1, 2, 3])
+
+    def test_merge_rows(self):
+        self.results.sort_keys = [(0, False), (1, True)]
+        inserted = []
+        self.results.on_trait_change(
+            lambda rows_range: inserted.append(rows_range), "rows_inserted"
+        )
+
+        with mock.patch.object(
+            SortedResults, "_sort_rows", autospec=True,
+            side_effect=SortedResults._sort_rows
+        ) as mock_sort:
+            self.analysis_model.notify((1, 0.2, "H2"))
+            self.analysis_model.notify((2, 0.5, "O2"))
+            self.analysis_model.notify((0, 1.0, "N2"))
+        mock_sort.assert_not_called()
+
+        self.assertEqual([(2, 3), (2, 3), (6, 7)], inserted)
+        self.assertPermutation([2, 0, 5, 4, 1, 3, 6])
+        self.assertEqual(3, self.results.view_index(4))
+        self.assertEqual(6, self.results.view_index(6))
+
+    def test_merge_many_rows(self):
+        self.results.sort_keys = [(1, True)]
+        self.analysis_model._evaluation_steps.extend(
+            [(index, 1.0 - index / 10, "CO") for index in range(8)]
+        )
+        np.testing.assert_array_equal(
+            [2, 1, 3, 11, 10, 0, 9, 8, 7, 6, 5, 4],
+            self.results.permutation
+        )
+
+        resets = []
+        self.results.on_trait_change(lambda: resets.append(True), "rows_reset")
+        self.analysis_model._evaluation_steps.extend(
+            [(0, 0.0, "CO")] * (MERGE_LIMIT + 1)
+        )
+        self.assertEqual(1, len(resets))
+        self.assertEqual(
+            list(range(12, 13 + MERGE_LIMIT)),
+            list(self.results.permutation[:MERGE_LIMIT + 1])
+        )
+
+    def test_widened_column(self):
+        self.results.sort_keys = [(0, True)]
+        self.analysis_model.notify((1.5, 0.3, "CO"))
+        self.assertPermutation([1, 3, 4, 0, 2])
+
+    def test_reset(self):
+        self.results.sort_keys = [(0, True)]
+        self.analysis_model.clear_steps()
+        self.assertEqual(0, len(self.results))
+        self.assertPermutation([])
+
+        self.analysis_model.notify((3, 0.1, "CO"))
+        self.analysis_model.notify((1, 0.1, "CO"))
+        self.assertPermutation([1, 0])
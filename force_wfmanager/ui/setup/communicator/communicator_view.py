@@ -8,6 +8,8 @@ from traitsui.api import View, Item
 
 from force_bdss.api import Workflow
 
+from force_wfmanager.ui.ui_utils import verify_request_origin
+
 from .notification_listener_view import NotificationListenerView
 
 
@@ -52,18 +54,23 @@ class CommunicatorView(HasTraits):
     @on_trait_change("model.notification_listeners[]")
     def update_notification_listener_views(self):
         """Updates the views for the notification listeners, but ignores
-        any which are non UI visible"""
+        any which are non UI visible. The views of the notification
+        listeners still in the model are kept."""
+        current_views = {
+            id(view.model): view for view in self.notification_listener_views
+        }
         self.notification_listener_views = [
-            NotificationListenerView(
-                model=notification_listener,
-            )
+            current_views.get(id(notification_listener))
+            or NotificationListenerView(model=notification_listener)
             for notification_listener in self.model.notification_listeners
             if notification_listener.factory.ui_visible is True
         ]
 
     @on_trait_change('notification_listeners.verify_workflow_event')
-    def received_verify_request(self):
-        self.verify_workflow_event = True
+    def received_verify_request(self, object, name, new):
+        self.verify_workflow_event = verify_request_origin(
+            self, object, name, new
+        )
 
     # -------------------
     #    Public Methods
@@ -12,6 +12,7 @@ from force_bdss.core.verifier import VerifierError
 from force_wfmanager.ui.setup.mco.base_mco_options_model_view import (
     BaseMCOOptionsModelView
 )
+from force_wfmanager.ui.ui_utils import verify_request_origin
 from force_wfmanager.utils.variable_names_registry import (
     VariableNamesRegistry
 )
@@ -99,9 +100,11 @@ class BaseMCOOptionsView(HasTraits):
 
     # Workflow Validation
     @on_trait_change('model_views.verify_workflow_event')
-    def received_verify_request(self):
+    def received_verify_request(self, object, name, new):
         """Pass on call for verify_workflow_event"""
-        self.verify_workflow_event = True
+        self.verify_workflow_event = verify_request_origin(
+            self, object, name, new
+        )
 
     @on_trait_change('model_views.model.name')
     def verify_model_names(self):
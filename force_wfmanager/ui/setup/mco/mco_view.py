@@ -16,7 +16,9 @@ from force_wfmanager.ui.setup.mco.kpi_specification_view import \
 from force_wfmanager.ui.setup.mco.mco_parameter_view import (
     MCOParameterView
 )
-from force_wfmanager.ui.ui_utils import get_factory_name
+from force_wfmanager.ui.ui_utils import (
+    get_factory_name, verify_request_origin
+)
 from force_wfmanager.utils.variable_names_registry import \
     VariableNamesRegistry
 
@@ -108,8 +110,10 @@ class MCOView(HasTraits):
     # Workflow Verification
     @on_trait_change('parameter_view.verify_workflow_event,'
                      'kpi_view.verify_workflow_event')
-    def received_verify_request(self):
-        self.verify_workflow_event = True
+    def received_verify_request(self, object, name, new):
+        self.verify_workflow_event = verify_request_origin(
+            self, object, name, new
+        )
 
     @on_trait_change('parameter_view')
     def sync_mco_options_parameter_view(self):
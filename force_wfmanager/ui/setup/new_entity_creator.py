@@ -6,13 +6,14 @@ from traits.api import (
     Property, Str, on_trait_change
 )
 from traitsui.api import (
-    HSplit, HTMLEditor, InstanceEditor, Menu, TreeEditor, TreeNode, UItem,
-    VGroup, View
+    HSplit, HTMLEditor, InstanceEditor, Item, Menu, TextEditor, TreeEditor,
+    TreeNode, UItem, VGroup, View
 )
 
 from force_bdss.api import BaseFactory, BaseMCOParameter, BaseModel
 
 from force_wfmanager.ui.ui_utils import model_info
+from force_wfmanager.utils.factory_search_index import FactorySearchIndex
 
 no_view = View()
 no_menu = Menu()
@@ -70,6 +71,15 @@ class NewEntityCreator(HasStrictTraits):
     #: The root node displayed in the TreeEditor
     plugins_root = Instance(Root)
 
+    #: The index of :attr:`factories` used to search them. It can be shared
+    #: by the NewEntityCreators of the same factories, so that it is only
+    #: built once.
+    search_index = Instance(FactorySearchIndex)
+
+    #: The words searched in the factories. The TreeEditor displays the
+    #: matching factories, best first, unless empty.
+    search_term = Str()
+
     #: A message to be displayed if there are no config options
     _no_config_options_msg = ReadOnly(Str)
 
@@ -94,6 +104,9 @@ class NewEntityCreator(HasStrictTraits):
     #: Listens to :attr:`selected_factory`
     model = Either(Instance(BaseModel), Instance(BaseMCOParameter))
 
+    #: The root node of all the plugins, kept while searching
+    _all_plugins_root = Instance(Root)
+
     #: Cache for created models, models are created when selecting a new
     #: factory and cached so that when selected_factory changes the created
     #: models are saved
@@ -152,6 +165,10 @@ class NewEntityCreator(HasStrictTraits):
                 HSplit(
                     VGroup(
                         VGroup(
+                            Item("search_term",
+                                 label="Search",
+                                 editor=TextEditor(auto_set=True)
+                                 ),
                             UItem("plugins_root",
                                   editor=editor
                                   ),
@@ -230,6 +247,9 @@ class NewEntityCreator(HasStrictTraits):
             ))
         return Root(plugins=plugins)
 
+    def _search_index_default(self):
+        return FactorySearchIndex(factories=self.factories)
+
     def __no_config_options_msg_default(self):
         """A message to be displayed for models with no configuration options
         """
@@ -246,6 +266,21 @@ class NewEntityCreator(HasStrictTraits):
             return "Available Factories"
         return f"Available {self.factory_name} Factories"
 
+    @on_trait_change("search_term")
+    def update_plugins_root(self):
+        """ Displays the factories matching :attr:`search_term`, ranked by
+        the :attr:`search_index`, or all the plugins if there is nothing to
+        search."""
+        if self._all_plugins_root is None:
+            self._all_plugins_root = self.plugins_root
+        if not self.search_term.strip():
+            self.plugins_root = self._all_plugins_root
+            return
+        self.plugins_root = Root(plugins=[PluginModelView(
+            name="Search results",
+            factories=self.search_index.search(self.search_term),
+        )])
+
     @on_trait_change("selected_factory")
     def update_current_model(self):
         """ Update the current editable model when the selected factory has
@@ -11,11 +11,12 @@ from traitsui.api import (
 )
 from traitsui.table_column import ObjectColumn
 
-from force_bdss.api import (BaseDataSourceModel, BaseDataSource, Identifier,
+from force_bdss.api import (BaseDataSourceModel, Identifier,
                             InputSlotInfo, OutputSlotInfo)
 
 from force_wfmanager.ui.ui_utils import (
     get_factory_name, get_default_background_color)
+from force_wfmanager.utils.slot_signatures import slot_signature_cache
 from force_wfmanager.utils.variable_names_registry import (
     VariableNamesRegistry)
 
@@ -141,6 +142,12 @@ class DataSourceView(HasTraits):
     #: Registry of the available variables
     variable_names_registry = Instance(VariableNamesRegistry)
 
+    #: Defers the creation of the data source and of the tables of slots
+    #: until :meth:`create_slots_tables` is called, e.g. when the view is
+    #: selected in the workflow tree. Until then, the view is a lightweight
+    #: proxy of the model, which can be verified and displayed in the tree.
+    deferred = Bool(False)
+
     # ------------------
     # Regular Attributes
     # ------------------
@@ -148,8 +155,8 @@ class DataSourceView(HasTraits):
     #: The human readable name of the data source
     label = Str()
 
-    #: evaluator object, shouldn't be touched
-    _data_source = Instance(BaseDataSource)
+    #: Whether the tables of slots were created
+    slots_tables_created = Bool(False)
 
     #: Input slots representation for the table editor
     input_slots_representation = List(InputSlotRow)
@@ -220,8 +227,11 @@ class DataSourceView(HasTraits):
 
     def __init__(self, *args, **kwargs):
         super(DataSourceView, self).__init__(*args, **kwargs)
-        # Performs private method to set up slots tables on instantiation
-        self._create_slots_tables()
+        # Sets up the slots tables on instantiation, unless deferred. The
+        # slots of the model are initialized straight away all the same,
+        # if they have not been yet.
+        if not (self.deferred and self._slots_initialized()):
+            self.create_slots_tables()
 
     # -------------------
     #     Defaults
@@ -230,9 +240,6 @@ class DataSourceView(HasTraits):
     def _label_default(self):
         return get_factory_name(self.model.factory)
 
-    def __data_source_default(self):
-        return self.model.factory.create_data_source()
-
     # -------------------
     #     Listeners
     # -------------------
@@ -272,7 +279,7 @@ class DataSourceView(HasTraits):
         self.input_slots_representation[:] = []
         self.output_slots_representation[:] = []
 
-        input_slots, output_slots = self._data_source.slots(self.model)
+        input_slots, output_slots = slot_signature_cache.slots(self.model)
 
         #: Initialize the input slots
         self.model.input_slot_info = [
@@ -303,11 +310,37 @@ class DataSourceView(HasTraits):
                              self.output_slots_representation):
             row.name = info.name
 
+    # -------------------
+    #   Public Methods
+    # -------------------
+
+    def create_slots_tables(self):
+        """ Creates the tables of the input and output slots, if not done
+        yet.
+
+        Raises
+        ------
+        RuntimeError:
+            If the input slots or output slots in the model are not of the
+            right length. This can come from a corrupted file.
+        """
+        if not self.slots_tables_created:
+            self._create_slots_tables()
+
     # -------------------
     #   Private Methods
     # -------------------
 
     # Initialization
+    def _slots_initialized(self):
+        """ Returns whether the model has as many input and output slots
+        as its data source, which may have none of either."""
+        input_slots, output_slots = slot_signature_cache.slots(self.model)
+        return (
+            len(self.model.input_slot_info) == len(input_slots)
+            and len(self.model.output_slot_info) == len(output_slots)
+        )
+
     def _create_slots_tables(self):
         """ Initialize the tables for editing the input and output slots
 
@@ -317,7 +350,7 @@ class DataSourceView(HasTraits):
             If the input slots or output slots in the model are not of the
             right length. This can come from a corrupted file.
         """
-        input_slots, output_slots = self._data_source.slots(self.model)
+        input_slots, output_slots = slot_signature_cache.slots(self.model)
 
         # Initialize model.input_slot_info if not initialized yet
         if len(self.model.input_slot_info) == 0:
@@ -378,6 +411,7 @@ class DataSourceView(HasTraits):
             output_representation.append(slot_representation)
 
         self.output_slots_representation[:] = output_representation
+        self.slots_tables_created = True
 
     def _available_variables(self):
         """Returns the available variables for the containing execution layer
@@ -8,6 +8,7 @@ from traits.api import (
 
 from force_bdss.api import ExecutionLayer
 
+from force_wfmanager.ui.ui_utils import verify_request_origin
 from force_wfmanager.utils.variable_names_registry import \
     VariableNamesRegistry
 from .data_source_view import \
@@ -74,21 +75,35 @@ class ExecutionLayerView(HasTraits):
     @on_trait_change("model.data_sources[]")
     def update_data_source_views(self):
         """Updates the data source modelviews on a change in the underlying
-        data source model. """
+        data source model. The modelviews of the data sources still in the
+        model are kept, and the tables of slots of the new ones are only
+        created when they are displayed."""
+        current_views = {
+            id(view.model): view for view in self.data_source_views
+        }
         self.data_source_views = [
-            DataSourceView(
+            current_views.get(id(data_source)) or DataSourceView(
                 layer_index=self.layer_index,
                 model=data_source,
-                variable_names_registry=self.variable_names_registry
+                variable_names_registry=self.variable_names_registry,
+                deferred=True,
             ) for data_source in self.model.data_sources]
 
+    @on_trait_change("layer_index")
+    def update_data_source_views_layer_index(self):
+        """Moves the data source modelviews along with the layer"""
+        for data_source_view in self.data_source_views:
+            data_source_view.layer_index = self.layer_index
+
     # Workflow Verification
     @on_trait_change('data_source_views.verify_workflow_event')
-    def received_verify_request(self):
+    def received_verify_request(self, object, name, new):
         """Fires :attr:`verify_workflow_event` when a data source contained
         in this execution layer fires its `verify_workflow_event`
         """
-        self.verify_workflow_event = True
+        self.verify_workflow_event = verify_request_origin(
+            self, object, name, new
+        )
 
     # -------------------
     #   Public Methods
@@ -7,6 +7,7 @@ from traits.api import (
 
 from force_bdss.api import Workflow
 
+from force_wfmanager.ui.ui_utils import verify_request_origin
 from force_wfmanager.utils.variable_names_registry import (
     VariableNamesRegistry
 )
@@ -71,24 +72,36 @@ class ProcessView(HasTraits):
 
     @on_trait_change('model.execution_layers[]')
     def update_execution_layers_views(self):
-        """Update the ExecutionLayer ModelViews when the model changes."""
-        self.execution_layer_views = [
-            ExecutionLayerView(
-                model=execution_layer,
-                layer_index=idx,
-                variable_names_registry=self.variable_names_registry,
-                label="Layer {}".format(idx)
-            )
-            for idx, execution_layer in enumerate(
-                self.model.execution_layers)
-        ]
+        """Update the ExecutionLayer ModelViews when the model changes.
+        The modelviews of the execution layers still in the model are
+        kept, and only reindexed."""
+        current_views = {
+            id(view.model): view for view in self.execution_layer_views
+        }
+        execution_layer_views = []
+        for idx, execution_layer in enumerate(self.model.execution_layers):
+            view = current_views.get(id(execution_layer))
+            if view is None:
+                view = ExecutionLayerView(
+                    model=execution_layer,
+                    layer_index=idx,
+                    variable_names_registry=self.variable_names_registry,
+                    label="Layer {}".format(idx)
+                )
+            else:
+                view.layer_index = idx
+                view.label = "Layer {}".format(idx)
+            execution_layer_views.append(view)
+        self.execution_layer_views = execution_layer_views
 
     @on_trait_change('execution_layer_views.verify_workflow_event')
-    def received_verify_request(self):
+    def received_verify_request(self, object, name, new):
         """Fires :attr:`verify_workflow_event` when a data source contained
         in this execution layer fires its `verify_workflow_event`
         """
-        self.verify_workflow_event = True
+        self.verify_workflow_event = verify_request_origin(
+            self, object, name, new
+        )
 
     # -------------------
     #   Public Methods
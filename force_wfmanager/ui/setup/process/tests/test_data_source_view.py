@@ -1,6 +1,8 @@
 #  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
 #  All rights reserved.
 
+from unittest import mock
+
 from traits.testing.unittest_tools import UnittestTools
 
 from force_bdss.api import OutputSlotInfo, InputSlotInfo, BaseDataSourceModel
@@ -113,6 +115,75 @@ class TestDataSourceView(WfManagerBaseTestCase, UnittestTools):
         self.assertIn("PRESSURE",
                       self.data_source_view.selected_slot_description)
 
+    def test_deferred_slots_tables(self):
+        self.model_1.output_slot_info = [
+            OutputSlotInfo(name='T1'), OutputSlotInfo(name='T2')
+        ]
+        factory = self.model_1.factory
+        with mock.patch.object(
+            type(factory), "create_data_source", autospec=True,
+            side_effect=type(factory).create_data_source
+        ) as mock_create:
+            data_source_view = DataSourceView(
+                model=self.model_1,
+                variable_names_registry=self.variable_names_registry,
+                deferred=True,
+            )
+            mock_create.assert_not_called()
+            self.assertFalse(data_source_view.slots_tables_created)
+            self.assertEqual([], data_source_view.output_slots_representation)
+
+            data_source_view.create_slots_tables()
+            data_source_view.create_slots_tables()
+            # The slots were memoised by the variable names registry
+            mock_create.assert_not_called()
+
+        self.assertTrue(data_source_view.slots_tables_created)
+        self.assertEqual(
+            ['T1', 'T2'],
+            [row.name
+             for row in data_source_view.output_slots_representation]
+        )
+
+    def test_deferred_new_model(self):
+        model = self.factory_registry.data_source_factories[2].create_model()
+        data_source_view = DataSourceView(
+            model=model,
+            variable_names_registry=self.variable_names_registry,
+            deferred=True,
+        )
+        # The slots of a new model are initialized straight away
+        self.assertTrue(data_source_view.slots_tables_created)
+        self.assertEqual(2, len(model.input_slot_info))
+        self.assertEqual(3, len(model.output_slot_info))
+
+    def test_deferred_no_input_slots(self):
+        factory = ProbeDataSourceFactory({'id': '0', 'name': 'plugin'})
+        model = factory.create_model()
+        model.input_slots_size = 0
+        model.output_slots_size = 1
+        model.output_slot_info = [OutputSlotInfo(name='T1')]
+        data_source_view = DataSourceView(
+            model=model,
+            variable_names_registry=self.variable_names_registry,
+            deferred=True,
+        )
+        # A data source without inputs is initialized all the same
+        self.assertFalse(data_source_view.slots_tables_created)
+        self.assertEqual([], model.input_slot_info)
+
+        # Slots not matching those of the data source are initialized
+        model = factory.create_model()
+        model.input_slots_size = 0
+        model.output_slots_size = 2
+        data_source_view = DataSourceView(
+            model=model,
+            variable_names_registry=self.variable_names_registry,
+            deferred=True,
+        )
+        self.assertTrue(data_source_view.slots_tables_created)
+        self.assertEqual(2, len(model.output_slot_info))
+
     def test_verify_data_source(self):
 
         factory = ProbeDataSourceFactory({'id': '0', 'name': 'plugin'})
@@ -2,12 +2,15 @@
 #  All rights reserved.
 
 from pyface.tasks.api import TraitsDockPane
-from traits.api import Bool, Button, Instance, on_trait_change
+from traits.api import Bool, Button, Float, Instance, on_trait_change
 from traitsui.api import UItem, VGroup, View
 
 from force_bdss.api import IFactoryRegistry, Workflow
 
 from force_wfmanager.ui.setup.system_state import SystemState
+from force_wfmanager.ui.setup.verification_scheduler import (
+    VerificationScheduler
+)
 from force_wfmanager.ui.setup.workflow_tree import WorkflowTree
 
 
@@ -75,6 +78,11 @@ class SidePane(TraitsDockPane):
     #: Enable or disable the run button.
     run_enabled = Bool(True)
 
+    #: Seconds during which the verification requests of the workflow are
+    #: coalesced, before verifying it in a secondary thread. Zero verifies
+    #: the workflow synchronously on each request.
+    verification_delay = Float(0.0)
+
     # -------------------
     #        View
     # -------------------
@@ -91,24 +99,34 @@ class SidePane(TraitsDockPane):
     # -------------------
 
     def _workflow_tree_default(self):
+        verification_scheduler = None
+        if self.verification_delay > 0:
+            verification_scheduler = VerificationScheduler(
+                delay=self.verification_delay,
+                factory_registry=self.factory_registry,
+            )
         workflow_tree = WorkflowTree(
             model=self.workflow_model,
             _factory_registry=self.factory_registry,
-            system_state=self.system_state
+            system_state=self.system_state,
+            verification_scheduler=verification_scheduler,
         )
-        self.run_enabled = workflow_tree.workflow_view.valid
+        self.run_enabled = self._runnable(workflow_tree)
         return workflow_tree
 
     # -------------------
     #      Listeners
     # -------------------
 
-    @on_trait_change('workflow_tree.workflow_view.valid')
+    @on_trait_change(
+        'workflow_tree.workflow_view.valid,'
+        'workflow_tree.verification_scheduler.pending'
+    )
     def update_run_btn_status(self):
-        """Enables/Disables the run button if the workflow is valid/invalid
-        or if a computation is running"""
+        """Enables/Disables the run button if the workflow is valid/invalid,
+        if its verification is pending or if a computation is running"""
         self.run_enabled = (
-            self.workflow_tree.workflow_view.valid and self.ui_enabled
+            self._runnable(self.workflow_tree) and self.ui_enabled
         )
 
     @on_trait_change('workflow_model', post_init=True)
@@ -116,3 +134,32 @@ class SidePane(TraitsDockPane):
         """Synchronises :attr:`workflow_tree.model <workflow_tree>`
         with :attr:`workflow_model`"""
         self.workflow_tree.model = self.workflow_model
+
+    # -------------------
+    #   Public Methods
+    # -------------------
+
+    def stop_verifications(self):
+        """Stops the background verifications of the workflow, if any"""
+        verification_scheduler = self.workflow_tree.verification_scheduler
+        if verification_scheduler is not None:
+            verification_scheduler.shutdown()
+
+    def destroy(self):
+        """Overrides TraitsDockPane. Stops the background verifications of
+        the workflow before destroying the pane"""
+        self.stop_verifications()
+        super(SidePane, self).destroy()
+
+    # -------------------
+    #   Private Methods
+    # -------------------
+
+    def _runnable(self, workflow_tree):
+        """Whether the workflow of `workflow_tree` is known to be valid,
+        i.e. valid and with no verification pending"""
+        verification_scheduler = workflow_tree.verification_scheduler
+        return workflow_tree.workflow_view.valid and (
+            verification_scheduler is None
+            or not verification_scheduler.pending
+        )
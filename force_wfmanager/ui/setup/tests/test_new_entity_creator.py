@@ -138,3 +138,19 @@ class TestNewEntityModel(unittest.TestCase):
             "Available MCO Factories",
             model.view_header
         )
+
+    def test_search(self):
+        model, _ = self._get_data_selector()
+        plugins_root = model.plugins_root
+
+        model.search_term = "test data"
+        self.assertEqual(1, len(model.plugins_root.plugins))
+        self.assertEqual(
+            self.data_sources, model.plugins_root.plugins[0].factories
+        )
+
+        model.search_term = "unknown"
+        self.assertEqual([], model.plugins_root.plugins[0].factories)
+
+        model.search_term = ""
+        self.assertIs(plugins_root, model.plugins_root)
@@ -0,0 +1,187 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+from unittest import mock
+
+from pyface.ui.qt4.util.gui_test_assistant import GuiTestAssistant
+
+from force_bdss.api import verify_workflow
+
+from force_wfmanager.ui.setup.side_pane import SidePane
+from force_wfmanager.ui.setup.system_state import SystemState
+from force_wfmanager.ui.setup.tests.wfmanager_base_test_case import (
+    WfManagerBaseTestCase
+)
+from force_wfmanager.ui.setup.verification_scheduler import (
+    VerificationScheduler,
+    workflow_subjects,
+)
+
+
+class TestVerificationScheduler(GuiTestAssistant, WfManagerBaseTestCase):
+    def setUp(self):
+        GuiTestAssistant.setUp(self)
+        WfManagerBaseTestCase.setUp(self)
+        # The snapshots require the parameters to have a factory
+        parameter_factory = self.mco_model.factory.parameter_factories[0]
+        self.mco_model.parameters = [
+            parameter_factory.create_model(
+                {"name": parameter.name, "type": parameter.type}
+            )
+            for parameter in self.mco_model.parameters
+        ]
+        self.scheduler = VerificationScheduler(
+            delay=0.01, factory_registry=self.factory_registry
+        )
+        self.addCleanup(self.scheduler.shutdown)
+        self.callback = mock.Mock()
+
+    def test_workflow_subjects(self):
+        subjects = workflow_subjects(self.workflow)
+        self.assertIs(self.workflow, subjects[0])
+        self.assertIn(self.mco_model, subjects)
+        self.assertIn(self.model_1, subjects)
+        self.assertIn(self.model_1.input_slot_info[0], subjects)
+        self.assertIn(self.notification_listener, subjects)
+
+    def test_coalesced_requests(self):
+        with self.event_loop_until_condition(
+            lambda: self.callback.called
+        ):
+            self.scheduler.request("first", self.callback)
+            self.scheduler.request("second", self.callback)
+        self.callback.assert_called_once_with(["first", "second"])
+
+    def test_verify_workflow(self):
+        with self.event_loop_until_condition(
+            lambda: self.callback.called
+        ):
+            self.scheduler.verify_workflow(self.workflow, self.callback)
+
+        errors = self.callback.call_args[0][0]
+        expected = verify_workflow(self.workflow)
+        self.assertEqual(
+            [error.subject for error in expected],
+            [error.subject for error in errors],
+        )
+        self.assertEqual(
+            [error.local_error for error in expected],
+            [error.local_error for error in errors],
+        )
+
+    def test_stale_snapshot(self):
+        future = self.scheduler.verify_workflow(self.workflow, self.callback)
+        self.scheduler.request("edit", mock.Mock())
+        future.result()
+        self.event_loop_helper.event_loop(repeat=5)
+        self.callback.assert_not_called()
+
+    def test_verification_failure(self):
+        with mock.patch(
+            "force_wfmanager.ui.setup.verification_scheduler."
+            "verify_workflow", side_effect=Exception("error")
+        ):
+            future = self.scheduler.verify_workflow(
+                self.workflow, self.callback
+            )
+            with self.assertLogs(
+                "force_wfmanager.ui.setup.verification_scheduler"
+            ):
+                with self.event_loop_until_condition(future.done):
+                    pass
+                self.event_loop_helper.event_loop(repeat=5)
+        self.callback.assert_not_called()
+
+    def test_snapshot_failure(self):
+        with mock.patch(
+            "force_wfmanager.ui.setup.verification_scheduler."
+            "Workflow.from_json", side_effect=Exception("error")
+        ):
+            with self.assertLogs(
+                "force_wfmanager.ui.setup.verification_scheduler"
+            ):
+                future = self.scheduler.verify_workflow(
+                    self.workflow, self.callback
+                )
+        self.assertIsNone(future)
+        self.assertFalse(self.scheduler.pending)
+
+        # The workflow itself is verified synchronously instead
+        errors = self.callback.call_args[0][0]
+        self.assertEqual(
+            [error.subject for error in verify_workflow(self.workflow)],
+            [error.subject for error in errors],
+        )
+
+    def test_pending(self):
+        self.assertFalse(self.scheduler.pending)
+
+        def verify(origins):
+            self.scheduler.verify_workflow(self.workflow, self.callback)
+
+        self.scheduler.request("edit", verify)
+        self.assertTrue(self.scheduler.pending)
+        with self.event_loop_until_condition(
+            lambda: self.callback.called
+        ):
+            pass
+        self.assertFalse(self.scheduler.pending)
+
+        # Requests handled synchronously
+        callback = mock.Mock()
+        self.scheduler.request("edit", callback)
+        self.assertTrue(self.scheduler.pending)
+        with self.event_loop_until_condition(lambda: callback.called):
+            pass
+        self.assertFalse(self.scheduler.pending)
+
+    def test_shutdown(self):
+        self.scheduler.request("edit", self.callback)
+        self.scheduler.shutdown()
+        self.assertFalse(self.scheduler.pending)
+        self.event_loop_helper.event_loop(repeat=5)
+        self.callback.assert_not_called()
+        with self.assertRaises(RuntimeError):
+            self.scheduler.executor.submit(verify_workflow, self.workflow)
+
+    def test_workflow_tree(self):
+        side_pane = SidePane(
+            workflow_model=self.workflow,
+            factory_registry=self.factory_registry,
+            system_state=SystemState(),
+            verification_delay=0.01,
+        )
+        workflow_tree = side_pane.workflow_tree
+        self.assertIsInstance(
+            workflow_tree.verification_scheduler, VerificationScheduler
+        )
+        self.addCleanup(side_pane.stop_verifications)
+
+        workflow_view = workflow_tree.workflow_view
+        # The first verification is done in the background, and the
+        # workflow can't be run until it is done
+        self.assertFalse(side_pane.run_enabled)
+        with self.event_loop_until_condition(
+            lambda: workflow_tree._view_messages
+        ):
+            pass
+        self.assertEqual(workflow_view.valid, side_pane.run_enabled)
+
+        self.model_1.input_slot_info[0].name = ""
+        data_source_view = (
+            workflow_view.process_view[0].execution_layer_views[0]
+            .data_source_views[0]
+        )
+        with self.event_loop_until_condition(
+            lambda: "An input slot is not named"
+            in data_source_view.error_message
+        ):
+            pass
+
+        with mock.patch.object(
+            VerificationScheduler, "shutdown", autospec=True
+        ) as mock_shutdown:
+            side_pane.destroy()
+        mock_shutdown.assert_called_once_with(
+            workflow_tree.verification_scheduler
+        )
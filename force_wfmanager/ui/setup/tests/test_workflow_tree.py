@@ -14,10 +14,14 @@ from force_bdss.api import (
     RangedVectorMCOParameter,
     RangedVectorMCOParameterFactory,
     CategoricalMCOParameter,
-    CategoricalMCOParameterFactory
+    CategoricalMCOParameterFactory,
+    verify_workflow
 )
 
 from force_bdss.tests.dummy_classes.mco import DummyMCOFactory
+from force_bdss.tests.probe_classes.factory_registry import (
+    ProbeFactoryRegistry
+)
 
 from force_wfmanager.tests.dummy_classes.dummy_mco_options_view import (
     DummyBaseMCOOptionsView,
@@ -31,6 +35,9 @@ from force_wfmanager.ui.setup.workflow_tree import (
     TreeNodeWithStatus,
     verifier_check,
 )
+from force_wfmanager.ui.setup.workflow_view import WorkflowView
+
+VERIFY_WORKFLOW_PATH = "force_wfmanager.ui.setup.workflow_tree.verify_workflow"
 
 
 class TestWorkflowTree(WfManagerBaseTestCase):
@@ -108,13 +115,37 @@ class TestWorkflowTree(WfManagerBaseTestCase):
         self.assertIsNotNone(self.system_state.remove_entity)
         self.assertIsNotNone(self.system_state.entity_creator)
 
+    def test_shared_search_index(self):
+        execution_layer_views = (
+            self.workflow_tree.workflow_view.process_view[0]
+            .execution_layer_views
+        )
+        self.workflow_tree.execution_layer_selected(execution_layer_views[0])
+        search_index = self.system_state.entity_creator.search_index
+        self.workflow_tree.execution_layer_selected(execution_layer_views[1])
+        self.assertIs(
+            search_index, self.system_state.entity_creator.search_index
+        )
+
+        self.workflow_tree._factory_registry = ProbeFactoryRegistry(
+            plugin=self.plugin
+        )
+        self.workflow_tree.execution_layer_selected(execution_layer_views[1])
+        self.assertIsNot(
+            search_index, self.system_state.entity_creator.search_index
+        )
+
     def test_data_source_selected(self):
+        # The slots of the models were initialized by the first views
+        self.workflow_tree.workflow_view = WorkflowView(model=self.workflow)
         data_source_view = (
             self.workflow_tree.workflow_view.process_view[0]
             .execution_layer_views[0]
             .data_source_views[0]
         )
+        self.assertFalse(data_source_view.slots_tables_created)
         self.workflow_tree.data_source_selected(data_source_view)
+        self.assertTrue(data_source_view.slots_tables_created)
         self.assertEqual("None", self.system_state.selected_factory_name)
         self.assertIsNone(self.system_state.add_new_entity)
         self.assertIsNotNone(self.system_state.remove_entity)
@@ -387,6 +418,135 @@ class TestWorkflowTree(WfManagerBaseTestCase):
         )
         self.assertFalse(mco_view.parameter_view.valid)
 
+    def test_incremental_verification(self):
+        workflow_view = self.workflow_tree.workflow_view
+        layer_views = workflow_view.process_view[0].execution_layer_views
+        data_source_view = layer_views[0].data_source_views[0]
+        model_class = type(data_source_view.model)
+
+        with mock.patch(
+            VERIFY_WORKFLOW_PATH, wraps=verify_workflow
+        ) as mock_verify, mock.patch.object(
+            model_class, "verify", autospec=True,
+            side_effect=model_class.verify
+        ) as mock_verify_data_source:
+            data_source_view.model.output_slot_info[0].name = "something"
+
+            # Only the changed data source is verified again
+            mock_verify.assert_not_called()
+            self.assertTrue(mock_verify_data_source.called)
+            self.assertEqual(
+                {data_source_view.model},
+                {args[0] for args, _ in mock_verify_data_source.call_args_list}
+            )
+
+        self.assertIn(
+            "An output variable has an undefined name",
+            data_source_view.error_message,
+        )
+        # Same errors as a verification of the whole workflow
+        views = [workflow_view, layer_views[0], layer_views[1],
+                 data_source_view, workflow_view.mco_view[0]]
+        messages = [view.error_message for view in views]
+        validity = [view.valid for view in views]
+        with mock.patch(
+            VERIFY_WORKFLOW_PATH, wraps=verify_workflow
+        ) as mock_verify:
+            self.workflow_tree.verify_workflow_event = True
+            mock_verify.assert_called_once_with(self.workflow)
+        self.assertEqual(messages, [view.error_message for view in views])
+        self.assertEqual(validity, [view.valid for view in views])
+
+    def test_structural_change_verification(self):
+        process_view = self.workflow_tree.workflow_view.process_view[0]
+        execution_layer_view = process_view.execution_layer_views[0]
+
+        with mock.patch(
+            VERIFY_WORKFLOW_PATH, wraps=verify_workflow
+        ) as mock_verify:
+            self.workflow_tree.delete_layer(None, execution_layer_view)
+            mock_verify.assert_called_with(self.workflow)
+
+        self.assertNotIn(
+            execution_layer_view.model, self.workflow_tree._verifier_errors
+        )
+
+    def test_verify_tree_dispatch(self):
+        workflow_view = self.workflow_tree.workflow_view
+        layer_view = workflow_view.process_view[0].execution_layer_views[0]
+        data_source_view = layer_view.data_source_views[0]
+        kpi_view = workflow_view.mco_view[0].kpi_view
+        kpi = self.workflow.mco_model.kpis[0]
+        slot = data_source_view.model.input_slot_info[0]
+
+        errors = [
+            VerifierError(subject=slot, local_error="slot error",
+                          global_error="SLOT ERROR"),
+            VerifierError(subject=kpi, local_error="kpi error",
+                          global_error="KPI ERROR"),
+            VerifierError(subject=self.workflow, local_error="warning",
+                          global_error="WARNING", severity="warning"),
+        ]
+        self.workflow_tree.verify_tree(errors)
+
+        self.assertEqual("slot error", data_source_view.error_message)
+        self.assertFalse(data_source_view.valid)
+        self.assertEqual("SLOT ERROR", layer_view.error_message)
+        self.assertFalse(layer_view.valid)
+        self.assertEqual("kpi error", kpi_view.model_views[0].error_message)
+        # The local error of the KPI is not displayed on the KPI view
+        self.assertEqual("KPI ERROR", kpi_view.error_message)
+        self.assertFalse(kpi_view.valid)
+        self.assertEqual(
+            "warning\nSLOT ERROR\nKPI ERROR", workflow_view.error_message
+        )
+        self.assertFalse(workflow_view.valid)
+
+        self.workflow_tree.verify_tree([])
+        self.assertTrue(workflow_view.valid)
+        self.assertEqual("", data_source_view.error_message)
+
+    def test_update_model(self):
+        # Copying the workflow requires the parameters to have a factory
+        parameter_factory = self.mco_model.factory.parameter_factories[0]
+        self.mco_model.parameters = [
+            parameter_factory.create_model({"name": "P1"})
+        ]
+        workflow_view = self.workflow_tree.workflow_view
+        mco_view = workflow_view.mco_view[0]
+        process_view = workflow_view.process_view[0]
+        layer_views = list(process_view.execution_layer_views)
+        data_source_views = list(layer_views[0].data_source_views)
+
+        new_workflow = Workflow.from_json(
+            self.factory_registry, self.workflow.__getstate__()
+        )
+        new_data_source = new_workflow.execution_layers[0].data_sources[1]
+        new_data_source.input_slot_info[0].name = "changed"
+        self.workflow_tree.model = new_workflow
+
+        self.assertIs(workflow_view, self.workflow_tree.workflow_view)
+        self.assertIs(new_workflow, workflow_view.model)
+        self.assertIs(mco_view, workflow_view.mco_view[0])
+        self.assertIs(new_workflow, process_view.model)
+        self.assertEqual(layer_views, process_view.execution_layer_views)
+        self.assertIs(
+            data_source_views[0], layer_views[0].data_source_views[0]
+        )
+        self.assertIsNot(
+            data_source_views[1], layer_views[0].data_source_views[1]
+        )
+        self.assertIs(
+            new_data_source, layer_views[0].data_source_views[1].model
+        )
+        self.assertIs(
+            new_workflow, workflow_view.variable_names_registry.workflow
+        )
+
+        self.workflow_tree.model = Workflow()
+        self.assertEqual([], workflow_view.mco_view)
+        self.assertEqual([], process_view.execution_layer_views)
+
 
 class TestProcessElementNode(TestCase):
     def test_wfelement_node(self):
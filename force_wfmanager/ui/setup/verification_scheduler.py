@@ -0,0 +1,192 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+import logging
+
+from pyface.api import GUI
+from pyface.timer.api import CallbackTimer
+from traits.api import (
+    Bool, Callable, Float, HasStrictTraits, Instance, Int, List, Property
+)
+
+from force_bdss.api import IFactoryRegistry, Workflow, verify_workflow
+
+log = logging.getLogger(__name__)
+
+
+def workflow_subjects(workflow):
+    """ Returns the objects of a workflow which can be the subject of a
+    VerifierError, in the order of the workflow: the workflow itself, the
+    MCO with its parameters and KPIs, the execution layers with their data
+    sources and slots, and the notification listeners."""
+    subjects = [workflow]
+    if workflow.mco_model is not None:
+        subjects.append(workflow.mco_model)
+        subjects.extend(workflow.mco_model.parameters)
+        subjects.extend(workflow.mco_model.kpis)
+    for layer in workflow.execution_layers:
+        subjects.append(layer)
+        for data_source in layer.data_sources:
+            subjects.extend(chain(
+                [data_source],
+                data_source.input_slot_info,
+                data_source.output_slot_info,
+            ))
+    subjects.extend(workflow.notification_listeners)
+    return subjects
+
+
+class VerificationScheduler(HasStrictTraits):
+    """ Schedules the verifications of a workflow out of the GUI thread.
+
+    The verification requests received within :attr:`delay` of each other
+    are coalesced into a single call of the callback of the last request.
+    :meth:`verify_workflow` verifies a snapshot of the workflow in a
+    secondary thread, and hands the errors back on the GUI thread, unless
+    another verification was requested meanwhile, which makes them stale.
+    The scheduler must be :meth:`shutdown` once no longer used.
+    """
+
+    #: Seconds to wait for further requests before calling back
+    delay = Float(0.2)
+
+    #: The factory registry, used to take the snapshots of the workflows
+    factory_registry = Instance(IFactoryRegistry, allow_none=False)
+
+    #: Verifies the snapshots of the workflows in a secondary thread
+    executor = Instance(ThreadPoolExecutor)
+
+    #: Number of the requests received. The verifications started before
+    #: the last request are stale.
+    generation = Int(0)
+
+    #: Whether a verification is pending: requests are being coalesced,
+    #: or the errors of the last verification are not handed back yet
+    pending = Property(Bool, depends_on="_waiting,_verifying")
+
+    #: Called on the GUI thread with the list of the coalesced requests
+    _callback = Callable()
+
+    #: The origins of the requests received since the last call back
+    _origins = List()
+
+    #: Timer calling back once no request was received for :attr:`delay`
+    _timer = Instance(CallbackTimer)
+
+    #: Whether requests are waiting for the :attr:`_timer`
+    _waiting = Bool(False)
+
+    #: Whether the last requested verification runs in the secondary thread
+    _verifying = Bool(False)
+
+    def _executor_default(self):
+        return ThreadPoolExecutor(max_workers=1)
+
+    def _get_pending(self):
+        return self._waiting or self._verifying
+
+    def request(self, origin, callback):
+        """ Requests a verification, and restarts the wait for further
+        requests.
+
+        Parameters
+        ----------
+        origin: object
+            The origin of the request, passed on to `callback`
+        callback: callable
+            Called on the GUI thread with the list of the origins of the
+            coalesced requests
+        """
+        self.generation += 1
+        self._origins.append(origin)
+        self._callback = callback
+        self._waiting = True
+        if self._timer is not None:
+            self._timer.stop()
+        self._timer = CallbackTimer.single_shot(
+            interval=self.delay, callback=self._requests_coalesced
+        )
+
+    def verify_workflow(self, workflow, callback):
+        """ Verifies a snapshot of `workflow` in a secondary thread.
+
+        Parameters
+        ----------
+        workflow: Workflow
+            The workflow to verify
+        callback: callable
+            Called on the GUI thread with the list of VerifierErrors, whose
+            subjects are the objects of `workflow`. Not called if another
+            verification was requested in the meantime, or if the
+            verification failed.
+
+        Returns
+        -------
+        future: concurrent.futures.Future or None
+            The future of the verification, or None if no snapshot of the
+            workflow could be taken, in which case `workflow` itself is
+            verified synchronously.
+        """
+        try:
+            snapshot = Workflow.from_json(
+                self.factory_registry, workflow.__getstate__()
+            )
+        except Exception:
+            log.exception(
+                "Unable to take a snapshot of the workflow, verifying it "
+                "in the GUI thread"
+            )
+            self._verifying = False
+            callback(verify_workflow(workflow))
+            return None
+
+        subjects = dict(zip(
+            workflow_subjects(snapshot), workflow_subjects(workflow)
+        ))
+        future = self.executor.submit(verify_workflow, snapshot)
+        self._verifying = True
+        future.add_done_callback(
+            lambda future, generation=self.generation: GUI.invoke_later(
+                self._workflow_verified, future, generation, subjects,
+                callback
+            )
+        )
+        return future
+
+    def shutdown(self):
+        """ Cancels the pending requests, and stops the secondary thread"""
+        if self._timer is not None:
+            self._timer.stop()
+        self._origins = []
+        # Makes the verifications in progress stale
+        self.generation += 1
+        self._waiting = False
+        self._verifying = False
+        self.executor.shutdown(wait=False)
+
+    def _requests_coalesced(self):
+        origins, self._origins = self._origins, []
+        # The verification in progress, if any, is stale by now
+        self._verifying = False
+        self._waiting = False
+        if origins:
+            self._callback(origins)
+
+    def _workflow_verified(self, future, generation, subjects, callback):
+        """ Hands the errors of a verification to `callback` on the GUI
+        thread, with the objects of the snapshot replaced by the ones of
+        the verified workflow."""
+        if generation != self.generation:
+            log.debug("Dropping the errors of a stale workflow snapshot")
+            return
+        self._verifying = False
+        try:
+            errors = future.result()
+        except Exception:
+            log.exception("Unable to verify the workflow")
+            return
+        for error in errors:
+            error.subject = subjects.get(error.subject, error.subject)
+        callback(errors)
@@ -2,9 +2,11 @@
 #  All rights reserved.
 
 from functools import partial, wraps
+from itertools import chain
+import logging
 
 from traits.api import (
-    Event, Instance, Property, Str, on_trait_change
+    Dict, Event, Instance, Property, Str, on_trait_change
 )
 from traitsui.api import (
     Action, Group, Menu, ModelView, TextEditor,
@@ -12,9 +14,8 @@ from traitsui.api import (
 )
 
 from force_bdss.api import (
-    ExecutionLayer, IFactoryRegistry, InputSlotInfo,
-    OutputSlotInfo, Workflow, verify_workflow, KPISpecification,
-    BaseMCOParameter
+    ExecutionLayer, IFactoryRegistry, Workflow, verify_workflow,
+    KPISpecification, BaseMCOModel, BaseMCOParameter
 )
 
 from force_wfmanager.ui.setup.communicator.communicator_view import (
@@ -37,14 +38,32 @@ from force_wfmanager.ui.setup.process.execution_layer_view \
     import ExecutionLayerView
 from force_wfmanager.ui.setup.process.process_view import ProcessView
 from force_wfmanager.ui.setup.system_state import SystemState
+from force_wfmanager.ui.setup.verification_scheduler import (
+    VerificationScheduler
+)
 from force_wfmanager.ui.setup.workflow_view import WorkflowView
+from force_wfmanager.ui.ui_utils import verify_request_origin
+from force_wfmanager.utils.factory_search_index import FactorySearchIndex
+from force_wfmanager.utils.workflow_diff import merge_workflow
 
+log = logging.getLogger(__name__)
 
 # VerifierError severity constants
 _ERROR = "error"
 _WARNING = "warning"
 _INFO = "information"
 
+# The names of the lists of child modelviews of each modelview class
+_CHILD_VIEWS = {
+    'WorkflowView': ['mco_view', 'process_view', 'communicator_view'],
+    'MCOView': ['mco_options'],
+    'MCOParameterView': ['model_views'],
+    'KPISpecificationView': ['model_views'],
+    'ProcessView': ['execution_layer_views'],
+    'ExecutionLayerView': ['data_source_views'],
+    'CommunicatorView': ['notification_listener_views']
+}
+
 # Create an empty view and menu for objects that have no data to display:
 no_view = View()
 no_menu = Menu()
@@ -86,12 +105,14 @@ delete_data_source_action = Action(name='Delete', action='delete_data_source')
 #: Wrapper to perform workflow verification after a method or function call
 def triggers_verify(func):
     """Decorator for functions which make changes requiring the workflow to
-    be verified"""
+    be verified. The selected modelview `object` is passed on with the
+    verification request, so that only its part of the workflow is
+    verified."""
 
     @wraps(func)
-    def wrap(self, *args, **kwargs):
-        func(self, *args, **kwargs)
-        self.verify_workflow_event = True
+    def wrap(self, ui_info, object):
+        func(self, ui_info, object)
+        self.verify_workflow_event = object
 
     return wrap
 
@@ -186,6 +207,11 @@ class WorkflowTree(ModelView):
     #: The ModelView for the BDSS Workflow
     workflow_view = Instance(WorkflowView, allow_none=False)
 
+    #: Coalesces the verification requests, and verifies the whole
+    #: workflow in a secondary thread. None verifies the workflow
+    #: synchronously on each request.
+    verification_scheduler = Instance(VerificationScheduler)
+
     # ------------------
     # Derived Attributes
     # ------------------
@@ -205,6 +231,23 @@ class WorkflowTree(ModelView):
         depends_on="system_state.selected_view.[error_message,label]"
     )
 
+    # ------------------
+    #      Private
+    # ------------------
+
+    #: The verification errors of each node of the workflow at the last
+    #: verification, by model: the workflow itself, the MCO, each
+    #: execution layer, data source and notification listener.
+    _verifier_errors = Dict()
+
+    #: The error messages passed by each modelview to its parent at the
+    #: last :meth:`verify_tree`
+    _view_messages = Dict()
+
+    #: The search indices of the factories of the NewEntityCreators, by
+    #: factory name. Cleared when the factory registry changes.
+    _search_indices = Dict()
+
     # -------------------
     #        View
     # -------------------
@@ -401,41 +444,46 @@ class WorkflowTree(ModelView):
             return ERROR_TEMPLATE.format(
                 "Errors for {}:".format(mv_label), body_strings)
 
+    @on_trait_change('_factory_registry')
+    def _clear_search_indices(self):
+        self._search_indices = {}
+
     @on_trait_change('model')
     def update_model_view(self):
         """Update the workflow modelview's model and verify, on either loading
-        a new workflow, or an internal change to the workflow.
+        a new workflow, or an internal change to the workflow. The models
+        of the new workflow which are unchanged are replaced by the ones of
+        the previous workflow, so that only the modelviews of the changed
+        models are created, and the state of the tree is kept.
         """
-        self.workflow_view = WorkflowView(model=self.model)
+        if self.workflow_view is None:
+            self.workflow_view = WorkflowView(model=self.model)
+        else:
+            merge_workflow(self.workflow_view.model, self.model)
+            self.workflow_view.model = self.model
         self.verify_workflow_event = True
 
     # Workflow Verification
     @on_trait_change("workflow_view.verify_workflow_event")
-    def received_verify_request(self):
+    def received_verify_request(self, object, name, new):
         """Checks if the root node of workflow tree is requesting a
         verification of the workflow"""
-        self.verify_workflow_event = True
+        self.verify_workflow_event = verify_request_origin(
+            self, object, name, new
+        )
 
     @on_trait_change("verify_workflow_event")
-    def perform_verify_workflow_event(self):
+    def perform_verify_workflow_event(self, origin=True):
         """Verify the workflow and update error_message traits of
-        every ModelView in the workflow"""
-        errors = verify_workflow(self.model)
-
-        # Update the error list with verification checks that occur
-        # outside the foce_bdss
-        if self.workflow_view.model.mco_model is not None:
-            errors += (
-                self.workflow_view.mco_view[0]
-                .parameter_view.verify_model_names()
-            )
-            errors += (
-                self.workflow_view.mco_view[0]
-                .kpi_view.verify_model_names()
+        every ModelView in the workflow. With a
+        :attr:`verification_scheduler`, the requests are coalesced and
+        the whole workflow is verified in a secondary thread."""
+        if self.verification_scheduler is None:
+            self._verify_requests([origin])
+        else:
+            self.verification_scheduler.request(
+                origin, self._verify_requests
             )
-        # Communicate the verification errors to each level of the
-        # workflow tree
-        self.verify_tree(errors)
 
     # -------------------
     #    Public Methods
@@ -465,10 +513,16 @@ class WorkflowTree(ModelView):
 
         if from_registry is not None:
             visible_factories = [f for f in from_registry if f.ui_visible]
+            search_index = self._search_indices.get(factory_name)
+            if (search_index is None
+                    or search_index.factories != visible_factories):
+                search_index = FactorySearchIndex(factories=visible_factories)
+                self._search_indices[factory_name] = search_index
             self.system_state.entity_creator = NewEntityCreator(
                 factories=visible_factories,
                 dclick_function=add_new_entity,
-                factory_name=factory_name
+                factory_name=factory_name,
+                search_index=search_index,
             )
 
         self.system_state.add_new_entity = partial(
@@ -538,6 +592,15 @@ class WorkflowTree(ModelView):
         data_source_view: DataSourceView
             Selected DataSourceView node in the TreeEditor
         """
+        # The slots of the data source are only displayed once selected
+        try:
+            data_source_view.create_slots_tables()
+        except RuntimeError:
+            log.exception(
+                "Unable to display the slots of the data source {}".format(
+                    data_source_view.label)
+            )
+
         self.system_state.remove_entity = partial(
             self.delete_data_source,
             ui_info=None,
@@ -731,121 +794,319 @@ class WorkflowTree(ModelView):
         """Delete a notification listener from the workflow"""
         self.workflow_view.remove_notification_listener(object.model)
 
-    def verify_tree(self, errors, start_view=None):
+    def verify_tree(self, errors, start_view=None, refresh_views=None):
         """ Assign the errors generated by verifier.py to the appropriate
         ModelView. This is done recursively, so parent ModelViews also have
         error messages from their child ModelViews.
+
+        The errors are first dispatched to the ModelViews they concern,
+        by their subject, so that each ModelView only goes through its
+        own errors.
+
         Parameters
         ----------
         errors: List(VerifierError)
             A list of the current workflow errors
         start_view: ModelView
+        refresh_views: set of ModelView or None
+            The ModelViews to update. The other ModelViews keep the errors
+            of the previous call. None updates every ModelView.
         """
-        # A dictionary with the mappings between modelview lists
-        mappings = {
-            'WorkflowView': ['mco_view', 'process_view',
-                             'communicator_view'],
-            'MCOView': ['mco_options'],
-            'MCOParameterView': ['model_views'],
-            'KPISpecificationView': ['model_views'],
-            'ProcessView': ['execution_layer_views'],
-            'ExecutionLayerView': ['data_source_views'],
-            'CommunicatorView': ['notification_listener_views']
-        }
-
         # Begin from top-level WorkflowModelView if nothing specified already
         if start_view is None:
             start_view = self.workflow_view
+            if refresh_views is None:
+                self._view_messages = {}
+
+        errors_by_view = self._errors_by_view(
+            errors, start_view, refresh_views
+        )
+        return self._verify_view(start_view, errors_by_view, refresh_views)
 
-        # Get the current modelview's class
-        current_view_type = start_view.__class__.__name__
+    # -------------------
+    #   Private Methods
+    # -------------------
 
+    def _verify_view(self, view, errors_by_view, refresh_views):
+        """ Updates the validity and error message of a ModelView from its
+        errors in `errors_by_view`, after its child ModelViews, and returns
+        the error messages to pass on to its parent."""
         # A list of error messages to be displayed in the UI
         message_list = []
+        messages = set()
 
         # Reset the validity of each view
-        start_view.valid = True
+        view.valid = True
 
         # If the current ModelView has any child modelviews
-        # retrieve their error messages by calling self.verify_tree
-        if current_view_type in mappings:
-
-            for child_view_list_name in mappings[current_view_type]:
-                child_view_list = getattr(
-                    start_view, child_view_list_name
-                )
-
-                for child_view in child_view_list:
-                    child_view_errors = self.verify_tree(
-                        errors, start_view=child_view
+        # retrieve their error messages first
+        for child_view_list_name in _CHILD_VIEWS.get(
+                view.__class__.__name__, []):
+            for child_view in getattr(view, child_view_list_name):
+                if self._needs_verification(child_view, refresh_views):
+                    child_view_errors = self._verify_view(
+                        child_view, errors_by_view, refresh_views
                     )
-                    # If a child view is invalid, invalidate the parent
-                    if not child_view.valid:
-                        start_view.valid = False
+                else:
+                    child_view_errors = self._view_messages[child_view]
+
+                # If a child view is invalid, invalidate the parent
+                if not child_view.valid:
+                    view.valid = False
 
-                    # Add any unique error messages to the list
-                    for message in child_view_errors:
-                        if message not in message_list:
-                            message_list.append(message)
+                # Add any unique error messages to the list
+                for message in child_view_errors:
+                    if message not in messages:
+                        messages.add(message)
+                        message_list.append(message)
 
         # A list of messages to pass to the parent ModelView
         send_to_parent = message_list[:]
 
-        for verifier_error in errors:
+        for verifier_error, show_locally in errors_by_view.get(view, []):
+            # Errors of the models of the model_views of a
+            # BaseMCOOptionsView are not displayed again on it
+            verifier_check(
+                verifier_error, _ERROR,
+                message_list if show_locally else [],
+                send_to_parent, view)
+
+        # Display message so that errors relevant to this ModelView come first
+        view.error_message = '\n'.join(reversed(message_list))
+
+        # Pass relevant error messages to parent
+        self._view_messages[view] = send_to_parent
+        return send_to_parent
 
-            # If start_view does not have a corresponding model object,
-            # check whether this view is the subject of an error.
+    def _needs_verification(self, view, refresh_views):
+        """Whether a ModelView must be updated by :meth:`verify_tree`"""
+        return (
+            refresh_views is None
+            or view in refresh_views
+            or view not in self._view_messages
+        )
+
+    def _errors_by_view(self, errors, start_view, refresh_views):
+        """Returns the errors concerning each ModelView updated by
+        :meth:`verify_tree` from `start_view`, as lists of (error,
+        show_locally) tuples, in the order of `errors`.
+
+        An error concerns the ModelView of its subject, the DataSourceView
+        of its slot, and the BaseMCOOptionsView containing the
+        ModelView of its KPI or parameter, where it is not displayed."""
+        views_by_subject = {}
+        views = [start_view]
+        while views:
+            view = views.pop()
+
+            # Views without a corresponding model object are the subject
+            # of their errors
             if isinstance(
-                    start_view,
+                    view,
                     (ProcessView, KPISpecificationView, MCOParameterView)
             ):
-                subject = start_view
-            # Otherwise check whether the model is the subject of an error.
+                subject = view
             else:
-                subject = start_view.model
-
-            if verifier_error.subject == subject:
-                verifier_check(
-                    verifier_error, _ERROR, message_list,
-                    send_to_parent, start_view)
-
-            # Further checks for UI objects not relating to an object in the
-            # force_bdss Workflow model
-            # For errors where the subject is an Input/OutputSlotInfo object,
-            # check if this is an attribute of the (DataSource) model
-            if isinstance(verifier_error.subject,
-                          (InputSlotInfo, OutputSlotInfo)):
-                slots = []
-                slots.extend(
-                    getattr(start_view.model, 'input_slot_info', [])
+                subject = view.model
+            views_by_subject.setdefault(subject, []).append((view, True))
+
+            model = view.model
+            for slot in chain(getattr(model, 'input_slot_info', []),
+                              getattr(model, 'output_slot_info', [])):
+                views_by_subject.setdefault(slot, []).append((view, True))
+
+            for model_view in getattr(view, 'model_views', []):
+                views_by_subject.setdefault(model_view.model, []).append(
+                    (view, False)
                 )
-                slots.extend(
-                    getattr(start_view.model, 'output_slot_info', [])
+
+            for child_view_list_name in _CHILD_VIEWS.get(
+                    view.__class__.__name__, []):
+                views.extend(
+                    child_view
+                    for child_view in getattr(view, child_view_list_name)
+                    if self._needs_verification(child_view, refresh_views)
                 )
-                if verifier_error.subject in slots:
-                    verifier_check(
-                        verifier_error, _ERROR, message_list,
-                        send_to_parent, start_view)
-
-            # For errors where the subject is an KPISpecification or
-            # BaseMCOParameter, check if this is an attribute of
-            # the (BaseMCOOptionsView) model
-            if isinstance(verifier_error.subject,
-                          (KPISpecification, BaseMCOParameter)):
-                model_views = getattr(start_view, 'model_views', [])
-                models = [model_view.model for model_view in model_views]
-                if verifier_error.subject in models:
-                    # Don't append local_error to message_list as we don't
-                    # want to show duplicate messages on BaseMCOOptionsView
-                    verifier_check(
-                        verifier_error, _ERROR, [],
-                        send_to_parent, start_view)
 
-        # Display message so that errors relevant to this ModelView come first
-        start_view.error_message = '\n'.join(reversed(message_list))
+        errors_by_view = {}
+        for verifier_error in errors:
+            for view, show_locally in views_by_subject.get(
+                    verifier_error.subject, []):
+                errors_by_view.setdefault(view, []).append(
+                    (verifier_error, show_locally)
+                )
+        return errors_by_view
+
+    def _verify_requests(self, origins):
+        """Verifies the workflow after the verification requests of the
+        modelviews `origins`.
+
+        If each modelview requesting the verification is part of a data
+        source, an execution layer or the MCO, only those nodes are
+        verified again, along with the MCO, whose parameters and KPIs
+        refer to the data source slots. The errors of the other nodes are
+        kept from the previous verification, and only the modelviews of
+        the verified nodes and their parents are updated."""
+        owners = self._error_owners()
+        dirty = []
+        for origin in origins:
+            origin_dirty = self._dirty_owners(origin, owners)
+            if origin_dirty is None:
+                dirty = None
+                break
+            dirty.extend(node for node in origin_dirty if node not in dirty)
+
+        if dirty is not None:
+            for owner in dirty:
+                self._verify_owner(owner, owners)
+            self._update_tree(
+                owners, self._views_to_refresh(dirty, owners)
+            )
+        elif self.verification_scheduler is None:
+            self._workflow_verified(verify_workflow(self.model))
+        else:
+            # Until the errors come back, the following requests verify
+            # the whole workflow as well
+            self._view_messages = {}
+            self.verification_scheduler.verify_workflow(
+                self.model, self._workflow_verified
+            )
 
-        # Pass relevant error messages to parent
-        return send_to_parent
+    def _workflow_verified(self, errors):
+        """Updates the modelviews with the errors of the whole workflow"""
+        owners = self._error_owners()
+        if self.model.mco_model is not None:
+            errors = errors + self._verify_model_names()
+        self._verifier_errors = self._errors_by_owner(errors, owners)
+        self._update_tree(owners)
+
+    def _update_tree(self, owners, refresh_views=None):
+        """Communicates the errors of the nodes of the workflow to the
+        `refresh_views` modelviews, or all of them if None."""
+        # Discard the errors of the nodes removed from the workflow
+        nodes = list(dict.fromkeys(owners.values()))
+        self._verifier_errors = {
+            node: self._verifier_errors.get(node, []) for node in nodes
+        }
+        errors = list(chain.from_iterable(
+            self._verifier_errors[node] for node in nodes
+        ))
+
+        # Communicate the verification errors to each level of the
+        # workflow tree
+        self.verify_tree(errors, refresh_views=refresh_views)
+
+    def _error_owners(self):
+        """Returns the node of the workflow owning the errors of each
+        possible subject of a VerifierError. The nodes are the workflow
+        itself, the MCO, the execution layers, the data sources and the
+        notification listeners, in the order of the workflow."""
+        owners = {self.model: self.model}
+
+        mco_model = self.model.mco_model
+        if mco_model is not None:
+            subjects = [mco_model]
+            subjects.extend(mco_model.parameters)
+            subjects.extend(mco_model.kpis)
+            for mco_view in self.workflow_view.mco_view:
+                subjects.extend([mco_view.parameter_view, mco_view.kpi_view])
+            for subject in subjects:
+                owners[subject] = mco_model
+
+        for layer in self.model.execution_layers:
+            owners[layer] = layer
+            for data_source in layer.data_sources:
+                for subject in chain([data_source],
+                                     data_source.input_slot_info,
+                                     data_source.output_slot_info):
+                    owners[subject] = data_source
+
+        for notification_listener in self.model.notification_listeners:
+            owners[notification_listener] = notification_listener
+
+        return owners
+
+    def _dirty_owners(self, origin, owners):
+        """Returns the nodes of the workflow to verify again after a
+        verification request of the modelview `origin`, or None if the
+        whole workflow must be verified."""
+        if not self._view_messages:
+            return None
+
+        if isinstance(origin, (DataSourceView, ExecutionLayerView)):
+            node = origin.model
+        elif isinstance(getattr(origin, 'model', None),
+                        (BaseMCOModel, BaseMCOParameter, KPISpecification)):
+            node = self.model.mco_model
+        else:
+            return None
+
+        # The node was removed from the workflow
+        if node is None or owners.get(node) is not node:
+            return None
+
+        # The MCO parameters and KPIs refer to the data source slots
+        dirty = [node]
+        mco_model = self.model.mco_model
+        if mco_model is not None and node is not mco_model:
+            dirty.append(mco_model)
+        return dirty
+
+    def _verify_owner(self, node, owners):
+        """Verifies again a node of the workflow, and updates its errors
+        and the errors of its child nodes"""
+        if isinstance(node, ExecutionLayer):
+            errors = self._errors_by_owner(node.verify(), owners)
+            for child in chain([node], node.data_sources):
+                self._verifier_errors[child] = errors.get(child, [])
+        elif isinstance(node, BaseMCOModel):
+            self._verifier_errors[node] = (
+                node.verify() + self._verify_model_names()
+            )
+        else:
+            self._verifier_errors[node] = node.verify()
+
+    def _verify_model_names(self):
+        """Returns the errors of the names of the MCO parameters and KPIs,
+        which are verified outside the force_bdss"""
+        mco_view = self.workflow_view.mco_view[0]
+        return (
+            mco_view.parameter_view.verify_model_names()
+            + mco_view.kpi_view.verify_model_names()
+        )
+
+    def _errors_by_owner(self, errors, owners):
+        """Returns `errors` by the node of the workflow owning them"""
+        errors_by_owner = {}
+        for error in errors:
+            owner = owners.get(error.subject, self.model)
+            errors_by_owner.setdefault(owner, []).append(error)
+        return errors_by_owner
+
+    def _views_to_refresh(self, dirty, owners, view=None, refresh=None,
+                          in_dirty_node=False):
+        """Returns the modelviews of the `dirty` nodes of the workflow,
+        their child modelviews and their parents."""
+        if view is None:
+            view = self.workflow_view
+            refresh = set()
+
+        subject = getattr(view, 'model', None)
+        in_dirty_node = in_dirty_node or owners.get(subject) in dirty
+        needs_refresh = in_dirty_node
+
+        for child_view_list_name in _CHILD_VIEWS.get(
+                view.__class__.__name__, []):
+            for child_view in getattr(view, child_view_list_name):
+                self._views_to_refresh(
+                    dirty, owners, child_view, refresh, in_dirty_node
+                )
+                if child_view in refresh:
+                    needs_refresh = True
+
+        if needs_refresh:
+            refresh.add(view)
+        return refresh
 
 
 def verifier_check(verifier_error, severity, message_list,
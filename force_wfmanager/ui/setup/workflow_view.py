@@ -13,6 +13,7 @@ from force_wfmanager.ui.setup.mco.mco_view import MCOView
 from force_wfmanager.ui.setup.process.process_view import (
     ProcessView
 )
+from force_wfmanager.ui.ui_utils import verify_request_origin
 from force_wfmanager.utils.variable_names_registry import (
     VariableNamesRegistry
 )
@@ -99,22 +100,27 @@ class WorkflowView(HasTraits):
     # -------------------
 
     @on_trait_change('model')
-    def update_process_view(self):
-        self.process_view = self._process_view_default()
+    def update_views_model(self):
+        """Updates the views for a new workflow. The views are kept, so
+        that the modelviews of the models shared with the previous workflow
+        are reused."""
+        self.variable_names_registry.workflow = self.model
+        self.process_view[0].model = self.model
+        self.communicator_view[0].model = self.model
 
     @on_trait_change('model:mco_model')
     def update_mco_view(self):
-        self.mco_view = self._mco_view_default()
-
-    @on_trait_change('model')
-    def update_communication_view(self):
-        self.communicator_view = self._communicator_view_default()
+        if (not self.mco_view
+                or self.mco_view[0].model is not self.model.mco_model):
+            self.mco_view = self._mco_view_default()
 
     @on_trait_change('mco_view.verify_workflow_event,'
                      'process_view.verify_workflow_event,'
                      'communicator_view.verify_workflow_event')
-    def received_verify_request(self):
-        self.verify_workflow_event = True
+    def received_verify_request(self, object, name, new):
+        self.verify_workflow_event = verify_request_origin(
+            self, object, name, new
+        )
 
     # -------------------
     #   Public Methods
@@ -121,3 +121,31 @@ def class_description(cl, maxlength=80, desc_attribute="description"):
     else:
         description = shorten(str(cl), length)
     return description
+
+
+def verify_request_origin(view, object, name, new):
+    """ Returns the view which requested a verification of the workflow,
+    to be passed on by the `verify_workflow_event` of `view`.
+
+    The views fire their `verify_workflow_event` with the value `True`, and
+    their parents pass it on with the value of the view which requested the
+    verification, so that only its part of the workflow can be verified.
+
+    Parameters
+    ----------
+    view : HasTraits
+        The view passing on the verification request of a child view
+    object : HasTraits
+        The object of the trait change notification received by `view`
+    name : str
+        The name of the changed trait. If this is not the
+        `verify_workflow_event` of a child view, the list of child views
+        changed and `view` itself requests the verification.
+    new : object
+        The new value of the changed trait
+    """
+    if name != "verify_workflow_event":
+        return view
+    if new is True:
+        return object
+    return new
@@ -0,0 +1,182 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+from collections import Counter, defaultdict
+from itertools import chain
+import logging
+import re
+
+from traits.api import (
+    Bool, Dict, HasStrictTraits, Instance, List, on_trait_change
+)
+
+from force_bdss.api import BaseDataSourceFactory, BaseFactory
+
+log = logging.getLogger(__name__)
+
+#: Weights of the fields of the factories in the ranking of the results
+FIELD_WEIGHTS = {
+    "name": 4.0,
+    "plugin": 2.0,
+    "slot": 1.5,
+    "description": 1.0,
+}
+
+#: Minimum fraction of the trigrams of a searched token which a word must
+#: contain to match it
+FUZZY_THRESHOLD = 0.5
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text):
+    """ Returns the lower case alphanumeric tokens of `text`"""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def trigrams(token):
+    """ Returns the set of trigrams of `token`, padded with a space on each
+    side so that the prefixes of a word share most of its trigrams."""
+    padded = " {} ".format(token)
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class FactorySearchIndex(HasStrictTraits):
+    """ A search index over the factories of a NewEntityCreator.
+
+    The names, descriptions, plugin names and, for the data sources, the
+    slot types of the factories are split into tokens, which are indexed
+    by factory along with the weight of their field, and by trigram. A
+    search matches each of its tokens with the indexed words sharing
+    enough trigrams, so that misspelled words and prefixes are found, and
+    ranks the factories matching all the tokens by the sum of the weights
+    of the matched fields. The index is built on the first search, and
+    rebuilt only when :attr:`factories` change.
+    """
+
+    #: The factories to search
+    factories = List(Instance(BaseFactory))
+
+    #: Whether the index is up to date with :attr:`factories`
+    built = Bool(False)
+
+    #: For each indexed word, the weight of its best field in each factory,
+    #: by index of the factory
+    _words = Dict()
+
+    #: The indexed words containing each trigram
+    _trigrams = Dict()
+
+    def search(self, search_term, limit=None):
+        """ Returns the factories matching `search_term`, best first.
+
+        Parameters
+        ----------
+        search_term: str
+            The words to search. A factory must match all of them.
+        limit: int or None
+            The maximum number of factories returned. None returns all the
+            matching factories.
+
+        Returns
+        -------
+        factories: list of BaseFactory
+            The matching factories, ranked by decreasing score, then by name
+        """
+        tokens = tokenize(search_term)
+        if not tokens:
+            return []
+        if not self.built:
+            self._build()
+
+        scores = None
+        for token in tokens:
+            token_scores = {}
+            for word, similarity in self._similar_words(token):
+                for index, weight in self._words[word].items():
+                    score = similarity * weight
+                    if score > token_scores.get(index, 0.0):
+                        token_scores[index] = score
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {
+                    index: score + token_scores[index]
+                    for index, score in scores.items()
+                    if index in token_scores
+                }
+            if not scores:
+                return []
+
+        ranked = sorted(
+            scores,
+            key=lambda index: (-scores[index], self.factories[index].name)
+        )
+        return [self.factories[index] for index in ranked[:limit]]
+
+    @on_trait_change("factories[]")
+    def _invalidate(self):
+        self.built = False
+
+    def _build(self):
+        """ Indexes the words of the fields of :attr:`factories`"""
+        words = defaultdict(dict)
+        for index, factory in enumerate(self.factories):
+            for field, text in self._factory_fields(factory):
+                weight = FIELD_WEIGHTS[field]
+                for word in tokenize(text):
+                    if weight > words[word].get(index, 0.0):
+                        words[word][index] = weight
+
+        word_trigrams = defaultdict(set)
+        for word in words:
+            for trigram in trigrams(word):
+                word_trigrams[trigram].add(word)
+
+        self._words = dict(words)
+        self._trigrams = dict(word_trigrams)
+        self.built = True
+
+    def _factory_fields(self, factory):
+        """ Returns the (field, text) pairs indexed for `factory`"""
+        fields = [
+            ("name", factory.name),
+            ("plugin", factory.plugin_name),
+            ("description", factory.get_description() or ""),
+        ]
+        if isinstance(factory, BaseDataSourceFactory):
+            fields.extend(
+                ("slot", slot_type) for slot_type in self._slot_types(factory)
+            )
+        return fields
+
+    def _slot_types(self, factory):
+        """ Returns the types of the slots of a default model of a data
+        source factory, or an empty list if they are not available."""
+        try:
+            data_source = factory.create_data_source()
+            input_slots, output_slots = data_source.slots(
+                factory.create_model()
+            )
+        except Exception:
+            log.exception(
+                "Unable to index the slots of the data source factory "
+                "'{}'".format(factory.id)
+            )
+            return []
+        return [slot.type for slot in chain(input_slots, output_slots)]
+
+    def _similar_words(self, token):
+        """ Yields the indexed words containing at least
+        :data:`FUZZY_THRESHOLD` of the trigrams of `token`, with the
+        fraction of them they contain."""
+        token_trigrams = trigrams(token)
+        shared = Counter(
+            word
+            for trigram in token_trigrams
+            for word in self._trigrams.get(trigram, ())
+        )
+        for word, count in shared.items():
+            similarity = count / len(token_trigrams)
+            if similarity >= FUZZY_THRESHOLD:
+                yield word, similarity
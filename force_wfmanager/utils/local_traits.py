@@ -7,13 +7,18 @@ from traits.api import BaseStr, HasStrictTraits, TraitError
 
 
 class ZMQSocketURL(BaseStr):
-    """A custom Unicode Trait which is required to be a valid tcp address."""
+    """A custom Unicode Trait which is required to be a valid tcp address,
+    or an ipc endpoint."""
     #: A basic description of the class
     info_text = "A ZeroMQ Socket URL"
 
     def validate(self, object, name, value):
-        """Checks that this is a valid tcp address """
+        """Checks that this is a valid tcp address or ipc endpoint"""
         super(ZMQSocketURL, self).validate(object, name, value)
+        m = re.match("ipc://(.+)", value)
+        if m is not None:
+            return value
+
         m = re.match(
             "tcp://(\\d{1,3})\\.(\\d{1,3})\\.(\\d{1,3})\\.(\\d{1,3}):(\\d+)",
             value)
@@ -0,0 +1,86 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+from weakref import WeakKeyDictionary
+
+from traits.api import HasStrictTraits, Instance
+
+
+class SlotSignatureCache(HasStrictTraits):
+    """ Memoises the input and output slots of the data source models.
+
+    Getting the slots of a data source model requires creating its data
+    source, and calling ``slots()``, which can be expensive, e.g. if the
+    data source inspects files. The slots of each model are memoised along
+    with the version of the model they were computed at, which is bumped
+    each time the model `changes_slots`. The models are held by weak
+    references, so that they are discarded along with their slots once
+    removed from the workflow.
+    """
+
+    #: The version of the slots of each data source model seen so far
+    _versions = Instance(WeakKeyDictionary, ())
+
+    #: The version and the (input_slots, output_slots) memoised for each
+    #: data source model
+    _signatures = Instance(WeakKeyDictionary, ())
+
+    def slots(self, data_source_model):
+        """ Returns the slots of a data source model, memoised until the
+        model `changes_slots`.
+
+        Parameters
+        ----------
+        data_source_model: BaseDataSourceModel
+            The model of the data source
+
+        Returns
+        -------
+        slots: tuple
+            The (input_slots, output_slots) of the data source, as returned
+            by ``slots()``
+
+        Raises
+        ------
+        Exception:
+            Any exception raised by the creation of the data source or by
+            its ``slots()`` method. Nothing is memoised then.
+        """
+        version = self.version(data_source_model)
+        try:
+            signature_version, signature = self._signatures[data_source_model]
+        except KeyError:
+            pass
+        else:
+            if signature_version == version:
+                return signature
+
+        data_source = data_source_model.factory.create_data_source()
+        signature = data_source.slots(data_source_model)
+        self._signatures[data_source_model] = (version, signature)
+        return signature
+
+    def version(self, data_source_model):
+        """ Returns the version of the slots of a data source model, and
+        starts following its changes of slots if not done yet."""
+        try:
+            return self._versions[data_source_model]
+        except KeyError:
+            # The version must be bumped before any other listener of
+            # the model gets the new slots
+            data_source_model.on_trait_change(
+                self._bump_version, "changes_slots", priority=True
+            )
+            self._versions[data_source_model] = 0
+            return 0
+
+    def clear(self):
+        """ Discards the memoised slots of all the models"""
+        self._signatures.clear()
+
+    def _bump_version(self, data_source_model, name, new):
+        self._versions[data_source_model] += 1
+
+
+#: The slots of the data source models, shared by the Workflow Manager
+slot_signature_cache = SlotSignatureCache()
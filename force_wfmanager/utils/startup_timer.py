@@ -0,0 +1,133 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+from contextlib import contextmanager
+import json
+import logging
+import time
+
+from traits.api import Bool, Dict, Float, HasStrictTraits, List, Str
+
+log = logging.getLogger(__name__)
+
+
+class StartupSpan(HasStrictTraits):
+    """ A timed phase of the startup of the application"""
+
+    #: Name of the phase
+    name = Str()
+
+    #: Seconds from the start of the application to the start of the phase
+    start = Float()
+
+    #: Duration of the phase, in seconds
+    duration = Float()
+
+    #: Details of the phase, e.g. the name of the plugin loaded
+    details = Dict(Str, Str)
+
+    def to_json(self):
+        """ Returns a dictionary representation of the span"""
+        data = {
+            "name": self.name,
+            "start": round(self.start, 6),
+            "duration": round(self.duration, 6),
+        }
+        data.update(self.details)
+        return data
+
+
+class StartupTimer(HasStrictTraits):
+    """ Times the phases of the startup of the application, until the main
+    window is painted, and reports them as JSON. The phases are timed with
+    :meth:`span`, and can be nested, e.g. the load of each plugin within
+    the plugin discovery. Phases completed after :meth:`finish` are not
+    recorded.
+    """
+
+    #: Time of the start of the application, as given by
+    #: :func:`time.perf_counter`
+    origin = Float()
+
+    #: The recorded phases, by end time
+    spans = List(StartupSpan)
+
+    #: Whether the startup is complete
+    finished = Bool(False)
+
+    #: Seconds from the start of the application to the end of the startup
+    total = Float()
+
+    def _origin_default(self):
+        return time.perf_counter()
+
+    def start(self):
+        """ Restarts the timing from now"""
+        self.origin = time.perf_counter()
+        self.spans = []
+        self.finished = False
+        self.total = 0.0
+
+    def now(self):
+        """ Returns the seconds elapsed since the start of the
+        application"""
+        return time.perf_counter() - self.origin
+
+    def add(self, name, start, **details):
+        """ Records a phase `name` started at `start` and ending now.
+
+        Parameters
+        ----------
+        name: str
+            Name of the phase
+        start: float
+            Start of the phase, as returned by :meth:`now`
+        details: dict
+            Details of the phase, converted to strings
+        """
+        if self.finished:
+            return
+        self.spans.append(StartupSpan(
+            name=name,
+            start=start,
+            duration=self.now() - start,
+            details={key: str(value) for key, value in details.items()},
+        ))
+
+    @contextmanager
+    def span(self, name, **details):
+        """ Context manager recording the phase `name` it encloses. See
+        :meth:`add`."""
+        start = self.now()
+        try:
+            yield
+        finally:
+            self.add(name, start, **details)
+
+    def finish(self):
+        """ Marks the end of the startup"""
+        if not self.finished:
+            self.total = self.now()
+            self.finished = True
+
+    def report(self, **info):
+        """ Returns the timing report, as a JSON serializable dict with
+        the `info` items, the "total" startup time and the "spans" of the
+        phases sorted by start time."""
+        spans = sorted(self.spans, key=lambda span: span.start)
+        report = dict(info)
+        report["total"] = round(self.total or self.now(), 6)
+        report["spans"] = [span.to_json() for span in spans]
+        return report
+
+    def write_report(self, file_path, **info):
+        """ Writes the timing :meth:`report` in the JSON file `file_path`"""
+        try:
+            with open(file_path, "w") as fp:
+                json.dump(self.report(**info), fp, indent=4)
+        except OSError:
+            log.exception(f"Unable to write the startup report {file_path}")
+
+
+#: Timer of the startup of the Workflow Manager
+startup_timer = StartupTimer()
@@ -0,0 +1,85 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import unittest
+from unittest import mock
+
+from force_bdss.tests.probe_classes.data_source import (
+    ProbeDataSourceFactory
+)
+from force_bdss.tests.probe_classes.probe_extension_plugin import \
+    ProbeExtensionPlugin
+
+from force_wfmanager.utils.factory_search_index import (
+    FactorySearchIndex, tokenize, trigrams
+)
+
+
+class TestFactorySearchIndex(unittest.TestCase):
+    def setUp(self):
+        self.plugin = ProbeExtensionPlugin()
+        self.factories = [
+            ProbeDataSourceFactory(self.plugin, input_slots_size=1)
+            for _ in range(3)
+        ]
+        self.factories[0].name = "Viscosity Calculator"
+        self.factories[1].name = "Pressure Drop"
+        self.factories[2].name = "Viscosity Fitter"
+        self.index = FactorySearchIndex(factories=self.factories)
+
+    def test_tokenize(self):
+        self.assertEqual(
+            ["viscosity", "2nd", "order"], tokenize("Viscosity (2nd-order)")
+        )
+        self.assertEqual({" ab", "ab "}, trigrams("ab"))
+
+    def test_search(self):
+        viscosity_calculator, pressure_drop, viscosity_fitter = (
+            self.factories
+        )
+        self.assertEqual(
+            [viscosity_calculator, viscosity_fitter],
+            self.index.search("viscosity")
+        )
+        self.assertEqual(
+            [viscosity_calculator], self.index.search("viscosity", limit=1)
+        )
+        # Prefixes and misspelled words
+        self.assertEqual([viscosity_fitter], self.index.search("Visc fit"))
+        self.assertEqual([pressure_drop], self.index.search("presure dro"))
+
+        self.assertEqual([], self.index.search("temperature"))
+        self.assertEqual([], self.index.search(" - "))
+
+    def test_slot_types(self):
+        # All the data sources have a PRESSURE slot, but the names rank
+        # higher than the slot types
+        results = self.index.search("pressure")
+        self.assertEqual(3, len(results))
+        self.assertIs(self.factories[1], results[0])
+
+    def test_slot_types_failure(self):
+        with mock.patch.object(
+            ProbeDataSourceFactory, "create_data_source",
+            side_effect=Exception("error")
+        ):
+            with self.assertLogs(
+                "force_wfmanager.utils.factory_search_index"
+            ):
+                results = self.index.search("pressure")
+        self.assertEqual([self.factories[1]], results)
+
+    def test_index_built_once(self):
+        with mock.patch.object(
+            FactorySearchIndex, "_build", autospec=True,
+            side_effect=FactorySearchIndex._build
+        ) as mock_build:
+            self.index.search("vis")
+            self.index.search("visc")
+            self.assertEqual(1, mock_build.call_count)
+
+            factory = ProbeDataSourceFactory(self.plugin)
+            factory.name = "Viscosity Model"
+            self.index.factories.append(factory)
+            self.assertIn(factory, self.index.search("visc"))
+            self.assertEqual(2, mock_build.call_count)
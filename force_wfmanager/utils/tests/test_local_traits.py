@@ -18,7 +18,8 @@ class TestLocalTraits(unittest.TestCase):
 
         for working in ["tcp://127.0.0.1:12345",
                         "tcp://255.255.255.255:65535",
-                        "tcp://1.1.1.1:65535"]:
+                        "tcp://1.1.1.1:65535",
+                        "ipc:///tmp/force_wfmanager_xyz/sync"]:
             c.socket_url = working
             self.assertEqual(c.socket_url, working)
 
@@ -28,6 +29,7 @@ class TestLocalTraits(unittest.TestCase):
                        "tcp://0.0.0.270:12345",
                        "url://255.255.255.255:65535",
                        "whatever",
+                       "ipc://",
                        "tcp://1.1.1.1:100000"]:
             with self.assertRaises(TraitError):
                 c.socket_url = broken
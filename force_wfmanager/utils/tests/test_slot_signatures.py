@@ -0,0 +1,70 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import gc
+import unittest
+from unittest import mock
+
+from force_bdss.tests.probe_classes.data_source import (
+    ProbeDataSourceFactory
+)
+from force_bdss.tests.probe_classes.probe_extension_plugin import \
+    ProbeExtensionPlugin
+
+from force_wfmanager.utils.slot_signatures import SlotSignatureCache
+
+
+class TestSlotSignatureCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = SlotSignatureCache()
+        self.factory = ProbeDataSourceFactory(
+            ProbeExtensionPlugin(), input_slots_size=1, output_slots_size=2
+        )
+        self.model = self.factory.create_model()
+
+    def patch_create_data_source(self):
+        return mock.patch.object(
+            ProbeDataSourceFactory, "create_data_source", autospec=True,
+            side_effect=ProbeDataSourceFactory.create_data_source
+        )
+
+    def test_memoised_slots(self):
+        with self.patch_create_data_source() as mock_create:
+            input_slots, output_slots = self.cache.slots(self.model)
+            self.assertIs(input_slots, self.cache.slots(self.model)[0])
+        mock_create.assert_called_once_with(self.factory)
+        self.assertEqual(1, len(input_slots))
+        self.assertEqual(2, len(output_slots))
+
+    def test_changes_slots(self):
+        self.cache.slots(self.model)
+        self.assertEqual(0, self.cache.version(self.model))
+
+        self.factory.input_slots_size = 3
+        self.model.changes_slots = True
+        self.assertEqual(1, self.cache.version(self.model))
+        with self.patch_create_data_source() as mock_create:
+            input_slots, _ = self.cache.slots(self.model)
+            self.cache.slots(self.model)
+        mock_create.assert_called_once_with(self.factory)
+        self.assertEqual(3, len(input_slots))
+
+    def test_slots_failure(self):
+        with mock.patch.object(
+            ProbeDataSourceFactory, "create_data_source",
+            side_effect=Exception("error")
+        ):
+            with self.assertRaisesRegex(Exception, "error"):
+                self.cache.slots(self.model)
+        self.assertEqual(1, len(self.cache.slots(self.model)[0]))
+
+    def test_discarded_model(self):
+        self.cache.slots(self.model)
+        self.cache.clear()
+        with self.patch_create_data_source() as mock_create:
+            self.cache.slots(self.model)
+        mock_create.assert_called_once_with(self.factory)
+
+        del self.model
+        gc.collect()
+        self.assertEqual(0, len(self.cache._signatures))
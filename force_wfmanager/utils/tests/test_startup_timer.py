@@ -0,0 +1,75 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from testfixtures import LogCapture
+
+from force_wfmanager.utils.startup_timer import StartupTimer
+
+
+class TestStartupTimer(unittest.TestCase):
+    def setUp(self):
+        self.timer = StartupTimer()
+
+    def test_span(self):
+        with self.timer.span("discovery"):
+            with self.timer.span("plugin load", plugin="example"):
+                pass
+
+        outer, inner = self.timer.report()["spans"]
+        self.assertEqual("discovery", outer["name"])
+        self.assertEqual(
+            {"name", "start", "duration", "plugin"}, set(inner)
+        )
+        self.assertEqual("example", inner["plugin"])
+        self.assertLessEqual(outer["start"], inner["start"])
+        self.assertGreaterEqual(outer["duration"], inner["duration"])
+
+        # Recorded even if the phase fails
+        with self.assertRaises(ValueError):
+            with self.timer.span("failure"):
+                raise ValueError
+        self.assertEqual(3, len(self.timer.spans))
+
+    def test_finish(self):
+        with self.timer.span("discovery"):
+            pass
+        self.timer.finish()
+        total = self.timer.total
+        self.assertGreater(total, 0.0)
+
+        # Phases after the startup are not recorded
+        with self.timer.span("plugin load"):
+            pass
+        self.timer.finish()
+        report = self.timer.report(version="1.0")
+        self.assertEqual("1.0", report["version"])
+        self.assertEqual(round(total, 6), report["total"])
+        self.assertEqual(["discovery"], [
+            span["name"] for span in report["spans"]
+        ])
+
+        self.timer.start()
+        self.assertFalse(self.timer.finished)
+        self.assertEqual([], self.timer.spans)
+
+    def test_write_report(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        file_path = os.path.join(tmp_dir, "startup.json")
+        with self.timer.span("discovery"):
+            pass
+        self.timer.finish()
+
+        self.timer.write_report(file_path, version="1.0")
+        with open(file_path) as fp:
+            self.assertEqual(self.timer.report(version="1.0"), json.load(fp))
+
+        with LogCapture() as capture:
+            self.timer.write_report(os.path.join(tmp_dir, "missing", "x"))
+        self.assertEqual("ERROR", capture.records[0].levelname)
@@ -2,6 +2,7 @@
 #  All rights reserved.
 
 import unittest
+from unittest import mock
 
 from force_bdss.api import OutputSlotInfo, InputSlotInfo, ExecutionLayer
 from force_bdss.core.workflow import Workflow
@@ -173,3 +174,46 @@ class VariableNamesRegistryTest(unittest.TestCase):
         self.data_source2.output_slot_info = [OutputSlotInfo(name='T2')]
         self.assertEqual([("V1", 'PRESSURE'), ("T1", 'PRESSURE')],
                          self.registry.data_source_inputs)
+
+    def test_slot_types_cached(self):
+        with mock.patch.object(
+            ProbeDataSourceFactory, "create_data_source", autospec=True,
+            side_effect=ProbeDataSourceFactory.create_data_source
+        ) as mock_create:
+            self.data_source1.input_slot_info = [InputSlotInfo(name='V1')]
+            self.data_source1.input_slot_info[0].name = 'V2'
+            self.data_source1.output_slot_info = [OutputSlotInfo(name='T1')]
+            self.assertEqual(0, mock_create.call_count)
+
+            # The slots of the data source changed
+            self.data_source1.changes_slots = True
+            self.assertEqual(1, mock_create.call_count)
+            self.data_source1.input_slot_info[0].name = 'V3'
+            self.assertEqual(1, mock_create.call_count)
+
+        self.assertEqual([[('V3', 'PRESSURE')], []],
+                         self.registry.available_input_variables_stack[0])
+
+    def test_update_single_layer(self):
+        with mock.patch.object(
+            VariableNamesRegistry, "_layer_entries", autospec=True,
+            side_effect=VariableNamesRegistry._layer_entries
+        ) as mock_entries:
+            self.data_source3.output_slot_info = [OutputSlotInfo(name='T3')]
+            mock_entries.assert_called_once_with(
+                self.registry, self.workflow.execution_layers[1]
+            )
+
+        # Reused for the layers which did not change
+        by_type = self.registry.available_variables_by_type
+        self.data_source4.output_slot_info = [OutputSlotInfo(name='T4')]
+        new_by_type = self.registry.available_variables_by_type
+        self.assertIs(by_type[0], new_by_type[0])
+        self.assertIs(by_type[1], new_by_type[1])
+        self.assertEqual({'PRESSURE': ['T4']}, new_by_type[2])
+
+    def test_removed_data_source(self):
+        self.workflow.execution_layers.pop()
+        self.assertEqual(
+            2, len(self.registry.available_input_variables_stack)
+        )
@@ -0,0 +1,120 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import unittest
+
+from force_bdss.api import ExecutionLayer, InputSlotInfo, Workflow
+from force_bdss.tests.probe_classes.factory_registry import (
+    ProbeFactoryRegistry
+)
+
+from force_wfmanager.utils.workflow_diff import (
+    merge_models, merge_workflow
+)
+
+
+class TestWorkflowDiff(unittest.TestCase):
+    def setUp(self):
+        self.factory_registry = ProbeFactoryRegistry()
+        mco_factory = self.factory_registry.mco_factories[0]
+        parameter_factory = mco_factory.parameter_factories[0]
+        data_source_factory = self.factory_registry.data_source_factories[0]
+        listener_factory = (
+            self.factory_registry.notification_listener_factories[0]
+        )
+
+        mco_model = mco_factory.create_model()
+        mco_model.parameters = [
+            parameter_factory.create_model({"name": "P1"}),
+            parameter_factory.create_model({"name": "P2"}),
+        ]
+        self.data_sources = [
+            data_source_factory.create_model() for _ in range(3)
+        ]
+        for index, data_source in enumerate(self.data_sources):
+            data_source.input_slot_info = [
+                InputSlotInfo(name="P{}".format(index))
+            ]
+        self.workflow = Workflow(
+            mco_model=mco_model,
+            execution_layers=[
+                ExecutionLayer(data_sources=self.data_sources[:2]),
+                ExecutionLayer(data_sources=self.data_sources[2:]),
+            ],
+            notification_listeners=[listener_factory.create_model()],
+        )
+
+    def copy_workflow(self):
+        return Workflow.from_json(
+            self.factory_registry, self.workflow.__getstate__()
+        )
+
+    def test_merge_models(self):
+        copies = self.copy_workflow().execution_layers[0].data_sources
+        copies[1].input_slot_info[0].name = "changed"
+
+        merged = merge_models(self.data_sources, copies[::-1])
+        self.assertIs(copies[1], merged[0])
+        self.assertIs(self.data_sources[0], merged[1])
+
+    def test_unchanged_workflow(self):
+        new_workflow = self.copy_workflow()
+        layers = list(self.workflow.execution_layers)
+
+        self.assertFalse(merge_workflow(self.workflow, new_workflow))
+        self.assertIs(self.workflow.mco_model, new_workflow.mco_model)
+        self.assertEqual(layers, new_workflow.execution_layers)
+        self.assertEqual(
+            self.data_sources[:2],
+            new_workflow.execution_layers[0].data_sources
+        )
+        self.assertEqual(
+            self.workflow.notification_listeners,
+            new_workflow.notification_listeners
+        )
+
+    def test_changed_data_source(self):
+        new_workflow = self.copy_workflow()
+        new_data_source = new_workflow.execution_layers[0].data_sources[1]
+        new_data_source.input_slot_info[0].name = "changed"
+        layer = self.workflow.execution_layers[0]
+
+        self.assertTrue(merge_workflow(self.workflow, new_workflow))
+        self.assertIs(layer, new_workflow.execution_layers[0])
+        self.assertEqual(
+            [self.data_sources[0], new_data_source], layer.data_sources
+        )
+        self.assertEqual(
+            self.data_sources[2:],
+            new_workflow.execution_layers[1].data_sources
+        )
+
+    def test_changed_layers(self):
+        new_workflow = self.copy_workflow()
+        new_workflow.execution_layers.pop(0)
+        new_layer = ExecutionLayer()
+        new_workflow.execution_layers.append(new_layer)
+
+        self.assertTrue(merge_workflow(self.workflow, new_workflow))
+        self.assertEqual(
+            [self.workflow.execution_layers[0], new_layer],
+            new_workflow.execution_layers
+        )
+        self.assertEqual(
+            self.data_sources[2:],
+            new_workflow.execution_layers[0].data_sources
+        )
+
+    def test_changed_mco(self):
+        mco_model = self.workflow.mco_model
+        new_workflow = self.copy_workflow()
+        new_parameter = new_workflow.mco_model.parameters[1]
+        new_parameter.name = "changed"
+
+        self.assertTrue(merge_workflow(self.workflow, new_workflow))
+        self.assertIs(mco_model, new_workflow.mco_model)
+        self.assertIs(new_parameter, mco_model.parameters[1])
+
+        new_workflow = Workflow()
+        self.assertTrue(merge_workflow(self.workflow, new_workflow))
+        self.assertIsNone(new_workflow.mco_model)
@@ -1,6 +1,7 @@
 #  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
 #  All rights reserved.
 
+from itertools import chain
 import logging
 
 from traits.api import (
@@ -10,6 +11,8 @@ from traits.api import (
 from force_bdss.api import Identifier, Workflow
 from force_bdss.local_traits import CUBAType
 
+from force_wfmanager.utils.slot_signatures import slot_signature_cache
+
 log = logging.getLogger(__name__)
 
 
@@ -113,6 +116,15 @@ class VariableNamesRegistry(HasStrictTraits):
         List(Identifier), depends_on="available_input_variables_stack"
     )
 
+    # ----------------
+    #    Private
+    # ----------------
+
+    #: For each execution layer, its input and output entries in the
+    #: stacks, with the available variables and the variables by type
+    #: derived from them
+    _derived_layers = List(Tuple)
+
     def __init__(self, workflow, *args, **kwargs):
         super(VariableNamesRegistry, self).__init__(*args, **kwargs)
         self.workflow = workflow
@@ -123,23 +135,7 @@ class VariableNamesRegistry(HasStrictTraits):
 
     @cached_property
     def _get_available_variables(self):
-        output_stack = self.available_output_variables_stack
-        input_stack = self.available_input_variables_stack
-        variables = []
-
-        for input_layer, output_layer in zip(input_stack, output_stack):
-            layer_variables = []
-            generator = zip(input_layer, output_layer)
-            for input_data_source, output_data_source in generator:
-                layer_variables += [
-                    variable[0] for variable in input_data_source
-                ]
-                layer_variables += [
-                    variable[0] for variable in output_data_source
-                ]
-            variables.append(layer_variables)
-
-        return variables
+        return [variables for _, variables, _ in self._derive_layers()]
 
     @cached_property
     def _get_data_source_outputs(self):
@@ -153,34 +149,38 @@ class VariableNamesRegistry(HasStrictTraits):
 
     @cached_property
     def _get_available_variables_by_type(self):
+        return [by_type for _, _, by_type in self._derive_layers()]
+
+    def _derive_layers(self):
+        """Returns the entries, the available variables and the variables
+        by type of each layer. The derived values of the layers whose
+        entries did not change are reused."""
         output_stack = self.available_output_variables_stack
         input_stack = self.available_input_variables_stack
-        res = []
+        derived_layers = []
+
+        for index, (input_layer, output_layer) in enumerate(
+                zip(input_stack, output_stack)):
+            entries = (
+                [list(variables) for variables in input_layer],
+                [list(variables) for variables in output_layer],
+            )
+            if (index < len(self._derived_layers)
+                    and self._derived_layers[index][0] == entries):
+                derived_layers.append(self._derived_layers[index])
+                continue
 
-        for input_layer, output_layer in zip(input_stack, output_stack):
+            layer_variables = []
             res_dict = {}
-            generator = zip(input_layer, output_layer)
-            for input_data_source, output_data_source in generator:
-                for input_info in input_data_source:
-                    var_name = input_info[0]
-                    var_type = input_info[1]
-
-                    if var_type in res_dict:
-                        res_dict[var_type].append(var_name)
-                    else:
-                        res_dict[var_type] = [var_name]
-
-                for output_info in output_data_source:
-                    var_name = output_info[0]
-                    var_type = output_info[1]
-
-                    if var_type in res_dict:
-                        res_dict[var_type].append(var_name)
-                    else:
-                        res_dict[var_type] = [var_name]
-
-            res.append(res_dict)
-        return res
+            for input_data_source, output_data_source in zip(*entries):
+                for var_name, var_type in chain(
+                        input_data_source, output_data_source):
+                    layer_variables.append(var_name)
+                    res_dict.setdefault(var_type, []).append(var_name)
+            derived_layers.append((entries, layer_variables, res_dict))
+
+        self._derived_layers = derived_layers
+        return derived_layers
 
     def _get_data_source_names(self, stack):
         res = []
@@ -195,61 +195,111 @@ class VariableNamesRegistry(HasStrictTraits):
         'workflow.execution_layers.data_sources.'
         '[input_slot_info.name,output_slot_info.name]'
     )
-    def update_available_variables_stacks(self):
-        """Updates the list of available variables. At present getting
-        the datasource output slots requires creating the datasource by
-        calling ``create_data_source()``."""
+    def update_available_variables_stacks(self, changed_object=None,
+                                          name=None, old=None, new=None):
+        """Updates the list of available variables. The entries of a
+        layer only depend on its data sources, so only the layer holding
+        `changed_object` is updated, if found. At present getting the
+        datasource slots requires creating the datasource by calling
+        ``create_data_source()``, so the slots of each data source model
+        are memoised by the :data:`slot_signature_cache` until it
+        `changes_slots`."""
         # FIXME: Remove reliance on create_data_source(). If one datasource
         # FIXME: has an error, this shouldn't blow up the whole workflow.
         # FIXME: Especially during the setup phase!
+        layers = self.workflow.execution_layers
+        index = self._layer_index(changed_object)
+        if (index is None
+                or len(self.available_input_variables_stack) != len(layers)):
+            self._update_all_layers()
+            return
+
+        input_entry, output_entry = self._layer_entries(layers[index])
+        input_stack = list(self.available_input_variables_stack)
+        output_stack = list(self.available_output_variables_stack)
+        input_stack[index] = input_entry
+        output_stack[index] = output_entry
+        self.available_input_variables_stack = input_stack
+        self.available_output_variables_stack = output_stack
+
+    @on_trait_change('workflow.execution_layers.data_sources:changes_slots')
+    def _slots_changed(self, data_source_model, name, new):
+        """Updates the layer of a data source model whose slots changed"""
+        self.update_available_variables_stacks(data_source_model)
+
+    def _update_all_layers(self):
+        """Updates the entries of every layer"""
         input_stack = []
         output_stack = []
-        # At the first layer, the available variables are the MCO parameters
-
         for layer in self.workflow.execution_layers:
-            input_stack_entry_for_layer = []
-            output_stack_entry_for_layer = []
-
-            for data_source_model in layer.data_sources:
-                input_names = [
-                    info.name for info in data_source_model.input_slot_info
-                ]
-                output_names = [
-                    info.name for info in data_source_model.output_slot_info
-                ]
-
-                # This try-except is also in execute.py in force_bdss, so if
-                # this fails the workflow would not be able to run anyway.
-                try:
-                    data_source = (
-                        data_source_model.factory.create_data_source())
-
-                    # ds.slots() returns (input_slots, output_slots)
-                    input_slots = data_source.slots(data_source_model)[0]
-                    output_slots = data_source.slots(data_source_model)[1]
-                except Exception:
-                    log.exception(
-                        "Unable to create data source from factory '{}' "
-                        "in plugin '{}'. This may indicate a programming "
-                        "error in the plugin".format(
-                            data_source_model.factory.id,
-                            data_source_model.factory.plugin_id))
-                    raise
-
-                input_types = [slot.type for slot in input_slots]
-                output_types = [slot.type for slot in output_slots]
-
-                input_stack_entry_for_layer.append([
-                    (name, type) for name, type
-                    in zip(input_names, input_types) if name != ''
-                ])
-                output_stack_entry_for_layer.append([
-                    (name, type) for name, type
-                    in zip(output_names, output_types) if name != ''
-                ])
-
-            input_stack.append(input_stack_entry_for_layer)
-            output_stack.append(output_stack_entry_for_layer)
+            input_entry, output_entry = self._layer_entries(layer)
+            input_stack.append(input_entry)
+            output_stack.append(output_entry)
 
         self.available_input_variables_stack = input_stack
         self.available_output_variables_stack = output_stack
+
+    def _layer_index(self, changed_object):
+        """Returns the index of the execution layer holding
+        `changed_object`: the layer itself, one of its data source models
+        or one of their slot infos. Returns None if not found."""
+        if changed_object is None:
+            return None
+        layers = self.workflow.execution_layers
+        for index, layer in enumerate(layers):
+            if changed_object is layer:
+                return index
+            for data_source_model in layer.data_sources:
+                if changed_object is data_source_model or any(
+                    changed_object is info
+                    for info in chain(data_source_model.input_slot_info,
+                                      data_source_model.output_slot_info)
+                ):
+                    return index
+        return None
+
+    def _layer_entries(self, layer):
+        """Returns the input and output entries of the stacks for an
+        execution layer: the named (name, type) pairs of each data
+        source."""
+        input_entry = []
+        output_entry = []
+        for data_source_model in layer.data_sources:
+            input_types, output_types = self._get_slot_types(
+                data_source_model
+            )
+            input_entry.append([
+                (info.name, type) for info, type
+                in zip(data_source_model.input_slot_info, input_types)
+                if info.name != ''
+            ])
+            output_entry.append([
+                (info.name, type) for info, type
+                in zip(data_source_model.output_slot_info, output_types)
+                if info.name != ''
+            ])
+        return input_entry, output_entry
+
+    def _get_slot_types(self, data_source_model):
+        """Returns the types of the input and output slots of a data
+        source model."""
+        # This try-except is also in execute.py in force_bdss, so if
+        # this fails the workflow would not be able to run anyway.
+        try:
+            # The slots are (input_slots, output_slots)
+            input_slots, output_slots = slot_signature_cache.slots(
+                data_source_model
+            )
+        except Exception:
+            log.exception(
+                "Unable to create data source from factory '{}' "
+                "in plugin '{}'. This may indicate a programming "
+                "error in the plugin".format(
+                    data_source_model.factory.id,
+                    data_source_model.factory.plugin_id))
+            raise
+
+        return (
+            [slot.type for slot in input_slots],
+            [slot.type for slot in output_slots],
+        )
@@ -0,0 +1,151 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+from collections import defaultdict
+from itertools import chain
+import json
+
+#: Keys of the state of an MCO model which are merged item by item
+MCO_LIST_KEYS = ("parameters", "kpis")
+
+
+def state_key(model):
+    """ Returns a hashable key of the state of `model`, equal for the models
+    which would be written identically in a workflow file."""
+    return json.dumps(model.__getstate__(), sort_keys=True, default=str)
+
+
+def mco_state_key(mco_model):
+    """ Returns the :func:`state_key` of `mco_model`, regardless of its
+    parameters and KPIs."""
+    state = mco_model.__getstate__()
+    model_data = {
+        key: value for key, value in state.get("model_data", {}).items()
+        if key not in MCO_LIST_KEYS
+    }
+    return json.dumps(
+        dict(state, model_data=model_data), sort_keys=True, default=str
+    )
+
+
+def _models_by_state(models):
+    """ Returns the lists of `models` by :func:`state_key`"""
+    models_by_state = defaultdict(list)
+    for model in models:
+        models_by_state[state_key(model)].append(model)
+    return models_by_state
+
+
+def _reuse_models(models_by_state, new_models):
+    """ Returns `new_models`, with the models having the same state as one
+    of `models_by_state` replaced by the latter, which are removed from
+    `models_by_state`."""
+    merged = []
+    for new_model in new_models:
+        candidates = models_by_state.get(state_key(new_model))
+        merged.append(candidates.pop(0) if candidates else new_model)
+    return merged
+
+
+def merge_models(models, new_models):
+    """ Returns `new_models`, with the models having the same state as one
+    of `models` replaced by the latter.
+
+    Parameters
+    ----------
+    models: list of BaseModel
+        The current models
+    new_models: list of BaseModel
+        The models to merge in
+
+    Returns
+    -------
+    merged: list of BaseModel
+        The merged models, in the order of `new_models`
+    """
+    return _reuse_models(_models_by_state(models), new_models)
+
+
+def _same_models(models, other_models):
+    """ Returns whether two lists hold the same model objects"""
+    return len(models) == len(other_models) and all(
+        model is other_model
+        for model, other_model in zip(models, other_models)
+    )
+
+
+def _assign_list(obj, name, models):
+    """ Assigns `models` to the list trait `name` of `obj`, unless it holds
+    the same models already. Returns True if the list was assigned."""
+    if _same_models(getattr(obj, name), models):
+        return False
+    setattr(obj, name, models)
+    return True
+
+
+def merge_workflow(workflow, new_workflow):
+    """ Updates `new_workflow` to hold the models of `workflow` whose state
+    is unchanged, so that the modelviews of `workflow` can be reused for
+    `new_workflow`, and only the modelviews of the changed models need to
+    be created.
+
+    The MCO model is reused if its factory and options are unchanged, in
+    which case its parameters and KPIs are merged. The execution layers are
+    matched by position, and the unchanged data sources are reused in
+    whichever layer they are moved to. The notification listeners are
+    merged with :func:`merge_models`. The reused MCO model and execution
+    layers are updated in place, and are therefore shared by both
+    workflows afterwards.
+
+    Parameters
+    ----------
+    workflow: Workflow
+        The current workflow, whose models are reused
+    new_workflow: Workflow
+        The workflow replacing `workflow`
+
+    Returns
+    -------
+    changed: bool
+        Whether `new_workflow` differs from `workflow`
+    """
+    changed = False
+
+    mco_model = workflow.mco_model
+    new_mco_model = new_workflow.mco_model
+    if (mco_model is not None and new_mco_model is not None
+            and mco_state_key(mco_model) == mco_state_key(new_mco_model)):
+        for name in MCO_LIST_KEYS:
+            changed |= _assign_list(mco_model, name, merge_models(
+                getattr(mco_model, name), getattr(new_mco_model, name)
+            ))
+        new_workflow.mco_model = mco_model
+    elif mco_model is not None or new_mco_model is not None:
+        changed = True
+
+    layers = workflow.execution_layers
+    new_layers = new_workflow.execution_layers
+    data_sources_by_state = _models_by_state(chain.from_iterable(
+        layer.data_sources for layer in layers
+    ))
+    for layer, new_layer in zip(layers, new_layers):
+        changed |= _assign_list(layer, "data_sources", _reuse_models(
+            data_sources_by_state, new_layer.data_sources
+        ))
+    for new_layer in new_layers[len(layers):]:
+        new_layer.data_sources = _reuse_models(
+            data_sources_by_state, new_layer.data_sources
+        )
+    changed |= len(layers) != len(new_layers)
+    new_workflow.execution_layers = (
+        layers[:len(new_layers)] + new_layers[len(layers):]
+    )
+
+    new_workflow.notification_listeners = merge_models(
+        workflow.notification_listeners,
+        new_workflow.notification_listeners
+    )
+    changed |= not _same_models(
+        workflow.notification_listeners, new_workflow.notification_listeners
+    )
+    return changed
@@ -82,6 +82,16 @@ class WfManagerGlobalTask(TaskExtension):
                     enabled_name="setup_task.save_load_enabled",
                     accelerator="Shift+Ctrl+S",
                 ),
+                TaskAction(
+                    name="Run Parameter Sweep...",
+                    method="setup_task.run_sweep",
+                    enabled_name="setup_task.run_enabled",
+                ),
+                TaskAction(
+                    name="Resume Run...",
+                    method="setup_task.resume_bdss",
+                    enabled_name="setup_task.run_enabled",
+                ),
                 TaskAction(name="Plugins...",
                            method="setup_task.open_plugins"),
                 name="&File",
@@ -11,6 +11,7 @@ from traits.api import Bool, Instance, List, on_trait_change
 from force_bdss.api import Workflow
 
 from force_wfmanager.model.analysis_model import AnalysisModel
+from force_wfmanager.model.resource_telemetry import ResourceTelemetry
 from force_wfmanager.ui.review.data_view_pane import DataViewPane
 from force_wfmanager.ui.review.results_pane import ResultsPane
 from force_wfmanager.io.project_io import write_project_file, load_project_file
@@ -39,14 +40,17 @@ class WfManagerReviewTask(Task):
 
     #: Workflow model used to create the review in the analysis model.
     #: This trait no longer tracks the workflow stored under
-    #: :attr:`setup_task.workflow_model` and instead is only updated
-    #: when a new run is started.
+    #: :attr:`setup_task.workflow_model` and instead is the snapshot
+    #: executed by the selected run.
     workflow_model = Instance(Workflow, allow_none=True)
 
     #: Analysis model. Contains the results that are displayed in the plot
     #: and table
     analysis_model = Instance(AnalysisModel, allow_none=False)
 
+    #: Resource usage of the BDSS processes of the selected run
+    telemetry = Instance(ResourceTelemetry, ())
+
     #: Is the results saving button enabled, i.e. are there results?
     export_results_enabled = Bool(False)
 
@@ -101,7 +105,9 @@ class WfManagerReviewTask(Task):
         """ Creates the central pane which contains the analysis part
         (pareto front and output KPI values)
         """
-        central_pane = DataViewPane(analysis_model=self.analysis_model)
+        central_pane = DataViewPane(
+            analysis_model=self.analysis_model, telemetry=self.telemetry
+        )
         self.central_pane = central_pane
         return central_pane
 
@@ -109,6 +115,13 @@ class WfManagerReviewTask(Task):
         """ Creates the dock panes """
         return [self.side_pane]
 
+    def activated(self):
+        """ Overrides method from Task. Shows the data view when the task
+        is first activated: the plotting libraries are not imported until
+        the results are reviewed."""
+        if self.central_pane is not None:
+            self.central_pane.show_data_view()
+
     # Default initialisers
 
     def _side_pane_default(self):
@@ -275,9 +288,14 @@ class WfManagerReviewTask(Task):
             )
             self.setup_task.workflow_model = new_workflow
 
-            # share the analysis model with the setup_task
-            self.analysis_model.from_json(analysis_model_dict)
-            self.setup_task.analysis_model = self.analysis_model
+            # share the analysis model with the setup_task. A new model
+            # is created, as the current one may hold the results of a run.
+            analysis_model = AnalysisModel()
+            analysis_model.from_json(analysis_model_dict)
+            self.setup_task.current_run = None
+            self.side_pane.selected_run = None
+            self.analysis_model = analysis_model
+            self.setup_task.analysis_model = analysis_model
         except IOError as e:
             error(
                 None,
@@ -309,19 +327,41 @@ class WfManagerReviewTask(Task):
                     self.setup_task = task
                     self.analysis_model = self.setup_task.analysis_model
 
-    @on_trait_change("setup_task.computation_running")
-    def cache_running_workflow(self):
-        """ When a new computation starts running, save a copy of the
-        :attr:`setup_task.workflow_model` as :attr:workflow_model` that
-        can be used when saving the results of the run alongside the
-        workflow that created it.
+    @on_trait_change("setup_task.current_run")
+    def sync_current_run(self):
+        """ When a run is selected or started, display its results and
+        keep the snapshot of the workflow that created them, so that they
+        can be saved together.
         """
-
-        if self.setup_task.computation_running:
-            self.workflow_model = Workflow.from_json(
-                self.setup_task.factory_registry,
-                self.setup_task.workflow_model.__getstate__(),
-            )
+        run = self.setup_task.current_run
+        if run is not None:
+            self.workflow_model = run.workflow_model
+            self.analysis_model = run.analysis_model
+            self.telemetry = run.telemetry
+        self.side_pane.selected_run = run
+
+    @on_trait_change("setup_task.run_scheduler.runs[]")
+    def sync_runs(self):
+        """ Lists the runs of the setup task in the results pane."""
+        self.side_pane.runs = list(self.setup_task.run_scheduler.runs)
+
+    @on_trait_change("side_pane.selected_run")
+    def select_run(self, run):
+        """ Switches the displayed results to the run selected by the
+        user. The run also becomes the one controlled by the toolbar."""
+        if run is not None and self.setup_task is not None:
+            self.setup_task.current_run = run
+
+    @on_trait_change("analysis_model", post_init=True)
+    def update_panes_analysis_model(self):
+        self.side_pane.analysis_model = self.analysis_model
+        if self.central_pane is not None:
+            self.central_pane.analysis_model = self.analysis_model
+
+    @on_trait_change("telemetry", post_init=True)
+    def update_panes_telemetry(self):
+        if self.central_pane is not None:
+            self.central_pane.telemetry = self.telemetry
 
     # Menu/Toolbar Methods
 
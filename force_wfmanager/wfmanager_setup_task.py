@@ -1,10 +1,9 @@
 #  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
 #  All rights reserved.
 
-from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import os
 import logging
-import subprocess
 import tempfile
 import textwrap
 import webbrowser
@@ -24,26 +23,49 @@ from pyface.api import (
 from pyface.tasks.action.api import SMenuBar, SToolBar, TaskAction
 from pyface.tasks.api import PaneItem, Task, TaskLayout
 from traits.api import (
-    Bool, File, Instance, List, on_trait_change, Str, Property)
+    Bool, Enum, File, Float, Instance, Int, List, on_trait_change, Property,
+    Str, Tuple)
 
 from force_bdss.api import (
     BaseExtensionPlugin,
     BaseUIHooksManager,
     IFactoryRegistry,
-    MCOStartEvent,
-    MCOProgressEvent,
-    MCORuntimeEvent,
     InvalidFileException,
     Workflow,
 )
 
+from force_wfmanager.io.checkpoint_io import checkpoint_file_name
+from force_wfmanager.io.sweep_io import load_sweep_file
 from force_wfmanager.io.workflow_io import (
     write_workflow_file,
     load_workflow_file,
 )
 from force_wfmanager.model.analysis_model import AnalysisModel
+from force_wfmanager.model.bdss_run import (
+    BDSSRun,
+    RUN_FAILED,
+    RUN_FINISHED,
+    RUN_QUEUED,
+    RUN_RUNNING,
+    RUN_STOPPED,
+)
+from force_wfmanager.model.evaluation_store import (
+    EvaluationStore,
+    workflow_structure_key,
+)
+from force_wfmanager.model.result_cache import (
+    ResultCache,
+    workflow_cache_key,
+)
+from force_wfmanager.plugins.lazy_extension_plugin import (
+    LazyExtensionPlugin,
+    load_plugins,
+)
 from force_wfmanager.plugins.plugin_dialog import PluginDialog
-from force_wfmanager.server.zmq_server import ZMQServer
+from force_wfmanager.server.execution_backend import LocalExecutionBackend
+from force_wfmanager.server.i_execution_backend import IExecutionBackend
+from force_wfmanager.server.run_scheduler import RunScheduler
+from force_wfmanager.server.zmq_server import READY_TIMEOUT, ZMQServer
 from force_wfmanager.ui import (
     ContributedUI,
     ContributedUIHandler,
@@ -52,9 +74,13 @@ from force_wfmanager.ui import (
 from force_wfmanager.ui.setup.setup_pane import SetupPane
 from force_wfmanager.ui.setup.side_pane import SidePane
 from force_wfmanager.ui.setup.system_state import SystemState
+from force_wfmanager.utils.startup_timer import startup_timer
 
 from force_wfmanager.wfmanager import TaskToggleGroupAccelerator
-from force_wfmanager.io.project_io import load_analysis_model
+from force_wfmanager.io.project_io import (
+    load_analysis_model,
+    load_project_file,
+)
 
 log = logging.getLogger(__name__)
 
@@ -70,7 +96,7 @@ class WfManagerSetupTask(Task):
     workflow_model = Instance(Workflow, allow_none=False)
 
     #: Analysis model. Contains the review that are displayed in the plot
-    #: and table
+    #: and table. Follows the results of the :attr:`current_run`.
     analysis_model = Instance(AnalysisModel, allow_none=False)
 
     #: Registry of the available factories
@@ -97,8 +123,8 @@ class WfManagerSetupTask(Task):
     #: Indicates whether the 'run' toolbar and side pane buttons are active
     run_enabled = Bool(True)
 
-    #: Indicates whether the computation is paused and waits to resume
-    _paused = Bool(False)
+    #: Indicates whether the current run is paused and waits to resume
+    _paused = Property(Bool, depends_on='current_run.paused')
 
     #: Utility property used to indicate switch between 'Pause' and 'Resume'
     #: toolbar objects
@@ -108,18 +134,55 @@ class WfManagerSetupTask(Task):
     #: active.
     save_load_enabled = Bool(True)
 
-    #: Indicates whether there a bdss computation running
-    computation_running = Bool(False)
+    #: Indicates whether the current run is queued or being executed
+    #: by the BDSS
+    computation_running = Property(Bool, depends_on='current_run.status')
+
+    #: Queue of the BDSS runs. Launches the runs concurrently, within a
+    #: core budget.
+    run_scheduler = Instance(RunScheduler)
+
+    #: The run that is controlled by the Stop/Pause buttons, and whose
+    #: results are displayed.
+    current_run = Instance(BDSSRun)
+
+    #: Parameter sweeps with runs still queued or executing. Each entry
+    #: holds the sweep, its name and the (label, run) of each variant.
+    _pending_sweeps = List(Tuple)
+
+    #: Number of parameter sweeps started in this session
+    _sweep_count = Int(0)
+
+    #: Executes the runs launched by the :attr:`run_scheduler`. By
+    #: default, the BDSS executable is spawned on the local machine.
+    execution_backend = Instance(IExecutionBackend)
+
+    #: Cache of the results of the finished runs. Before running a workflow
+    #: which was already run with the same plugins, the user is offered to
+    #: load the cached results instead. None disables the cache.
+    result_cache = Instance(ResultCache)
+
+    #: Store of the evaluations of the previous runs. It is fed with the
+    #: rows of each run, and the BDSS can look up the known evaluations
+    #: before evaluating. None disables the store.
+    evaluation_store = Instance(EvaluationStore)
 
-    #: The thread pool executor to spawn the BDSS CLI process.
-    executor = Instance(ThreadPoolExecutor)
+    #: Directory of the checkpoints of the runs, from which an interrupted
+    #: run can be resumed. An empty string disables the checkpoints.
+    checkpoint_directory = Str()
 
-    #: Path to spawn for the BDSS CLI executable.
-    #: This will go to some global configuration option later.
-    bdss_executable_path = Str("force_bdss")
+    #: Minimum number of seconds between two checkpoints of a run
+    checkpoint_interval = Float(30.0)
 
-    #: ZeroMQ Server to receive information from the running BDSS
-    zmq_server = Instance(ZMQServer)
+    #: Seconds during which the verification requests of the workflow are
+    #: coalesced, before verifying it in a secondary thread. Zero verifies
+    #: the workflow synchronously on each request.
+    verification_delay = Float(0.0)
+
+    #: Transport used by the ZeroMQ Servers receiving information from the
+    #: running BDSS. Unix domain sockets are used for local runs where
+    #: available, with TCP on the loopback interface as a fallback.
+    zmq_transport = Enum(ZMQServer.TRANSPORT_IPC, ZMQServer.TRANSPORT_TCP)
 
     #: A list of UI hooks managers. These hold plugin injected "hook managers",
     #: classes with methods that are called when some operation is performed
@@ -221,6 +284,7 @@ class WfManagerSetupTask(Task):
             workflow_model=self.workflow_model,
             factory_registry=self.factory_registry,
             system_state=self.system_state,
+            verification_delay=self.verification_delay,
         )
 
     def _analysis_model_default(self):
@@ -241,24 +305,33 @@ class WfManagerSetupTask(Task):
                 )
         return managers
 
-    def _executor_default(self):
-        return ThreadPoolExecutor(max_workers=1)
-
-    def _zmq_server_default(self):
-        return ZMQServer(
-            on_event_callback=self._server_event_callback,
-            on_error_callback=self._server_error_callback,
+    def _execution_backend_default(self):
+        # The scheduler never launches more runs than cores in its budget
+        return LocalExecutionBackend(
+            max_runs=self.run_scheduler.core_budget
         )
 
+    def _run_scheduler_default(self):
+        return RunScheduler(launcher=self._launch_run)
+
     # ------------------
     #     Listeners
     # ------------------
 
+    def _get__paused(self):
+        return self.current_run is not None and self.current_run.paused
+
     def _get__not_paused(self):
         """Simple property used to control visibility of Resume' toolbar
         object"""
         return not self._paused
 
+    def _get_computation_running(self):
+        return (
+            self.current_run is not None
+            and self.current_run.status in (RUN_QUEUED, RUN_RUNNING)
+        )
+
     # Synchronization with side pane (Tree Pane)
     @on_trait_change("side_pane.run_enabled")
     def set_toolbar_run_btn_state(self):
@@ -276,15 +349,13 @@ class WfManagerSetupTask(Task):
         change as the user modifies a workflow via the UI."""
         self.side_pane.workflow_model = self.workflow_model
 
-    @on_trait_change("computation_running")
-    def update_pane_active_status(self):
-        """Disables the saving/loading toolbar buttons and the SetupPane UI
-        if a computation is running, and re-enables them when it finishes."""
-
-        self.side_pane.ui_enabled = not self.computation_running
-        self.setup_pane.ui_enabled = not self.computation_running
-        self.save_load_enabled = not self.computation_running
-        self.run_enabled = not self.computation_running
+    @on_trait_change("current_run")
+    def update_analysis_model(self):
+        """Displays the results of the current run. The workflow executed
+        by each run is a snapshot, so the workflow can still be edited
+        and run again while other runs are being executed."""
+        if self.current_run is not None:
+            self.analysis_model = self.current_run.analysis_model
 
     # Method call from side pane interaction
     @on_trait_change("side_pane.run_button")
@@ -306,36 +377,6 @@ class WfManagerSetupTask(Task):
     #   Private Methods
     # ------------------
 
-    def _execute_bdss(self, workflow_path):
-        """Secondary thread executor routine.
-        This executes the BDSS and wait for its completion.
-        """
-        try:
-            subprocess.check_call([self.bdss_executable_path, workflow_path])
-        except OSError as e:
-            log.exception(
-                "Error while executing force_bdss executable. "
-                " Is force_bdss in your path?"
-            )
-            self._clean_tmp_workflow(workflow_path, silent=True)
-            raise e
-        except subprocess.CalledProcessError as e:
-            # Ignore any error of execution.
-            log.exception(
-                "force_bdss returned a non-zero value after execution"
-            )
-            self._clean_tmp_workflow(workflow_path, silent=True)
-            raise e
-        except Exception as e:
-            log.exception(
-                "Unknown exception occurred "
-                "while invoking force bdss executable."
-            )
-            self._clean_tmp_workflow(workflow_path, silent=True)
-            raise e
-
-        self._clean_tmp_workflow(workflow_path)
-
     def _clean_tmp_workflow(self, workflow_path, silent=False):
         """Removes the temporary file for the workflow.
 
@@ -359,24 +400,119 @@ class WfManagerSetupTask(Task):
             if not silent:
                 raise e
 
-    def _execution_done_callback(self, future):
+    def _launch_run(self, run):
+        """Called by the run scheduler in the main thread, when `run` can
+        be started. Starts the ZMQ server of the run and executes the BDSS
+        on a different thread.
+
+        Parameters
+        ----------
+        run: BDSSRun
+            The run to launch
+        """
+        self._attach_evaluation_store(run)
+        self._attach_checkpoint(run)
+        try:
+            run.zmq_server = self._create_zmq_server(run)
+            run.zmq_server.start()
+            if not run.zmq_server.wait_until_ready(READY_TIMEOUT):
+                raise RuntimeError("Unable to start the ZMQ server.")
+
+            # Run any plugin injected ui hooks before execution
+            # For example, the UI Notification Hooks Manager sets up
+            # sockets to communicate with the server of the run
+            for hook_manager in self.ui_hooks_managers:
+                try:
+                    hook_manager.before_execution(run)
+                except Exception:
+                    log.exception(
+                        "Failed before_execution hook "
+                        "for hook manager {}".format(
+                            hook_manager.__class__.__name__
+                        )
+                    )
+
+            # Creates a temporary file containing the workflow
+            tmpfile_path = tempfile.mktemp()
+            write_workflow_file(run.workflow_model, tmpfile_path)
+
+            future = self.execution_backend.submit(run, tmpfile_path)
+            future.add_done_callback(
+                partial(self._execution_done_callback, run, tmpfile_path)
+            )
+        except Exception as e:
+            log.exception("Unable to run BDSS.")
+            self._stop_zmq_server(run)
+            self.run_scheduler.run_finished(run, RUN_FAILED)
+            error(
+                None,
+                "Unable to run BDSS: {}".format(e),
+                "Error when running BDSS",
+            )
+
+    def _attach_evaluation_store(self, run):
+        """Lets `run` feed and query the evaluation store, if enabled"""
+        if self.evaluation_store is None:
+            return
+        try:
+            run.workflow_key = workflow_structure_key(
+                run.workflow_model, self._plugin_versions()
+            )
+        except Exception:
+            log.exception("Unable to compute the evaluation store key.")
+            return
+        run.evaluation_store = self.evaluation_store
+
+    def _attach_checkpoint(self, run):
+        """Lets `run` write checkpoints, if enabled. A resumed run keeps
+        writing to the checkpoint it was resumed from."""
+        if not self.checkpoint_directory:
+            return
+        if not run.checkpoint_path:
+            run.checkpoint_path = os.path.join(
+                self.checkpoint_directory, checkpoint_file_name(run)
+            )
+        run.checkpoint_interval = self.checkpoint_interval
+
+    def _create_zmq_server(self, run):
+        """Creates the ZMQ server receiving the events of `run`"""
+        return ZMQServer(
+            on_event_callback=partial(self._server_event_callback, run),
+            on_error_callback=self._server_error_callback,
+            transport=self.zmq_transport,
+            on_lookup_callback=run.lookup_evaluation,
+            on_history_callback=run.evaluation_history,
+        )
+
+    def _stop_zmq_server(self, run):
+        """Stops the ZMQ server of `run`, if any"""
+        if run.zmq_server is not None:
+            run.zmq_server.stop()
+
+    def _execution_done_callback(self, run, workflow_path, future):
         """Secondary thread code.
         Called when the execution is completed.
         """
         exc = future.exception()
-        GUI.invoke_later(self._bdss_done, exc)
+        try:
+            self._clean_tmp_workflow(workflow_path, silent=exc is not None)
+        except OSError as e:
+            exc = e
+        GUI.invoke_later(self._bdss_done, run, exc)
 
-    def _bdss_done(self, exception):
+    def _bdss_done(self, run, exception):
         """Called in the main thread when the execution is completed.
 
         Parameters
         ----------
+        run: BDSSRun
+            The run whose execution completed.
         exception: Exception or None
             If the execution raised an exception of any sort.
         """
         for hook_manager in self.ui_hooks_managers:
             try:
-                hook_manager.after_execution(self)
+                hook_manager.after_execution(run)
             except Exception:
                 log.exception(
                     "Failed after_execution hook "
@@ -385,7 +521,22 @@ class WfManagerSetupTask(Task):
                     )
                 )
 
-        self.computation_running = False
+        self._stop_zmq_server(run)
+
+        if exception is None:
+            status = RUN_FINISHED
+        elif run.stop_requested:
+            status = RUN_STOPPED
+        else:
+            status = RUN_FAILED
+        self.run_scheduler.run_finished(run, status)
+
+        if status == RUN_FINISHED:
+            self._cache_results(run)
+            run.remove_checkpoint()
+        else:
+            # Keeps the latest results, so that the run can be resumed
+            run.write_checkpoint()
 
         if exception is not None:
             if str(exception) == "BDSS stopped" or isinstance(
@@ -399,40 +550,38 @@ class WfManagerSetupTask(Task):
                     "Error when running BDSS",
                 )
 
+    def _cache_results(self, run):
+        """ Stores the results of the finished `run` in the result cache,
+        if it is enabled"""
+        if (self.result_cache is None or not run.cache_key
+                or run.analysis_model.is_empty):
+            return
+        try:
+            self.result_cache.put(run.cache_key, run.analysis_model)
+        except Exception:
+            log.exception("Unable to store the results in the result cache.")
+
     # Handling of BDSS events via ZMQ server
-    def _server_event_callback(self, event):
-        """Callback that is called by the server thread
+    def _server_event_callback(self, run, event):
+        """Callback that is called by the server thread of `run`
         when a new event is received. This method is
         executed by the server thread.
         """
-        GUI.invoke_later(self._server_event_mainthread, event)
+        GUI.invoke_later(self._server_event_mainthread, run, event)
 
     def _server_error_callback(self, error_type, error_message):
         """Callback in case of server error. Invoked by the secondary thread"""
         if error_type == ZMQServer.ERROR_TYPE_CRITICAL:
             GUI.invoke_later(self._show_error_dialog, error_message)
 
-    def _server_event_mainthread(self, event):
+    def _server_event_mainthread(self, run, event):
         """Invoked by the main thread.
-        Handles the event received by the server, dispatching its
-        action appropriately according to the type.
+        Handles the event received by the server of `run`.
         Note: All the decision making related to the AnalysisModel
-        should be done by the AnalysisModel, not the setup task.
-        The AnalysisModel should receive the event instance and process
-        the events itself.
+        should be done by the run and its AnalysisModel, not the
+        setup task.
         """
-        if isinstance(event, MCOStartEvent):
-            self.analysis_model.clear()
-            self.computation_running = True
-
-        if isinstance(
-            event, (MCOStartEvent, MCOProgressEvent, MCORuntimeEvent)
-        ):
-            event_data = event.serialize()
-            self.analysis_model.notify(
-                event_data,
-                metadata=isinstance(event, MCORuntimeEvent)
-            )
+        run.notify_event(event)
 
     # Error Display
     def _show_error_dialog(self, message):
@@ -455,85 +604,257 @@ class WfManagerSetupTask(Task):
 
     # ZMQ Setup
     def initialized(self):
-        """Overrides method from Task. Starts the ZMQ Server when this Task is
-        initialized
+        """Overrides method from Task. Starts the execution backend, e.g.
+        so that warm workers load the plugins before the first run
         """
-        self.zmq_server.start()
+        with startup_timer.span("setup task initialization"):
+            self.execution_backend.start()
 
     def prepare_destroy(self):
-        """Overrides method from Task. Stops the ZMQ Server when this Task is
-        about to be destroyed
+        """Overrides method from Task. Stops the ZMQ Servers of the running
+        BDSS runs, the background verifications of the workflow and the
+        execution backend, when this Task is about to be destroyed
         """
-        self.zmq_server.stop()
+        for run in self.run_scheduler.running_runs:
+            self._stop_zmq_server(run)
+        self.side_pane.stop_verifications()
+        self.execution_backend.shutdown()
+        if self.evaluation_store is not None:
+            self.evaluation_store.close()
 
     # BDSS Interaction
     def run_bdss(self):
-        """ Run the BDSS computation """
+        """ Queues a new run of the current workflow. The run is executed
+        by the BDSS as soon as enough cores are available in the budget
+        of the run scheduler, and its results are kept separately from
+        the ones of the previous runs."""
+        try:
+            # Take a snapshot, so that the workflow can be edited while
+            # the run is queued or executing
+            workflow_model = Workflow.from_json(
+                self.factory_registry, self.workflow_model.__getstate__()
+            )
+        except Exception as e:
+            log.exception("Unable to run BDSS.")
+            error(
+                None,
+                "Unable to run BDSS: {}".format(e),
+                "Error when running BDSS",
+            )
+            return
+
+        run = BDSSRun(
+            workflow_model=workflow_model,
+            factory_registry=self.factory_registry,
+        )
+        if self.result_cache is not None and self._load_cached_results(run):
+            return
+
+        self.current_run = run
+        self.run_scheduler.submit(run)
+
+    def _load_cached_results(self, run):
+        """ Computes the result cache key of `run` and, if results are
+        cached for it, offers the user to load them instead of running
+        the BDSS. Returns whether the cached results were loaded."""
+        try:
+            run.cache_key = self._result_cache_key(run.workflow_model)
+            if not self.result_cache.contains(run.cache_key):
+                return False
+        except Exception:
+            log.exception("Unable to look up the result cache.")
+            return False
+
+        answer = confirm(
+            None,
+            "This workflow was already run with the same plugins.\n\n"
+            "Load the cached results instead of running the BDSS?",
+            "Cached results available",
+        )
+        if answer != YES:
+            return False
+
+        analysis_model = self.result_cache.get(run.cache_key)
+        if analysis_model is None:
+            return False
+
+        run.name = "Cached results"
+        run.analysis_model = analysis_model
+        run.status = RUN_FINISHED
+        self.run_scheduler.record(run)
+        self.current_run = run
+        return True
+
+    def _result_cache_key(self, workflow_model):
+        """ Returns the result cache key of `workflow_model`, executed
+        with the currently loaded plugins"""
+        return workflow_cache_key(workflow_model, self._plugin_versions())
+
+    def _plugin_versions(self):
+        """ Returns the version of each loaded plugin, by plugin id"""
+        return {
+            plugin.id: plugin.version for plugin in self.lookup_plugins()
+        }
+
+    def run_sweep(self):
+        """ Shows a dialog to open a parameter sweep specification, and
+        queues a run for each variant of the current workflow. The
+        results of the variants are merged when they have all completed.
+        """
+        dialog = FileDialog(
+            action="open", wildcard="JSON files (*.json)|*.json"
+        )
+        result = dialog.open()
+
+        if result is not OK:
+            return False
+
+        return self._run_sweep_file(dialog.path)
 
-        # Confirm we want to run a calculation
-        if len(self.analysis_model.evaluation_steps) != 0:
-            result = confirm(
+    def _run_sweep_file(self, file_path):
+        """ Queues the variants of the sweep specified in `file_path`."""
+        try:
+            workflow_model = Workflow.from_json(
+                self.factory_registry, self.workflow_model.__getstate__()
+            )
+            sweep = load_sweep_file(
+                workflow_model, self.factory_registry, file_path
+            )
+            variants = sweep.create_variants()
+        except Exception as e:
+            log.exception("Unable to run the parameter sweep.")
+            error(
                 None,
-                "Are you sure you want to run the computation and "
-                "empty the result table?",
+                "Unable to run the parameter sweep:\n\n{}".format(e),
+                "Error when running the parameter sweep",
             )
-            if result is not YES:
-                return
+            return False
 
-        # Run any plugin injected ui hooks before execution
-        # For example, the UI Notification Hooks Manager sets up sockets
-        # to communicate with the server before executing a workflow
+        self._sweep_count += 1
+        name = f"Sweep {self._sweep_count}"
+        labelled_runs = [
+            (label, BDSSRun(
+                name=f"{name}: {label}",
+                workflow_model=variant_model,
+                factory_registry=self.factory_registry,
+            ))
+            for label, variant_model in variants
+        ]
+        self._pending_sweeps.append((sweep, name, labelled_runs))
+        for _, run in labelled_runs:
+            self.run_scheduler.submit(run)
+        if labelled_runs:
+            self.current_run = labelled_runs[0][1]
+        return True
+
+    @on_trait_change("run_scheduler.runs.status")
+    def _check_pending_sweeps(self):
+        """ Merges the results of the sweeps whose runs have all
+        completed."""
+        for pending_sweep in list(self._pending_sweeps):
+            _, _, labelled_runs = pending_sweep
+            if not any(
+                run.status in (RUN_QUEUED, RUN_RUNNING)
+                for _, run in labelled_runs
+            ):
+                self._pending_sweeps.remove(pending_sweep)
+                self._sweep_done(*pending_sweep)
+
+    def _sweep_done(self, sweep, name, labelled_runs):
+        """ Adds a run holding the merged results of the variants of
+        `sweep`, and displays it."""
         try:
-            for hook_manager in self.ui_hooks_managers:
-                try:
-                    hook_manager.before_execution(self)
-                except Exception:
-                    log.exception(
-                        "Failed before_execution hook "
-                        "for hook manager {}".format(
-                            hook_manager.__class__.__name__
-                        )
-                    )
+            analysis_model = sweep.merge_results(
+                [(label, run.analysis_model) for label, run in labelled_runs]
+            )
+        except Exception as e:
+            log.exception(f"Unable to merge the results of {name}.")
+            error(
+                None,
+                "Unable to merge the results of {}:\n\n{}".format(name, e),
+                "Error when running the parameter sweep",
+            )
+            return
 
-            # Creates a temporary file containing the workflow
-            tmpfile_path = tempfile.mktemp()
-            write_workflow_file(self.workflow_model, tmpfile_path)
+        run = BDSSRun(
+            name=f"{name} (merged)",
+            workflow_model=sweep.workflow_model,
+            factory_registry=self.factory_registry,
+            analysis_model=analysis_model,
+            status=RUN_FINISHED,
+        )
+        self.run_scheduler.record(run)
+        self.current_run = run
 
-            # Clear the analysis model before attempting to run
-            self.analysis_model.clear()
+    def resume_bdss(self):
+        """ Shows a dialog to open the checkpoint of an interrupted run,
+        and queues a run resuming it."""
+        dialog = FileDialog(
+            action="open",
+            wildcard="JSON files (*.json)|*.json",
+            default_directory=self.checkpoint_directory,
+        )
+        result = dialog.open()
 
-            # Execute the bdss on a different thread
-            future = self.executor.submit(self._execute_bdss, tmpfile_path)
-            future.add_done_callback(self._execution_done_callback)
+        if result is not OK:
+            return False
+
+        return self._resume_checkpoint_file(dialog.path)
+
+    def _resume_checkpoint_file(self, file_path):
+        """ Queues a run of the workflow of the checkpoint in `file_path`,
+        which starts from the results of the checkpoint. The evaluations
+        of the checkpoint are served to the BDSS, so that the MCO can skip
+        them, and the checkpoint is updated by the new run.
+        """
+        try:
+            analysis_model_data, workflow_model = load_project_file(
+                self.factory_registry, file_path
+            )
+            run = BDSSRun(
+                name="Resumed {}".format(os.path.basename(file_path)),
+                workflow_model=workflow_model,
+                factory_registry=self.factory_registry,
+                checkpoint_path=file_path,
+            )
+            run.resume(analysis_model_data)
         except Exception as e:
-            logging.exception("Unable to run BDSS.")
+            log.exception("Unable to resume the run.")
             error(
                 None,
-                "Unable to run BDSS: {}".format(e),
-                "Error when running BDSS",
+                "Unable to resume the run:\n\n{}".format(e),
+                "Error when resuming the run",
             )
-            self.computation_running = False
+            return False
+
+        self.current_run = run
+        self.run_scheduler.submit(run)
+        return True
 
     def stop_bdss(self):
-        self.zmq_server.publish_message("STOP_BDSS")
-        self._paused = False
+        """Stops the current run, or removes it from the queue if it
+        has not been launched yet"""
+        if self.current_run is None:
+            return
+
+        if not self.run_scheduler.cancel(self.current_run):
+            self.execution_backend.stop(self.current_run)
 
     def pause_bdss(self):
-        """Pause an MCO run"""
-        if self._paused:
-            message = "RESUME_BDSS"
-        else:
-            message = "PAUSE_BDSS"
-        self.zmq_server.publish_message(message)
-        self._paused = not self._paused
+        """Pause (or resume) the MCO of the current run"""
+        if self.current_run is not None and self.current_run.is_running:
+            self.execution_backend.pause(self.current_run)
 
     # Plugin Status
     def lookup_plugins(self):
-
+        """Returns the BDSS plugins of the application, sorted by name.
+        The plugins which are not imported yet are returned as
+        :class:`LazyExtensionPlugin`, which hold their id, name and version.
+        """
         plugins = [
             plugin
             for plugin in self.window.application.plugin_manager
-            if isinstance(plugin, BaseExtensionPlugin)
+            if isinstance(plugin, (BaseExtensionPlugin, LazyExtensionPlugin))
         ]
 
         # Plugins guaranteed to have an id, so sort by that if name is not set
@@ -547,7 +868,7 @@ class WfManagerSetupTask(Task):
         """Opens a dialogue window displaying information about the currently
         loaded plugins
         """
-        plugins = self.lookup_plugins()
+        plugins = load_plugins(self.lookup_plugins())
 
         dlg = PluginDialog(plugins)
         dlg.edit_traits()
@@ -560,16 +881,7 @@ class WfManagerSetupTask(Task):
 
     # Custom UI Methods
     def ui_select(self):
-        plugins = [
-            plugin
-            for plugin in self.window.application.plugin_manager
-            if isinstance(plugin, BaseExtensionPlugin)
-        ]
-
-        # Plugins guaranteed to have an id, so sort by that if name is not set
-        plugins.sort(
-            key=lambda s: s.name if s.name not in ("", None) else s.id
-        )
+        plugins = load_plugins(self.lookup_plugins())
         ui_modal = UISelectModal(
             contributed_uis=self.contributed_uis, available_plugins=plugins
         )
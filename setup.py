@@ -39,6 +39,12 @@ setup(
         'gui_scripts': [
             'force_wfmanager = force_wfmanager.gui.run:force_wfmanager'
         ],
+        'console_scripts': [
+            'force_wfmanager_batch = '
+            'force_wfmanager.batch.run:force_wfmanager_batch',
+            'force_wfmanager_cache = '
+            'force_wfmanager.batch.cache:force_wfmanager_cache',
+        ],
         "force.bdss.extensions": [
             "ui_notification = "
             "force_wfmanager.notifications.ui_notification_plugin:"